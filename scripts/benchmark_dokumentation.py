@@ -0,0 +1,66 @@
+"""
+Benchmark der Dokumentations-Modi von standsicherheit() (je mit doc_aufbewahrung alle/gewinner).
+
+Aufruf (aus dem Repo-Root):
+    python -m scripts.benchmark_dokumentation [wiederholungen]
+"""
+import sys
+import time
+
+from windlast_CORE.konstruktionen.generic import Konstruktion
+from windlast_CORE.rechenfunktionen.standsicherheit import standsicherheit
+from windlast_CORE.datenstruktur.enums import Windzone, Zeitfaktor
+from windlast_CORE.datenstruktur.zeit import Dauer
+from windlast_CORE.datenstruktur.lastcache import lastcache
+
+# (dokumentation, doc_aufbewahrung)
+MODI = (("full", "alle"), ("full", "gewinner"), ("relevant", "alle"), ("relevant", "gewinner"), ("none", "alle"))
+
+def tor_build(breite: float = 8.0, hoehe: float = 4.0, anzahl_steher: int = 2, hoehe_flaeche: float = 2.0) -> dict:
+    t = 0.287 / 2
+    trav = "prolyte_h30v"
+    els = [dict(typ="Traversenstrecke", traverse_name_intern=trav, start=[0, 0, hoehe - t], ende=[breite, 0, hoehe - t],
+                orientierung=[0, 0, 1], element_id_intern="Strecke_Oben", anzeigename="Traverse oben")]
+    abstand = (breite - 2 * t) / (anzahl_steher - 1)
+    mitte = anzahl_steher // 2
+    for i in range(anzahl_steher):
+        x = t + i * abstand
+        seite = [-1, 0, 0] if i <= mitte else [1, 0, 0]
+        els.append(dict(typ="Traversenstrecke", traverse_name_intern=trav, start=[x, 0, 0], ende=[x, 0, hoehe],
+                        orientierung=seite, element_id_intern=f"Steher_{i + 1}", anzeigename=f"Steher {i + 1}"))
+        els.append(dict(typ="Bodenplatte", name_intern="bp_stahl_100x100", mittelpunkt=[x, 0, 0], orientierung=[0, 0, 1],
+                        drehung=seite, untergrund="BETON", gummimatte="GUMMI",
+                        element_id_intern=f"Bodenplatte_{i + 1}", anzeigename=f"Bodenplatte {i + 1}"))
+    els.append(dict(typ="Traversenstrecke", traverse_name_intern=trav, start=[0, 0, hoehe - hoehe_flaeche + t],
+                    ende=[breite, 0, hoehe - hoehe_flaeche + t], orientierung=[0, 0, -1],
+                    element_id_intern="Strecke_Unten", anzeigename="Traverse unten"))
+    els.append(dict(typ="senkrechteFlaeche",
+                    eckpunkte=[[0, -t, hoehe - hoehe_flaeche], [0, -t, hoehe], [breite, -t, hoehe], [breite, -t, hoehe - hoehe_flaeche]],
+                    element_id_intern="Flaeche", anzeigename="Banner", flaechenlast=None, gesamtgewicht=None))
+    return {"bauelemente": els}
+
+def zaehle_docs(ergebnis) -> int:
+    return sum(len(ne.details.docs or []) for ne in ergebnis.normen.values() if ne.details is not None)
+
+def main():
+    wiederholungen = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    faelle = {
+        "tor_8x4": (tor_build(), Dauer(3, Zeitfaktor.MONAT)),
+        "tor_16x6": (tor_build(breite=16.0, hoehe=6.0, anzahl_steher=4, hoehe_flaeche=3.0), Dauer(3, Zeitfaktor.TAG)),
+    }
+
+    print(f"=== DOKUMENTATIONS-MODI ({wiederholungen} Wiederholungen, Lastcache jeweils geleert) ===")
+    for name, (build, dauer) in faelle.items():
+        for modus, aufbewahrung in MODI:
+            zeiten = []
+            for _ in range(wiederholungen):
+                lastcache.clear()
+                konstruktion = Konstruktion(name=name, build=build)
+                t0 = time.perf_counter()
+                ergebnis = standsicherheit(konstruktion, aufstelldauer=dauer, windzone=Windzone.I_BINNENLAND,
+                                           dokumentation=modus, doc_aufbewahrung=aufbewahrung)
+                zeiten.append(time.perf_counter() - t0)
+            print(f"{name:10s} {modus:9s} {aufbewahrung:9s} min={min(zeiten) * 1000:8.1f} ms  docs={zaehle_docs(ergebnis)}")
+
+if __name__ == "__main__":
+    main()
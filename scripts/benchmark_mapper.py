@@ -0,0 +1,61 @@
+"""
+Benchmark des API-Mappers (build_api_output) auf Ergebnissen in der Größe von ergebnis_dump.json,
+dazu Größe und Serialisierungszeit der Antwort mit Doc-Objektliste vs. docs_format=columnar.
+
+Aufruf (aus dem Repo-Root):
+    python -m scripts.benchmark_mapper [wiederholungen]
+"""
+import copy
+import json
+import sys
+import time
+
+from windlast_API.core_adapter.ergebnis_mapper import build_api_output
+from windlast_API.core_adapter.docs_spalten import ergebnis_docs_spaltenweise
+from windlast_CORE.datenstruktur.ergebnis_json import ergebnis_json
+from windlast_CORE.konstruktionen.generic import Konstruktion
+from windlast_CORE.rechenfunktionen.standsicherheit import standsicherheit
+from windlast_CORE.datenstruktur.enums import Windzone, Zeitfaktor
+from windlast_CORE.datenstruktur.zeit import Dauer
+
+from scripts.benchmark_dokumentation import tor_build, zaehle_docs
+
+def main():
+    wiederholungen = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    faelle = {
+        "tor_8x4": (tor_build(), Dauer(3, Zeitfaktor.MONAT)),
+        "tor_16x6": (tor_build(breite=16.0, hoehe=6.0, anzahl_steher=4, hoehe_flaeche=3.0), Dauer(3, Zeitfaktor.TAG)),
+    }
+
+    print(f"=== build_api_output ({wiederholungen} Wiederholungen) ===")
+    for name, (build, dauer) in faelle.items():
+        for modus in ("full", "relevant"):
+            ergebnis = standsicherheit(Konstruktion(name=name, build=build), aufstelldauer=dauer,
+                                       windzone=Windzone.I_BINNENLAND, dokumentation=modus)
+            build_api_output(ergebnis, {})  # Lazy-Bundles einmal auswerten (wie im ersten Request)
+            zeiten = []
+            for _ in range(wiederholungen):
+                t0 = time.perf_counter()
+                out = build_api_output(ergebnis, {})
+                zeiten.append(time.perf_counter() - t0)
+            groesse = len(json.dumps(out, ensure_ascii=False).encode("utf-8"))
+            docs_aus = sum(len(n.get("docs", [])) + sum(len(a.get("docs", [])) for a in (n.get("alternativen") or {}).values())
+                           for n in out["normen"].values())
+            print(f"{name:10s} {modus:9s} min={min(zeiten) * 1000:8.1f} ms  docs_roh={zaehle_docs(ergebnis):6d}  "
+                  f"docs_aus={docs_aus:6d}  json={groesse / 1024:8.0f} KB")
+
+            # Serialisierung wie in der Route (sort_keys, ensure_ascii), columnar inkl. Umbau
+            objekte, spalten = [], []
+            for _ in range(wiederholungen):
+                t0 = time.perf_counter()
+                body = ergebnis_json(out, sort_keys=True, ensure_ascii=True, json_sicher=True)
+                objekte.append(time.perf_counter() - t0)
+                kopie = copy.deepcopy(out)
+                t0 = time.perf_counter()
+                body_spalten = ergebnis_json(ergebnis_docs_spaltenweise(kopie), sort_keys=True, ensure_ascii=True, json_sicher=True)
+                spalten.append(time.perf_counter() - t0)
+            print(f"{'':20s} objects:  {min(objekte) * 1000:8.1f} ms {len(body) / 1024:8.0f} KB   "
+                  f"columnar: {min(spalten) * 1000:8.1f} ms {len(body_spalten) / 1024:8.0f} KB")
+
+if __name__ == "__main__":
+    main()
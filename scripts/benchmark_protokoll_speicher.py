@@ -0,0 +1,54 @@
+"""
+Speicherbedarf der Szenario-Protokolle mit und ohne Doc-Grenzen (BegrenztesProtokoll).
+
+Gemessen wird mit tracemalloc: belegt nach der Rechnung (Ergebnis mit Docs) und Spitze
+einschließlich Mappen (build_api_output); dazu protokoll_statistik.stats().
+
+Aufruf (aus dem Repo-Root):
+    python -m scripts.benchmark_protokoll_speicher [grenze]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from windlast_API.core_adapter.ergebnis_mapper import build_api_output
+from windlast_CORE.datenstruktur.begrenztes_protokoll import DocGrenzen, protokoll_statistik
+from windlast_CORE.datenstruktur.enums import Windzone, Zeitfaktor
+from windlast_CORE.datenstruktur.lastcache import lastcache
+from windlast_CORE.datenstruktur.zeit import Dauer
+from windlast_CORE.konstruktionen.generic import Konstruktion
+from windlast_CORE.rechenfunktionen.standsicherheit import standsicherheit
+from scripts.benchmark_dokumentation import tor_build
+
+def main():
+    grenze = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    build = tor_build(breite=16.0, hoehe=6.0, anzahl_steher=4, hoehe_flaeche=3.0)
+    varianten = {
+        "unbegrenzt": DocGrenzen(),
+        f"{grenze}/auslagern": DocGrenzen(standard=grenze, ueberlauf="auslagern"),
+        f"{grenze}/zusammenfassen": DocGrenzen(standard=grenze, ueberlauf="zusammenfassen"),
+    }
+
+    print(f"=== PROTOKOLL-SPEICHER (tor_16x6, 16 Windrichtungen, Grenze {grenze} je nachweis/doc_type) ===")
+    for name, grenzen in varianten.items():
+        lastcache.clear()
+        protokoll_statistik.clear()
+        gc.collect()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        ergebnis = standsicherheit(Konstruktion(name="tor_16x6", build=build), aufstelldauer=Dauer(3, Zeitfaktor.TAG),
+                                   windzone=Windzone.I_BINNENLAND, anzahl_windrichtungen=16, doc_grenzen=grenzen)
+        belegt, _ = tracemalloc.get_traced_memory()
+        ausgabe = build_api_output(ergebnis, {})
+        _, spitze = tracemalloc.get_traced_memory()
+        dauer = time.perf_counter() - t0
+        tracemalloc.stop()
+        stats = protokoll_statistik.stats()
+        docs = sum(len(n["docs"]) for n in ausgabe["normen"].values())
+        print(f"{name:20s} {dauer * 1000:8.1f} ms  belegt={belegt / 1e6:6.1f} MB  spitze={spitze / 1e6:6.1f} MB  "
+              f"docs={docs}  im_speicher_max={stats['im_speicher_max']}  geschaetzt_max={stats['geschaetzt_bytes_max'] / 1e6:.1f} MB  "
+              f"ausgelagert={stats['ausgelagert_bytes'] / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
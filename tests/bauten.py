@@ -0,0 +1,66 @@
+"""
+Kleine Test-Konstruktionen (Tore aus Traversen mit Bodenplatten, optional mit Banner) und Hilfen zum Rechnen.
+"""
+from typing import Optional
+
+from windlast_CORE.datenstruktur.enums import Windzone, Zeitfaktor
+from windlast_CORE.datenstruktur.lastcache import lastcache
+from windlast_CORE.datenstruktur.zeit import Dauer
+from windlast_CORE.konstruktionen.generic import Konstruktion
+from windlast_CORE.rechenfunktionen.standsicherheit import standsicherheit
+
+TRAVERSE = "prolyte_h30v"
+BODENPLATTE = "bp_stahl_100x100"
+
+def tor_build(breite: float = 8.0, hoehe: float = 4.0, anzahl_steher: int = 2,
+              hoehe_flaeche: Optional[float] = 2.0, extra: tuple = ()) -> dict:
+    t = 0.287 / 2
+    els = [dict(typ="Traversenstrecke", traverse_name_intern=TRAVERSE, start=[0, 0, hoehe - t], ende=[breite, 0, hoehe - t],
+                orientierung=[0, 0, 1], element_id_intern="Strecke_Oben", anzeigename="Traverse oben")]
+    abstand = (breite - 2 * t) / (anzahl_steher - 1)
+    mitte = anzahl_steher // 2
+    for i in range(anzahl_steher):
+        x = t + i * abstand
+        seite = [-1, 0, 0] if i <= mitte else [1, 0, 0]
+        els.append(dict(typ="Traversenstrecke", traverse_name_intern=TRAVERSE, start=[x, 0, 0], ende=[x, 0, hoehe],
+                        orientierung=seite, element_id_intern=f"Steher_{i + 1}", anzeigename=f"Steher {i + 1}"))
+        els.append(dict(typ="Bodenplatte", name_intern=BODENPLATTE, mittelpunkt=[x, 0, 0], orientierung=[0, 0, 1],
+                        drehung=seite, untergrund="BETON", gummimatte="GUMMI",
+                        element_id_intern=f"Bodenplatte_{i + 1}", anzeigename=f"Bodenplatte {i + 1}"))
+    if hoehe_flaeche:
+        els.append(dict(typ="Traversenstrecke", traverse_name_intern=TRAVERSE, start=[0, 0, hoehe - hoehe_flaeche + t],
+                        ende=[breite, 0, hoehe - hoehe_flaeche + t], orientierung=[0, 0, -1],
+                        element_id_intern="Strecke_Unten", anzeigename="Traverse unten"))
+        els.append(dict(typ="senkrechteFlaeche",
+                        eckpunkte=[[0, -t, hoehe - hoehe_flaeche], [0, -t, hoehe], [breite, -t, hoehe], [breite, -t, hoehe - hoehe_flaeche]],
+                        element_id_intern="Flaeche", anzeigename="Banner", flaechenlast=None, gesamtgewicht=None))
+    els.extend(extra)
+    return {"bauelemente": els}
+
+ROHR = dict(typ="Rohr", rohr_name_intern="stahl_48x2", start=[0, 1, 0], ende=[0, 1, 2.5],
+            element_id_intern="Rohr_1", anzeigename="Rohr")
+
+# name -> (build, aufstelldauer)
+FAELLE = {
+    "tor_flaeche": (tor_build(), None),
+    "tor3_ohne_flaeche": (tor_build(breite=6, hoehe=5, anzahl_steher=3, hoehe_flaeche=None), Dauer(3, Zeitfaktor.MONAT)),
+    "tor_rohr": (tor_build(breite=4, hoehe=3, hoehe_flaeche=1.0, extra=(ROHR,)), Dauer(12, Zeitfaktor.MONAT)),
+    "tor_breit": (tor_build(breite=16, hoehe=6, anzahl_steher=4, hoehe_flaeche=3.0), Dauer(3, Zeitfaktor.TAG)),
+}
+
+def rechne(name: str, **kwargs):
+    """standsicherheit() für einen Fall aus FAELLE, mit leerem LastCache."""
+    build, dauer = FAELLE[name]
+    lastcache.clear()
+    return standsicherheit(Konstruktion(name=name, build=build), aufstelldauer=dauer,
+                           windzone=Windzone.I_BINNENLAND, **kwargs)
+
+def werte(ergebnis) -> dict:
+    """Hauptergebnisse als {"NORM/ALTERNATIVE/NACHWEIS": wert} (ohne Docs und Meldungen)."""
+    aus = {}
+    for norm, ne in ergebnis.normen.items():
+        bloecke = [("", ne.werte)] + [(getattr(alt, "name", alt), ae.werte) for alt, ae in (ne.alternativen or {}).items()]
+        for alt, w in bloecke:
+            for nachweis, zw in (w or {}).items():
+                aus[f"{norm.name}/{alt}/{nachweis.name}"] = zw.wert
+    return aus
@@ -0,0 +1,106 @@
+"""
+BegrenztesProtokoll: Grenzen je (nachweis, doc_type), Überlauf "zusammenfassen"/"auslagern" und
+Vergleich der Ausgabe mit dem unbegrenzten Protokoll.
+"""
+import json
+import pickle
+from collections import Counter
+
+import pytest
+
+from windlast_API.core_adapter.ergebnis_mapper import build_api_output
+from windlast_CORE.datenstruktur.begrenztes_protokoll import BegrenztesProtokoll, DocGrenzen, doc_grenzen_aus_env
+
+from tests.bauten import rechne
+
+def _protokoll(ueberlauf, grenze=2):
+    p = BegrenztesProtokoll(grenzen=DocGrenzen(standard=grenze, ueberlauf=ueberlauf))
+    for i in range(5):
+        p.add_doc(bundle={"titel": "M_kipp", "wert": float(i), "einheit": "Nm"},
+                  kontext={"nachweis": "KIPP", "doc_type": "axis_momente", "rolle": "irrelevant", "i": i})
+    p.add_doc(bundle={"titel": "S_kipp", "wert": 1.5}, kontext={"nachweis": "KIPP", "doc_type": "axis_momente", "rolle": "relevant"})
+    p.add_doc(bundle={"titel": "F_wind", "wert": 9.0}, kontext={"nachweis": "LOADS", "doc_type": "element_kraft", "i": 5})
+    for i in range(3):
+        p.add_doc(bundle={"titel": "F_wind", "wert": float(i)}, kontext={"nachweis": "LOADS", "doc_type": "element_kraft"})
+    return p
+
+def _titel(docs):
+    return [bundle["titel"] for bundle, _ in docs]
+
+def test_zusammenfassen_haelt_grenze_und_fasst_rest():
+    p = _protokoll("zusammenfassen")
+    docs = list(p.docs)
+    assert _titel(docs) == ["M_kipp", "M_kipp", "M_kipp (zusammengefasst)", "S_kipp"] + ["F_wind"] * 4
+    bundle, kontext = docs[2]
+    assert bundle["wert"] == [2.0, 4.0]
+    assert kontext["zusammenfassung"] == 3 and kontext["rolle"] == "irrelevant"
+    assert p.zusammengefasst == 3 and p.ausgelagert == 0
+
+def test_auslagern_liefert_alle_docs_in_reihenfolge():
+    p = _protokoll("auslagern")
+    unbegrenzt = _protokoll("auslagern", grenze=0)
+    assert p.ausgelagert == 3 and unbegrenzt.ausgelagert == 0
+    assert list(p.docs) == list(unbegrenzt.docs)
+    assert len(p.docs) == len(unbegrenzt.docs) == 10
+    # zweiter Durchlauf liest das Log erneut
+    assert list(p.docs) == list(unbegrenzt.docs)
+
+def test_auslagern_uebersteht_pickle():
+    p = _protokoll("auslagern")
+    kopie = pickle.loads(pickle.dumps(p))
+    assert list(kopie.docs) == list(p.docs)
+
+def test_relevante_und_loads_docs_bleiben_trotz_grenze():
+    p = _protokoll("zusammenfassen", grenze=1)
+    titel = _titel(p.docs)
+    assert "S_kipp" in titel
+    assert titel.count("F_wind") == 4
+    assert p.speicher_statistik()["je_typ"][("LOADS", "element_kraft")] == 4
+
+def test_doc_grenzen_aus_env():
+    grenzen = doc_grenzen_aus_env({
+        "WINDLAST_DOC_GRENZE": "50",
+        "WINDLAST_DOC_GRENZEN": "KIPP/axis_momente=200, GLEIT/=10",
+        "WINDLAST_DOC_UEBERLAUF": "auslagern",
+    })
+    assert grenzen.aktiv and grenzen.ueberlauf == "auslagern"
+    assert grenzen.grenze(("KIPP", "axis_momente")) == 200
+    assert grenzen.grenze(("GLEIT", None)) == 10
+    assert grenzen.grenze(("ABHEBE", "x")) == 50
+    assert doc_grenzen_aus_env({}) == DocGrenzen()
+    assert DocGrenzen().ueberlauf == "zusammenfassen" and not DocGrenzen().aktiv
+    with pytest.raises(ValueError):
+        doc_grenzen_aus_env({"WINDLAST_DOC_GRENZEN": "KIPP"})
+    with pytest.raises(ValueError):
+        DocGrenzen(ueberlauf="wegwerfen")
+
+# ----- Ausgabe gegen das unbegrenzte Protokoll -----
+
+def _relevante_docs(ausgabe, nachweis=None) -> Counter:
+    """Docs mit Rolle 'relevant' in mindestens einem Nachweis, je Norm (optional nur ein Nachweis)."""
+    aus: Counter = Counter()
+    for norm, n in ausgabe["normen"].items():
+        for doc in n["docs"]:
+            ctx = doc["context"]
+            if nachweis is not None and ctx.get("nachweis") != nachweis:
+                continue
+            if "relevant" in (ctx.get("rolle_pro_nachweis") or {}).values():
+                aus[(norm, json.dumps(doc, sort_keys=True, ensure_ascii=False, default=str))] += 1
+    return aus
+
+@pytest.fixture(scope="module")
+def unbegrenzt():
+    return build_api_output(rechne("tor_breit"), {})
+
+@pytest.mark.parametrize("ueberlauf", ["zusammenfassen", "auslagern"])
+def test_massgebende_docs_wie_unbegrenzt(unbegrenzt, ueberlauf):
+    ausgabe = build_api_output(rechne("tor_breit", doc_grenzen=DocGrenzen(standard=20, ueberlauf=ueberlauf)), {})
+    # LOADS der maßgebenden Richtung bekommen ihre Rolle erst im Mapper → dürfen nicht wegfallen
+    loads = _relevante_docs(unbegrenzt, "LOADS")
+    assert loads
+    assert _relevante_docs(ausgabe, "LOADS") == loads
+    assert _relevante_docs(ausgabe) == _relevante_docs(unbegrenzt)
+    if ueberlauf == "auslagern":
+        assert ausgabe["normen"] == unbegrenzt["normen"]
+    else:
+        assert sum(len(n["docs"]) for n in ausgabe["normen"].values()) < sum(len(n["docs"]) for n in unbegrenzt["normen"].values())
@@ -0,0 +1,84 @@
+"""
+Spaltenweises Doc-Format: Hin- und Rückweg (Dekodierung wie decodeDocs in static/js/ergebnis_zerlegen.js).
+"""
+import json
+
+import pytest
+
+from windlast_API.core_adapter.docs_spalten import (
+    DOCS_FORMAT, docs_format_aus, docs_spaltenweise, ergebnis_docs_spaltenweise,
+)
+from windlast_API.core_adapter.ergebnis_mapper import build_api_output
+
+from tests.bauten import rechne
+
+_FELDER = ("title", "unit", "formula", "formula_source", "symbols", "symbols_source", "items", "items_source")
+
+def dekodieren(block):
+    tabelle = block["table"]
+    spalten = block["columns"]
+    def hole(i):
+        return None if i is None else tabelle[i]
+    docs = []
+    for n in range(block["count"]):
+        eintrag = block["contexts"][spalten["context"][n]]
+        kontext = {k: hole(i) for k, i in zip(block["context_keys"][eintrag[0]], eintrag[1:])}
+        if spalten["role"][n] is not None:
+            kontext["rolle_pro_nachweis"] = tabelle[spalten["role"][n]]
+        doc = {feld: hole(spalten[feld][n]) for feld in _FELDER}
+        doc["value"] = spalten["value"][n]
+        doc["context"] = kontext
+        docs.append(doc)
+    return docs
+
+def _voll(doc):
+    """Doc mit allen Feldern (fehlende als None), wie sie dekodiert zurückkommen."""
+    return {**{feld: None for feld in _FELDER}, "value": None, **doc, "context": doc.get("context") or {}}
+
+def test_typen_und_sonderfaelle_bleiben_erhalten():
+    docs = [
+        {"title": "a", "value": 1, "unit": "kN", "symbols": [1, 1.0, True, "1"], "context": {"n": 1, "x": 1.0}},
+        {"title": "a", "value": 1.0, "unit": "kN", "symbols": [1, 1, 1, "1"], "context": {"n": True, "x": None}},
+        {"title": "b", "value": [1.5, 2.5], "items": [["F", 1.0], ["G", [1, 2]]],
+         "context": {"rolle_pro_nachweis": {"KIPP": "relevant"}, "nachweis": "KIPP"}},   # Rolle nicht zuletzt
+        {"title": "b", "value": None, "context": {"nachweis": "KIPP", "rolle_pro_nachweis": {"KIPP": "irrelevant"}}},
+        {"title": None, "value": float("inf"), "context": {}},
+    ]
+    block = docs_spaltenweise(docs)
+    assert block["format"] == DOCS_FORMAT and block["count"] == len(docs)
+    aus = dekodieren(block)
+    for original, zurueck in zip(docs, aus):
+        assert zurueck == _voll(original)
+        # 1, 1.0, True und "1" dürfen nicht zusammenfallen
+        assert [type(v) for v in zurueck["symbols"] or []] == [type(v) for v in original.get("symbols") or []]
+        assert {k: type(v) for k, v in zurueck["context"].items()} == {k: type(v) for k, v in original["context"].items()}
+
+def test_gleiche_werte_nur_einmal_in_der_tabelle():
+    docs = [{"title": "Moment", "unit": "kNm", "value": i, "context": {"nachweis": "KIPP", "element_id": "Steher_1"}}
+            for i in range(50)]
+    block = docs_spaltenweise(docs)
+    assert len(block["contexts"]) == 1 and len(block["context_keys"]) == 1
+    assert block["table"].count("Moment") == 1 and block["table"].count("kNm") == 1
+
+@pytest.mark.parametrize("dokumentation", ["full", "relevant"])
+def test_rundreise_echte_ausgabe_ueber_json(dokumentation):
+    ausgabe = build_api_output(rechne("tor_rohr", dokumentation=dokumentation), {})
+    erwartet = json.loads(json.dumps(ausgabe, default=str))
+    spaltenweise = json.loads(json.dumps(ergebnis_docs_spaltenweise(json.loads(json.dumps(ausgabe, default=str))), default=str))
+    assert spaltenweise["meta"]["docs_format"] == DOCS_FORMAT
+    anzahl = 0
+    for norm_key, norm in erwartet["normen"].items():
+        bloecke = [(norm["docs"], spaltenweise["normen"][norm_key]["docs"])]
+        bloecke += [(alt["docs"], spaltenweise["normen"][norm_key]["alternativen"][name]["docs"])
+                    for name, alt in (norm.get("alternativen") or {}).items()]
+        for original, block in bloecke:
+            assert dekodieren(block) == [_voll(d) for d in original]
+            anzahl += len(original)
+    assert anzahl > 0
+
+def test_docs_format_aus():
+    assert docs_format_aus({}, {}) is None
+    assert docs_format_aus({"docs_format": "objects"}) is None
+    assert docs_format_aus({"docs_format": "objects"}, {"docs_format": "columnar"}) == DOCS_FORMAT
+    with pytest.raises(ValueError):
+        docs_format_aus({"docs_format": "csv"})
@@ -0,0 +1,55 @@
+"""
+ErgebnisCache: LRU mit Einträge- und Byte-Budget, SQLite-Stufe und Cache-Schlüssel.
+"""
+from windlast_API.core_adapter.ergebnis_cache import ErgebnisCache, ergebnis_schluessel
+from windlast_CORE.materialdaten.catalog import catalog
+
+def test_byte_budget_verdraengt_lru():
+    cache = ErgebnisCache(maxsize=100, db_pfad="", max_bytes=25)
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+    assert cache.get("a") == (b"a" * 10, "memory")     # a ist jetzt der jüngste
+    cache.put("c", b"c" * 10)                          # 30 Bytes > 25 → b fliegt
+    assert cache.get("b") == (None, "")
+    assert cache.get("a")[0] is not None and cache.get("c")[0] is not None
+    stats = cache.stats()
+    assert stats["bytes"] == 20 and stats["size"] == 2 and stats["evictions"] == 1
+
+def test_eintraege_budget_greift_ebenfalls():
+    cache = ErgebnisCache(maxsize=2, db_pfad="", max_bytes=1000)
+    for key in "abc":
+        cache.put(key, key.encode())
+    assert cache.get("a") == (None, "")
+    assert cache.stats()["size"] == 2
+
+def test_zu_grosse_antwort_bleibt_nicht_im_speicher():
+    cache = ErgebnisCache(maxsize=10, db_pfad="", max_bytes=16)
+    cache.put("klein", b"x" * 8)
+    cache.put("gross", b"y" * 17)
+    assert cache.get("gross") == (None, "")
+    assert cache.get("klein")[0] == b"x" * 8           # nicht verdrängt
+    assert cache.stats()["too_large"] == 1
+
+def test_ersetzen_zaehlt_bytes_nicht_doppelt():
+    cache = ErgebnisCache(maxsize=10, db_pfad="", max_bytes=100)
+    cache.put("a", b"1" * 40)
+    cache.put("a", b"2" * 30)
+    assert cache.stats()["bytes"] == 30
+
+def test_platte_liefert_nach_verdraengung(tmp_path):
+    cache = ErgebnisCache(maxsize=1, db_pfad=str(tmp_path / "ergebnisse.db"), max_bytes=1000)
+    cache.put("a", b"A")
+    cache.put("b", b"B")                               # a nur noch auf Platte
+    assert cache.get("a") == (b"A", "disk")
+    assert cache.get("a") == (b"A", "memory")          # Plattentreffer wandert in den RAM
+    assert cache.stats()["disk_size"] == 2
+
+def test_schluessel_haengt_an_payload_projektion_und_katalog(monkeypatch):
+    payload = {"konstruktion": {"bauelemente": []}, "windzone": "I_BINNENLAND"}
+    umsortiert = {"windzone": "I_BINNENLAND", "konstruktion": {"bauelemente": []}}
+    basis = ergebnis_schluessel(payload)
+    assert ergebnis_schluessel(umsortiert) == basis
+    assert ergebnis_schluessel({**payload, "windzone": "II_BINNENLAND"}) != basis
+    assert ergebnis_schluessel(payload, {"felder": ["kipp"]}) != basis
+    monkeypatch.setattr(catalog, "_spec_version", catalog.spec_version + "-geaendert")
+    assert ergebnis_schluessel(payload) != basis
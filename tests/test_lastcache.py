@@ -0,0 +1,63 @@
+"""
+LastCache: LRU-Verhalten und inhaltsadressierte Schlüssel (Katalog-Version, Element-Inhalt).
+"""
+from windlast_CORE.datenstruktur.enums import Windzone
+from windlast_CORE.datenstruktur.lastcache import (
+    LastCache, LastCacheEintrag, element_fingerprint, gewicht_schluessel, lastcache,
+)
+from windlast_CORE.konstruktionen.generic import Konstruktion
+from windlast_CORE.materialdaten.catalog import catalog
+from windlast_CORE.rechenfunktionen.standsicherheit import standsicherheit
+
+from tests.bauten import FAELLE, tor_build, werte
+
+def _rechne(build, dauer):
+    return standsicherheit(Konstruktion(name="tor", build=build), aufstelldauer=dauer, windzone=Windzone.I_BINNENLAND)
+
+def test_lru_verdraengt_aeltesten_eintrag():
+    cache = LastCache(maxsize=2)
+    cache.put("a", LastCacheEintrag(kraefte=()))
+    cache.put("b", LastCacheEintrag(kraefte=()))
+    assert cache.get("a") is not None          # a ist jetzt der jüngste
+    cache.put("c", LastCacheEintrag(kraefte=()))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+def test_geringere_protokoll_stufe_zaehlt_als_miss():
+    cache = LastCache()
+    cache.put("a", LastCacheEintrag(kraefte=()))   # ohne Protokoll aufgezeichnet → Stufe 0
+    assert cache.get("a", stufe=0) is not None
+    assert cache.get("a", stufe=1) is None
+    assert cache.stats()["misses"] == 1
+
+def test_wiederholte_rechnung_trifft_katalogwechsel_verfehlt(monkeypatch):
+    build, dauer = FAELLE["tor_flaeche"]
+    lastcache.clear()
+    referenz = werte(_rechne(build, dauer))
+    vorher = lastcache.stats()
+
+    # gleiche Eingaben → nur Treffer, gleiche Ergebnisse
+    assert werte(_rechne(build, dauer)) == referenz
+    danach = lastcache.stats()
+    assert danach["misses"] == vorher["misses"]
+    assert danach["hits"] > vorher["hits"]
+
+    # anderer Katalog-Stand → kein Eintrag darf wiederverwendet werden
+    monkeypatch.setattr(catalog, "_spec_version", catalog.spec_version + "-geaendert")
+    _rechne(build, dauer)
+    neu = lastcache.stats()
+    assert neu["misses"] - danach["misses"] == vorher["misses"]
+    assert neu["size"] == 2 * vorher["size"]
+
+def test_geaendertes_element_bekommt_neuen_schluessel():
+    a = Konstruktion(name="a", build=tor_build()).bauelemente
+    b = Konstruktion(name="b", build=tor_build(hoehe=5.0)).bauelemente
+    fp_a = [element_fingerprint(el) for el in a]
+    fp_b = [element_fingerprint(el) for el in b]
+    assert all(fp is not None for fp in fp_a)
+    # Oberer Riegel und Steher ändern sich mit der Höhe, die Bodenplatten nicht
+    assert fp_a[0] != fp_b[0]
+    assert set(fp_a) & set(fp_b)
+    konst = object()
+    assert gewicht_schluessel(fp_a[0], "v1", konst) != gewicht_schluessel(fp_a[0], "v2", konst)
@@ -0,0 +1,31 @@
+"""
+Regression gegen die Ergebnisse vor den Performance-Umbauten (Kipp-Kernel, KraftBlock, Batch-Windrichtungen, …).
+
+tests/data/referenz_baseline.json enthält die Hauptergebnisse der Fälle aus tests.bauten, gerechnet mit dem
+skalaren Stand vor dem Kipp-Kernel. Der Kernel selbst rechnet bitgleich; bei symmetrischen Konstruktionen werden
+die Windrichtungen aber aus dem Grundsektor gespiegelt (symmetrie.py), die Winkel liegen dadurch um Rundung
+anders. Abweichungen in der letzten Stelle (~1e-16 relativ) sind daher erwartet, mehr nicht.
+"""
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from tests.bauten import FAELLE, rechne, werte
+
+REFERENZ = json.loads((Path(__file__).parent / "data" / "referenz_baseline.json").read_text(encoding="utf-8"))
+REL_TOL = 1e-12
+ABS_TOL = 1e-9
+
+@pytest.mark.parametrize("name", sorted(FAELLE))
+def test_hauptwerte_wie_baseline(name):
+    aktuell = werte(rechne(name))
+    erwartet = REFERENZ[name]
+    assert aktuell.keys() == erwartet.keys()
+    for schluessel, ref in erwartet.items():
+        wert = aktuell[schluessel]
+        if ref is None or wert is None or math.isinf(ref):
+            assert wert == ref, schluessel
+        else:
+            assert math.isclose(wert, ref, rel_tol=REL_TOL, abs_tol=ABS_TOL), (schluessel, wert, ref)
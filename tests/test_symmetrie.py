@@ -0,0 +1,72 @@
+"""
+Symmetrie-Erkennung und Reduktion der Windrichtungen auf den Fundamentalbereich.
+"""
+import math
+
+import pytest
+
+import windlast_CORE.rechenfunktionen.abhebesicherheit as abhebesicherheit
+import windlast_CORE.rechenfunktionen.kippsicherheit as kippsicherheit
+from windlast_CORE.konstruktionen.generic import Konstruktion
+from windlast_CORE.rechenfunktionen.symmetrie import KEINE_SYMMETRIE, ermittle_symmetrie, symmetrie_von
+
+from tests.bauten import FAELLE, ROHR, rechne, tor_build, werte
+
+def _rohre_im_quadrat(kante: float = 2.0) -> Konstruktion:
+    ecken = [(0.0, 0.0), (kante, 0.0), (kante, kante), (0.0, kante)]
+    return Konstruktion(name="quadrat", build={"bauelemente": [
+        dict(typ="Rohr", rohr_name_intern="stahl_48x2", start=[x, y, 0], ende=[x, y, 2.0],
+             element_id_intern=f"Rohr_{i + 1}", anzeigename=f"Rohr {i + 1}")
+        for i, (x, y) in enumerate(ecken)
+    ]})
+
+def _richtungen(schritt: float = 45.0):
+    return [(w, (math.cos(math.radians(w)), math.sin(math.radians(w)), 0.0)) for w in range(0, 360, int(schritt))]
+
+def test_symmetrisches_tor_spiegelung_in_windrichtung():
+    sym = symmetrie_von(Konstruktion(name="tor", build=tor_build(breite=6, hoehe=5, anzahl_steher=3, hoehe_flaeche=None)))
+    assert [(a.art, a.winkel_deg) for a in sym.abbildungen] == [("spiegelung", 0.0)]
+    assert sym.bilder(45.0) == [315.0]
+    assert [w for w, _ in sym.fundamentalbereich(_richtungen())] == [0, 45, 90, 135, 180]
+
+def test_quadrat_dreh_und_spiegelsymmetrisch():
+    sym = symmetrie_von(_rohre_im_quadrat())
+    arten = {(a.art, a.winkel_deg) for a in sym.abbildungen}
+    assert {("drehung", 90.0), ("drehung", 180.0), ("drehung", 270.0)} <= arten
+    assert {("spiegelung", 0.0), ("spiegelung", 45.0), ("spiegelung", 90.0), ("spiegelung", 135.0)} <= arten
+    assert [w for w, _ in sym.fundamentalbereich(_richtungen())] == [0, 45]
+
+@pytest.mark.parametrize("build", [
+    tor_build(breite=6, hoehe=5, anzahl_steher=3, hoehe_flaeche=None, extra=(ROHR,)),   # Rohr nur auf einer Seite
+    tor_build(),                                                                       # Banner vor der Ebene
+])
+def test_unsymmetrisch_rechnet_alle_richtungen(build):
+    sym = symmetrie_von(Konstruktion(name="tor", build=build))
+    assert sym == KEINE_SYMMETRIE
+    assert not sym
+    assert sym.fundamentalbereich(_richtungen()) == _richtungen()
+
+def test_nicht_beschreibbare_elemente_keine_symmetrie():
+    assert ermittle_symmetrie([object(), object()]) == KEINE_SYMMETRIE
+
+def test_geometrieaenderung_invalidiert_cache():
+    konstruktion = _rohre_im_quadrat()
+    assert symmetrie_von(konstruktion)
+    konstruktion.bauelemente[0].start = (0.5, 0.0, 0.0)
+    konstruktion.bauelemente[0].ende = (0.5, 0.0, 2.0)
+    assert not symmetrie_von(konstruktion)
+
+def test_reduktion_liefert_gleiche_ergebnisse(monkeypatch):
+    name = "tor3_ohne_flaeche"
+    assert symmetrie_von(Konstruktion(name=name, build=FAELLE[name][0]))
+    reduziert = werte(rechne(name))
+    for modul in (kippsicherheit, abhebesicherheit):
+        monkeypatch.setattr(modul, "symmetrie_von", lambda konstruktion: KEINE_SYMMETRIE)
+    voll = werte(rechne(name))
+    assert reduziert.keys() == voll.keys()
+    for schluessel, wert in voll.items():
+        if wert is None or math.isinf(wert):
+            assert reduziert[schluessel] == wert, schluessel
+        else:
+            # gespiegelte Richtungen weichen nur um Rundung ab
+            assert math.isclose(reduziert[schluessel], wert, rel_tol=1e-12, abs_tol=1e-9), schluessel
@@ -6,4 +6,8 @@ from . import routes_config  # noqa: E402,F401
 from . import routes_catalog
 from . import routes_berechnung
 from . import routes_reibwert
-from . import routes_meta
\ No newline at end of file
+from . import routes_meta
+from . import routes_jobs
+
+from . import routes_admin
+from . import routes_ergebnis
\ No newline at end of file
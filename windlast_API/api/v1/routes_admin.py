@@ -0,0 +1,32 @@
+from flask import request, jsonify
+from . import bp_v1
+from core_adapter.ergebnis_cache import ergebnis_cache
+from windlast_CORE.datenstruktur.begrenztes_protokoll import protokoll_statistik
+
+def _nur_lokal():
+    # Admin-Endpunkte nur vom eigenen Rechner (wie /__client_event)
+    if request.remote_addr not in ("127.0.0.1", "::1"):
+        return jsonify({"error": {"code": "FORBIDDEN", "message": "Nur lokal erlaubt."}}), 403
+    return None
+
+@bp_v1.get("/admin/cache")
+def cache_status():
+    return _nur_lokal() or jsonify(ergebnis_cache.stats())
+
+@bp_v1.delete("/admin/cache")
+def cache_leeren():
+    """Leert den Ergebnis-Cache (RAM und, falls aktiv, SQLite). Antwort: Anzahl entfernter Einträge."""
+    return _nur_lokal() or jsonify({"purged": ergebnis_cache.clear()})
+
+@bp_v1.get("/admin/protokoll")
+def protokoll_status():
+    """Speicher-Statistik der Szenario-Protokolle seit Start/Reset (Docs, geschätzte Bytes, ausgelagert)."""
+    return _nur_lokal() or jsonify(protokoll_statistik.stats())
+
+@bp_v1.delete("/admin/protokoll")
+def protokoll_status_zuruecksetzen():
+    verboten = _nur_lokal()
+    if verboten:
+        return verboten
+    protokoll_statistik.clear()
+    return jsonify({"reset": True})
@@ -1,10 +1,19 @@
-from flask import request, jsonify
+import json
+from flask import request, jsonify, Response, stream_with_context
 from . import bp_v1
-from .schemas import KonstruktionInput, Result  # , TorInput, SteherInput, TischInput
+from .schemas import KonstruktionInput, result_dump, ergebnis_antwort  # , TorInput, SteherInput, TischInput
 # from core_adapter.tor import berechne_tor
 # from core_adapter.steher import berechne_steher
 # from core_adapter.tisch import berechne_tisch
-from core_adapter.generic import berechne_konstruktion
+from core_adapter.generic import berechne_konstruktion, pruefe_payload
+from core_adapter.batch import berechne_batch, berechne_batch_iter
+from core_adapter.ergebnis_cache import ergebnis_cache, ergebnis_schluessel
+from core_adapter.projektion import projektion_aus
+from core_adapter.ergebnis_store import ergebnis_store
+from core_adapter.docs_spalten import docs_format_aus, ergebnis_docs_spaltenweise
+from windlast_CORE.datenstruktur.ergebnis_json import ergebnis_json
+
+MAX_BATCH_ITEMS = 200
 
 # @bp_v1.post("/tor/berechnen") # Setzt Endpunkt /api/v1/tor/berechnen
 # def tor_berechnen(): # Funktion wird aufgerufen bei POST-Request
@@ -36,12 +45,157 @@ from core_adapter.generic import berechne_konstruktion
 #     except Exception as e:
 #         return jsonify({"error": {"code": "INVALID_INPUT", "message": str(e)}}), 400
     
+def _result_dump(resp, projektion, result_id=None, docs_format=None):
+    # result_id: Schlüssel für den Drill-down /ergebnis/<result_id>/docs
+    if result_id is not None:
+        resp["meta"]["result_id"] = result_id
+    # Projizierte Antworten: nur die gemappten Felder ausgeben (keine Defaults für Weggelassenes)
+    result = result_dump(resp, projiziert=projektion is not None)
+    # docs_format=columnar: Doc-Listen als spaltenweise Blöcke (erst nach der Validierung)
+    return ergebnis_docs_spaltenweise(result) if docs_format is not None else result
+
+def _ausgabe_schluessel(projektion, docs_format):
+    """Alles, was die Antwort formt, für den Cache-Schlüssel (None → volle Antwort wie bisher)."""
+    ausgabe = None if projektion is None else projektion.als_dict()
+    if docs_format is not None:
+        ausgabe = {**(ausgabe or {}), "docs_format": docs_format}
+    return ausgabe
+
+def _cache_header(antwort, status: str, schluessel: str):
+    antwort.headers["X-Cache"] = status
+    antwort.headers["X-Cache-Key"] = schluessel
+    return antwort
+
+def berechnung_lesen(daten, args, *, pruefen: bool = False):
+    """
+    Anfrage wie /konstruktion/berechnen (auch /jobs) → (payload, projektion, docs_format, Cache-Schlüssel, result_id).
+    Der Payload wird dabei im Ergebnis-Store registriert (mit pruefen=True erst nach pruefe_payload).
+    """
+    payload = KonstruktionInput.model_validate(daten).model_dump()
+    if pruefen:
+        pruefe_payload(payload)
+    projektion = projektion_aus(daten if isinstance(daten, dict) else {}, args)
+    docs_format = docs_format_aus(daten if isinstance(daten, dict) else {}, args)
+    schluessel = ergebnis_schluessel(payload, _ausgabe_schluessel(projektion, docs_format))
+    result_id = ergebnis_store.registrieren(payload)
+    return payload, projektion, docs_format, schluessel, result_id
+
+def cache_umgehen() -> bool:
+    return "no-cache" in (request.headers.get("Cache-Control") or "")
+
+def antwort_cachen(resp, projektion, docs_format, schluessel, result_id):
+    """Rohergebnis → (Result-Dict, Antwort); die Antwort-Bytes landen im Ergebnis-Cache. Braucht einen App-Kontext."""
+    ergebnis = _result_dump(resp, projektion, result_id, docs_format)
+    antwort = ergebnis_antwort(ergebnis)
+    ergebnis_cache.put(schluessel, antwort.get_data())
+    return ergebnis, antwort
+
 @bp_v1.post("/konstruktion/berechnen")
 def konstruktion_berechnen():
+    """
+    Ergebnisse werden im Ergebnis-Cache abgelegt (Schlüssel: kanonischer Payload + Katalog- und
+    Engine-Version). Header: X-Cache = HIT-MEMORY | HIT-DISK | MISS | BYPASS, X-Cache-Key.
+    "Cache-Control: no-cache" rechnet neu und ersetzt den Eintrag.
+
+    Projektion (Body oder Query, Query gewinnt): fields=kipp,gleit,abhebe,ballast,alternativen,
+    messages,docs | normen=EN_17879_2024,... | docs=none|relevant|all | nachweis=KIPP,...
+    Nicht Angefordertes wird nicht gerechnet und fehlt in der Antwort.
+
+    meta.result_id: Docs lassen sich später über /ergebnis/<result_id>/docs nachladen
+    (z.B. schnelle Hauptrechnung ohne "docs" in fields).
+
+    docs_format=columnar (Body oder Query): Docs je Norm/Alternative als spaltenweiser Block mit
+    Wertetabelle statt Objektliste (siehe core_adapter/docs_spalten.py), meta.docs_format gesetzt.
+    """
+    try:
+        daten = json.loads(request.data or b"null")
+        payload, projektion, docs_format, schluessel, result_id = berechnung_lesen(daten, request.args)
+        bypass = cache_umgehen()
+        if not bypass:
+            body, quelle = ergebnis_cache.get(schluessel)
+            if body is not None:
+                return _cache_header(Response(body, mimetype="application/json"), f"HIT-{quelle.upper()}", schluessel)
+        resp = berechne_konstruktion(payload, projektion=projektion)
+        _, antwort = antwort_cachen(resp, projektion, docs_format, schluessel, result_id)
+        return _cache_header(antwort, "BYPASS" if bypass else "MISS", schluessel)
+    except Exception as e:
+        return jsonify({"error": {"code": "INVALID_INPUT", "message": str(e)}}), 400
+
+def _batch_payloads():
+    """
+    Liest und validiert alle Batch-Items → (payloads, projektion, docs_format, None)
+    oder (None, None, None, Fehlerantwort).
+    """
+    try:
+        daten = json.loads(request.data or b"null")
+        projektion = projektion_aus(daten if isinstance(daten, dict) else {}, request.args)
+        docs_format = docs_format_aus(daten if isinstance(daten, dict) else {}, request.args)
+    except Exception as e:
+        return None, None, None, (jsonify({"error": {"code": "INVALID_INPUT", "message": f"Kein gültiges JSON: {e}"}}), 400)
+
+    items = daten.get("items") if isinstance(daten, dict) else daten
+    if not isinstance(items, list) or not items:
+        return None, None, None, (jsonify({"error": {"code": "INVALID_INPUT", "message": "items muss eine nicht-leere Liste sein."}}), 400)
+    if len(items) > MAX_BATCH_ITEMS:
+        return None, None, None, (jsonify({"error": {"code": "INVALID_INPUT", "message": f"Maximal {MAX_BATCH_ITEMS} Einträge je Batch."}}), 400)
+
+    payloads = []
+    fehler = []
+    for i, item in enumerate(items):
+        try:
+            payload = KonstruktionInput.model_validate(item).model_dump()
+            pruefe_payload(payload)
+            payloads.append(payload)
+        except Exception as e:
+            fehler.append({"index": i, "message": str(e)})
+    if fehler:
+        return None, None, None, (jsonify({"error": {
+            "code": "INVALID_INPUT",
+            "message": f"{len(fehler)} von {len(items)} Einträgen ungültig.",
+            "items": fehler,
+        }}), 400)
+    return payloads, projektion, docs_format, None
+
+def _batch_eintrag(ok, eintrag, projektion=None, payload=None, docs_format=None):
+    if not ok:
+        return {"ok": False, "error": eintrag}
     try:
-        data = KonstruktionInput.model_validate_json(request.data)
-        payload = data.model_dump()
-        resp = berechne_konstruktion(payload)
-        return jsonify(Result(**resp).model_dump())
+        result_id = ergebnis_store.registrieren(payload) if payload is not None else None
+        return {"ok": True, "result": _result_dump(eintrag, projektion, result_id, docs_format)}
     except Exception as e:
-        return jsonify({"error": {"code": "INVALID_INPUT", "message": str(e)}}), 400
\ No newline at end of file
+        return {"ok": False, "error": {"code": "INVALID_OUTPUT", "message": str(e)}}
+
+def _will_ndjson() -> bool:
+    return (request.args.get("stream") or "").lower() in ("1", "true", "ndjson") \
+        or "application/x-ndjson" in (request.headers.get("Accept") or "")
+
+@bp_v1.post("/konstruktion/berechnen-batch")
+def konstruktion_berechnen_batch():
+    """
+    Body: {"items": [KonstruktionInput, ...]} (oder direkt die Liste).
+    Alle Items werden vorab validiert (Fehler → 400 mit Index je Item, es wird nichts gerechnet),
+    dann im Prozess-Pool gerechnet. Antwort: {"results": [{"ok": true, "result": ...} |
+    {"ok": false, "error": {...}}]} in Eingabereihenfolge.
+
+    Mit ?stream=ndjson (oder Accept: application/x-ndjson): application/x-ndjson, eine Zeile
+    {"index": i, "ok": ..., "result"|"error": ...} je Item, sobald es fertig ist
+    (Reihenfolge = Fertigstellung, nicht Eingabe). Jedes Item ist dabei ein eigener Worker-Auftrag;
+    Items gleicher Geometrie teilen sich je Worker weiterhin die Konstruktion.
+
+    Projektion und docs_format wie bei /konstruktion/berechnen (Body-Top-Level oder Query), gelten für alle Items.
+    """
+    payloads, projektion, docs_format, fehler = _batch_payloads()
+    if fehler is not None:
+        return fehler
+
+    if _will_ndjson():
+        def zeilen():
+            for i, ok, eintrag in berechne_batch_iter(payloads, paket_max=1, projektion=projektion):
+                yield ergebnis_json({"index": i, **_batch_eintrag(ok, eintrag, projektion, payloads[i], docs_format)},
+                                    sort_keys=True, json_sicher=True) + b"\n"
+        return Response(stream_with_context(zeilen()), mimetype="application/x-ndjson")
+
+    return ergebnis_antwort({"results": [
+        _batch_eintrag(ok, eintrag, projektion, payload, docs_format)
+        for payload, (ok, eintrag) in zip(payloads, berechne_batch(payloads, projektion=projektion))
+    ]})
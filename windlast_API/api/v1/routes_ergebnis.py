@@ -0,0 +1,42 @@
+from flask import request, jsonify
+from . import bp_v1
+from .schemas import ergebnis_antwort
+from core_adapter.ergebnis_store import ergebnis_store
+from core_adapter.projektion import NORM_AUS_KEY
+from core_adapter.docs_spalten import docs_format_aus, docs_spaltenweise
+
+NACHWEIS_SICHTEN = ("KIPP", "GLEIT", "ABHEBE", "BALLAST", "BASIS", "LOADS")
+
+@bp_v1.get("/ergebnis/<result_id>/docs")
+def ergebnis_docs(result_id):
+    """
+    Drill-down: Docs einer Norm zu meta.result_id einer Berechnung.
+    Query: norm=<API-Norm-Key> (Pflicht), szenario=<Alternative>, nachweis=KIPP|GLEIT|ABHEBE|BALLAST|BASIS|LOADS,
+    windrichtung=<Grad>, docs_format=columnar (spaltenweiser Block statt Liste).
+    Docs werden beim ersten Abruf je Norm mit voller Dokumentation nachgerechnet.
+    """
+    norm = request.args.get("norm") or ""
+    if norm not in NORM_AUS_KEY:
+        return jsonify({"error": {"code": "INVALID_INPUT", "message": f"norm muss einer von {', '.join(NORM_AUS_KEY)} sein."}}), 400
+    nachweis = (request.args.get("nachweis") or "").upper() or None
+    if nachweis is not None and nachweis not in NACHWEIS_SICHTEN:
+        return jsonify({"error": {"code": "INVALID_INPUT", "message": f"nachweis muss einer von {', '.join(NACHWEIS_SICHTEN)} sein."}}), 400
+    try:
+        windrichtung = float(request.args["windrichtung"]) if request.args.get("windrichtung") else None
+    except ValueError:
+        return jsonify({"error": {"code": "INVALID_INPUT", "message": "windrichtung muss eine Zahl (Grad) sein."}}), 400
+    szenario = request.args.get("szenario") or None
+    try:
+        docs_format = docs_format_aus(request.args)
+    except ValueError as e:
+        return jsonify({"error": {"code": "INVALID_INPUT", "message": str(e)}}), 400
+
+    try:
+        docs = ergebnis_store.docs(result_id, norm, szenario=szenario, nachweis=nachweis, windrichtung=windrichtung)
+    except Exception as e:
+        return jsonify({"error": {"code": "CALCULATION_FAILED", "message": str(e)}}), 500
+    if docs is None:
+        return jsonify({"error": {"code": "NOT_FOUND", "message": f"Ergebnis {result_id} unbekannt oder abgelaufen."}}), 404
+    if docs_format is not None:
+        docs = docs_spaltenweise(docs)
+    return ergebnis_antwort({"result_id": result_id, "norm": norm, "szenario": szenario, "docs": docs})
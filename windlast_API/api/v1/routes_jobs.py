@@ -0,0 +1,63 @@
+import json
+from flask import current_app, request, jsonify
+from . import bp_v1
+from .schemas import ergebnis_antwort
+from .routes_berechnung import antwort_cachen, berechnung_lesen, cache_umgehen
+from core_adapter.ergebnis_cache import ergebnis_cache
+from core_adapter.jobs import jobs, WarteschlangeVoll
+
+RETRY_AFTER_S = 5
+
+@bp_v1.post("/jobs")
+def job_starten():
+    """
+    Body und Query wie /konstruktion/berechnen (Projektion, docs_format, meta.result_id für den Drill-down,
+    "Cache-Control: no-cache"). Liegt das Ergebnis schon im Ergebnis-Cache, ist der Job sofort "done";
+    sonst landet das fertige Ergebnis dort auch für /konstruktion/berechnen.
+    Antwort 202 {"job_id", "status"}; 429 wenn die Warteschlange voll ist.
+    """
+    try:
+        daten = json.loads(request.data or b"null")
+        payload, projektion, docs_format, schluessel, result_id = berechnung_lesen(daten, request.args, pruefen=True)
+    except Exception as e:
+        return jsonify({"error": {"code": "INVALID_INPUT", "message": str(e)}}), 400
+
+    if not cache_umgehen():
+        body, _ = ergebnis_cache.get(schluessel)
+        if body is not None:
+            return _angenommen(jobs.abgeschlossen(json.loads(body)))
+
+    app = current_app._get_current_object()
+    def nachbereiten(resp):
+        # Im Job-Thread: App-Kontext für die gleichen Antwort-Bytes wie /konstruktion/berechnen
+        with app.app_context():
+            ergebnis, _ = antwort_cachen(resp, projektion, docs_format, schluessel, result_id)
+        return ergebnis
+
+    try:
+        job = jobs.einreihen(payload, nachbereiten=nachbereiten, projektion=projektion)
+    except WarteschlangeVoll as e:
+        resp = jsonify({"error": {"code": "QUEUE_FULL", "message": str(e)}})
+        resp.headers["Retry-After"] = str(RETRY_AFTER_S)
+        return resp, 429
+    return _angenommen(job)
+
+def _angenommen(job):
+    resp = jsonify({"job_id": job.id, "status": job.status})
+    resp.headers["Location"] = f"{request.path.rstrip('/')}/{job.id}"
+    return resp, 202
+
+@bp_v1.get("/jobs/<job_id>")
+def job_status(job_id):
+    """Status (queued|running|done|error|cancelled), Fortschritt und – wenn fertig – Ergebnis."""
+    job = jobs.holen(job_id)
+    if job is None:
+        return jsonify({"error": {"code": "NOT_FOUND", "message": f"Job {job_id} unbekannt."}}), 404
+    return ergebnis_antwort(job.als_dict())
+
+@bp_v1.delete("/jobs/<job_id>")
+def job_abbrechen(job_id):
+    job = jobs.abbrechen(job_id)
+    if job is None:
+        return jsonify({"error": {"code": "NOT_FOUND", "message": f"Job {job_id} unbekannt."}}), 404
+    return ergebnis_antwort(job.als_dict(), 202)
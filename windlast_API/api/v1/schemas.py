@@ -1,3 +1,9 @@
+import logging
+import os
+
+from flask import Response, current_app, has_app_context
+
+from windlast_CORE.datenstruktur.ergebnis_json import ergebnis_json
 from pydantic import BaseModel, Field, PositiveFloat
 from typing import Literal, Dict, Any, List, Optional
 
@@ -44,6 +50,9 @@ class KonstruktionInput(BaseModel):
     konstruktion: Dict[str, Any]  # Platzhalter für beliebige Konstruktion-Daten aus UI-Build
     aufstelldauer: DauerInput | None = None
     windzone: str  # Windzone Enum-Name (z.B. "III_Binnenland")
+    dokumentation: Literal["none", "relevant", "full"] = "full"  # "none" → nur Zahlen, keine Docs
+    richtungsstrategie: Literal["RASTER", "ADAPTIV"] = "RASTER"  # RichtungsStrategie-Name
+    doc_aufbewahrung: Literal["alle", "gewinner"] = "alle"  # "gewinner" → unterlegene Richtungen nur zusammengefasst
 
 # =========================
 # Output-Modelle
@@ -72,17 +81,17 @@ class ResultMessage(BaseModel):
 
 class ResultNormAltVals(BaseModel):
     anzeigename: Optional[str] = None
-    kipp:    NumberLike
-    gleit:   NumberLike
-    abhebe:  NumberLike
+    kipp:    NumberLike = None  # Default nur für projizierte Antworten (fields=/nachweis=)
+    gleit:   NumberLike = None
+    abhebe:  NumberLike = None
     ballast: NumberLike = None  # kg
     messages: List[ResultMessage] = Field(default_factory=list)
     docs: List[ResultDoc] = Field(default_factory=list)
 
 class ResultNormVals(BaseModel):
-    kipp:    NumberLike
-    gleit:   NumberLike
-    abhebe:  NumberLike
+    kipp:    NumberLike = None  # Default nur für projizierte Antworten (fields=/nachweis=)
+    gleit:   NumberLike = None
+    abhebe:  NumberLike = None
     ballast: NumberLike = None  # kg
     alternativen: Dict[str, ResultNormAltVals] | None = None  # z.B. {"IN_BETRIEB": {...}}
     # NEU: flache Nachrichtenliste pro Norm (Text, Severity, Kontext)
@@ -92,3 +101,65 @@ class ResultNormVals(BaseModel):
 class Result(BaseModel):
     normen: Dict[str, ResultNormVals]
     meta: Dict[str, Any]
+
+# =========================
+# Ausgabe ohne Revalidierung
+# =========================
+# build_api_output liefert bereits schemakonforme Dicts (Docs/Messages mit allen Feldern).
+# result_dump gibt dasselbe aus wie Result(**resp).model_dump(...), ergänzt aber nur fehlende
+# Felder auf Norm-/Alternativen-Ebene statt jedes Doc neu zu validieren. Validiert wird nur
+# im Debug-/Testbetrieb (app.debug/testing oder WINDLAST_OUTPUT_VALIDIEREN=1).
+
+OUTPUT_VALIDIEREN = os.environ.get("WINDLAST_OUTPUT_VALIDIEREN", "") == "1"
+
+def _felder(model) -> tuple:
+    # (Name, Default-Fabrik) in Feldreihenfolge des Modells
+    return tuple(
+        (name, f.default_factory if f.default_factory is not None else (lambda d=f.default: d))
+        for name, f in model.model_fields.items()
+    )
+
+_NORM_FELDER = _felder(ResultNormVals)
+_ALT_FELDER = _felder(ResultNormAltVals)
+
+def _validieren() -> bool:
+    return OUTPUT_VALIDIEREN or (has_app_context() and (current_app.debug or current_app.testing))
+
+def _ebene(d: Dict[str, Any], felder: tuple, projiziert: bool) -> Dict[str, Any]:
+    if projiziert:
+        return {name: d[name] for name, _ in felder if name in d}
+    return {name: (d[name] if name in d else default()) for name, default in felder}
+
+def _result_vertraut(resp: Dict[str, Any], projiziert: bool) -> Dict[str, Any]:
+    normen = {}
+    for key, norm in resp["normen"].items():
+        out = _ebene(norm, _NORM_FELDER, projiziert)
+        if out.get("alternativen") is not None:
+            out["alternativen"] = {name: _ebene(alt, _ALT_FELDER, projiziert) for name, alt in out["alternativen"].items()}
+        normen[key] = out
+    return {"normen": normen, "meta": resp["meta"]}
+
+def result_dump(resp: Dict[str, Any], *, projiziert: bool = False) -> Dict[str, Any]:
+    """
+    Ausgabe von build_api_output als Result-Dict (projiziert → nur gesetzte Felder, wie exclude_unset).
+    Im Debug-/Testbetrieb wird zusätzlich über das Result-Modell validiert und verglichen.
+    """
+    vertraut = _result_vertraut(resp, projiziert)
+    if not _validieren():
+        return vertraut
+    geprueft = Result(**resp).model_dump(exclude_unset=projiziert)
+    if geprueft != vertraut:
+        logging.warning("result_dump: vertraute Ausgabe weicht von Result.model_dump ab")
+    return geprueft
+
+def ergebnis_antwort(obj: Any, status: int = 200) -> Response:
+    """
+    Wie jsonify(obj), aber über ergebnis_json (C-Encoder für die JSON-sichere Mapper-Ausgabe,
+    sonst ein Durchlauf mit Enums/Vec3/INF/NaN). Einstellungen vom App-JSON-Provider
+    (sort_keys, ensure_ascii; im Debug eingerückt) → gleiche Bytes wie jsonify.
+    """
+    provider = current_app.json
+    kompakt = provider.compact if provider.compact is not None else not current_app.debug
+    body = ergebnis_json(obj, sort_keys=provider.sort_keys, ensure_ascii=provider.ensure_ascii,
+                         indent=None if kompakt else 2, json_sicher=True)
+    return current_app.response_class(body + b"\n", status=status, mimetype=provider.mimetype)
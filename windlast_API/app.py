@@ -16,7 +16,7 @@ for p in (str(ROOT), str(CORE_DIR), str(API_DIR)):
         sys.path.insert(0, p)
 # -------------------------------------------------------------------------
 
-import socket, time, webbrowser
+import multiprocessing, socket, time, webbrowser
 from threading import Thread
 from flask import Flask, send_from_directory, abort
 from api.v1 import bp_v1  # klappt jetzt, weil ROOT/API/CORE im sys.path sind
@@ -174,6 +174,9 @@ def open_browser_when_ready(url, host, port):
             pass
 
 if __name__ == "__main__":
+    # .exe (PyInstaller): Batch-/Prozess-Worker starten per spawn diese Datei erneut –
+    # freeze_support() übernimmt dort den Worker, statt Flask/Browser ein zweites Mal zu starten
+    multiprocessing.freeze_support()
     app = create_app()
     port = find_free_port() or 5000
     url = f"http://127.0.0.1:{port}"
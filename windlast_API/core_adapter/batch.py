@@ -0,0 +1,116 @@
+"""
+Batch-Rechenpfad für /konstruktion/berechnen-batch:
+- derselbe warme Prozess-Pool wie executor="processes" (rechenfunktionen/ausfuehrung.py),
+  also ein Satz Worker je API-Prozess, Katalog in jedem Worker vorgeladen
+- Items mit gleicher Geometrie werden zusammen in einem Worker gerechnet und teilen sich
+  die Konstruktion samt ihrer Caches (Kippgeometrie, Symmetrie) sowie den LastCache des Workers
+- jeder Worker merkt sich die zuletzt gebaute Konstruktion → auch Einzel-Aufträge derselben
+  Geometrie bauen sie nicht neu
+- Ergebnisse in Eingabereihenfolge, Fehler je Item
+- berechne_batch_iter: Ergebnisse sobald fertig (für NDJSON-Streaming), je Item mit Index
+"""
+import json
+import math
+import os
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from windlast_CORE.rechenfunktionen.ausfuehrung import prozess_pool, prozess_pool_verwerfen
+
+from .generic import _build_konstruktion_from_payload, berechne_konstruktion
+from .projektion import Projektion
+
+# Standard = Anzahl CPUs wie bei executor="processes" → beide nutzen denselben Pool
+BATCH_WORKERS = int(os.environ.get("WINDLAST_BATCH_WORKERS", "0")) or (os.cpu_count() or 1)
+
+# Im Worker: zuletzt gebaute Konstruktion (Gruppenschlüssel, Konstruktion)
+_worker_konstruktion: Optional[Tuple[str, Any]] = None
+
+def batch_gruppenschluessel(payload: Dict[str, Any]) -> str:
+    """Kanonische Form von payload['konstruktion'] → Items mit gleichem Schlüssel teilen sich die Konstruktion."""
+    return json.dumps(payload.get("konstruktion"), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+def _konstruktion_fuer(payload: Dict[str, Any]) -> Any:
+    global _worker_konstruktion
+    schluessel = batch_gruppenschluessel(payload)
+    if _worker_konstruktion is None or _worker_konstruktion[0] != schluessel:
+        _worker_konstruktion = None
+        _worker_konstruktion = (schluessel, _build_konstruktion_from_payload(payload["konstruktion"]))
+    return _worker_konstruktion[1]
+
+def _fehler(e: Exception) -> Dict[str, Any]:
+    return {"code": "CALCULATION_FAILED", "message": str(e)}
+
+def berechne_gruppe(payloads: List[Dict[str, Any]],
+                    projektion: Optional[Projektion] = None) -> List[Tuple[bool, Dict[str, Any]]]:
+    """Rechnet Items gleicher Geometrie nacheinander mit derselben Konstruktion. Rückgabe je Item (ok, Ergebnis|Fehler)."""
+    try:
+        konstruktion = _konstruktion_fuer(payloads[0])
+    except Exception as e:
+        return [(False, _fehler(e)) for _ in payloads]
+
+    ergebnisse: List[Tuple[bool, Dict[str, Any]]] = []
+    for payload in payloads:
+        try:
+            ergebnisse.append((True, berechne_konstruktion(payload, konstruktion=konstruktion, projektion=projektion)))
+        except Exception as e:
+            ergebnisse.append((False, _fehler(e)))
+    return ergebnisse
+
+def _pakete(payloads: List[Dict[str, Any]], paket_max: Optional[int]) -> List[List[int]]:
+    gruppen: Dict[str, List[int]] = {}
+    for i, payload in enumerate(payloads):
+        gruppen.setdefault(batch_gruppenschluessel(payload), []).append(i)
+
+    # Große Gruppen aufteilen, damit alle Worker beschäftigt sind (LastCache je Worker bleibt geteilt)
+    max_je_auftrag = max(1, math.ceil(len(payloads) / BATCH_WORKERS))
+    if paket_max is not None:
+        max_je_auftrag = min(max_je_auftrag, max(1, paket_max))
+    return [
+        indizes[k:k + max_je_auftrag]
+        for indizes in gruppen.values()
+        for k in range(0, len(indizes), max_je_auftrag)
+    ]
+
+def berechne_batch_iter(payloads: List[Dict[str, Any]], *, paket_max: Optional[int] = None,
+                        projektion: Optional[Projektion] = None) -> Iterator[Tuple[int, bool, Dict[str, Any]]]:
+    """
+    Wie berechne_batch, liefert aber (Index, ok, Ergebnis|Fehler) in Fertigstellungsreihenfolge.
+    paket_max begrenzt die Items je Worker-Auftrag; mit paket_max=1 kommt jedes Item, sobald es selbst fertig ist.
+    Bricht der Pool weg, werden nur die noch offenen Aufträge einmal wiederholt. Wird der
+    Generator vorzeitig geschlossen (Client weg), werden noch wartende Aufträge gestrichen.
+    """
+    offen = _pakete(payloads, paket_max)
+    for versuch in range(2):
+        pool = prozess_pool(BATCH_WORKERS)
+        auftraege = {pool.submit(berechne_gruppe, [payloads[i] for i in indizes], projektion): k for k, indizes in enumerate(offen)}
+        fertig = set()
+        try:
+            for future in as_completed(auftraege):
+                k = auftraege[future]
+                gruppen_ergebnis = future.result()
+                fertig.add(k)
+                for i, (ok, eintrag) in zip(offen[k], gruppen_ergebnis):
+                    yield i, ok, eintrag
+            return
+        except BrokenProcessPool:
+            # Worker abgestürzt (z.B. OOM) → Pool neu aufsetzen und Rest einmal wiederholen
+            if versuch:
+                raise
+            prozess_pool_verwerfen(BATCH_WORKERS, pool)
+            offen = [indizes for k, indizes in enumerate(offen) if k not in fertig]
+        finally:
+            for future in auftraege:
+                future.cancel()
+
+def berechne_batch(payloads: List[Dict[str, Any]], *,
+                   projektion: Optional[Projektion] = None) -> List[Tuple[bool, Dict[str, Any]]]:
+    """
+    Verteilt die (bereits validierten) Payloads gruppiert nach Geometrie auf den warmen Pool.
+    Rückgabe in Eingabereihenfolge: (True, Ergebnis) bzw. (False, {"code", "message"}).
+    """
+    ergebnisse: List[Optional[Tuple[bool, Dict[str, Any]]]] = [None] * len(payloads)
+    for i, ok, eintrag in berechne_batch_iter(payloads, projektion=projektion):
+        ergebnisse[i] = (ok, eintrag)
+    return ergebnisse
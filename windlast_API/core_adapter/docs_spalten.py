@@ -0,0 +1,167 @@
+"""
+Spaltenweises Doc-Format (docs_format=columnar).
+
+Statt einer Liste voll ausgeschriebener Docs je Norm/Alternative ein Block mit
+- table:        Werte-Tabelle (Titel, Einheiten, Formeln, Quellen, Symbol-/Item-Listen, Kontextwerte, Rollen),
+                jeder Wert genau einmal
+- context_keys: Schlüssellisten der Kontexte (je Schlüsselsatz einmal)
+- contexts:     [Schlüsselsatz-Index, Tabellen-Index je Schlüssel ...] (gleiche Kontexte einmal)
+- columns:      je Doc-Feld eine Spalte; value roh, alle anderen als Tabellen-Index (null = None),
+                context → Index in contexts, role → Tabellen-Index von context.rolle_pro_nachweis
+
+Dekodiert wird im UI (static/js/ergebnis_zerlegen.js, ResultsIndex.decodeDocs) erst bei Bedarf.
+"""
+from typing import Any, Dict, List, Mapping, Optional
+
+DOCS_FORMAT = "columnar"
+
+# Doc-Felder in Ausgabereihenfolge (ResultDoc); value bleibt roh, context/role gesondert
+_INDEX_FELDER = ("title", "unit", "formula", "formula_source", "symbols", "symbols_source", "items", "items_source")
+_KOPF_FELDER = ("title", "unit", "formula", "formula_source")   # Strings, wiederholen sich gemeinsam
+_ROLLE = "rolle_pro_nachweis"
+_SKALARE = (float, bool)
+
+class _Tabelle:
+    """Interniert JSON-Werte: gleiche Werte (nach Typ und Inhalt) → gleicher Index."""
+    __slots__ = ("werte", "_index", "_ganz")
+
+    def __init__(self) -> None:
+        self.werte: List[Any] = []
+        # str direkt; Zahlen/bool als (Typ, Wert), sonst 1 == 1.0 == True; flache Listen/Dicts als
+        # Tupel samt Elementtypen, verschachtelte über repr (unterscheidet 1/1.0/True/"1")
+        self._index: Dict[Any, int] = {}
+        self._ganz: Dict[int, int] = {}   # int (exakter Typ) → Index, häufig in Kontexten
+
+    def index(self, v: Any) -> Optional[int]:
+        if v is None:
+            return None
+        t = type(v)
+        if t is int:
+            i = self._ganz.get(v)
+            if i is None:
+                i = self._ganz[v] = len(self.werte)
+                self.werte.append(v)
+            return i
+        if t is str:
+            schluessel = v
+        elif t in _SKALARE:
+            schluessel = (t, v)
+        elif t is list or t is tuple:
+            schluessel = (list, tuple(v), tuple(map(type, v)))
+            try:
+                hash(schluessel)
+            except TypeError:   # verschachtelt
+                schluessel = (list, repr(v))
+        elif t is dict:
+            schluessel = (dict, tuple(v.items()), tuple(map(type, v.values())))
+            try:
+                hash(schluessel)
+            except TypeError:
+                schluessel = (dict, repr(v))
+        else:
+            schluessel = (t, repr(v))
+        i = self._index.get(schluessel)
+        if i is None:
+            i = self._index[schluessel] = len(self.werte)
+            self.werte.append(v)
+        return i
+
+def docs_spaltenweise(docs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Doc-Liste (aus build_api_output) → spaltenweiser Block (siehe Modul-Doku)."""
+    tabelle = _Tabelle()
+    index = tabelle.index
+    texte = tabelle._index
+    ganz = tabelle._ganz
+    schluessel_saetze: Dict[tuple, int] = {}
+    kontexte: Dict[tuple, int] = {}
+    koepfe: Dict[tuple, tuple] = {}   # (title, unit, formula, formula_source) → Indizes
+    rollen_cache: Dict[tuple, int] = {}
+
+    spalten: Dict[str, List[Any]] = {feld: [] for feld in _INDEX_FELDER}
+    kopf_spalten = [spalten[feld].append for feld in _KOPF_FELDER]
+    listen = [(feld, spalten[feld].append) for feld in _INDEX_FELDER if feld not in _KOPF_FELDER]
+    werte: List[Any] = []
+    kontext_spalte: List[int] = []
+    rollen: List[Optional[int]] = []
+
+    for d in docs:
+        kopf = (d.get("title"), d.get("unit"), d.get("formula"), d.get("formula_source"))
+        ix = koepfe.get(kopf)
+        if ix is None:
+            ix = koepfe[kopf] = tuple(index(v) for v in kopf)
+        for anhaengen, i in zip(kopf_spalten, ix):
+            anhaengen(i)
+        for feld, anhaengen in listen:
+            v = d.get(feld)
+            anhaengen(None if v is None else index(v))
+        werte.append(d.get("value"))
+
+        # Kontext: rolle_pro_nachweis gesondert (Spalte role), Rest als ganzer Kontext interniert
+        ctx = d.get("context") or {}
+        schluessel, kwerte = tuple(ctx), tuple(ctx.values())
+        rolle = ctx.get(_ROLLE)
+        if rolle is None:
+            rollen.append(None)
+        else:
+            try:
+                rk = (tuple(rolle.items()), tuple(map(type, rolle.values())))
+                ri = rollen_cache.get(rk)
+                if ri is None:
+                    ri = rollen_cache[rk] = index(rolle)
+            except (AttributeError, TypeError):   # kein flaches Dict
+                ri = index(rolle)
+            rollen.append(ri)
+            if schluessel[-1] == _ROLLE:   # vom Mapper zuletzt gesetzt
+                schluessel, kwerte = schluessel[:-1], kwerte[:-1]
+            else:
+                schluessel = tuple(k for k in ctx if k != _ROLLE)
+                kwerte = tuple(ctx[k] for k in schluessel)
+
+        ks = schluessel_saetze.get(schluessel)
+        if ks is None:
+            ks = schluessel_saetze[schluessel] = len(schluessel_saetze)
+        eintrag = [ks]
+        for v in kwerte:
+            t = type(v)
+            i = texte.get(v) if t is str else (ganz.get(v) if t is int else None)
+            eintrag.append(i if i is not None or v is None else index(v))
+        eintrag = tuple(eintrag)
+        ki = kontexte.get(eintrag)
+        if ki is None:
+            ki = kontexte[eintrag] = len(kontexte)
+        kontext_spalte.append(ki)
+
+    spalten["value"] = werte
+    spalten["context"] = kontext_spalte
+    spalten["role"] = rollen
+    return {
+        "format": DOCS_FORMAT,
+        "count": len(docs),
+        "table": tabelle.werte,
+        "context_keys": [list(s) for s in schluessel_saetze],
+        "contexts": [list(e) for e in kontexte],
+        "columns": spalten,
+    }
+
+def docs_format_aus(*quellen: Mapping[str, Any]) -> Optional[str]:
+    """docs_format aus Body/Query (später überschreibt früher): "columnar" oder None (Objektliste wie bisher)."""
+    wert = None
+    for quelle in quellen:
+        if quelle.get("docs_format") not in (None, ""):
+            wert = quelle.get("docs_format")
+    if wert is None or wert == "objects":
+        return None
+    if wert != DOCS_FORMAT:
+        raise ValueError(f"Unbekanntes docs_format: {wert!r} (erlaubt: objects, {DOCS_FORMAT})")
+    return wert
+
+def ergebnis_docs_spaltenweise(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Ersetzt in einer Result-Ausgabe alle Doc-Listen (Normen und Alternativen) durch Blöcke; in place."""
+    for norm in (result.get("normen") or {}).values():
+        if isinstance(norm.get("docs"), list):
+            norm["docs"] = docs_spaltenweise(norm["docs"])
+        for alt in (norm.get("alternativen") or {}).values():
+            if isinstance(alt.get("docs"), list):
+                alt["docs"] = docs_spaltenweise(alt["docs"])
+    result["meta"]["docs_format"] = DOCS_FORMAT
+    return result
@@ -0,0 +1,188 @@
+"""
+Ergebnis-Cache für /konstruktion/berechnen:
+- Schlüssel: SHA-256 über den kanonischen (validierten) Payload + Katalog-Spec-Version
+  + Engine-Version + Physik-Konstanten
+- Werte: fertige Antwort-Bytes (identisch zur frisch gerechneten Antwort)
+- In-Memory-LRU (höchstens ERGEBNIS_CACHE_MAX Einträge und ERGEBNIS_CACHE_BYTES Bytes; einzelne
+  Antworten über dem Byte-Budget bleiben nicht im RAM), optional SQLite auf Platte
+  (WINDLAST_ERGEBNIS_CACHE_DB=<Pfad>, höchstens ERGEBNIS_CACHE_DB_MAX Einträge)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from windlast_CORE.datenstruktur.konstanten import aktuelle_konstanten
+from windlast_CORE.materialdaten.catalog import catalog
+
+ERGEBNIS_CACHE_MAX = int(os.environ.get("WINDLAST_ERGEBNIS_CACHE_MAX", "256"))
+ERGEBNIS_CACHE_BYTES = int(os.environ.get("WINDLAST_ERGEBNIS_CACHE_BYTES", str(128 * 1024 * 1024)))
+ERGEBNIS_CACHE_DB = os.environ.get("WINDLAST_ERGEBNIS_CACHE_DB", "")
+ERGEBNIS_CACHE_DB_MAX = int(os.environ.get("WINDLAST_ERGEBNIS_CACHE_DB_MAX", "5000"))
+
+_engine_version: Optional[str] = None
+
+def engine_version() -> str:
+    """
+    Inhalts-Hash des Rechenkerns (windlast_CORE + Adapter + Schemas). In der EXE liegen keine
+    Quelltexte vor → Pfad + Zeitstempel der EXE (Code ändert sich nur mit neuer EXE).
+    """
+    global _engine_version
+    if _engine_version is None:
+        api = Path(__file__).resolve().parents[1]
+        dateien = sorted((api.parent / "windlast_CORE").rglob("*.py"))
+        dateien += sorted((api / "core_adapter").glob("*.py"))
+        dateien.append(api / "api" / "v1" / "schemas.py")
+        h = hashlib.sha1()
+        gefunden = False
+        for datei in dateien:
+            if datei.is_file():
+                gefunden = True
+                h.update(datei.relative_to(api.parent).as_posix().encode("utf-8"))
+                h.update(datei.read_bytes())
+        if not gefunden:
+            h.update(f"{sys.executable}:{os.path.getmtime(sys.executable)}".encode("utf-8"))
+        _engine_version = h.hexdigest()[:16]
+    return _engine_version
+
+def ergebnis_schluessel(payload: Dict[str, Any], projektion: Optional[Dict[str, Any]] = None) -> str:
+    """projektion: Projektion.als_dict() bei projizierten Antworten (None → volle Antwort)."""
+    kanonisch = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    h = hashlib.sha256(kanonisch.encode("utf-8"))
+    if projektion is not None:
+        h.update(json.dumps(projektion, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    h.update(f"|{catalog.spec_version}|{engine_version()}|{aktuelle_konstanten()!r}".encode("utf-8"))
+    return h.hexdigest()
+
+class _SqliteSpeicher:
+    def __init__(self, pfad: str, maxsize: int) -> None:
+        Path(pfad).parent.mkdir(parents=True, exist_ok=True)
+        self.maxsize = maxsize
+        self._con = sqlite3.connect(pfad, check_same_thread=False, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS ergebnisse ("
+            " schluessel TEXT PRIMARY KEY, body BLOB NOT NULL, zugriff REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            zeile = self._con.execute("SELECT body FROM ergebnisse WHERE schluessel=?", (key,)).fetchone()
+            if zeile is None:
+                return None
+            self._con.execute("UPDATE ergebnisse SET zugriff=? WHERE schluessel=?", (time.time(), key))
+            return bytes(zeile[0])
+
+    def put(self, key: str, body: bytes) -> None:
+        with self._lock:
+            self._con.execute(
+                "INSERT OR REPLACE INTO ergebnisse (schluessel, body, zugriff) VALUES (?, ?, ?)",
+                (key, body, time.time()),
+            )
+            self._con.execute(
+                "DELETE FROM ergebnisse WHERE schluessel IN ("
+                " SELECT schluessel FROM ergebnisse ORDER BY zugriff DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def clear(self) -> int:
+        with self._lock:
+            return self._con.execute("DELETE FROM ergebnisse").rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._con.execute("SELECT COUNT(*) FROM ergebnisse").fetchone()[0]
+
+class ErgebnisCache:
+    """
+    LRU über Antwort-Bytes mit Einträge- und Byte-Budget (verdrängt wird, bis beide eingehalten sind);
+    optional zweite Stufe auf Platte (Treffer dort wandern in den RAM).
+    """
+    def __init__(self, maxsize: int = ERGEBNIS_CACHE_MAX, db_pfad: str = ERGEBNIS_CACHE_DB,
+                 max_bytes: int = ERGEBNIS_CACHE_BYTES) -> None:
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._daten: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._platte: Optional[_SqliteSpeicher] = _SqliteSpeicher(db_pfad, ERGEBNIS_CACHE_DB_MAX) if db_pfad else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.too_large = 0
+
+    def _ablegen(self, key: str, body: bytes) -> None:
+        alt = self._daten.pop(key, None)
+        if alt is not None:
+            self.bytes -= len(alt)
+        if len(body) > self.max_bytes:
+            # würde den ganzen RAM-Cache verdrängen → nur auf Platte (falls vorhanden)
+            self.too_large += 1
+            return
+        self._daten[key] = body
+        self.bytes += len(body)
+        while len(self._daten) > self.maxsize or self.bytes > self.max_bytes:
+            _, verdraengt = self._daten.popitem(last=False)
+            self.bytes -= len(verdraengt)
+            self.evictions += 1
+
+    def get(self, key: str) -> Tuple[Optional[bytes], str]:
+        """(Body, Quelle) mit Quelle "memory" | "disk" | "" (Miss)."""
+        with self._lock:
+            body = self._daten.get(key)
+            if body is not None:
+                self._daten.move_to_end(key)
+                self.hits += 1
+                return body, "memory"
+        body = self._platte.get(key) if self._platte is not None else None
+        with self._lock:
+            if body is None:
+                self.misses += 1
+                return None, ""
+            self._ablegen(key, body)
+            self.disk_hits += 1
+            return body, "disk"
+
+    def put(self, key: str, body: bytes) -> None:
+        with self._lock:
+            self._ablegen(key, body)
+        if self._platte is not None:
+            self._platte.put(key, body)
+
+    def clear(self) -> Dict[str, int]:
+        with self._lock:
+            anzahl = len(self._daten)
+            self._daten.clear()
+            self.bytes = 0
+            self.hits = self.disk_hits = self.misses = self.evictions = self.too_large = 0
+        platte = self._platte.clear() if self._platte is not None else 0
+        return {"memory": anzahl, "disk": platte}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            aus: Dict[str, Any] = {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "too_large": self.too_large,
+                "size": len(self._daten),
+                "maxsize": self.maxsize,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+        aus["disk_size"] = len(self._platte) if self._platte is not None else None
+        aus["engine_version"] = engine_version()
+        aus["spec_version"] = catalog.spec_version
+        return aus
+
+# Prozessweiter Cache (analog zu lastcache)
+ergebnis_cache = ErgebnisCache()
@@ -3,6 +3,7 @@ from typing import Dict, Any, Mapping, Iterable
 from math import isfinite, isinf, isnan
 from dataclasses import is_dataclass, asdict
 from windlast_CORE.datenstruktur.enums import Norm, Nachweis
+from windlast_CORE.datenstruktur.zwischenergebnis import LazyDocBundle, kontext_flach
 
 # ---------------------------------------------------------------------------
 # Deduplikations-Konfiguration für Zwischenergebnisse
@@ -23,6 +24,8 @@ DEDUP_FIELDS = [
     "lastfall_index",
     "zone",
     "ref_nachweis",
+    "variabilitaet",
+    "ist_guenstig",
 ]
 
 # ---------- API keys ----------
@@ -42,8 +45,17 @@ def _to_primitive(obj):
     We do NOT touch numbers here (numbers go through _jsonify_number elsewhere),
     this is just to turn arbitrary context into JSON-safe primitives.
     """
-    if obj is None:
-        return None
+    # Schnellpfad für die häufigen exakten Typen (str-Enums wie Nachweis laufen unten über den Enum-Zweig)
+    t = type(obj)
+    if t is str or t is int or t is bool or obj is None:
+        return obj
+    if t is float:
+        return _jsonify_number(obj)
+    if t is dict:
+        return {(k if isinstance(k, str) else _enum_to_str(k)): _to_primitive(v)
+                for k, v in obj.items()}
+    if t is list or t is tuple:
+        return [_to_primitive(v) for v in obj]
     # --- Zahlen: hier ebenfalls absichern ---
     if isinstance(obj, float):
         return _jsonify_number(obj)
@@ -120,30 +132,22 @@ def _collect_messages_from_list(items: Iterable[Any], fallback_szenario: str | N
         })
     return out
 
-def _find_ballast_source_nachweis(docs: list[dict]) -> str | None:
-    """
-    Sucht das globale BALLAST-Dokument und liest daraus, welcher Nachweis
-    (`"KIPP"`, `"GLEIT"`, `"ABHEBE"`) den Ballast bestimmt.
-    """
-    for d in docs:
-        ctx = d.get("context") or {}
-        if ctx.get("nachweis") != "BALLAST":
-            continue
-        src = ctx.get("quelle_nachweis")
-        if src in ("KIPP", "GLEIT", "ABHEBE"):
-            return src
-    return None
-
-# ----- docs: (bundle, ctx) -> JSON -----
+# ----- docs: (bundle, ctx) -> JSON, ein Durchlauf mit Index -----
 
 _ROLE_ORDER = {"relevant": 3, "entscheidungsrelevant": 2, "irrelevant": 1, None: 0}
 
+_EINZEL = ("KIPP", "GLEIT", "ABHEBE")
+
+# Richtungszusammenfassung je Nachweis (Quelle der Richtungsrollen)
+_RICHTUNGS_DOC_TYPE = {"KIPP": "dir_min_sicherheit", "GLEIT": "dir_sicherheit", "ABHEBE": "dir_sicherheit"}
+
 def _normalize_doc_bundle(bundle, ctx):
     """
-    bundle: Mapping[str, Any] (siehe make_docbundle), ctx: dict
-    -> JSON-sicheres Dict
+    bundle: Mapping[str, Any] (siehe make_docbundle), ctx: Kontext/dict
+    -> JSON-sicheres Dict (verketteter Kontext wird erst hier flachgeklopft)
     """
-    b = dict(bundle or {})
+    # nur gelesen → dict/LazyDocBundle direkt, ohne Kopie
+    b = bundle if (type(bundle) is dict or isinstance(bundle, LazyDocBundle)) else dict(bundle or {})
     out = {
         "title": b.get("titel") or b.get("title"),
         "value": _to_primitive(b.get("wert")),
@@ -154,200 +158,161 @@ def _normalize_doc_bundle(bundle, ctx):
         "symbols_source": _to_primitive(b.get("quelle_formelzeichen")),
         "items": _to_primitive(b.get("einzelwerte")),
         "items_source": _to_primitive(b.get("quelle_einzelwerte")),
-        "context": _to_primitive(ctx or {}),
+        "context": _to_primitive(kontext_flach(ctx)),
     }
     return out
 
 def _make_dedup_key(doc: dict) -> tuple:
     ctx = doc.get("context") or {}
-
-    def _resolve(field: str):
+    key = []
+    for field in DEDUP_FIELDS:
         # Spezialfälle mit Normalisierung:
         if field == "title":
-            return doc.get("title")
-
-        if field == "szenario":
-            return ctx.get("szenario") or ctx.get("scenario")
-
-        if field == "element_id":
-            return ctx.get("element_id") or ctx.get("element_id_intern")
-
+            key.append(doc.get("title"))
+        elif field == "szenario":
+            key.append(ctx.get("szenario") or ctx.get("scenario"))
+        elif field == "element_id":
+            key.append(ctx.get("element_id") or ctx.get("element_id_intern"))
         # Generischer Fallback:
-        if field in ctx:
-            return ctx.get(field)
-        return doc.get(field)
-
-    return tuple(_resolve(f) for f in DEDUP_FIELDS)
-
-
-def _collect_docs_from_list(items):
-    """
-    items: List[Tuple[bundle, ctx]]
-    - normalisiert Bundles
-    - dedupliziert *nur* echte Duplikate über einen erweiterten Schlüssel:
-      (title, doc_type, nachweis, szenario, windrichtung_deg, achse_index, element_id, segment_index, ref_nachweis)
-      → Falls identisch, gewinnt die höhere Rolle (relevant > entscheidungsrelevant > irrelevant).
-    """
-    if not items:
-        return []
-
-    dedup = {}  # key -> doc
-    for bundle, ctx in items:
-        doc = _normalize_doc_bundle(bundle, ctx)
-        c = doc["context"] or {}
-        key = _make_dedup_key(doc)
-        role_new = (c.get("rolle") or c.get("role"))
-
-        if key in dedup:
-            role_old = (dedup[key]["context"] or {}).get("rolle")
-            if _ROLE_ORDER.get(role_new, 0) > _ROLE_ORDER.get(role_old, 0):
-                dedup[key] = doc
+        elif field in ctx:
+            key.append(ctx[field])
         else:
-            dedup[key] = doc
-
-    return list(dedup.values())
+            key.append(doc.get(field))
+    return tuple(key)
 
-def _build_richtungsrollen(docs: list[dict]) -> tuple[Dict[str, Dict[object, str]], str | None]:
+class _DocGruppe:
     """
-    Liest aus den vorhandenen dir-Docs die Rollen pro (Nachweis, Windrichtung) aus.
-    Ergebnis: z.B. {"KIPP": {0.0: "relevant"}, "GLEIT": {90.0: "entscheidungsrelevant"}, ...}
-    BALLAST übernimmt die Richtungsrollen des ballastkritischen Nachweises (quelle_nachweis).
+    Docs einer Gruppe (Hauptberechnung oder eine Alternative) in Ausgabereihenfolge + Index:
+    - richtungen[(nachweis, windrichtung)] = (Position, Rolle) der Richtungszusammenfassung
+      (bei mehreren gewinnt die letzte Position, wie beim sequentiellen Durchlauf)
+    - ballast_pos: Positionen der BALLAST-Docs (erstes mit quelle_nachweis bestimmt die Quelle)
     """
-    rollen_by: Dict[str, Dict[object, str]] = {
-        "KIPP": {},
-        "GLEIT": {},
-        "ABHEBE": {},
-        "BALLAST": {},
-    }
-    ballast_source: str | None = None
+    __slots__ = ("docs", "richtungen", "ballast_pos")
+
+    def __init__(self) -> None:
+        self.docs: list[dict] = []
+        self.richtungen: Dict[tuple, tuple] = {}
+        self.ballast_pos: list[int] = []
 
-    # 1) Rollen aus Richtungs-Top-Level-Docs für KIPP / GLEIT / ABHEBE auslesen
-    for d in docs:
-        ctx = d.get("context") or {}
+    def indexieren(self, pos: int, doc: dict) -> None:
+        ctx = doc["context"] or {}
         nachweis = ctx.get("nachweis")
-        doc_type = ctx.get("doc_type")
+        if nachweis == "BALLAST":
+            self.ballast_pos.append(pos)
+            return
         wdir = ctx.get("windrichtung_deg")
+        if wdir is None or nachweis not in _RICHTUNGS_DOC_TYPE or ctx.get("doc_type") != _RICHTUNGS_DOC_TYPE[nachweis]:
+            return
         rolle = ctx.get("rolle") or ctx.get("role")
+        if not rolle:
+            return
+        alt = self.richtungen.get((nachweis, wdir))
+        if alt is None or pos >= alt[0]:
+            self.richtungen[(nachweis, wdir)] = (pos, str(rolle).lower())
+
+    def ballast_quelle(self) -> str | None:
+        for pos in sorted(set(self.ballast_pos)):
+            qs = (self.docs[pos]["context"] or {}).get("quelle_nachweis")
+            if qs in _EINZEL:
+                return qs
+        return None
 
-        if nachweis == "BALLAST" and ballast_source is None:
-            qs = ctx.get("quelle_nachweis")
-            if qs in ("KIPP", "GLEIT", "ABHEBE"):
-                ballast_source = qs
-
-        if wdir is None:
-            continue
-        if rolle is not None:
-            rolle = str(rolle).lower()
-
-        # GLEIT / ABHEBE: dir_sicherheit ist die "Richtungszusammenfassung"
-        if nachweis == "GLEIT" and doc_type == "dir_sicherheit" and rolle:
-            rollen_by["GLEIT"][wdir] = rolle
-
-        if nachweis == "ABHEBE" and doc_type == "dir_sicherheit" and rolle:
-            rollen_by["ABHEBE"][wdir] = rolle
-
-        # KIPP: dir_min_sicherheit ist die maßgebende Richtungsinfo
-        if nachweis == "KIPP" and doc_type == "dir_min_sicherheit" and rolle:
-            rollen_by["KIPP"][wdir] = rolle
-
-    # 2) BALLAST-Richtungsrollen = Rollen des ballastkritischen Nachweises
-    if ballast_source:
-        src_map = rollen_by.get(ballast_source, {})
-        dst_map = rollen_by["BALLAST"]
-        for wdir, rolle in src_map.items():
-            dst_map[wdir] = rolle
+    def rollen_annotieren(self) -> None:
+        """
+        Schreibt für jedes Doc eine vollständige Map rolle_pro_nachweis in den Kontext.
+
+        - Grundlage ist IMMER die Rolle, die die Rechenfunktionen in ctx["rolle"] gesetzt haben.
+        - LOADS (und nachweislose Meta-Docs) ziehen je Nachweis die kritische Richtung mit
+          (Richtungsrolle == "relevant" → relevant, sonst irrelevant).
+        - BALLAST: jedes Doc bekommt für BALLAST die Rolle, die es für den ballastkritischen
+          Nachweis hat; End-Ballaste der unterlegenen Nachweise sind "entscheidungsrelevant".
+        """
+        ballast_source = self.ballast_quelle()
+        relevant_je_richtung: Dict[Any, list] = {}
+        for (nachweis, wdir), (_, rolle) in self.richtungen.items():
+            if rolle == "relevant":
+                relevant_je_richtung.setdefault(wdir, []).append(nachweis)
+
+        for d in self.docs:
+            ctx = d["context"] or {}
+            nachweis_doc = ctx.get("nachweis")
+
+            # --- BASIS: immer und überall relevant ----------------------
+            if nachweis_doc == "BASIS":
+                ctx["rolle_pro_nachweis"] = {"KIPP": "relevant", "GLEIT": "relevant", "ABHEBE": "relevant", "BALLAST": "relevant"}
+                d["context"] = ctx
+                continue
+
+            rel_map = {"KIPP": "irrelevant", "GLEIT": "irrelevant", "ABHEBE": "irrelevant", "BALLAST": "irrelevant"}
+            own_role = ctx.get("rolle") or ctx.get("role")
+            own_role = str(own_role).lower() if own_role is not None else None
+
+            # --- 1) Rolle für den "eigenen" Nachweis (aus der Rechenfunktion) ---
+            if nachweis_doc in _EINZEL or nachweis_doc == "BALLAST":
+                if own_role in ("relevant", "entscheidungsrelevant"):
+                    rel_map[nachweis_doc] = own_role
+
+            # --- 2) LOADS / globale Meta-Daten: kritische Richtung je Nachweis ---
+            elif nachweis_doc in ("LOADS", None):
+                wdir = ctx.get("windrichtung_deg")
+                if wdir is not None:
+                    for nz in relevant_je_richtung.get(wdir, ()):
+                        rel_map[nz] = "relevant"
+
+            # --- 3) BALLAST: copy/paste von der entscheidenden Sicherheit ---
+            if ballast_source:
+                if nachweis_doc != "BALLAST":
+                    rel_map["BALLAST"] = rel_map[ballast_source]
+                # globaler Vergleich: End-Ballaste der unterlegenen Einzelnachweise
+                if nachweis_doc in _EINZEL and nachweis_doc != ballast_source:
+                    title = (d.get("title") or d.get("titel") or "")
+                    if (isinstance(title, str) and title.startswith("Erforderlicher Ballast m_Ballast")
+                            and rel_map[nachweis_doc] == "relevant"):
+                        rel_map["BALLAST"] = "entscheidungsrelevant"
 
-    return rollen_by, ballast_source
+            ctx["rolle_pro_nachweis"] = rel_map
+            d["context"] = ctx
 
-def _annotate_rolle_pro_nachweis(docs: list[dict]) -> None:
+def _docs_aufbereiten(items, alt_names) -> tuple[list[dict], Dict[str, list[dict]]]:
     """
-    Schreibt für jedes Doc eine vollständige Map rolle_pro_nachweis in den Kontext.
-
-    - Grundlage ist IMMER die Rolle, die die Rechenfunktionen in ctx["rolle"] gesetzt haben.
-    - Für LOADS (und nachweislose Meta-Docs) werden Rollen pro Nachweis aus den
-      Richtungsrollen abgeleitet:
-        * Nur die kritische Richtung (rolle == "relevant") wird als relevant gezogen.
-        * Alles andere bleibt für diesen Nachweis "irrelevant".
-    - Für BALLAST gilt: jedes Doc bekommt für BALLAST genau die Rolle, die es
-      für den ballastkritischen Nachweis hat (copy/paste).
+    items: List[Tuple[bundle, ctx]] → (Haupt-Docs, {Alternative: Docs}) in einem Durchlauf:
+    - normalisiert Bundles (Primitive genau einmal)
+    - dedupliziert *nur* echte Duplikate über DEDUP_FIELDS; bei gleichem Schlüssel gewinnt die
+      höhere Rolle (relevant > entscheidungsrelevant > irrelevant), die Position bleibt
+    - teilt nach Szenario in Haupt/Alternativen und baut dabei den Rollen-Index je Gruppe
+    - löst danach rolle_pro_nachweis je Doc aus dem Index auf
     """
-    rollen_by, ballast_source = _build_richtungsrollen(docs)
+    haupt = _DocGruppe()
+    gruppen = {name: _DocGruppe() for name in alt_names}
+    dedup: Dict[tuple, tuple] = {}  # key -> (Gruppe, Position)
 
-    for d in docs:
-        ctx = d.get("context") or {}
-        wdir = ctx.get("windrichtung_deg")
-        nachweis_doc = ctx.get("nachweis")
-        own_role = (ctx.get("rolle") or ctx.get("role"))
-        own_role = str(own_role).lower() if own_role is not None else None
-
-        # Grundgerüst: jedes Doc bekommt alle vier Einträge
-        rel_map: Dict[str, str] = {
-            "KIPP": "irrelevant",
-            "GLEIT": "irrelevant",
-            "ABHEBE": "irrelevant",
-            "BALLAST": "irrelevant",
-        }
+    for bundle, ctx in (items or ()):
+        doc = _normalize_doc_bundle(bundle, ctx)
+        c = doc["context"] or {}
+        key = _make_dedup_key(doc)
 
-        # --- BASIS: immer und überall relevant ----------------------
-        if nachweis_doc == "BASIS":
-            rel_map: Dict[str, str] = {
-                "KIPP": "relevant",
-                "GLEIT": "relevant",
-                "ABHEBE": "relevant",
-                "BALLAST": "relevant",
-            }
-            new_ctx = dict(ctx)
-            new_ctx["rolle_pro_nachweis"] = rel_map
-            d["context"] = new_ctx
+        treffer = dedup.get(key)
+        if treffer is not None:
+            gruppe, pos = treffer
+            role_new = (c.get("rolle") or c.get("role"))
+            role_old = (gruppe.docs[pos]["context"] or {}).get("rolle")
+            if _ROLE_ORDER.get(role_new, 0) > _ROLE_ORDER.get(role_old, 0):
+                gruppe.docs[pos] = doc
+                gruppe.indexieren(pos, doc)
             continue
 
-        # --- 1) Rolle für den "eigenen" Nachweis -----------------------
-        if nachweis_doc in ("KIPP", "GLEIT", "ABHEBE"):
-            # Hier vertrauen wir komplett der Rechenfunktion:
-            # nur wo ctx.rolle gesetzt ist, war der Wert im Vergleich / Pfad.
-            if own_role in ("relevant", "entscheidungsrelevant"):
-                rel_map[nachweis_doc] = own_role
-
-        elif nachweis_doc == "BALLAST":
-            if own_role in ("relevant", "entscheidungsrelevant"):
-                rel_map["BALLAST"] = own_role
-
-        # --- 2) LOADS / globale Meta-Daten: Rollen über Richtungsrollen -------
-        # LOADS und nachweislose Docs sollen die kritische Richtung pro Nachweis mitziehen.
-        if nachweis_doc in ("LOADS", None) and wdir is not None:
-            for nz in ("KIPP", "GLEIT", "ABHEBE"):
-                rolle_dir = rollen_by.get(nz, {}).get(wdir)
-                # Nur die wirklich kritische Richtung (rolle == "relevant") als relevant ziehen.
-                if isinstance(rolle_dir, str) and rolle_dir.lower() == "relevant":
-                    rel_map[nz] = "relevant"
-
-        # --- 3) BALLAST: copy/paste von der entscheidenden Sicherheit ---------
-        if ballast_source:
-            if nachweis_doc == "BALLAST":
-                # globales Ballast-Dokument behält seine eigene Rolle (oben gesetzt)
-                pass
-            else:
-                # Alle anderen Docs: BALLAST-Rolle = Rolle des ballastkritischen Nachweises
-                rolle_source = rel_map.get(ballast_source)
-                if rolle_source is not None:
-                    rel_map["BALLAST"] = rolle_source
-
-            # --- 3b) globaler Vergleich KIPP/GLEIT/ABHEB für den Ballast -------
-            # Wenn z.B. KIPP gewinnt, sollen die Einzelnachweis-Ballaste von
-            # GLEIT und ABHEB für BALLAST "entscheidungsrelevant" sein.
-            if nachweis_doc in ("KIPP", "GLEIT", "ABHEBE") and nachweis_doc != ballast_source:
-                # Heuristik: End-Ballast-Dokus der Einzelnachweise erkennen
-                title = (d.get("title") or d.get("titel") or "")
-                if isinstance(title, str) and title.startswith("Erforderlicher Ballast m_Ballast"):
-                    # In ihrem eigenen Nachweis sind diese Werte "relevant" (Endwert),
-                    # im globalen Ballast-Vergleich aber Verlierer -> "entscheidungsrelevant".
-                    if rel_map.get(nachweis_doc) == "relevant":
-                        rel_map["BALLAST"] = "entscheidungsrelevant"
+        sc = c.get("szenario") or c.get("scenario")
+        sc = None if sc is None else str(sc).strip()
+        gruppe = gruppen.get(sc, haupt)
+        pos = len(gruppe.docs)
+        gruppe.docs.append(doc)
+        gruppe.indexieren(pos, doc)
+        dedup[key] = (gruppe, pos)
 
-        # Kontext mit rolle_pro_nachweis zurückschreiben
-        new_ctx = dict(ctx)
-        new_ctx["rolle_pro_nachweis"] = rel_map
-        d["context"] = new_ctx
+    haupt.rollen_annotieren()
+    for gruppe in gruppen.values():
+        gruppe.rollen_annotieren()
+    return haupt.docs, {name: gruppe.docs for name, gruppe in gruppen.items()}
 
 # ====== Eingaben Meta ======
 _DENY_KEYS = {
@@ -376,7 +341,7 @@ def _make_meta_eingaben(payload: Mapping[str, Any]) -> Dict[str, Any]:
     return out
 
 # ---------- main mapper ----------
-def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
+def build_api_output(ergebnis, input_payload: Dict[str, Any], projektion=None) -> Dict[str, Any]:
     """
     Mappt das reiche Ergebnisobjekt (z. B. StandsicherheitErgebnis) auf das API-Ausgabeformat:
       {
@@ -412,8 +377,15 @@ def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
       }
     WICHTIG: Werte bleiben wie bisher (float/None/"INF"/"-INF").
     Zusätzlich geben wir je Norm eine flache Liste "messages" zurück (Text, Severity, Kontext).
+
+    projektion (optional, siehe core_adapter.projektion): nur die Felder in projektion.felder
+    werden gemappt und ausgegeben (Messages/Docs/Alternativen sonst gar nicht erst aufbereitet).
     """
     out_normen: Dict[str, Dict[str, Any]] = {}
+    felder = None if projektion is None else projektion.felder
+
+    def _mit(feld: str) -> bool:
+        return felder is None or feld in felder
 
     for norm, nres in ergebnis.normen.items():
         key = _NORM_KEY.get(norm)
@@ -427,10 +399,12 @@ def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
             "abhebe":  _jsonify_number(nres.werte.get(Nachweis.ABHEBE).wert)  if Nachweis.ABHEBE  in nres.werte else None,
             "ballast": _jsonify_number(nres.werte.get(Nachweis.BALLAST).wert) if Nachweis.BALLAST in nres.werte else None,
         }
+        if felder is not None:
+            main = {k: v for k, v in main.items() if k in felder}
 
         # --- alternatives (same handling for numbers) ---
         alts: Dict[str, Dict[str, float | str | None]] = {}
-        for alt_name, alt_res in (nres.alternativen or {}).items():
+        for alt_name, alt_res in ((nres.alternativen or {}) if _mit("alternativen") else {}).items():
             vals = getattr(alt_res, "werte", {}) or {}
 
             alts[alt_name] = {
@@ -441,6 +415,8 @@ def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
                 "abhebe":  _jsonify_number(vals.get(Nachweis.ABHEBE).wert)  if Nachweis.ABHEBE  in vals else None,
                 "ballast": _jsonify_number(vals.get(Nachweis.BALLAST).wert) if Nachweis.BALLAST in vals else None,
             }
+            if felder is not None:
+                alts[alt_name] = {k: v for k, v in alts[alt_name].items() if k == "anzeigename" or k in felder}
         if alts:
             main["alternativen"] = alts
 
@@ -448,10 +424,11 @@ def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
         messages = []
 
         # 1) norm-level reasons
-        messages += _collect_messages_from_list(getattr(nres, "reasons", None))
+        if _mit("messages"):
+            messages += _collect_messages_from_list(getattr(nres, "reasons", None))
 
         # 2) SafetyValue.messages on main values (if you attach messages to values)
-        for nachweis in (Nachweis.KIPP, Nachweis.GLEIT, Nachweis.ABHEBE, Nachweis.BALLAST):
+        for nachweis in ((Nachweis.KIPP, Nachweis.GLEIT, Nachweis.ABHEBE, Nachweis.BALLAST) if _mit("messages") else ()):
             if nachweis in nres.werte:
                 sv = nres.werte[nachweis]
                 # we add nachweis to context if missing
@@ -465,7 +442,7 @@ def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
                 messages += msgs
 
         # 3) messages attached to alternatives' values
-        for alt_name, alt_res in (nres.alternativen or {}).items():
+        for alt_name, alt_res in ((nres.alternativen or {}) if _mit("messages") else {}).items():
             vals = getattr(alt_res, "werte", {}) or {}
             for nachweis, sv in vals.items():
                 msgs = _collect_messages_from_list(
@@ -480,7 +457,7 @@ def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
 
         # 4) optional: details.notes
         details = getattr(nres, "details", None)
-        if details is not None:
+        if details is not None and _mit("messages"):
             messages += _collect_messages_from_list(getattr(details, "notes", None))
 
          # ========= NEU: Messages in Haupt vs. Alternativen splitten =========
@@ -503,36 +480,26 @@ def build_api_output(ergebnis, input_payload: Dict[str, Any]) -> Dict[str, Any]:
         alt_docs_map: Dict[str, list[dict]] = { name: [] for name in (alts.keys() if alts else []) }
 
         details = getattr(nres, "details", None)
-        if details is not None:
+        if details is not None and _mit("docs"):
             raw_docs = getattr(details, "docs", None)  # erwartet: List[(bundle, ctx)]
             if raw_docs:
-                docs_all = _collect_docs_from_list(raw_docs)
-                # ========= NEU: Docs in Haupt vs. Alternativen splitten =========
-                alt_names = set(alts.keys())
-                for d in docs_all:
-                    ctx = d.get("context") or {}
-                    sc = ctx.get("szenario") or ctx.get("scenario")
-                    sc = None if sc is None else str(sc).strip()
-                    if sc in alt_names:
-                        alt_docs_map[sc].append(d)
-                    else:
-                        docs_main.append(d)
-                # ========= NEU: Relevanz pro Nachweis je Doc berechnen =========
-                if docs_main:
-                    _annotate_rolle_pro_nachweis(docs_main)
-                if alt_docs_map:
-                    for name, docs_list in alt_docs_map.items():
-                        if docs_list:
-                            _annotate_rolle_pro_nachweis(docs_list)
-                # ===============================================================
+                # Normalisieren, Deduplizieren, Haupt/Alternativen splitten, Rollen je Nachweis
+                docs_main, alt_docs_map = _docs_aufbereiten(raw_docs, alts.keys())
 
         # --- attach split messages/docs to alternatives ---
         if alts:
             for name in alts.keys():
-                alts[name]["messages"] = alt_msgs_map.get(name, [])
-                alts[name]["docs"] = alt_docs_map.get(name, [])
+                if _mit("messages"):
+                    alts[name]["messages"] = alt_msgs_map.get(name, [])
+                if _mit("docs"):
+                    alts[name]["docs"] = alt_docs_map.get(name, [])
 
         out_normen[key] = { **main, "messages": messages_main, "docs": docs_main }
+        if felder is not None:
+            if "messages" not in felder:
+                del out_normen[key]["messages"]
+            if "docs" not in felder:
+                del out_normen[key]["docs"]
 
     # ---- meta unchanged ----
     return {
@@ -0,0 +1,106 @@
+"""
+Sitzungs-Speicher für Drill-down-Docs (/ergebnis/<result_id>/docs):
+- je Berechnung wird nur der validierte Payload unter seiner result_id abgelegt (klein, LRU)
+- Docs einer Norm werden erst beim ersten Abruf mit voller Dokumentation nachgerechnet
+  (nur diese Norm) und dann für weitere Abrufe (andere Nachweis-/Richtungsfilter) vorgehalten
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ergebnis_cache import ergebnis_schluessel
+from .generic import berechne_konstruktion
+from .projektion import Projektion
+
+ERGEBNIS_STORE_MAX = int(os.environ.get("WINDLAST_ERGEBNIS_STORE_MAX", "256"))
+ERGEBNIS_STORE_DOCS_MAX = int(os.environ.get("WINDLAST_ERGEBNIS_STORE_DOCS_MAX", "8"))
+
+# Diese Docs gehören zu jeder Nachweis-Sicht (vgl. filterDocsByNachweis im UI)
+_GEMEINSAM = ("BASIS", "LOADS", None)
+
+def _richtung_passt(wert: Any, windrichtung: float) -> bool:
+    # windrichtung_deg steht im Kontext als "45.0°"; richtungsunabhängige Docs passen immer
+    if wert is None:
+        return True
+    try:
+        return abs(float(str(wert).rstrip("°")) - windrichtung) < 1e-6
+    except ValueError:
+        return False
+
+class ErgebnisStore:
+    def __init__(self, maxsize: int = ERGEBNIS_STORE_MAX, docs_maxsize: int = ERGEBNIS_STORE_DOCS_MAX) -> None:
+        self.maxsize = maxsize
+        self.docs_maxsize = docs_maxsize
+        self._payloads: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._docs: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def registrieren(self, payload: Dict[str, Any]) -> str:
+        """Legt den Payload ab und liefert seine result_id (gleicher Payload → gleiche ID)."""
+        result_id = ergebnis_schluessel(payload)
+        with self._lock:
+            self._payloads[result_id] = payload
+            self._payloads.move_to_end(result_id)
+            while len(self._payloads) > self.maxsize:
+                self._payloads.popitem(last=False)
+        return result_id
+
+    def bekannt(self, result_id: str) -> bool:
+        with self._lock:
+            return result_id in self._payloads
+
+    def _norm_docs(self, result_id: str, norm_key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            payload = self._payloads.get(result_id)
+            if payload is None:
+                return None
+            self._payloads.move_to_end(result_id)
+            eintrag = self._docs.get((result_id, norm_key))
+            if eintrag is not None:
+                self._docs.move_to_end((result_id, norm_key))
+                return eintrag
+
+        # Nur diese Norm nachrechnen, alle Nachweise (Rollen pro Nachweis hängen voneinander ab)
+        projektion = Projektion(
+            felder=frozenset({"docs", "alternativen"}),
+            normen=frozenset({norm_key}),
+            docs="all" if payload.get("dokumentation") == "none" else None,
+        )
+        resp = berechne_konstruktion(payload, projektion=projektion)
+        eintrag = resp["normen"].get(norm_key, {"docs": []})
+        with self._lock:
+            self._docs[(result_id, norm_key)] = eintrag
+            while len(self._docs) > self.docs_maxsize:
+                self._docs.popitem(last=False)
+        return eintrag
+
+    def docs(self, result_id: str, norm_key: str, *, szenario: Optional[str] = None,
+             nachweis: Optional[str] = None, windrichtung: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Docs einer Norm (szenario=None → Hauptberechnung, sonst Alternative), optional gefiltert:
+        - nachweis:     Docs dieses Nachweises + gemeinsame (BASIS, LOADS, ohne Nachweis)
+        - windrichtung: Docs dieser Richtung + richtungsunabhängige
+        None → result_id unbekannt (abgelaufen).
+        """
+        eintrag = self._norm_docs(result_id, norm_key)
+        if eintrag is None:
+            return None
+        if szenario:
+            docs = ((eintrag.get("alternativen") or {}).get(szenario) or {}).get("docs") or []
+        else:
+            docs = eintrag.get("docs") or []
+
+        if nachweis is not None:
+            docs = [d for d in docs if (d.get("context") or {}).get("nachweis") in (nachweis, *_GEMEINSAM)]
+        if windrichtung is not None:
+            docs = [d for d in docs if _richtung_passt((d.get("context") or {}).get("windrichtung_deg"), windrichtung)]
+        return docs
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+            self._docs.clear()
+
+# Prozessweiter Speicher (analog zu ergebnis_cache)
+ergebnis_store = ErgebnisStore()
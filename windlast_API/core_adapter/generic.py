@@ -1,11 +1,12 @@
 from typing import Dict, Any
 
 from windlast_CORE.konstruktionen.generic import Konstruktion
-from windlast_CORE.datenstruktur.enums import Zeitfaktor, Windzone as WindzoneEnum
+from windlast_CORE.datenstruktur.enums import Zeitfaktor, Windzone as WindzoneEnum, RichtungsStrategie
 from windlast_CORE.datenstruktur.zeit import Dauer
 from windlast_CORE.rechenfunktionen.standsicherheit import standsicherheit
 
 from .ergebnis_mapper import build_api_output
+from .projektion import Projektion
 
 def _build_konstruktion_from_payload(konstr_dict: Dict[str, Any]) -> Konstruktion:
     """
@@ -25,38 +26,77 @@ def _build_konstruktion_from_payload(konstr_dict: Dict[str, Any]) -> Konstruktio
         build=konstr_dict,
     )
 
-def berechne_konstruktion(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _header_aus_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Header-Inputs -> Enums (wirft ValueError bei unbekannten Werten)."""
+    if payload.get("aufstelldauer"):
+        da = payload["aufstelldauer"]
+        try:
+            aufstelldauer = Dauer(
+                wert=int(da["wert"]),
+                einheit=Zeitfaktor[da["einheit"]],
+            )
+        except Exception as e:
+            raise ValueError(f"Ungültige aufstelldauer: {da}") from e
+    else:
+        aufstelldauer = None
+
+    try:
+        windzone = WindzoneEnum[payload["windzone"]]
+    except Exception as e:
+        raise ValueError(f"Unbekannte windzone: {payload.get('windzone')}") from e
+
+    try:
+        richtungsstrategie = RichtungsStrategie[payload.get("richtungsstrategie") or "RASTER"]
+    except Exception as e:
+        raise ValueError(f"Unbekannte richtungsstrategie: {payload.get('richtungsstrategie')}") from e
+
+    return {
+        "aufstelldauer": aufstelldauer,
+        "windzone": windzone,
+        "richtungsstrategie": richtungsstrategie,
+        "dokumentation": payload.get("dokumentation") or "full",
+        "doc_aufbewahrung": payload.get("doc_aufbewahrung") or "alle",
+    }
+
+def pruefe_payload(payload: Dict[str, Any]) -> None:
+    """
+    Vorab-Prüfung ohne Rechnung (z.B. für Batches): Header-Enums und Aufbau der Bauelemente.
+    Wirft ValueError/KeyError mit lesbarer Meldung.
+    """
+    _header_aus_payload(payload)
+    konstr_dict = payload.get("konstruktion")
+    if not isinstance(konstr_dict, dict):
+        raise ValueError("konstruktion fehlt oder ist kein Objekt.")
+    _build_konstruktion_from_payload(konstr_dict)
+
+def berechne_konstruktion(payload: Dict[str, Any], *, konstruktion: Konstruktion | None = None,
+                          projektion: Projektion | None = None) -> Dict[str, Any]:
     """
     Generischer Rechenpfad:
     - payload['konstruktion'] kommt direkt aus der UI (buildX(...))
     - Untergrund/Gummimatte/etc. stehen in den Bauelementen (Bodenplatten)
     - Header liefert nur Windzone & Aufstelldauer
+    - payload['dokumentation'] (optional): "none" | "relevant" | "full" (Default)
+    - payload['richtungsstrategie'] (optional): "RASTER" (Default) | "ADAPTIV"
+    - payload['doc_aufbewahrung'] (optional): "alle" (Default) | "gewinner" (unterlegene Richtungen
+      nur mit Zusammenfassungen, siehe standsicherheit)
+    - konstruktion (optional): bereits aufgebaute Konstruktion zu payload['konstruktion'] (Caches am
+      Objekt werden dann mitbenutzt, z.B. im Batch für gleiche Geometrie)
+    - projektion (optional): nur angeforderte Normen/Nachweise/Felder werden gerechnet und gemappt
     """
     # 1) Konstruktion aus dem Build-Dict erzeugen
-    konstr_dict = payload["konstruktion"]
-    konstruktion = _build_konstruktion_from_payload(konstr_dict)
+    if konstruktion is None:
+        konstruktion = _build_konstruktion_from_payload(payload["konstruktion"])
 
     # 2) Header-Inputs -> Enums
-    if payload.get("aufstelldauer"):
-        da = payload["aufstelldauer"]
-        aufstelldauer = Dauer(
-            wert=int(da["wert"]),
-            einheit=Zeitfaktor[da["einheit"]],
-        )
-    else:
-        aufstelldauer = None
-
-    try:
-        windzone = WindzoneEnum[payload["windzone"]]
-    except Exception as e:
-        raise ValueError(f"Unbekannte windzone: {payload['windzone']}") from e
+    header = _header_aus_payload(payload)
 
     # 3) Rechnen
-    er = standsicherheit(
-        konstruktion,
-        aufstelldauer=aufstelldauer,
-        windzone=windzone,
-    )
+    if projektion is None:
+        er = standsicherheit(konstruktion, **header)
+    else:
+        header["dokumentation"] = projektion.dokumentation(header["dokumentation"])
+        er = standsicherheit(konstruktion, **header, **projektion.engine_kwargs())
 
     # 4) Auf Minimalformat mappen
-    return build_api_output(er, payload)
+    return build_api_output(er, payload, projektion)
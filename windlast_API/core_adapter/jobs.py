@@ -0,0 +1,146 @@
+"""
+Asynchrone Berechnungs-Jobs für /jobs:
+- begrenzter Thread-Pool im API-Prozess (JOB_WORKERS) mit Warteschlangen-Limit (JOB_QUEUE_MAX)
+- Fortschritt in Einheiten Norm × Szenario × Nachweis × Windrichtung (Fortschritt aus windlast_CORE)
+- Abbruch kooperativ: noch wartende Jobs werden gestrichen, laufende enden am nächsten Checkpoint
+- abgeschlossene Jobs werden JOB_TTL_S Sekunden (höchstens JOB_BEHALTEN Stück) aufbewahrt
+- Projektion wie bei /konstruktion/berechnen; Treffer im Ergebnis-Cache werden ohne Rechnung
+  als fertiger Job angelegt (abgeschlossen)
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from windlast_CORE.datenstruktur.fortschritt import BerechnungAbgebrochen, Fortschritt, fortschritt_kontext
+
+from .generic import berechne_konstruktion
+from .projektion import Projektion
+
+JOB_WORKERS = int(os.environ.get("WINDLAST_JOB_WORKERS", "2"))
+JOB_QUEUE_MAX = int(os.environ.get("WINDLAST_JOB_QUEUE_MAX", "16"))
+JOB_TTL_S = float(os.environ.get("WINDLAST_JOB_TTL_S", "900"))
+JOB_BEHALTEN = int(os.environ.get("WINDLAST_JOB_BEHALTEN", "256"))
+
+OFFEN = ("queued", "running")
+
+class WarteschlangeVoll(Exception):
+    """Mehr als JOB_QUEUE_MAX Jobs warten oder laufen bereits."""
+
+@dataclass
+class Job:
+    id: str
+    fortschritt: Fortschritt = field(default_factory=Fortschritt)
+    status: str = "queued"  # queued | running | done | error | cancelled
+    ergebnis: Optional[Dict[str, Any]] = None
+    fehler: Optional[Dict[str, Any]] = None
+    erstellt: float = field(default_factory=time.time)
+    beendet: Optional[float] = None
+    future: Optional[Future] = None
+
+    def als_dict(self) -> Dict[str, Any]:
+        stand = self.fortschritt.stand()
+        if self.status == "done":
+            stand["anteil"] = 1.0
+        aus: Dict[str, Any] = {"job_id": self.id, "status": self.status, "progress": stand}
+        if self.ergebnis is not None:
+            aus["result"] = self.ergebnis
+        if self.fehler is not None:
+            aus["error"] = self.fehler
+        return aus
+
+class JobVerwaltung:
+    """
+    Hält Jobs und Pool. nachbereiten(resp) wird im Worker auf das Rohergebnis angewendet
+    (z.B. Validierung gegen das Result-Schema, Ablage im Ergebnis-Cache); Fehler dort landen
+    als INVALID_OUTPUT im Job.
+    """
+    def __init__(self, workers: int = JOB_WORKERS, queue_max: int = JOB_QUEUE_MAX) -> None:
+        self.workers = max(1, workers)
+        self.queue_max = max(1, queue_max)
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _pool_holen(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="windlast-job")
+        return self._pool
+
+    def _aufraeumen(self) -> None:
+        grenze = time.time() - JOB_TTL_S
+        fertig = sorted(
+            (j for j in self._jobs.values() if j.status not in OFFEN),
+            key=lambda j: j.beendet or j.erstellt,
+        )
+        ueberzahl = len(fertig) - JOB_BEHALTEN
+        for i, job in enumerate(fertig):
+            if i < ueberzahl or (job.beendet or job.erstellt) < grenze:
+                del self._jobs[job.id]
+
+    def einreihen(self, payload: Dict[str, Any],
+                  nachbereiten: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                  *, projektion: Optional[Projektion] = None) -> Job:
+        with self._lock:
+            self._aufraeumen()
+            offen = sum(1 for j in self._jobs.values() if j.status in OFFEN)
+            if offen >= self.queue_max:
+                raise WarteschlangeVoll(f"Bereits {offen} offene Jobs (Limit {self.queue_max}).")
+            job = Job(id=uuid.uuid4().hex)
+            self._jobs[job.id] = job
+            job.future = self._pool_holen().submit(self._ausfuehren, job, payload, nachbereiten, projektion)
+        return job
+
+    def abgeschlossen(self, ergebnis: Dict[str, Any]) -> Job:
+        """Job mit bereits vorliegendem Ergebnis (z.B. aus dem Ergebnis-Cache), zählt nicht zur Warteschlange."""
+        with self._lock:
+            self._aufraeumen()
+            job = Job(id=uuid.uuid4().hex, status="done", ergebnis=ergebnis)
+            job.beendet = job.erstellt
+            self._jobs[job.id] = job
+        return job
+
+    def _ausfuehren(self, job: Job, payload: Dict[str, Any], nachbereiten, projektion: Optional[Projektion]) -> None:
+        with self._lock:
+            if job.status != "queued":
+                return
+            job.status = "running"
+        status, ergebnis, fehler = "done", None, None
+        try:
+            with fortschritt_kontext(job.fortschritt):
+                resp = berechne_konstruktion(payload, projektion=projektion)
+            try:
+                ergebnis = nachbereiten(resp) if nachbereiten is not None else resp
+            except Exception as e:
+                status, fehler = "error", {"code": "INVALID_OUTPUT", "message": str(e)}
+        except BerechnungAbgebrochen:
+            status = "cancelled"
+        except Exception as e:
+            status, fehler = "error", {"code": "CALCULATION_FAILED", "message": str(e)}
+        with self._lock:
+            job.status, job.ergebnis, job.fehler = status, ergebnis, fehler
+            job.beendet = time.time()
+
+    def holen(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._aufraeumen()
+            return self._jobs.get(job_id)
+
+    def abbrechen(self, job_id: str) -> Optional[Job]:
+        """Wartend → sofort 'cancelled'; laufend → Abbruch-Flag, Status folgt am nächsten Checkpoint."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job.fortschritt.abbrechen()
+            if job.status == "queued":
+                if job.future is not None:
+                    job.future.cancel()
+                job.status = "cancelled"
+                job.beendet = time.time()
+            return job
+
+jobs = JobVerwaltung()
@@ -0,0 +1,102 @@
+"""
+Projektion der Ergebnis-Antwort (fields= / normen= / docs= / nachweis=).
+Wird in die Rechnung durchgereicht: nicht angeforderte Normen, Nachweise, Alternativ-Szenarien
+und Docs werden gar nicht erst gerechnet bzw. gemappt.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+from windlast_CORE.datenstruktur.enums import Nachweis
+
+from .ergebnis_mapper import _NORM_KEY
+
+# Felder je Norm (und, soweit vorhanden, je Alternative)
+FELDER = ("kipp", "gleit", "abhebe", "ballast", "alternativen", "messages", "docs")
+_WERT_FELD = {Nachweis.KIPP: "kipp", Nachweis.GLEIT: "gleit", Nachweis.ABHEBE: "abhebe", Nachweis.BALLAST: "ballast"}
+NORM_AUS_KEY = {key: norm for norm, key in _NORM_KEY.items()}
+_DOKUMENTATION = {"none": "none", "relevant": "relevant", "all": "full"}
+
+PROJEKTION_PARAMETER = ("fields", "normen", "docs", "nachweis")
+
+@dataclass(frozen=True)
+class Projektion:
+    felder: FrozenSet[str]
+    normen: Optional[FrozenSet[str]] = None       # API-Norm-Keys (z.B. "EN_17879_2024"), None → alle
+    nachweise: Optional[FrozenSet[Nachweis]] = None
+    docs: Optional[str] = None                    # "none" | "relevant" | "all", None → payload['dokumentation']
+
+    def dokumentation(self, standard: str) -> str:
+        if "docs" not in self.felder:
+            return "none"
+        return _DOKUMENTATION[self.docs] if self.docs is not None else standard
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        return {
+            "normen": None if self.normen is None else [NORM_AUS_KEY[k] for k in sorted(self.normen)],
+            "nachweise": self.nachweise,
+            "alternativen": "alternativen" in self.felder,
+        }
+
+    def als_dict(self) -> Dict[str, Any]:
+        return {
+            "fields": sorted(self.felder),
+            "normen": None if self.normen is None else sorted(self.normen),
+            "nachweis": None if self.nachweise is None else sorted(n.name for n in self.nachweise),
+            "docs": self.docs,
+        }
+
+def _liste(wert: Any, name: str) -> Optional[list]:
+    if wert is None or wert == "":
+        return None
+    if isinstance(wert, str):
+        return [w.strip() for w in wert.split(",") if w.strip()]
+    if isinstance(wert, (list, tuple)) and all(isinstance(w, str) for w in wert):
+        return list(wert)
+    raise ValueError(f"{name} muss eine Liste oder kommagetrennte Zeichenkette sein.")
+
+def projektion_aus(*quellen: Mapping[str, Any]) -> Optional[Projektion]:
+    """
+    Liest fields/normen/docs/nachweis aus den Quellen (später überschreibt früher, z.B. Body, dann Query).
+    Ohne einen dieser Parameter → None (volle Antwort wie bisher). Wirft ValueError bei unbekannten Werten.
+    """
+    roh: Dict[str, Any] = {}
+    for quelle in quellen:
+        for name in PROJEKTION_PARAMETER:
+            if quelle.get(name) not in (None, ""):
+                roh[name] = quelle.get(name)
+    if not roh:
+        return None
+
+    felder = _liste(roh.get("fields"), "fields")
+    if felder is not None:
+        unbekannt = set(felder) - set(FELDER)
+        if unbekannt:
+            raise ValueError(f"Unbekannte fields: {', '.join(sorted(unbekannt))} (erlaubt: {', '.join(FELDER)})")
+    felder_menge = set(felder) if felder is not None else set(FELDER)
+
+    normen = _liste(roh.get("normen"), "normen")
+    if normen is not None:
+        unbekannt = set(normen) - set(NORM_AUS_KEY)
+        if unbekannt:
+            raise ValueError(f"Unbekannte normen: {', '.join(sorted(unbekannt))} (erlaubt: {', '.join(NORM_AUS_KEY)})")
+
+    nachweise = None
+    namen = _liste(roh.get("nachweis"), "nachweis")
+    if namen is not None:
+        try:
+            nachweise = frozenset(Nachweis[n.upper()] for n in namen)
+        except KeyError as e:
+            raise ValueError(f"Unbekannter nachweis: {e.args[0]} (erlaubt: {', '.join(n.name for n in Nachweis)})") from None
+        # Werte nicht angeforderter Nachweise entfallen in der Antwort
+        felder_menge -= {feld for n, feld in _WERT_FELD.items() if n not in nachweise}
+
+    docs = roh.get("docs")
+    if docs is not None and docs not in _DOKUMENTATION:
+        raise ValueError(f"Unbekanntes docs: {docs!r} (erlaubt: {', '.join(_DOKUMENTATION)})")
+
+    return Projektion(
+        felder=frozenset(felder_menge),
+        normen=None if normen is None else frozenset(normen),
+        nachweise=nachweise,
+        docs=docs,
+    )
@@ -19,10 +19,11 @@ from windlast_CORE.rechenfunktionen import (
 )
 from windlast_CORE.datenstruktur.enums import ObjektTyp, MaterialTyp, Lasttyp, Variabilitaet, FormTyp, Norm, Severity
 from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.datenstruktur.geometrie import GeometrieVersioniert
 from windlast_CORE.datenstruktur.konstanten import _EPS
 
 @dataclass
-class Bodenplatte:
+class Bodenplatte(GeometrieVersioniert):
     name_intern: str
     mittelpunkt: Vec3
     orientierung: Vec3
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple, List, Sequence, Optional
 import math
 from windlast_CORE.datenstruktur.konstanten import PhysikKonstanten, aktuelle_konstanten
@@ -26,6 +26,7 @@ from windlast_CORE.rechenfunktionen import (
     segmentiere_strecke_nach_hoehenbereichen,
 )
 from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.datenstruktur.geometrie import GeometrieVersioniert
 from windlast_CORE.datenstruktur.enums import Lasttyp, Variabilitaet, ObjektTyp, Norm, Severity, senkrechteFlaecheTyp, Zone
 from windlast_CORE.datenstruktur.konstanten import _EPS
 
@@ -50,10 +51,10 @@ def zonen_einteilung_horizontal(
     return trennpunkte
 
 @dataclass
-class senkrechteFlaeche:
+class senkrechteFlaeche(GeometrieVersioniert):
     eckpunkte: List[Vec3]
     objekttyp: ObjektTyp = ObjektTyp.SENKRECHTE_FLAECHE
-    flaeche_typ: Optional[senkrechteFlaecheTyp] = None
+    flaeche_typ: Optional[senkrechteFlaecheTyp] = field(default=None, metadata={"abgeleitet": True})  # wird in windkraefte() bestimmt
     element_id_intern: Optional[str] = None
     anzeigename: Optional[str] = None
     flaechenlast: Optional[float] = None  # [kg/m²]
@@ -463,4 +464,34 @@ class senkrechteFlaeche:
                     text=f"Windkraefte für Flächetyp {self.flaeche_typ.value} sind noch nicht implementiert.",
                     kontext=base_ctx,
             )
-            return []
\ No newline at end of file
+            return []
+    def windkraefte_batch(
+        self,
+        norm: Norm,
+        richtungen: Sequence[Vec3],
+        staudruecke: Sequence[float],
+        obergrenzen: Sequence[float],
+        konst: PhysikKonstanten | None = None,
+        *,
+        protokolle: Optional[Sequence[Optional[Protokoll]]] = None,
+        kontext: Optional[dict] = None,
+        richtungs_kontexte: Optional[Sequence[Optional[dict]]] = None,
+        vorbereitung=None,
+    ) -> List[List[Kraefte]]:
+        """
+        Einheitlicher Batch-Einstieg (vgl. Traversenstrecke.windkraefte_batch).
+        Bei senkrechten Flächen hängen Zoneneinteilung, Kraftbeiwert und Bezugsflächen vom
+        Anströmwinkel ab – es gibt keinen nennenswerten richtungsunabhängigen Anteil,
+        daher wird windkraefte(...) je Richtung ausgewertet (vorbereitung wird ignoriert).
+        Rückgabe: [richtung][lastfall] → Kraefte
+        """
+        n = len(richtungen)
+        protokolle = list(protokolle) if protokolle is not None else [None] * n
+        return [
+            self.windkraefte(
+                norm, windrichtung, staudruecke, obergrenzen, konst,
+                protokoll=protokolle[d],
+                kontext=merge_kontext(kontext, richtungs_kontexte[d] if richtungs_kontexte is not None else None),
+            ) or []
+            for d, windrichtung in enumerate(richtungen)
+        ]
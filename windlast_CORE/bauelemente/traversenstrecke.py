@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Tuple, List, Sequence, Optional
 from windlast_CORE.datenstruktur.konstanten import PhysikKonstanten, aktuelle_konstanten
-from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, make_docbundle
+from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, make_docbundle, make_aufzeichnung, protokoll_stufe, protokoll_uebertragen
 from windlast_CORE.materialdaten.catalog import catalog
 from windlast_CORE.rechenfunktionen import (
     Vec3,
@@ -19,11 +19,17 @@ from windlast_CORE.rechenfunktionen import (
     windkraft_zu_vektor,
     segmentiere_strecke_nach_hoehenbereichen,
 )
+from windlast_CORE.rechenfunktionen.segmentierung import pruefe_hoehenbereiche
 from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.datenstruktur.geometrie import GeometrieVersioniert
+from windlast_CORE.datenstruktur.lastcache import lastcache, element_fingerprint, basis_schluessel
+from windlast_CORE.datenstruktur.windlastbasis import (
+    WindlastBasis, WindlastSegmentBasis, WindlastRichtungsBasis, WindlastSegmentQ, WindlastVorbereitung, richtungs_schluessel,
+)
 from windlast_CORE.datenstruktur.enums import Lasttyp, Variabilitaet, ObjektTyp, Norm, Severity
 
 @dataclass
-class Traversenstrecke:
+class Traversenstrecke(GeometrieVersioniert):
     traverse_name_intern: str
     start: Vec3
     ende:  Vec3
@@ -85,103 +91,284 @@ class Traversenstrecke:
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Kraefte]:
-        k = konst or aktuelle_konstanten()
-        _zaehigkeit = k.zaehigkeit_kin
-        _luftdichte = k.luftdichte
+        return self.windkraefte_batch(
+            norm, [windrichtung], staudruecke, obergrenzen, konst,
+            protokolle=[protokoll], kontext=kontext,
+        )[0]
 
-        base_ctx = merge_kontext(kontext, {
-            "funktion": "Windkraefte",
-            "norm": norm.value,
-            "element_id": self.element_id_intern,
-            "objekttyp": self.objekttyp.value,
-            "objekt_name": self.anzeigename,
-            "windrichtung": windrichtung,
-        })
+    def windlast_basis(
+        self,
+        norm: Norm,
+        obergrenzen: Sequence[float],
+        *,
+        stufe: int = 0,
+    ) -> WindlastBasis:
+        """
+        q-unabhängige Windlast-Basis (Schlankheit, Segmentierung, eingeschlossene Fläche).
+        Gecacht im lastcache je (Element, Katalog-Spec, Norm, Obergrenzen) → gilt für alle Staudruck-Szenarien.
+        """
+        fp = element_fingerprint(self)
+        key = basis_schluessel(fp, catalog.spec_version, norm, obergrenzen) if fp is not None else None
+        if key is not None:
+            basis = lastcache.get(key, stufe=stufe)
+            if basis is not None:
+                return basis
 
-        # 1) Gesamt (einmalig)
+        elem_ctx = self._wind_kontext(norm)
+        aufz_schlankheit = make_aufzeichnung(stufe)
         _schlankheit = schlankheit(
             norm, self.objekttyp, self.traverse_name_intern, [self.start, self.ende],
-            protokoll=protokoll, kontext=base_ctx,
+            protokoll=aufz_schlankheit, kontext=elem_ctx,
         )
 
-        # 2) Segmentierung nach Höhenbereichen
+        # Segmentierung hängt nur von der Geometrie und den Obergrenzen ab (q wird je Szenario zugeordnet)
         segmente = segmentiere_strecke_nach_hoehenbereichen(
-            self.start, self.ende, staudruecke, obergrenzen
+            self.start, self.ende, [0.0] * len(obergrenzen), obergrenzen
         )
-        if not segmente:
-            protokolliere_msg(
-                protokoll, severity=Severity.ERROR, code="TRAV/NO_WIND_SEGMENTS",
-                text="Traverse liegt in keinem Windbereich.",
-                kontext=base_ctx,
-            )
-            # Fallback: keine Windkräfte zurückgeben (wird durch ERROR später verworfen)
-            return []
-
-        # 3) Pro Abschnitt rechnen
-        einzelkraefte_vektoren: list[Vec3] = []
-        angriffsbereiche: list[list[Vec3]] = []
-
+        seg_basis: List[WindlastSegmentBasis] = []
         for i, seg in enumerate(segmente):
             start_lokal = seg["start_lokal"]
             ende_lokal  = seg["ende_lokal"]
-            staudruck   = seg["staudruck"]
-            seg_ctx = merge_kontext(base_ctx, {
-                "segment_index": i,
-                "segment_z": (start_lokal[2], ende_lokal[2]),
-                "staudruck": staudruck,
-            })
-
-            # Abschnittsweise Größen (abhängig von lokaler Geometrie / staudruck)
-            _reynoldszahl = reynoldszahl(
-                norm, self.objekttyp, self.traverse_name_intern, staudruck, _zaehigkeit, _luftdichte,
-                protokoll=protokoll, kontext=seg_ctx,
+            aufz_eingeschlossen = make_aufzeichnung(stufe)
+            _eingeschlossene_Flaeche = eingeschlossene_flaeche(
+                norm, self.objekttyp, self.traverse_name_intern, [start_lokal, ende_lokal],
+                protokoll=aufz_eingeschlossen, kontext=self._segment_kontext(elem_ctx, i, start_lokal, ende_lokal),
             )
+            seg_basis.append(WindlastSegmentBasis(
+                bereich_index=seg["bereich_index"],
+                start_lokal=start_lokal,
+                ende_lokal=ende_lokal,
+                eingeschlossene_flaeche=_eingeschlossene_Flaeche.wert,
+                aufz_eingeschlossen=aufz_eingeschlossen,
+            ))
+
+        basis = WindlastBasis(
+            schlankheit=_schlankheit.wert,
+            segmente=tuple(seg_basis),
+            aufz_schlankheit=aufz_schlankheit,
+            stufe=stufe,
+        )
+        if key is not None:
+            lastcache.put(key, basis)
+        return basis
+
+    def _richtungs_basis(
+        self,
+        norm: Norm,
+        basis: WindlastBasis,
+        windrichtung: Vec3,
+        *,
+        stufe: int = 0,
+    ) -> WindlastRichtungsBasis:
+        """Projizierte Fläche, Völligkeitsgrad und Abminderungsfaktor je Segment (q-unabhängig, je Richtung gecacht)."""
+        r_key = richtungs_schluessel(windrichtung)
+        rb = basis.richtungen.get(r_key)
+        if rb is not None and rb.stufe >= stufe:
+            return rb
+
+        elem_ctx = self._wind_kontext(norm)
+        A_proj, phi, psi = [], [], []
+        aufz_proj, aufz_phi, aufz_psi = [], [], []
+        for i, seg in enumerate(basis.segmente):
+            seg_ctx = self._segment_kontext(elem_ctx, i, seg.start_lokal, seg.ende_lokal)
+            aufz = make_aufzeichnung(stufe)
             _projizierte_Flaeche = projizierte_flaeche(
-                norm, self.objekttyp, [start_lokal, ende_lokal, self.orientierung],
+                norm, self.objekttyp, [seg.start_lokal, seg.ende_lokal, self.orientierung],
                 self.traverse_name_intern, windrichtung,
-                protokoll=protokoll, kontext=seg_ctx,
-            )
-            _eingeschlossene_Flaeche = eingeschlossene_flaeche(
-                norm, self.objekttyp, self.traverse_name_intern, [start_lokal, ende_lokal],
-                protokoll=protokoll, kontext=seg_ctx,
+                protokoll=aufz, kontext=seg_ctx,
             )
+            A_proj.append(_projizierte_Flaeche.wert)
+            aufz_proj.append(aufz)
+
+            aufz = make_aufzeichnung(stufe)
             _voelligkeitsgrad = voelligkeitsgrad(
-                norm, _projizierte_Flaeche.wert, _eingeschlossene_Flaeche.wert,
-                protokoll=protokoll, kontext=seg_ctx,
-            )
-            _grundkraftbeiwert = grundkraftbeiwert(
-                norm, self.objekttyp, self.traverse_name_intern,
-                [start_lokal, ende_lokal, self.orientierung],
-                None,
-                windrichtung,
-                _voelligkeitsgrad.wert,
-                _reynoldszahl.wert,
-                protokoll=protokoll, kontext=seg_ctx,
+                norm, _projizierte_Flaeche.wert, seg.eingeschlossene_flaeche,
+                protokoll=aufz, kontext=seg_ctx,
             )
+            phi.append(_voelligkeitsgrad.wert)
+            aufz_phi.append(aufz)
+
+            aufz = make_aufzeichnung(stufe)
             _abminderungsfaktor_schlankheit = abminderungsfaktor_schlankheit(
-                norm, self.objekttyp, _schlankheit.wert, _voelligkeitsgrad.wert,
-                protokoll=protokoll, kontext=seg_ctx,
-            )
-            _kraftbeiwert = kraftbeiwert(
-                norm, self.objekttyp, _grundkraftbeiwert.wert, _abminderungsfaktor_schlankheit.wert,
-                protokoll=protokoll, kontext=seg_ctx,
+                norm, self.objekttyp, basis.schlankheit, _voelligkeitsgrad.wert,
+                protokoll=aufz, kontext=seg_ctx,
             )
-            _windkraft = windkraft(
-                norm, self.objekttyp, _kraftbeiwert.wert, staudruck, _projizierte_Flaeche.wert,
-                protokoll=protokoll, kontext=seg_ctx,
+            psi.append(_abminderungsfaktor_schlankheit.wert)
+            aufz_psi.append(aufz)
+
+        rb = WindlastRichtungsBasis(
+            projizierte_flaeche=tuple(A_proj),
+            voelligkeitsgrad=tuple(phi),
+            abminderungsfaktor=tuple(psi),
+            aufz_projiziert=tuple(aufz_proj),
+            aufz_voelligkeit=tuple(aufz_phi),
+            aufz_abminderung=tuple(aufz_psi),
+            stufe=stufe,
+        )
+        basis.richtungen[r_key] = rb
+        return rb
+
+    def _wind_kontext(self, norm: Norm) -> dict:
+        return merge_kontext(None, {
+            "funktion": "Windkraefte",
+            "norm": norm.value,
+            "element_id": self.element_id_intern,
+            "objekttyp": self.objekttyp.value,
+            "objekt_name": self.anzeigename,
+        })
+
+    @staticmethod
+    def _segment_kontext(elem_ctx: dict, i: int, start_lokal: Vec3, ende_lokal: Vec3) -> dict:
+        return merge_kontext(elem_ctx, {
+            "segment_index": i,
+            "segment_z": (start_lokal[2], ende_lokal[2]),
+        })
+
+    def wind_vorbereitung(
+        self,
+        norm: Norm,
+        staudruecke: Sequence[float],
+        obergrenzen: Sequence[float],
+        konst: PhysikKonstanten | None = None,
+        *,
+        stufe: int = 0,
+        kontext: Optional[dict] = None,
+    ) -> WindlastVorbereitung:
+        """
+        Richtungsunabhängiger Anteil von windkraefte_batch: windlast_basis + Reynoldszahl je Segment
+        (q-abhängig, Doku aufgezeichnet). kontext=None → Kontexte relativ zum Element (wie im Batch).
+        """
+        k = konst or aktuelle_konstanten()
+        _zaehigkeit = k.zaehigkeit_kin
+        _luftdichte = k.luftdichte
+
+        pruefe_hoehenbereiche(staudruecke, obergrenzen)
+        basis = self.windlast_basis(norm, obergrenzen, stufe=stufe)
+        base_ctx = merge_kontext(kontext, self._wind_kontext(norm))
+
+        seg_daten: List[WindlastSegmentQ] = []
+        for i, seg in enumerate(basis.segmente):
+            staudruck = staudruecke[seg.bereich_index]
+            seg_ctx = merge_kontext(
+                self._segment_kontext(base_ctx, i, seg.start_lokal, seg.ende_lokal),
+                {"staudruck": staudruck},
             )
-            _windkraft_vec = windkraft_zu_vektor(
-                norm, self.objekttyp, [start_lokal, ende_lokal], _windkraft.wert, windrichtung,
-                protokoll=protokoll, kontext=seg_ctx,
+            aufz_reynoldszahl = make_aufzeichnung(stufe)
+            _reynoldszahl = reynoldszahl(
+                norm, self.objekttyp, self.traverse_name_intern, staudruck, _zaehigkeit, _luftdichte,
+                protokoll=aufz_reynoldszahl, kontext=seg_ctx,
             )
+            seg_daten.append(WindlastSegmentQ(
+                staudruck=staudruck,
+                kontext=seg_ctx,
+                reynoldszahl=_reynoldszahl.wert,
+                aufz_reynoldszahl=aufz_reynoldszahl,
+            ))
+        return WindlastVorbereitung(basis=basis, segmente=tuple(seg_daten), stufe=stufe)
 
-            einzelkraefte_vektoren.append(_windkraft_vec.wert)
-            angriffsbereiche.append([start_lokal, ende_lokal])
+    def windkraefte_batch(
+        self,
+        norm: Norm,
+        richtungen: Sequence[Vec3],
+        staudruecke: Sequence[float],
+        obergrenzen: Sequence[float],
+        konst: PhysikKonstanten | None = None,
+        *,
+        protokolle: Optional[Sequence[Optional[Protokoll]]] = None,
+        kontext: Optional[dict] = None,
+        richtungs_kontexte: Optional[Sequence[Optional[dict]]] = None,
+        vorbereitung: Optional[WindlastVorbereitung] = None,
+    ) -> List[List[Kraefte]]:
+        """
+        Windkräfte für mehrere Windrichtungen in einem Durchlauf.
+        Stufe 1 (q-unabhängig, siehe windlast_basis): Schlankheit, Segmentierung, eingeschlossene Fläche,
+        je Richtung projizierte Fläche, Völligkeitsgrad und Abminderungsfaktor.
+        Stufe 2 (je q-Profil): Reynoldszahl, Grundkraftbeiwert (Re-Bereiche), Kraftbeiwert, F = c_f · q · A.
 
-        return [Kraefte(
-            element_id_intern=self.element_id_intern,
-            typ=Lasttyp.WIND,
-            variabilitaet=Variabilitaet.VERAENDERLICH,
-            Einzelkraefte=einzelkraefte_vektoren,
-            Angriffsflaeche_Einzelkraefte=angriffsbereiche,
-        )]
\ No newline at end of file
+        - protokolle[d]: Protokoll je Richtung; die Doku der wiederverwendeten Größen wird
+          in jedes Richtungs-Protokoll übertragen (identisch zu windkraefte(...) je Richtung).
+        - richtungs_kontexte[d]: zusätzliche Kontext-Einträge je Richtung (z.B. winkel_deg).
+        - vorbereitung: vorab bestimmter richtungsunabhängiger Anteil (wind_vorbereitung, z.B. aus prepare(...));
+          wird nur genutzt, wenn kontext=None und die Protokoll-Stufe ausreicht.
+        Rückgabe: [richtung][lastfall] → Kraefte (Einzelkräfte: Segmente × 3)
+        """
+        n = len(richtungen)
+        protokolle = list(protokolle) if protokolle is not None else [None] * n
+        stufe = max((protokoll_stufe(p) for p in protokolle), default=0)
+        dir_ctx = [
+            merge_kontext(richtungs_kontexte[d] if richtungs_kontexte is not None else None, {"windrichtung": r})
+            for d, r in enumerate(richtungen)
+        ]
+
+        if vorbereitung is None or vorbereitung.stufe < stufe or kontext is not None:
+            vorbereitung = self.wind_vorbereitung(norm, staudruecke, obergrenzen, konst, stufe=stufe, kontext=kontext)
+        basis = vorbereitung.basis
+        base_ctx = merge_kontext(kontext, self._wind_kontext(norm))
+
+        if not basis.segmente:
+            for d in range(n):
+                protokoll_uebertragen(basis.aufz_schlankheit, protokolle[d], basis=kontext, kontext=dir_ctx[d])
+                protokolliere_msg(
+                    protokolle[d], severity=Severity.ERROR, code="TRAV/NO_WIND_SEGMENTS",
+                    text="Traverse liegt in keinem Windbereich.",
+                    kontext=merge_kontext(base_ctx, dir_ctx[d]),
+                )
+            # Fallback: keine Windkräfte zurückgeben (wird durch ERROR später verworfen)
+            return [[] for _ in range(n)]
+
+        ergebnis: List[List[Kraefte]] = []
+        for d, windrichtung in enumerate(richtungen):
+            protokoll = protokolle[d]
+            rb = self._richtungs_basis(norm, basis, windrichtung, stufe=stufe)
+            protokoll_uebertragen(basis.aufz_schlankheit, protokoll, basis=kontext, kontext=dir_ctx[d])
+
+            einzelkraefte_vektoren: list[Vec3] = []
+            angriffsbereiche: list[list[Vec3]] = []
+
+            for i, seg in enumerate(basis.segmente):
+                seg_q = vorbereitung.segmente[i]
+                staudruck = seg_q.staudruck
+                start_lokal, ende_lokal = seg.start_lokal, seg.ende_lokal
+                seg_ctx_dir = merge_kontext(seg_q.kontext, dir_ctx[d])
+                unterlage = merge_kontext(merge_kontext(kontext, {"staudruck": staudruck}), dir_ctx[d])
+
+                protokoll_uebertragen(seg_q.aufz_reynoldszahl, protokoll, kontext=dir_ctx[d])
+                protokoll_uebertragen(rb.aufz_projiziert[i], protokoll, basis=unterlage)
+                protokoll_uebertragen(seg.aufz_eingeschlossen, protokoll, basis=unterlage)
+                protokoll_uebertragen(rb.aufz_voelligkeit[i], protokoll, basis=unterlage)
+                # c_f,0 hängt nur über Gültigkeitsgrenzen von Re ab → je q-Profil neu auswerten
+                _grundkraftbeiwert = grundkraftbeiwert(
+                    norm, self.objekttyp, self.traverse_name_intern,
+                    [start_lokal, ende_lokal, self.orientierung],
+                    None,
+                    windrichtung,
+                    rb.voelligkeitsgrad[i],
+                    seg_q.reynoldszahl,
+                    protokoll=protokoll, kontext=seg_ctx_dir,
+                )
+                protokoll_uebertragen(rb.aufz_abminderung[i], protokoll, basis=unterlage)
+                _kraftbeiwert = kraftbeiwert(
+                    norm, self.objekttyp, _grundkraftbeiwert.wert, rb.abminderungsfaktor[i],
+                    protokoll=protokoll, kontext=seg_ctx_dir,
+                )
+                _windkraft = windkraft(
+                    norm, self.objekttyp, _kraftbeiwert.wert, staudruck, rb.projizierte_flaeche[i],
+                    protokoll=protokoll, kontext=seg_ctx_dir,
+                )
+                _windkraft_vec = windkraft_zu_vektor(
+                    norm, self.objekttyp, [start_lokal, ende_lokal], _windkraft.wert, windrichtung,
+                    protokoll=protokoll, kontext=seg_ctx_dir,
+                )
+
+                einzelkraefte_vektoren.append(_windkraft_vec.wert)
+                angriffsbereiche.append([start_lokal, ende_lokal])
+
+            ergebnis.append([Kraefte(
+                element_id_intern=self.element_id_intern,
+                typ=Lasttyp.WIND,
+                variabilitaet=Variabilitaet.VERAENDERLICH,
+                Einzelkraefte=einzelkraefte_vektoren,
+                Angriffsflaeche_Einzelkraefte=angriffsbereiche,
+            )])
+
+        return ergebnis
@@ -0,0 +1,431 @@
+# datenstruktur/begrenztes_protokoll.py — Protokoll mit Obergrenzen je (nachweis, doc_type)
+"""
+Speicherbegrenztes Protokoll für große Rechnungen (viele Elemente, feines Richtungsraster).
+
+- DocGrenzen: Obergrenze je (nachweis, doc_type) plus Standardgrenze (0 = unbegrenzt)
+- BegrenztesProtokoll: Docs bis zur Grenze im Speicher, darüber je nach Überlauf
+    - "zusammenfassen" (Standard): je (nachweis, doc_type, szenario, titel) nur Anzahl/Min/Max als ein Doc
+    - "auslagern":      Anhängen an ein Temp-File (Pickle-Log), gelesen erst beim Iterieren (Mapper);
+                        hält alle Docs, kostet aber Zeit und beim Mappen Spitzenspeicher
+  Ergebnisbestimmende Docs (Rolle relevant/entscheidungsrelevant, BASIS, BALLAST) zählen mit,
+  bleiben aber immer im Speicher. Ebenso LOADS: diese Docs tragen beim Einfügen noch keine Rolle
+  (die vergibt der Mapper je Richtung), die der maßgebenden Richtung dürfen aber nicht wegfallen.
+- DocFolge: Doc-Sequenz über mehrere Protokolle, ausgelagerte Docs werden erst beim Lesen geholt
+- protokoll_statistik: prozessweite Speicher-Statistik (für die Dimensionierung der Server-Worker)
+
+Konfiguration über die Umgebung:
+    WINDLAST_DOC_GRENZE=<n>                          Standardgrenze je (nachweis, doc_type)
+    WINDLAST_DOC_GRENZEN=KIPP/axis_momente=200,GLEIT/=500  einzelne Grenzen (leerer doc_type = None)
+    WINDLAST_DOC_UEBERLAUF=zusammenfassen|auslagern
+"""
+from __future__ import annotations
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import chain
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Tuple, Union
+import os
+import pickle
+import sys
+import tempfile
+
+from windlast_CORE.datenstruktur.zwischenergebnis import (
+    DocAufbewahrung,
+    DOC_AUFBEWAHRUNG,
+    Kontext,
+    LazyDocBundle,
+    ListProtokoll,
+    collect_docs,
+    make_docbundle,
+    merge_kontext,
+)
+
+Ueberlauf = Literal["auslagern", "zusammenfassen"]
+UEBERLAUF: Tuple[str, ...] = ("auslagern", "zusammenfassen")
+
+DocTyp = Tuple[Optional[str], Optional[str]]   # (nachweis, doc_type)
+
+_IMMER_IM_SPEICHER_ROLLEN = ("relevant", "entscheidungsrelevant")
+_IMMER_IM_SPEICHER_NACHWEISE = ("BASIS", "BALLAST", "LOADS")
+_STICHPROBE = 32   # Docs je Protokoll für die Größenschätzung
+
+@dataclass(frozen=True)
+class DocGrenzen:
+    standard: int = 0                                          # 0 = unbegrenzt
+    je_typ: Mapping[DocTyp, int] = field(default_factory=dict)
+    ueberlauf: Ueberlauf = "zusammenfassen"
+
+    def __post_init__(self) -> None:
+        if self.ueberlauf not in UEBERLAUF:
+            raise ValueError(f"Unbekannter ueberlauf: {self.ueberlauf!r} (erlaubt: {', '.join(UEBERLAUF)})")
+        if self.standard < 0 or any(g < 0 for g in self.je_typ.values()):
+            raise ValueError("Doc-Grenzen müssen >= 0 sein (0 = unbegrenzt).")
+
+    @property
+    def aktiv(self) -> bool:
+        return self.standard > 0 or any(g > 0 for g in self.je_typ.values())
+
+    def grenze(self, typ: DocTyp) -> int:
+        return self.je_typ.get(typ, self.standard)
+
+def doc_grenzen_aus_env(environ: Mapping[str, str] = os.environ) -> DocGrenzen:
+    """DocGrenzen aus WINDLAST_DOC_GRENZE / WINDLAST_DOC_GRENZEN / WINDLAST_DOC_UEBERLAUF (siehe Modul-Doku)."""
+    je_typ: Dict[DocTyp, int] = {}
+    for eintrag in (environ.get("WINDLAST_DOC_GRENZEN") or "").split(","):
+        if not eintrag.strip():
+            continue
+        try:
+            typ, wert = eintrag.split("=")
+            nachweis, _, doc_type = typ.strip().partition("/")
+            je_typ[(nachweis or None, doc_type or None)] = int(wert)
+        except ValueError as e:
+            raise ValueError(f"Ungültiger Eintrag in WINDLAST_DOC_GRENZEN: {eintrag!r} (Form: NACHWEIS/doc_type=n)") from e
+    return DocGrenzen(
+        standard=int(environ.get("WINDLAST_DOC_GRENZE") or "0"),
+        je_typ=je_typ,
+        ueberlauf=environ.get("WINDLAST_DOC_UEBERLAUF") or "zusammenfassen",
+    )
+
+DOC_GRENZEN = doc_grenzen_aus_env()
+
+class _AuslagerLog:
+    """Append-only Pickle-Log in einer anonymen Temp-Datei (wird beim Schließen/GC gelöscht)."""
+    __slots__ = ("_datei", "anzahl")
+
+    def __init__(self) -> None:
+        self._datei = tempfile.TemporaryFile(prefix="windlast_docs_")
+        self.anzahl = 0
+
+    @property
+    def bytes(self) -> int:
+        return self._datei.seek(0, os.SEEK_END)
+
+    def anhaengen(self, doc: Tuple[Any, Any]) -> None:
+        self._datei.seek(0, os.SEEK_END)
+        pickle.dump(doc, self._datei, protocol=pickle.HIGHEST_PROTOCOL)
+        self.anzahl += 1
+
+    def lesen(self) -> Iterator[Tuple[Any, Any]]:
+        # eigener Lesezeiger je Durchlauf, Anhängen setzt ohnehin ans Ende
+        pos = 0
+        for _ in range(self.anzahl):
+            self._datei.seek(pos)
+            doc = pickle.load(self._datei)
+            pos = self._datei.tell()
+            yield doc
+
+    def roh(self) -> bytes:
+        self._datei.seek(0)
+        return self._datei.read()
+
+    @classmethod
+    def aus_roh(cls, daten: bytes, anzahl: int) -> "_AuslagerLog":
+        log = cls()
+        log._datei.write(daten)
+        log.anzahl = anzahl
+        return log
+
+class _Sammlung:
+    """Zusammenfassung übergelaufener Docs eines (nachweis, doc_type, szenario, titel)."""
+    __slots__ = ("kontext", "titel", "einheit", "anzahl", "minimum", "maximum")
+
+    def __init__(self, kontext: Kontext, titel: Any, einheit: Any) -> None:
+        self.kontext = kontext
+        self.titel = titel
+        self.einheit = einheit
+        self.anzahl = 0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def aufnehmen(self, wert: Any) -> None:
+        self.anzahl += 1
+        if type(wert) in (int, float) and wert == wert:
+            if self.minimum is None or wert < self.minimum:
+                self.minimum = wert
+            if self.maximum is None or wert > self.maximum:
+                self.maximum = wert
+
+    def als_doc(self) -> Tuple[Dict[str, Any], Kontext]:
+        bundle = make_docbundle(
+            titel=f"{self.titel} (zusammengefasst)",
+            wert=None if self.minimum is None else [self.minimum, self.maximum],
+            einheit=self.einheit,
+            einzelwerte=[("Anzahl", self.anzahl), ("Minimum", self.minimum), ("Maximum", self.maximum)],
+        )
+        return bundle, merge_kontext(self.kontext, {"zusammenfassung": self.anzahl})
+
+_Eintrag = Union[Tuple[Any, Kontext], None, _Sammlung]   # im Speicher | nächstes Doc im Log | Zusammenfassung
+
+class BegrenztesProtokoll(ListProtokoll):
+    """
+    Protokoll mit Obergrenzen je (nachweis, doc_type), siehe Modul-Doku.
+    Beachtet die Aufbewahrung (richtungsdoc_behalten); dedupliziert wird nicht (der Dedup-Index
+    wüchse wieder mit jedem Doc), das übernimmt wie bisher der Mapper. Messages/Decisions wie ListProtokoll.
+    docs: DocFolge in Einfügereihenfolge; ausgelagerte Docs werden erst beim Iterieren gelesen.
+    """
+
+    def __init__(self, *, grenzen: DocGrenzen, aufbewahrung: DocAufbewahrung = "alle") -> None:
+        # bewusst ohne ListProtokoll.__init__: docs ist hier eine Sicht auf _eintraege
+        if aufbewahrung not in DOC_AUFBEWAHRUNG:
+            raise ValueError(f"Unbekannte aufbewahrung: {aufbewahrung!r} (erlaubt: {', '.join(DOC_AUFBEWAHRUNG)})")
+        self.messages = []
+        self.decisions = []
+        self.grenzen = grenzen
+        self.aufbewahrung = aufbewahrung
+        self.verworfen = 0
+        self._eintraege: List[_Eintrag] = []
+        self._je_typ: Dict[DocTyp, int] = {}
+        self._sammlungen: Dict[tuple, _Sammlung] = {}
+        self._log: Optional[_AuslagerLog] = None
+        self.ausgelagert = 0
+        self.zusammengefasst = 0
+
+    @property
+    def docs(self) -> "DocFolge":
+        return DocFolge((self,))
+
+    def __len__(self) -> int:
+        return len(self._eintraege)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        log = self._log.lesen() if self._log is not None else None
+        for e in self._eintraege:
+            if type(e) is tuple:
+                yield e
+            elif e is None:
+                yield next(log)
+            else:
+                yield e.als_doc()
+
+    def add_doc(
+        self,
+        *,
+        bundle: Mapping[str, Any],
+        kontext: Optional[dict] = None,
+    ) -> None:
+        if not isinstance(bundle, LazyDocBundle):
+            bundle = dict(bundle)
+        if not isinstance(kontext, Kontext):
+            kontext = merge_kontext(kontext, None)
+        rolle = kontext.get("rolle") or kontext.get("role")
+        nachweis = kontext.get("nachweis")
+        typ = (nachweis, kontext.get("doc_type"))
+        anzahl = self._je_typ.get(typ, 0) + 1
+        self._je_typ[typ] = anzahl
+        grenze = self.grenzen.grenze(typ)
+        if (grenze <= 0 or anzahl <= grenze or rolle in _IMMER_IM_SPEICHER_ROLLEN
+                or nachweis in _IMMER_IM_SPEICHER_NACHWEISE):
+            eintrag: _Eintrag = (bundle, kontext)
+        elif self.grenzen.ueberlauf == "auslagern":
+            if self._log is None:
+                self._log = _AuslagerLog()
+            eintrag = None
+            self._log.anhaengen((bundle, kontext))
+            self.ausgelagert += 1
+        else:
+            self.zusammengefasst += 1
+            self._zusammenfassen(bundle, kontext)
+            return
+        self._eintraege.append(eintrag)
+
+    def _zusammenfassen(self, bundle: Mapping[str, Any], kontext: Kontext) -> None:
+        lesen = bundle.vorab if isinstance(bundle, LazyDocBundle) else bundle.get
+        titel = lesen("titel") or lesen("title")
+        nachweis, doc_type, szenario = kontext.get("nachweis"), kontext.get("doc_type"), kontext.get("szenario")
+        gruppe = (nachweis, doc_type, szenario, titel)
+        sammlung = self._sammlungen.get(gruppe)
+        if sammlung is None:
+            basis = {"nachweis": nachweis, "doc_type": doc_type, "szenario": szenario,
+                     "szenario_anzeigename": kontext.get("szenario_anzeigename"), "rolle": "irrelevant"}
+            sammlung = self._sammlungen[gruppe] = _Sammlung(merge_kontext(None, basis), titel, lesen("einheit"))
+            self._eintraege.append(sammlung)
+        sammlung.aufnehmen(lesen("wert"))
+
+    def speicher_statistik(self) -> Dict[str, Any]:
+        aus = _schaetzung(self, (e for e in self._eintraege if type(e) is tuple),
+                          len(self._eintraege) - self.ausgelagert - len(self._sammlungen))
+        aus.update({
+            "docs": len(self._eintraege) - len(self._sammlungen) + self.zusammengefasst,
+            "ausgelagert": self.ausgelagert,
+            "ausgelagert_bytes": self._log.bytes if self._log is not None else 0,
+            "zusammengefasst": self.zusammengefasst,
+            "zusammenfassungen": len(self._sammlungen),
+            "verworfen": self.verworfen,
+            "je_typ": dict(self._je_typ),
+        })
+        return aus
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Prozess-Grenzen (executor="processes"): Log als Bytes mitgeben, drüben neu anlegen
+        zustand = self.__dict__.copy()
+        log = zustand.pop("_log")
+        zustand["_log_roh"] = (log.roh(), log.anzahl) if log is not None else None
+        return zustand
+
+    def __setstate__(self, zustand: Dict[str, Any]) -> None:
+        roh = zustand.pop("_log_roh")
+        self.__dict__.update(zustand)
+        self._log = _AuslagerLog.aus_roh(*roh) if roh is not None else None
+
+class DocFolge(Sequence):
+    """
+    Docs mehrerer Protokolle als eine Sequenz (Reihenfolge der Teile), ohne sie zu kopieren.
+    Iterieren liest ausgelagerte Docs jedes Mal frisch aus dem Log; Indexzugriff materialisiert einmal.
+    Pickle/deepcopy ergeben eine normale Liste.
+    """
+    __slots__ = ("_teile", "_liste")
+
+    def __init__(self, teile: Iterable[Iterable[Tuple[Any, Any]]]) -> None:
+        self._teile = tuple(teile)
+        self._liste: Optional[List[Tuple[Any, Any]]] = None
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        if self._liste is not None:
+            return iter(self._liste)
+        return chain.from_iterable(self._teile)
+
+    def __len__(self) -> int:
+        return sum(len(t) for t in self._teile)
+
+    def __getitem__(self, index):
+        if self._liste is None:
+            self._liste = list(chain.from_iterable(self._teile))
+        return self._liste[index]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+        return deepcopy(list(self), memo)
+
+    def __repr__(self) -> str:
+        return f"DocFolge({len(self)} Docs)"
+
+def docs_einsammeln(protokolle: Iterable[Any]) -> Union[List[Tuple[Any, Any]], DocFolge]:
+    """
+    Docs aller Protokolle in Reihenfolge: Liste wie collect_docs, solange nichts ausgelagert wurde,
+    sonst eine DocFolge (ausgelagerte Docs werden erst vom Mapper gelesen).
+    """
+    protokolle = list(protokolle)
+    if any(isinstance(p, BegrenztesProtokoll) and p.ausgelagert for p in protokolle):
+        return DocFolge([p if isinstance(p, BegrenztesProtokoll) else collect_docs(p) for p in protokolle])
+    return [d for p in protokolle for d in collect_docs(p)]
+
+# ========= Speicher-Statistik =========
+
+def _flach_groesse(obj: Any) -> int:
+    # Objekt + direkte Inhalte (Strings/Zahlen/kleine Listen); geteilte Objekte zählen mehrfach
+    groesse = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        werte: Iterable[Any] = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        werte = obj
+    else:
+        return groesse
+    for v in werte:
+        groesse += sys.getsizeof(v)
+        if isinstance(v, (list, tuple)):
+            groesse += sum(sys.getsizeof(x) for x in v)
+    return groesse
+
+def _doc_groesse(bundle: Any, kontext: Any) -> int:
+    groesse = sys.getsizeof((bundle, kontext))
+    if isinstance(bundle, LazyDocBundle):
+        # unausgewertet: nur die gebundenen Argumente der Fabrik
+        daten = bundle._daten if bundle._daten is not None else getattr(bundle._fabrik, "keywords", None)
+        groesse += sys.getsizeof(bundle) + (_flach_groesse(daten) if daten is not None else 0)
+    else:
+        groesse += _flach_groesse(bundle)
+    if isinstance(kontext, Kontext):
+        # nur das eigene Delta, Eltern-Kontexte werden geteilt
+        groesse += sys.getsizeof(kontext) + _flach_groesse(kontext._delta)
+    elif kontext is not None:
+        groesse += _flach_groesse(kontext)
+    return groesse
+
+def _schaetzung(protokoll: Any, docs: Iterable[Tuple[Any, Any]], anzahl: int) -> Dict[str, Any]:
+    """Geschätzte Bytes der Docs im Speicher: flache Größe einer Stichprobe × Anzahl."""
+    stichprobe = []
+    schritt = max(1, anzahl // _STICHPROBE)
+    for i, (bundle, kontext) in enumerate(docs):
+        if i % schritt == 0:
+            stichprobe.append(_doc_groesse(bundle, kontext))
+            if len(stichprobe) >= _STICHPROBE:
+                break
+    mittel = sum(stichprobe) / len(stichprobe) if stichprobe else 0.0
+    return {
+        "im_speicher": anzahl,
+        "geschaetzt_bytes": int(mittel * anzahl),
+        "messages": len(getattr(protokoll, "messages", ()) or ()),
+        "decisions": len(getattr(protokoll, "decisions", ()) or ()),
+    }
+
+def speicher_statistik(protokoll: Any) -> Dict[str, Any]:
+    """Speicher-Statistik eines Protokolls (BegrenztesProtokoll ausführlich, sonst Anzahl + Schätzung)."""
+    if isinstance(protokoll, BegrenztesProtokoll):
+        return protokoll.speicher_statistik()
+    docs = getattr(protokoll, "docs", None) or []
+    aus = _schaetzung(protokoll, docs, len(docs))
+    aus.update({"docs": len(docs), "ausgelagert": 0, "ausgelagert_bytes": 0, "zusammengefasst": 0})
+    return aus
+
+class ProtokollStatistik:
+    """
+    Prozessweite Statistik über abgeschlossene Szenario-Protokolle (analog zu lastcache.stats()):
+    Summen und Maxima je Protokoll sowie die häufigsten (nachweis, doc_type) begrenzter Protokolle.
+    """
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._zuruecksetzen()
+
+    def _zuruecksetzen(self) -> None:
+        self.protokolle = 0
+        self.docs = 0
+        self.docs_max = 0
+        self.im_speicher_max = 0
+        self.geschaetzt_bytes = 0
+        self.geschaetzt_bytes_max = 0
+        self.ausgelagert = 0
+        self.ausgelagert_bytes = 0
+        self.zusammengefasst = 0
+        self.je_typ: Dict[DocTyp, int] = {}
+
+    def erfassen(self, protokoll: Any) -> Dict[str, Any]:
+        s = speicher_statistik(protokoll)
+        with self._lock:
+            self.protokolle += 1
+            self.docs += s["docs"]
+            self.docs_max = max(self.docs_max, s["docs"])
+            self.im_speicher_max = max(self.im_speicher_max, s["im_speicher"])
+            self.geschaetzt_bytes += s["geschaetzt_bytes"]
+            self.geschaetzt_bytes_max = max(self.geschaetzt_bytes_max, s["geschaetzt_bytes"])
+            self.ausgelagert += s["ausgelagert"]
+            self.ausgelagert_bytes += s["ausgelagert_bytes"]
+            self.zusammengefasst += s["zusammengefasst"]
+            for typ, n in (s.get("je_typ") or {}).items():
+                self.je_typ[typ] = self.je_typ.get(typ, 0) + n
+        return s
+
+    def clear(self) -> None:
+        with self._lock:
+            self._zuruecksetzen()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            haeufigste = sorted(self.je_typ.items(), key=lambda kv: -kv[1])[:20]
+            return {
+                "protokolle": self.protokolle,
+                "docs": self.docs,
+                "docs_max": self.docs_max,
+                "im_speicher_max": self.im_speicher_max,
+                "geschaetzt_bytes": self.geschaetzt_bytes,
+                "geschaetzt_bytes_max": self.geschaetzt_bytes_max,
+                "ausgelagert": self.ausgelagert,
+                "ausgelagert_bytes": self.ausgelagert_bytes,
+                "zusammengefasst": self.zusammengefasst,
+                "je_typ": {f"{n or ''}/{t or ''}": anzahl for (n, t), anzahl in haeufigste},
+            }
+
+# Prozessweite Statistik (analog zu lastcache)
+protokoll_statistik = ProtokollStatistik()
@@ -65,6 +65,10 @@ class RechenmethodeAbheben(str, Enum):
 class VereinfachungKonstruktion(str, Enum):
     KEINE = "keine"
 
+class RichtungsStrategie(str, Enum):
+    RASTER = "Raster"    # anzahl_windrichtungen gleichmäßig verteilte Richtungen
+    ADAPTIV = "Adaptiv"  # Raster als Grobsuche, danach Eingrenzung der kritischen Richtung
+
 class Betriebszustand(str, Enum):
     IN_BETRIEB = "in Betrieb"
     AUSSER_BETRIEB = "außer Betrieb"
@@ -0,0 +1,197 @@
+# datenstruktur/ergebnis_json.py — JSON-Kodierer für Ergebnisse (ein Durchlauf, direkt zu Bytes)
+from __future__ import annotations
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from json import JSONEncoder
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+import os
+
+# Kurze, wiederkehrende Strings (Titel, Einheiten, Katalog-/Elementnamen, Rollen ...) werden
+# einmal kodiert und als Fragment wiederverwendet. Begrenzung je Modus, danach kein Nachtragen mehr.
+FRAGMENT_CACHE_MAX = int(os.environ.get("WINDLAST_JSON_FRAGMENTE", "16384"))
+_FRAGMENT_LAENGE_MAX = 64
+
+_fragmente: Dict[bool, Dict[str, str]] = {True: {}, False: {}}  # ensure_ascii -> {str: JSON}
+
+# Strikte Standard-Encoder (C) für Daten, die bereits JSON-sicher sind (Ausgabe von build_api_output)
+_strikt: Dict[tuple, JSONEncoder] = {}
+
+_INF = float("inf")
+_float_repr = float.__repr__
+_int_repr = int.__repr__
+
+class JsonFragment(str):
+    """Bereits serialisiertes JSON; wird vom Kodierer unverändert übernommen."""
+    __slots__ = ()
+
+def _schluessel_text(k: Any) -> str:
+    # wie ergebnis_mapper._enum_to_str: Enums über den Namen, sonst str()
+    if type(k) is str:
+        return k
+    return getattr(k, "name", str(k))
+
+def _erstes(paar):
+    return paar[0]
+
+def _zahl(v: float) -> str:
+    if v != v:
+        return "null"
+    if v == _INF:
+        return '"INF"'
+    if v == -_INF:
+        return '"-INF"'
+    return _float_repr(v)
+
+def _kodierer(*, sort_keys: bool, ensure_ascii: bool, indent: Optional[int]) -> Callable[[Any, List[str], int], None]:
+    enc = encode_basestring_ascii if ensure_ascii else encode_basestring
+    fragmente = _fragmente[ensure_ascii]
+    fragment = fragmente.get
+    schluessel_sep = ":" if indent is None else ": "
+    schluessel_cache: Dict[str, str] = {}  # Schlüsseltext -> '"key":' (je Aufruf)
+    einrueckungen: List[str] = []
+
+    def text(s: str) -> str:
+        j = enc(s)
+        if len(s) <= _FRAGMENT_LAENGE_MAX and len(fragmente) < FRAGMENT_CACHE_MAX:
+            fragmente[s] = j
+        return j
+
+    def klammern(tiefe: int):
+        # (nach Öffnen, zwischen Einträgen, vor Schließen) je Tiefe
+        if indent is None:
+            return "", ",", ""
+        while len(einrueckungen) <= tiefe + 1:
+            einrueckungen.append("\n" + " " * (indent * len(einrueckungen)))
+        innen = einrueckungen[tiefe + 1]
+        return innen, "," + innen, einrueckungen[tiefe]
+
+    def skalar(v: Any, out: List[str], tiefe: int) -> None:
+        # häufige exakte Typen direkt, alles andere über kodieren()
+        t = type(v)
+        if t is str:
+            j = fragment(v)
+            out.append(j if j is not None else text(v))
+        elif t is float:
+            out.append(_float_repr(v) if v - v == 0.0 else _zahl(v))
+        elif v is None:
+            out.append("null")
+        elif t is int:
+            out.append(_int_repr(v))
+        else:
+            kodieren(v, out, tiefe)
+
+    def objekt(paare, out: List[str], tiefe: int) -> None:
+        paare = [(k if type(k) is str else _schluessel_text(k), v) for k, v in paare]
+        if not paare:
+            out.append("{}")
+            return
+        if sort_keys:
+            paare.sort(key=_erstes)
+        auf, sep, zu = klammern(tiefe)
+        out.append("{" + auf)
+        erst = True
+        for k, v in paare:
+            if erst:
+                erst = False
+            else:
+                out.append(sep)
+            j = schluessel_cache.get(k)
+            if j is None:
+                j = schluessel_cache[k] = enc(k) + schluessel_sep
+            out.append(j)
+            skalar(v, out, tiefe + 1)
+        out.append(zu + "}")
+
+    def liste(werte, out: List[str], tiefe: int) -> None:
+        if not werte:
+            out.append("[]")
+            return
+        auf, sep, zu = klammern(tiefe)
+        out.append("[" + auf)
+        erst = True
+        for v in werte:
+            if erst:
+                erst = False
+            else:
+                out.append(sep)
+            skalar(v, out, tiefe + 1)
+        out.append(zu + "]")
+
+    def kodieren(o: Any, out: List[str], tiefe: int) -> None:
+        t = type(o)
+        if t is dict:
+            objekt(o.items(), out, tiefe)
+        elif t is list or t is tuple:
+            liste(o, out, tiefe)
+        elif t is str:
+            out.append(fragment(o) or text(o))
+        elif t is float:
+            out.append(_zahl(o))
+        elif o is None:
+            out.append("null")
+        elif o is True:
+            out.append("true")
+        elif o is False:
+            out.append("false")
+        elif t is int:
+            out.append(_int_repr(o))
+        elif t is JsonFragment:
+            out.append(o)
+        # Unterklassen: Zahlen vor Enums (IntEnum bleibt Zahl), str-Enums über den Namen
+        elif isinstance(o, float):
+            out.append(_zahl(o))
+        elif isinstance(o, int):
+            out.append(_int_repr(o))
+        elif isinstance(o, Enum):
+            out.append(text(o.name))
+        elif isinstance(o, str):
+            out.append(text(str(o)))
+        elif is_dataclass(o) and not isinstance(o, type):
+            objekt(((f.name, getattr(o, f.name)) for f in fields(o)), out, tiefe)
+        elif isinstance(o, Mapping):   # auch LazyDocBundle
+            objekt(o.items(), out, tiefe)
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            liste(list(o), out, tiefe)
+        elif isinstance(o, Sequence) and not isinstance(o, (bytes, bytearray)):   # z.B. DocFolge
+            liste(list(o), out, tiefe)
+        else:
+            raise TypeError(f"Object of type {t.__name__} is not JSON serializable")
+
+    return kodieren
+
+def _strikter_encoder(sort_keys: bool, ensure_ascii: bool, indent: Optional[int]) -> JSONEncoder:
+    schluessel = (sort_keys, ensure_ascii, indent)
+    encoder = _strikt.get(schluessel)
+    if encoder is None:
+        encoder = _strikt[schluessel] = JSONEncoder(
+            sort_keys=sort_keys, ensure_ascii=ensure_ascii, indent=indent, allow_nan=False,
+            separators=(",", ":") if indent is None else (",", ": "),
+        )
+    return encoder
+
+def ergebnis_json(obj: Any, *, sort_keys: bool = False, ensure_ascii: bool = False,
+                  indent: Optional[int] = None, json_sicher: bool = False) -> bytes:
+    """
+    Serialisiert Ergebnisse (Dicts aus build_api_output ebenso wie StandsicherheitErgebnis selbst)
+    in einem Durchlauf zu UTF-8-Bytes:
+    - Enums → Name, Dataclasses/Mappings → Objekt, Tupel/Vec3/Sets → Liste
+    - float: NaN → null, ±inf → "INF"/"-INF" (wie _jsonify_number im Mapper)
+    - JsonFragment wird unverändert eingefügt
+    indent=None → kompakt (",", ":"), sonst wie json.dumps(indent=...).
+
+    json_sicher=True: obj besteht nur aus Builtins mit endlichen Zahlen (z.B. build_api_output).
+    Dann schreibt der C-Encoder; stößt er doch auf inf/NaN oder fremde Typen, folgt der volle Durchlauf.
+    """
+    if json_sicher:
+        try:
+            return _strikter_encoder(sort_keys, ensure_ascii, indent).encode(obj).encode("utf-8")
+        except (TypeError, ValueError):
+            pass
+    out: List[str] = []
+    _kodierer(sort_keys=sort_keys, ensure_ascii=ensure_ascii, indent=indent)(obj, out, 0)
+    return "".join(out).encode("utf-8")
+
+def fragment_cache_leeren() -> None:
+    for fragmente in _fragmente.values():
+        fragmente.clear()
@@ -0,0 +1,75 @@
+# datenstruktur/fortschritt.py — Fortschritt + kooperativer Abbruch langer Berechnungen
+from __future__ import annotations
+import contextlib, contextvars
+import threading
+from typing import Dict, Iterator, Optional
+
+class BerechnungAbgebrochen(Exception):
+    """Die Berechnung wurde über Fortschritt.abbrechen() beendet (an einem Checkpoint)."""
+
+class Fortschritt:
+    """
+    Zähler für erledigte Einheiten (Norm × Szenario × Nachweis × Windrichtung) und Abbruch-Flag.
+    Wird über fortschritt_kontext(...) gesetzt; Rechenfunktionen melden über fortschritt_checkpoint().
+    Thread-sicher (mehrere Szenario-Jobs können gleichzeitig melden).
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._abbruch = threading.Event()
+        self.gesamt = 0
+        self.erledigt = 0
+
+    def planen(self, einheiten: int) -> None:
+        with self._lock:
+            self.gesamt += einheiten
+
+    def melden(self, einheiten: int = 1) -> None:
+        with self._lock:
+            self.erledigt += einheiten
+            if self.erledigt > self.gesamt:
+                self.gesamt = self.erledigt
+
+    def abbrechen(self) -> None:
+        self._abbruch.set()
+
+    @property
+    def abgebrochen(self) -> bool:
+        return self._abbruch.is_set()
+
+    def pruefen(self) -> None:
+        if self._abbruch.is_set():
+            raise BerechnungAbgebrochen("Berechnung abgebrochen.")
+
+    def stand(self) -> Dict[str, float]:
+        with self._lock:
+            gesamt, erledigt = self.gesamt, self.erledigt
+        return {
+            "erledigt": erledigt,
+            "gesamt": gesamt,
+            "anteil": (erledigt / gesamt) if gesamt else 0.0,
+        }
+
+_fortschritt_var: contextvars.ContextVar[Optional[Fortschritt]] = contextvars.ContextVar("fortschritt", default=None)
+
+def aktueller_fortschritt() -> Optional[Fortschritt]:
+    return _fortschritt_var.get()
+
+@contextlib.contextmanager
+def fortschritt_kontext(fortschritt: Optional[Fortschritt]) -> Iterator[Optional[Fortschritt]]:
+    token = _fortschritt_var.set(fortschritt)
+    try:
+        yield fortschritt
+    finally:
+        _fortschritt_var.reset(token)
+
+def fortschritt_planen(einheiten: int) -> None:
+    f = _fortschritt_var.get()
+    if f is not None:
+        f.planen(einheiten)
+
+def fortschritt_checkpoint(einheiten: int = 1) -> None:
+    """Checkpoint in Richtungsschleifen: bei Abbruch BerechnungAbgebrochen, sonst Fortschritt melden."""
+    f = _fortschritt_var.get()
+    if f is not None:
+        f.pruefen()
+        f.melden(einheiten)
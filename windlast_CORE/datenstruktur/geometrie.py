@@ -0,0 +1,60 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Hashable, Optional, Sequence, Tuple
+
+from windlast_CORE.datenstruktur.objekte3d import Achse, Vec3
+from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll, protokoll_stufe
+
+# Global fortlaufend: jede Änderung bekommt eine neue, nie wiederverwendete Versionsnummer
+_versionen = count(1)
+
+class GeometrieVersioniert:
+    """
+    Mixin für Bauelemente: jede Zuweisung an ein (nicht abgeleitetes) Dataclass-Feld
+    vergibt eine neue geometrie_version. In-place-Änderungen (z.B. list.append) werden
+    nicht erkannt – Geometrie wird deshalb immer neu zugewiesen.
+    """
+    _geometrie_version: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        feld = getattr(self, "__dataclass_fields__", {}).get(name)
+        if feld is not None and not feld.metadata.get("abgeleitet", False):
+            object.__setattr__(self, "_geometrie_version", next(_versionen))
+
+    @property
+    def geometrie_version(self) -> int:
+        return self._geometrie_version
+
+def geometrie_schluessel(bauelemente: Sequence[Any], spec_version: str) -> Hashable:
+    """
+    Schlüssel für konstruktionsweite Geometrie-Caches: (Objekt, Version) je Element + Katalog-Version.
+    Elemente ohne Versionszähler → None (nicht cachebar).
+    """
+    schluessel = []
+    for elem in bauelemente:
+        if not isinstance(elem, GeometrieVersioniert):
+            return None
+        schluessel.append((id(elem), elem.geometrie_version))
+    return (tuple(schluessel), spec_version)
+
+@dataclass(frozen=True)
+class Kippgeometrie:
+    """
+    Richtungs- und lastunabhängige Geometrie für den Kippnachweis (einmal je Geometrie-Stand):
+    - huelle:  konvexe Hülle der Eckpunkte (xy)
+    - achsen:  Kippachsen entlang der Hülle
+    - schwerpunkt_ballast: Flächenschwerpunkt der Hülle (Angriffspunkt des Ballasts)
+    - ballast_standmoment_einheit[i]: Standmoment je 1 N Ballast um achsen[i]
+    - protokoll: Aufzeichnung von sammle_kippachsen (Kontexte relativ zum Aufrufer)
+    """
+    huelle: Tuple[Vec3, ...]
+    achsen: Tuple[Achse, ...]
+    schwerpunkt_ballast: Optional[Vec3]
+    ballast_standmoment_einheit: Tuple[float, ...]
+    protokoll: Optional[Protokoll] = None
+
+    @property
+    def stufe(self) -> int:
+        return protokoll_stufe(self.protokoll)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple, Iterator
+from windlast_CORE.datenstruktur.enums import Lasttyp, Variabilitaet
+from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.rechenfunktionen.geom3d import Vec3, vektoren_addieren
+
+# Int-Codes für Lasttyp/Variabilität (Index in der Enum-Reihenfolge)
+LASTTYPEN: Tuple[Lasttyp, ...] = tuple(Lasttyp)
+VARIABILITAETEN: Tuple[Variabilitaet, ...] = tuple(Variabilitaet)
+LASTTYP_CODE = {t: i for i, t in enumerate(LASTTYPEN)}
+VARIABILITAET_CODE = {v: i for i, v in enumerate(VARIABILITAETEN)}
+_NAN = float("nan")
+
+class KraftBlock:
+    """
+    Struct-of-Arrays für alle Lastfälle einer Windrichtung.
+
+    - kraefte:  float64-Block (fx, fy, fz, fx, fy, fz, ...) – eine Zeile je Einzelkraft
+    - punkte:   float64-Block (px, py, pz, ...) – Angriffspunkt je Einzelkraft
+    - lf_start: Offsets je Lastfall in die Kraftzeilen (Länge = anzahl_lastfaelle + 1)
+    - lf_typ / lf_variabilitaet: Int-Codes (siehe LASTTYPEN / VARIABILITAETEN)
+    - lf_element: Element-Index je Lastfall
+    - lf_gueltig: 0, falls Angriffspunkte fehlten/ungleich lang waren (Punkte dann NaN)
+    - element_start: Offsets je Element in die Lastfälle (Lastfälle liegen elementweise zusammen)
+
+    Für bestehenden Code liefert als_kraefte(i) / kraefte_nach_element() eine Kraefte-Ansicht.
+    """
+    __slots__ = (
+        "kraefte", "punkte", "lf_start", "lf_typ", "lf_variabilitaet", "lf_element",
+        "lf_gueltig", "lf_id", "elemente", "element_start", "_quellen", "_ansichten",
+    )
+
+    def __init__(self) -> None:
+        self.kraefte = array("d")
+        self.punkte = array("d")
+        self.lf_start = array("l", [0])
+        self.lf_typ = array("b")
+        self.lf_variabilitaet = array("b")
+        self.lf_element = array("l")
+        self.lf_gueltig = array("b")
+        self.lf_id: List[Optional[str]] = []
+        self.elemente: List[str] = []
+        self.element_start = array("l", [0])
+        self._quellen: List[Optional[Kraefte]] = []
+        self._ansichten: Optional[Dict[str, List[Kraefte]]] = None
+
+    # ---------- Aufbau ----------
+
+    def neues_element(self, element_id: str) -> int:
+        """Öffnet ein neues Element; folgende Lastfälle werden diesem zugeordnet."""
+        if self.elemente:
+            self.element_start.append(len(self.lf_typ))
+        self.elemente.append(element_id)
+        return len(self.elemente) - 1
+
+    def lastfall_anhaengen(
+        self,
+        typ: Lasttyp,
+        variabilitaet: Variabilitaet,
+        einzelkraefte: Sequence[Vec3],
+        angriffspunkte: Optional[Sequence[Vec3]],
+        *,
+        lastfall_id_intern: Optional[str] = None,
+        quelle: Optional[Kraefte] = None,
+    ) -> int:
+        """Hängt einen Lastfall an das zuletzt geöffnete Element an."""
+        if not self.elemente:
+            raise ValueError("lastfall_anhaengen: zuerst neues_element(...) aufrufen.")
+        gueltig = angriffspunkte is not None and len(angriffspunkte) == len(einzelkraefte)
+        for i, F in enumerate(einzelkraefte):
+            self.kraefte.extend((F[0], F[1], F[2]))
+            if gueltig:
+                P = angriffspunkte[i]
+                self.punkte.extend((P[0], P[1], P[2]))
+            else:
+                self.punkte.extend((_NAN, _NAN, _NAN))
+        self.lf_start.append(len(self.kraefte) // 3)
+        self.lf_typ.append(LASTTYP_CODE[typ])
+        self.lf_variabilitaet.append(VARIABILITAET_CODE[variabilitaet])
+        self.lf_element.append(len(self.elemente) - 1)
+        self.lf_gueltig.append(1 if gueltig else 0)
+        self.lf_id.append(lastfall_id_intern)
+        self._quellen.append(quelle)
+        self._ansichten = None
+        return len(self.lf_typ) - 1
+
+    def abschliessen(self) -> "KraftBlock":
+        """Schließt die Element-Offsets ab (nach dem letzten Lastfall aufrufen)."""
+        self.element_start.append(len(self.lf_typ))
+        return self
+
+    @classmethod
+    def aus_kraefte(cls, kraefte_nach_element: Dict[str, List[Kraefte]]) -> "KraftBlock":
+        """Baut einen Block aus dem bisherigen Format Dict[element_id, List[Kraefte]]."""
+        block = cls()
+        for element, lastfaelle in kraefte_nach_element.items():
+            block.neues_element(element)
+            for k in lastfaelle:
+                block.lastfall_anhaengen(
+                    k.typ, k.variabilitaet, k.Einzelkraefte, k.Angriffspunkte_Einzelkraefte,
+                    lastfall_id_intern=k.lastfall_id_intern, quelle=k,
+                )
+        return block.abschliessen()
+
+    # ---------- Zugriff ----------
+
+    @property
+    def anzahl_elemente(self) -> int:
+        return len(self.elemente)
+
+    @property
+    def anzahl_lastfaelle(self) -> int:
+        return len(self.lf_typ)
+
+    def lastfaelle_von(self, element_index: int) -> range:
+        """Lastfall-Indizes eines Elements (zusammenhängender Slice)."""
+        return range(self.element_start[element_index], self.element_start[element_index + 1])
+
+    def kraftzeilen_von(self, lastfall_index: int) -> range:
+        """Kraftzeilen-Indizes eines Lastfalls (zusammenhängender Slice)."""
+        return range(self.lf_start[lastfall_index], self.lf_start[lastfall_index + 1])
+
+    def lasttyp(self, lastfall_index: int) -> Lasttyp:
+        return LASTTYPEN[self.lf_typ[lastfall_index]]
+
+    def variabilitaet(self, lastfall_index: int) -> Variabilitaet:
+        return VARIABILITAETEN[self.lf_variabilitaet[lastfall_index]]
+
+    def iter_kraefte(self, lastfall_index: int) -> Iterator[Tuple[float, float, float, float, float, float]]:
+        """(fx, fy, fz, px, py, pz) je Einzelkraft eines Lastfalls."""
+        kr = self.kraefte
+        pu = self.punkte
+        for i in range(3 * self.lf_start[lastfall_index], 3 * self.lf_start[lastfall_index + 1], 3):
+            yield kr[i], kr[i + 1], kr[i + 2], pu[i], pu[i + 1], pu[i + 2]
+
+    # ---------- Kompatibilität: Kraefte-Ansicht ----------
+
+    def als_kraefte(self, lastfall_index: int) -> Kraefte:
+        """
+        Kraefte-Objekt eines Lastfalls. Wurde der Block aus Kraefte-Objekten gebaut,
+        wird das Original zurückgegeben; sonst eine Ansicht mit Punktangriff je Einzelkraft
+        (ohne erneute Validierung/Schwerpunktberechnung).
+        """
+        quelle = self._quellen[lastfall_index]
+        if quelle is not None:
+            return quelle
+
+        einzelkraefte: List[Vec3] = []
+        punkte: List[Vec3] = []
+        for fx, fy, fz, px, py, pz in self.iter_kraefte(lastfall_index):
+            einzelkraefte.append((fx, fy, fz))
+            punkte.append((px, py, pz))
+
+        k = Kraefte.__new__(Kraefte)
+        k.typ = self.lasttyp(lastfall_index)
+        k.variabilitaet = self.variabilitaet(lastfall_index)
+        k.Einzelkraefte = einzelkraefte
+        k.Angriffsflaeche_Einzelkraefte = [[p] for p in punkte]
+        k.Schwerpunkt = None
+        k.Resultierende = vektoren_addieren(einzelkraefte)
+        k.Angriffspunkte_Einzelkraefte = punkte
+        k.lastfall_id_intern = self.lf_id[lastfall_index]
+        k.element_id_intern = self.elemente[self.lf_element[lastfall_index]]
+        self._quellen[lastfall_index] = k
+        return k
+
+    def kraefte_nach_element(self) -> Dict[str, List[Kraefte]]:
+        """Bisheriges Format Dict[element_id, List[Kraefte]] (gecacht)."""
+        if self._ansichten is None:
+            self._ansichten = {
+                element: [self.als_kraefte(i) for i in self.lastfaelle_von(e)]
+                for e, element in enumerate(self.elemente)
+            }
+        return self._ansichten
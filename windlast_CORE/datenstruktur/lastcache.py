@@ -0,0 +1,131 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll, protokoll_stufe
+
+@dataclass(frozen=True)
+class LastCacheEintrag:
+    """
+    Gecachte Lasten eines Bauelements (für eine Windrichtung bzw. richtungsunabhängig).
+    - kraefte:   die Lastfälle (werden geteilt, nicht verändern!)
+    - protokoll: aufgezeichnete Doku/Messages, Kontexte RELATIV zum Element-Kontext
+                 (None → ohne Protokoll berechnet, NullProtokoll → nur Messages)
+    """
+    kraefte: Tuple[Kraefte, ...]
+    protokoll: Optional[Protokoll] = None
+
+    @property
+    def stufe(self) -> int:
+        return protokoll_stufe(self.protokoll)
+
+class LastCache:
+    """
+    Inhaltsadressierter LRU-Cache für Bauelement-Lasten.
+
+    Schlüssel (siehe wind_schluessel / gewicht_schluessel):
+      (Lasttyp, Element-Fingerprint, Katalog-Spec-Version, Norm, q-Profil, Richtung, PhysikKonstanten)
+    Damit teilen sich Kipp/Gleit/Abhebe, alle Staudruck-Szenarien und wiederholte Aufrufe
+    die Lasten genau dann, wenn ihre Eingaben identisch sind.
+    """
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._daten: "OrderedDict[Hashable, Any]" = OrderedDict()  # LastCacheEintrag | WindlastBasis
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, *, stufe: int = 0) -> Optional[Any]:
+        """
+        Eintrag oder None. Einträge, die mit geringerer Protokoll-Stufe aufgezeichnet wurden
+        als benötigt (siehe zwischenergebnis.protokoll_stufe), zählen als Miss.
+        """
+        with self._lock:
+            eintrag = self._daten.get(key)
+            if eintrag is None or getattr(eintrag, "stufe", 0) < stufe:
+                self.misses += 1
+                return None
+            self._daten.move_to_end(key)
+            self.hits += 1
+            return eintrag
+
+    def put(self, key: Hashable, eintrag: Any) -> None:
+        with self._lock:
+            self._daten[key] = eintrag
+            self._daten.move_to_end(key)
+            while len(self._daten) > self.maxsize:
+                self._daten.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._daten.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._daten),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._daten)
+
+# ---------- Schlüssel ----------
+
+def _einfrieren(wert: Any) -> Hashable:
+    if isinstance(wert, (list, tuple)):
+        return tuple(_einfrieren(v) for v in wert)
+    if isinstance(wert, dict):
+        return tuple(sorted((str(k), _einfrieren(v)) for k, v in wert.items()))
+    if isinstance(wert, Enum):
+        return (type(wert).__name__, wert.name)
+    return wert
+
+def element_fingerprint(elem: Any) -> Optional[Hashable]:
+    """
+    Inhaltlicher Fingerprint eines Bauelements (Typ + alle Dataclass-Felder).
+    Felder mit metadata={"abgeleitet": True} werden ignoriert (werden bei der Berechnung gesetzt).
+    None → nicht cachebar (keine Dataclass / nicht hashbare Felder).
+    """
+    if not is_dataclass(elem):
+        return None
+    werte = tuple(
+        (f.name, _einfrieren(getattr(elem, f.name, None)))
+        for f in fields(elem)
+        if not f.metadata.get("abgeleitet", False)
+    )
+    fp = (type(elem).__name__, werte)
+    try:
+        hash(fp)
+    except TypeError:
+        return None
+    return fp
+
+def q_profil_schluessel(staudruecke: Sequence[float], obergrenzen: Sequence[float]) -> Hashable:
+    return (tuple(float(q) for q in staudruecke), tuple(float(z) for z in obergrenzen))
+
+def wind_schluessel(fingerprint: Hashable, spec_version: str, norm, q_profil: Hashable,
+                    winkel_deg: float, windrichtung: Sequence[float], konst) -> Hashable:
+    richtung = (round(winkel_deg, 9), tuple(round(float(c), 12) for c in windrichtung))
+    return ("WIND", fingerprint, spec_version, norm, q_profil, richtung, konst)
+
+def gewicht_schluessel(fingerprint: Hashable, spec_version: str, konst) -> Hashable:
+    return ("GEWICHT", fingerprint, spec_version, konst)
+
+def basis_schluessel(fingerprint: Hashable, spec_version: str, norm, obergrenzen: Sequence[float]) -> Hashable:
+    """Schlüssel der q-unabhängigen Windlast-Basis (siehe datenstruktur.windlastbasis)."""
+    return ("WINDBASIS", fingerprint, spec_version, norm, tuple(float(z) for z in obergrenzen))
+
+# Prozessweiter Cache (analog zu materialdaten.catalog.catalog)
+lastcache = LastCache()
@@ -1,14 +1,22 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Hashable
 from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.datenstruktur.kraftblock import KraftBlock
+from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll
 from windlast_CORE.rechenfunktionen.geom3d import Vec3
 
 @dataclass
 class LastSet:
     winkel_deg: float
     windrichtung: Vec3
-    kraefte_nach_element: Dict[str, List[Kraefte]]
+    block: KraftBlock
+    lade_protokoll: Optional[Protokoll] = None  # gepufferte Lade-Doku (Batch), bis zum ersten Abruf
+
+    @property
+    def kraefte_nach_element(self) -> Dict[str, List[Kraefte]]:
+        """Kraefte-Ansicht des Blocks (Kompatibilität)."""
+        return self.block.kraefte_nach_element()
 
 @dataclass
 class LastPool:
-    nach_winkel: Dict[int, LastSet] = field(default_factory=dict)  # key: int(round(winkel_deg*1e4))
\ No newline at end of file
+    nach_winkel: Dict[int, LastSet] = field(default_factory=dict)  # key: int(round(winkel_deg*1e4))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from windlast_CORE.datenstruktur.enums import Norm
+from windlast_CORE.datenstruktur.lastcache import LastCacheEintrag, q_profil_schluessel
+from windlast_CORE.datenstruktur.lastpool import LastPool
+from windlast_CORE.datenstruktur.geometrie import Kippgeometrie
+from windlast_CORE.datenstruktur.windlastbasis import WindlastVorbereitung
+from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll, Zwischenergebnis
+
+if TYPE_CHECKING:
+    from windlast_CORE.rechenfunktionen.symmetrie import Symmetrie
+
+@dataclass(frozen=True)
+class ElementReibwert:
+    """Reibwert μ eines Elements (None → Element hat keinen) bzw. der Fehler der Ermittlung."""
+    wert: Optional[float] = None
+    fehler: Optional[str] = None
+    protokoll: Optional[Protokoll] = None
+
+@dataclass(frozen=True)
+class PreparedKonstruktion:
+    """
+    Für (Norm, q-Profil, Konstanten) vorbereitete Konstruktion, siehe rechenfunktionen.prepare.prepare(...).
+    Alle richtungsunabhängigen Größen sind einmal aufgelöst; die Nachweise (kipp/gleit/abhebe)
+    akzeptieren das Objekt anstelle der Konstruktion.
+
+    Je-Element-Daten liegen als Tupel parallel zu 'bauelemente' (Index = Element-Index):
+    - fingerprints:  element_fingerprint (Schlüssel für den LastCache)
+    - gewichte:      Gewichtskräfte inkl. aufgezeichneter Doku (None → Element ohne gewichtskraefte())
+    - gewicht_fehler: Fehlertext, falls gewichtskraefte() fehlschlug
+    - wind_vorbereitung(idx): richtungsunabhängiger Windlast-Anteil, erst beim ersten Bedarf bestimmt
+                     (LastCache-Treffer brauchen ihn nicht; None → Element rechnet selbst, z.B. Flächen;
+                     Fehler werden geworfen)
+    - reibwerte:     μ je Element (für ermittle_min_reibwert)
+    Konstruktionsweit: Kippgeometrie (Hülle, Achsen, Ballast) und Symmetrie.
+
+    Protokoll-Aufzeichnungen haben Kontexte relativ zum Aufrufer und werden beim Verwenden
+    wiedergegeben (protokoll_uebertragen). 'stufe' ist die Aufzeichnungsstufe (protokoll_stufe).
+    lastpool ist der Richtungs-Cache (LastSets) dieses q-Profils und wird bei Bedarf gefüllt.
+    """
+    konstruktion: Any
+    norm: Norm
+    staudruecke: Tuple[float, ...]
+    obergrenzen: Tuple[float, ...]
+    konst: Any
+    stufe: int
+    bauelemente: Tuple[Any, ...]
+    fingerprints: Tuple[Optional[Hashable], ...]
+    gewichte: Tuple[Optional[LastCacheEintrag], ...]
+    gewicht_fehler: Tuple[Optional[str], ...]
+    reibwerte: Tuple[ElementReibwert, ...]
+    kippgeometrie: Kippgeometrie
+    symmetrie: "Symmetrie"
+    lastpool: LastPool = field(default_factory=LastPool, compare=False, repr=False)
+    _wind: Dict[int, Optional[WindlastVorbereitung]] = field(default_factory=dict, compare=False, repr=False)
+
+    @property
+    def name(self) -> str:
+        return getattr(self.konstruktion, "name", self.konstruktion.__class__.__name__)
+
+    def passt(self, norm: Norm, staudruecke: Sequence[float], obergrenzen: Sequence[float], konst=None) -> bool:
+        """Gilt die Vorbereitung für diese Nachweis-Eingaben?"""
+        return (
+            norm == self.norm
+            and q_profil_schluessel(staudruecke, obergrenzen) == q_profil_schluessel(self.staudruecke, self.obergrenzen)
+            and konst == self.konst
+        )
+
+    def wind_vorbereitung(self, idx: int) -> Optional[WindlastVorbereitung]:
+        """Richtungsunabhängiger Windlast-Anteil von Element idx (einmal je Vorbereitung)."""
+        if idx not in self._wind:
+            fn = getattr(self.bauelemente[idx], "wind_vorbereitung", None)
+            # Fehler gehen an den Aufrufer (ermittle_kraefte_fuer_windrichtungen meldet sie je Richtung)
+            # und werden nicht gemerkt
+            self._wind[idx] = (
+                fn(self.norm, self.staudruecke, self.obergrenzen, self.konst, stufe=self.stufe) if callable(fn) else None
+            )
+        return self._wind[idx]
+
+    def gesamthoehe(self, **kwargs) -> float:
+        return self.konstruktion.gesamthoehe(**kwargs)
+
+    def gesamtgewicht(self) -> float:
+        return self.konstruktion.gesamtgewicht()
+
+    # ====== gleiche Einstiege wie Konstruktion/Tor/Tisch/Steher ======
+    # Es werden die Methoden der Konstruktionsklasse verwendet (gleicher Kontext "funktion"),
+    # mit der Vorbereitung anstelle der Konstruktion.
+
+    def berechne_kippsicherheit(self, norm: Norm, staudruecke, obergrenzen, **kwargs) -> List[Zwischenergebnis]:
+        return type(self.konstruktion).berechne_kippsicherheit(self, norm, staudruecke, obergrenzen, **kwargs)
+
+    def berechne_gleitsicherheit(self, norm: Norm, staudruecke, obergrenzen, **kwargs) -> List[Zwischenergebnis]:
+        return type(self.konstruktion).berechne_gleitsicherheit(self, norm, staudruecke, obergrenzen, **kwargs)
+
+    def berechne_abhebesicherheit(self, norm: Norm, staudruecke, obergrenzen, **kwargs) -> List[Zwischenergebnis]:
+        return type(self.konstruktion).berechne_abhebesicherheit(self, norm, staudruecke, obergrenzen, **kwargs)
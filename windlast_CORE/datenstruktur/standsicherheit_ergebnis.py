@@ -36,6 +36,7 @@ class Meta:
     methoden: Mapping[Nachweis, object] = field(default_factory=dict)
     vereinfachung_konstruktion: object = None
     anzahl_windrichtungen: int = 0
+    richtungsstrategie: object = None
     konst_overrides: Mapping[str, object] = field(default_factory=dict)
 
 
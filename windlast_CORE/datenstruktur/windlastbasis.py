@@ -0,0 +1,59 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll
+from windlast_CORE.rechenfunktionen.geom3d import Vec3
+
+# Einheits-q-Basis für stabförmige Bauelemente (Traversenstrecke, Rohr):
+# F = c_f · q · A ist bis auf die Re-abhängigen Beiwerte linear in q. Alles, was nicht von q
+# abhängt, wird je (Element, Norm, Obergrenzen) einmal bestimmt und für alle Staudruck-Szenarien
+# wiederverwendet; je Szenario werden nur Re, c_f,0 (Re-Bereiche), c_f und F = c_f · q · A ausgewertet.
+# aufz_* enthalten die aufgezeichnete Doku (Kontexte relativ zum Element, ohne staudruck/Windrichtung).
+
+@dataclass(frozen=True)
+class WindlastSegmentBasis:
+    bereich_index: int                   # Index in staudruecke/obergrenzen
+    start_lokal: Vec3
+    ende_lokal: Vec3
+    eingeschlossene_flaeche: float
+    aufz_eingeschlossen: Optional[Protokoll] = None
+
+@dataclass(frozen=True)
+class WindlastRichtungsBasis:
+    """Richtungsabhängige, q-unabhängige Größen je Segment."""
+    projizierte_flaeche: Tuple[float, ...]
+    voelligkeitsgrad: Tuple[float, ...]
+    abminderungsfaktor: Tuple[float, ...]
+    aufz_projiziert: Tuple[Optional[Protokoll], ...]
+    aufz_voelligkeit: Tuple[Optional[Protokoll], ...]
+    aufz_abminderung: Tuple[Optional[Protokoll], ...]
+    stufe: int = 0                       # Protokoll-Stufe der Aufzeichnung (zwischenergebnis.protokoll_stufe)
+
+@dataclass
+class WindlastBasis:
+    schlankheit: float
+    segmente: Tuple[WindlastSegmentBasis, ...]
+    aufz_schlankheit: Optional[Protokoll] = None
+    stufe: int = 0
+    richtungen: Dict[Hashable, WindlastRichtungsBasis] = field(default_factory=dict)
+
+@dataclass(frozen=True)
+class WindlastSegmentQ:
+    """q-abhängige, richtungsunabhängige Größen je Segment (Kontexte relativ zum Element)."""
+    staudruck: float
+    kontext: dict
+    reynoldszahl: float
+    aufz_reynoldszahl: Optional[Protokoll] = None
+
+@dataclass(frozen=True)
+class WindlastVorbereitung:
+    """
+    Gesamter richtungsunabhängiger Anteil von windkraefte_batch je (Element, Norm, q-Profil, Konstanten):
+    q-unabhängige Basis + Reynoldszahl je Segment. Wird von prepare(...) einmal je Anfrage bestimmt.
+    """
+    basis: WindlastBasis
+    segmente: Tuple[WindlastSegmentQ, ...]
+    stufe: int = 0
+
+def richtungs_schluessel(windrichtung: Sequence[float]) -> Hashable:
+    return tuple(round(float(c), 12) for c in windrichtung)
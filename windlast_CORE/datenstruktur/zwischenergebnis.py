@@ -1,6 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Sequence, Mapping, Any, Protocol, runtime_checkable, Dict, List, Tuple, Union, TYPE_CHECKING
+from functools import partial
+from enum import Enum
+from typing import Optional, Sequence, Mapping, Any, Protocol, runtime_checkable, Dict, List, Literal, Tuple, Union, Callable, Iterator, TYPE_CHECKING
 from windlast_CORE.datenstruktur.enums import Severity
 from windlast_CORE.datenstruktur.standsicherheit_ergebnis import Message
 
@@ -51,11 +53,14 @@ class ListProtokoll:
     """
     Einfache Protokoll-Implementierung:
     - speichert Messages als List[Message]
-    - speichert DocBundles als List[tuple[bundle, kontext]]
+    - speichert DocBundles als List[tuple[bundle, kontext]] (LazyDocBundle bleibt unausgewertet,
+      Kontext wird unverändert gespeichert und erst beim Serialisieren flachgeklopft)
     """
+    doku_aktiv = True
+
     def __init__(self) -> None:
         self.messages: List[Message] = []
-        self.docs: List[Tuple[Mapping[str, Any], dict]] = []
+        self.docs: List[Tuple[Mapping[str, Any], Kontext]] = []
         self.decisions: List[Decision] = []
 
     def add_message(
@@ -68,7 +73,7 @@ class ListProtokoll:
     ) -> None:
         # Message-Struktur aus standsicherheit_ergebnis.py verwenden
         self.messages.append(
-            Message(code=code, severity=severity, text=str(text), context=dict(kontext or {}))
+            Message(code=code, severity=severity, text=str(text), context=kontext_als_dict(kontext))
         )
 
     def add_doc(
@@ -77,22 +82,216 @@ class ListProtokoll:
         bundle: Mapping[str, Any],
         kontext: Optional[dict] = None,
     ) -> None:
-        self.docs.append( (dict(bundle), dict(kontext or {})) )
+        if not isinstance(bundle, LazyDocBundle):
+            bundle = dict(bundle)
+        if not isinstance(kontext, Kontext):
+            kontext = merge_kontext(kontext, None)
+        self.docs.append( (bundle, kontext) )
 
     def add_decision(self, *, decision: Decision) -> None:
         self.decisions.append(decision)
 
-def make_protokoll() -> Protokoll:
-    """Factory für ein nutzbares Protokoll-Objekt (kein typing.Protocol!)."""
+# Aufbewahrung der Richtungs-Docs beim Ausspielen aus den Richtungs-Subprotokollen:
+# - "alle":     alle Docs aller Richtungen (wie bisher)
+# - "gewinner": maßgebende Richtung vollständig, unterlegene Richtungen nur mit ihren
+#               Zusammenfassungen (doc_type "dir_*") und den nachweisübergreifenden Docs (z.B. LOADS)
+DocAufbewahrung = Literal["alle", "gewinner"]
+DOC_AUFBEWAHRUNG: Tuple[str, ...] = ("alle", "gewinner")
+
+# Schlüssel echter Duplikate wie ergebnis_mapper.DEDUP_FIELDS (Titel + diese Kontextfelder)
+DOC_DEDUP_FELDER: Tuple[str, ...] = (
+    "doc_type", "nachweis", "szenario", "windrichtung_deg", "achse_index", "element_id",
+    "segment_index", "lastfall_index", "zone", "ref_nachweis", "variabilitaet", "ist_guenstig",
+)
+ROLLEN_RANG = {"relevant": 3, "entscheidungsrelevant": 2, "irrelevant": 1, None: 0}
+
+def _schluesselwert(v: Any) -> Any:
+    # wie im Mapper nach _to_primitive: Enums über den Namen
+    return v.name if isinstance(v, Enum) else v
+
+def doc_schluessel(bundle: Mapping[str, Any], kontext: Optional[Mapping[str, Any]]) -> tuple:
+    """Dedup-Schlüssel eines Docs (Titel + DOC_DEDUP_FELDER), ohne LazyDocBundles auszuwerten."""
+    if isinstance(bundle, LazyDocBundle):
+        titel = bundle.vorab("titel") or bundle.vorab("title")
+    else:
+        titel = bundle.get("titel") or bundle.get("title")
+    ctx = kontext_flach(kontext)   # flache Sicht wird am Knoten gemerkt, der Mapper nutzt sie mit
+    schluessel = [titel]
+    for feld in DOC_DEDUP_FELDER:
+        if feld == "szenario":
+            v = ctx.get("szenario") or ctx.get("scenario")
+        elif feld == "element_id":
+            v = ctx.get("element_id") or ctx.get("element_id_intern")
+        else:
+            v = ctx.get(feld)
+        schluessel.append(_schluesselwert(v))
+    return tuple(schluessel)
+
+class DedupProtokoll(ListProtokoll):
+    """
+    ListProtokoll, das Docs schon beim Einfügen dedupliziert (Schlüssel siehe doc_schluessel):
+    bei gleichem Schlüssel gewinnt die höhere Rolle (relevant > entscheidungsrelevant > irrelevant),
+    die Position des ersten Docs bleibt – wie im ergebnis_mapper, der so nur noch Duplikate
+    über Protokollgrenzen hinweg sieht.
+    aufbewahrung: siehe DocAufbewahrung (ausgewertet über richtungsdoc_behalten beim Ausspielen).
+    """
+
+    def __init__(self, *, aufbewahrung: DocAufbewahrung = "alle") -> None:
+        super().__init__()
+        if aufbewahrung not in DOC_AUFBEWAHRUNG:
+            raise ValueError(f"Unbekannte aufbewahrung: {aufbewahrung!r} (erlaubt: {', '.join(DOC_AUFBEWAHRUNG)})")
+        self.aufbewahrung = aufbewahrung
+        self.verworfen = 0      # Duplikate + per Aufbewahrung ausgelassene Docs
+        self._positionen: Dict[tuple, int] = {}
+
+    def add_doc(
+        self,
+        *,
+        bundle: Mapping[str, Any],
+        kontext: Optional[dict] = None,
+    ) -> None:
+        if not isinstance(bundle, LazyDocBundle):
+            bundle = dict(bundle)
+        if not isinstance(kontext, Kontext):
+            kontext = merge_kontext(kontext, None)
+        schluessel = doc_schluessel(bundle, kontext)
+        try:
+            pos = self._positionen.get(schluessel)
+        except TypeError:   # nicht hashbare Kontextwerte → ohne Dedup
+            self.docs.append((bundle, kontext))
+            return
+        if pos is None:
+            self._positionen[schluessel] = len(self.docs)
+            self.docs.append((bundle, kontext))
+            return
+        self.verworfen += 1
+        rolle_neu = kontext.get("rolle") or kontext.get("role")
+        rolle_alt = self.docs[pos][1].get("rolle")
+        if ROLLEN_RANG.get(rolle_neu, 0) > ROLLEN_RANG.get(rolle_alt, 0):
+            self.docs[pos] = (bundle, kontext)
+
+def richtungsdoc_behalten(protokoll: Optional[Protokoll], kontext: Mapping[str, Any], *,
+                          nachweis: Optional[str], gewinner: bool) -> bool:
+    """
+    Aufbewahrung beim Ausspielen eines Richtungs-Docs (kontext: fertiger Doc-Kontext) in 'protokoll'.
+    Bei "gewinner" entfallen für unterlegene Richtungen die eigenen Detail-Docs des Nachweises;
+    Zusammenfassungen (dir_*) bleiben für Rollen/Vergleich, fremde Docs (LOADS) für die anderen Nachweise.
+    """
+    if gewinner or getattr(protokoll, "aufbewahrung", "alle") == "alle":
+        return True
+    if kontext.get("nachweis") != nachweis:
+        return True
+    doc_type = kontext.get("doc_type")
+    if isinstance(doc_type, str) and doc_type.startswith("dir_"):
+        return True
+    protokoll.verworfen += 1
+    return False
+
+class NullProtokoll(ListProtokoll):
+    """
+    Protokoll für dokumentation="none":
+    - Messages und Decisions werden weiter gesammelt (Status, Reasons, Fehlerpfade)
+    - DocBundles werden verworfen; Rechenfunktionen prüfen doku_aktiv(protokoll) vorab
+      und bauen Bundles/Doku-Kontexte dann gar nicht erst auf.
+    """
+    doku_aktiv = False
+
+    def add_doc(
+        self,
+        *,
+        bundle: Mapping[str, Any],
+        kontext: Optional[dict] = None,
+    ) -> None:
+        return None
+
+class LazyDocBundle(Mapping[str, Any]):
+    """
+    DocBundle als Thunk: wird erst beim ersten Lesezugriff über die Fabrik aufgebaut.
+    Docs, die später verworfen werden (Filter, Dedup), kosten so nur den Fabrik-Aufruf nicht.
+    """
+    __slots__ = ("_fabrik", "_daten")
+
+    def __init__(self, fabrik: Callable[[], Mapping[str, Any]]) -> None:
+        self._fabrik: Optional[Callable[[], Mapping[str, Any]]] = fabrik
+        self._daten: Optional[Dict[str, Any]] = None
+
+    def _materialisiere(self) -> Dict[str, Any]:
+        if self._daten is None:
+            self._daten = dict(self._fabrik())
+            self._fabrik = None
+        return self._daten
+
+    def __getitem__(self, key: str) -> Any:
+        return self._materialisiere()[key]
+
+    def vorab(self, key: str, default: Any = None) -> Any:
+        """Feld lesen, ohne auszuwerten, sofern es als Argument der Fabrik (lazy_docbundle) vorliegt."""
+        if self._daten is None:
+            keywords = getattr(self._fabrik, "keywords", None)
+            if keywords is not None and key in keywords:
+                return keywords[key]
+        return self.get(key, default)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._materialisiere().get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialisiere())
+
+    def __len__(self) -> int:
+        return len(self._materialisiere())
+
+    def __repr__(self) -> str:
+        if self._daten is None:
+            return "LazyDocBundle(<nicht ausgewertet>)"
+        return f"LazyDocBundle({self._daten!r})"
+
+    def __reduce__(self):
+        # ausgewertet serialisieren (Prozess-Grenzen): Fabriken sind nicht zwingend picklebar
+        return (_lazy_aus_daten, (self._materialisiere(),))
+
+def _lazy_aus_daten(daten: Dict[str, Any]) -> LazyDocBundle:
+    bundle = LazyDocBundle(dict)
+    bundle._daten = daten
+    bundle._fabrik = None
+    return bundle
+
+def make_protokoll(*, dokumentation: bool = True, dedup: bool = False,
+                   aufbewahrung: DocAufbewahrung = "alle") -> Protokoll:
+    """
+    Factory für ein nutzbares Protokoll-Objekt (kein typing.Protocol!).
+    dokumentation=False → NullProtokoll (nur Messages/Decisions).
+    dedup=True oder aufbewahrung="gewinner" → DedupProtokoll.
+    """
+    if not dokumentation:
+        return NullProtokoll()
+    if dedup or aufbewahrung != "alle":
+        return DedupProtokoll(aufbewahrung=aufbewahrung)
     return ListProtokoll()
 
+def doku_aktiv(protokoll: Optional[Protokoll]) -> bool:
+    """True, wenn das Protokoll DocBundles aufnimmt (False für None und NullProtokoll)."""
+    return protokoll is not None and getattr(protokoll, "doku_aktiv", True)
+
+def protokoll_stufe(protokoll: Optional[Protokoll]) -> int:
+    """0 = kein Protokoll, 1 = nur Messages (NullProtokoll), 2 = Messages + Doku."""
+    if protokoll is None:
+        return 0
+    return 2 if doku_aktiv(protokoll) else 1
+
+def make_aufzeichnung(stufe: int) -> Optional[Protokoll]:
+    """Aufzeichnungs-Protokoll passend zur Stufe (siehe protokoll_stufe); None für Stufe 0."""
+    if stufe <= 0:
+        return None
+    return make_protokoll(dokumentation=stufe >= 2)
+
 
 def collect_messages(protokoll: Optional[Protokoll]) -> List[Message]:
     """Helper, um Messages generisch aus einem Protokoll zu ziehen (oder [])."""
     return list(getattr(protokoll, "messages", []) or [])
 
 
-def collect_docs(protokoll: Optional[Protokoll]) -> List[Tuple[Mapping[str, Any], dict]]:
+def collect_docs(protokoll: Optional[Protokoll]) -> List[Tuple[Mapping[str, Any], Mapping[str, Any]]]:
     """Helper, um DocBundles generisch aus einem Protokoll zu ziehen (oder [])."""
     return list(getattr(protokoll, "docs", []) or [])
 
@@ -101,12 +300,146 @@ def collect_decisions(protokoll: Optional[Protokoll]) -> List[Decision]:
 
 # ========= Kontext-/Doc-Helfer =========
 
-def merge_kontext(basis: Optional[dict], extra: Optional[dict]) -> dict:
-    """Nicht-destruktives Merge zweier Kontext-Maps."""
-    out = dict(basis or {})
-    if extra:
-        out.update({k: v for k, v in extra.items() if v is not None})
-    return out
+class Kontext(Mapping[str, Any]):
+    """
+    Unveränderlicher, verketteter Kontext: Verweis auf den Eltern-Kontext + kleines Delta.
+    - merge_kontext(...) legt nur noch das Delta an statt die ganze Basis zu kopieren;
+      geteilte Eltern (Richtung, Achse, Element, ...) existieren genau einmal.
+    - Lesen über die Kette; die flache Sicht (als_dict/items/Iteration) wird erst bei
+      Bedarf aufgebaut und je Knoten gemerkt (z.B. beim Serialisieren im ergebnis_mapper).
+    Schlüsselreihenfolge und Überschreib-Semantik entsprechen dem bisherigen dict-Merge.
+    """
+    __slots__ = ("_eltern", "_delta", "_flach")
+
+    def __init__(self, eltern: Optional["Kontext"], delta: Dict[str, Any]) -> None:
+        self._eltern = eltern
+        self._delta = delta
+        self._flach: Optional[Dict[str, Any]] = None
+
+    def _flatten(self) -> Dict[str, Any]:
+        flach = self._flach
+        if flach is None:
+            if self._eltern is None:
+                flach = self._delta          # Wurzel: Delta gehört dem Kontext allein
+            else:
+                flach = dict(self._eltern._flatten())
+                flach.update(self._delta)
+            self._flach = flach
+        return flach
+
+    def __getitem__(self, key: str) -> Any:
+        if self._flach is not None:
+            return self._flach[key]
+        knoten = self
+        while knoten is not None:
+            delta = knoten._delta
+            if key in delta:
+                return delta[key]
+            knoten = knoten._eltern
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if self._flach is not None:
+            return self._flach.get(key, default)
+        knoten = self
+        while knoten is not None:
+            delta = knoten._delta
+            if key in delta:
+                return delta[key]
+            knoten = knoten._eltern
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        knoten = self
+        while knoten is not None:
+            if key in knoten._delta:
+                return True
+            knoten = knoten._eltern
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._flatten())
+
+    def __bool__(self) -> bool:
+        # Knoten unterhalb der Wurzel haben immer ein nicht-leeres Delta
+        return self._eltern is not None or bool(self._delta)
+
+    def __len__(self) -> int:
+        return len(self._flatten())
+
+    def keys(self):
+        return self._flatten().keys()
+
+    def items(self):
+        return self._flatten().items()
+
+    def values(self):
+        return self._flatten().values()
+
+    def als_dict(self) -> Dict[str, Any]:
+        """Flache, veränderbare Kopie."""
+        return dict(self._flatten())
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Kontext):
+            return self._flatten() == other._flatten()
+        if isinstance(other, Mapping):
+            return self._flatten() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Kontext({self._flatten()!r})"
+
+    def __reduce__(self):
+        # flach serialisieren (Prozess-Grenzen, Pickle-Caches)
+        return (_kontext_aus_dict, (self._flatten(),))
+
+def _kontext_aus_dict(werte: Mapping[str, Any]) -> Kontext:
+    return Kontext(None, dict(werte))
+
+KONTEXT_LEER = Kontext(None, {})
+
+def kontext_als_dict(kontext: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Flache dict-Kopie eines Kontexts (Kontext, dict oder None)."""
+    if kontext is None:
+        return {}
+    if isinstance(kontext, Kontext):
+        return kontext.als_dict()
+    return dict(kontext)
+
+def kontext_flach(kontext: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """Flache Sicht eines Kontexts ohne Kopie (nur lesen!)."""
+    if kontext is None:
+        return {}
+    if isinstance(kontext, Kontext):
+        return kontext._flatten()
+    return kontext
+
+def merge_kontext(basis: Optional[Mapping[str, Any]], extra: Optional[Mapping[str, Any]]) -> Kontext:
+    """
+    Nicht-destruktives Merge zweier Kontext-Maps (None-Werte in extra werden ignoriert).
+    Liefert einen verketteten Kontext (Mapping, wie bisher lesbar über get/[]/items/dict(...)).
+    """
+    if basis is None or basis.__class__ is Kontext:
+        eltern = basis
+    else:
+        eltern = Kontext(None, dict(basis))
+    if not extra:
+        return eltern if eltern is not None else KONTEXT_LEER
+    if extra.__class__ is Kontext:
+        if eltern is not None and (extra is eltern or extra._eltern is eltern):
+            return extra
+        # flache Sicht von extra als Delta teilen (unveränderlich, je Knoten gemerkt)
+        delta = extra._flatten()
+    else:
+        delta = dict(extra)
+    if None in delta.values():
+        delta = {k: v for k, v in delta.items() if v is not None}
+        if not delta:
+            return eltern if eltern is not None else KONTEXT_LEER
+    return Kontext(eltern, delta)
 
 def make_docbundle(
     *,
@@ -136,6 +469,10 @@ def make_docbundle(
         "quelle_einzelwerte": list(quelle_einzelwerte) if quelle_einzelwerte is not None else None,
     }
 
+def lazy_docbundle(**felder: Any) -> LazyDocBundle:
+    """Wie make_docbundle(...), aber erst bei Bedarf ausgewertet (Argumente werden sofort gebunden)."""
+    return LazyDocBundle(partial(make_docbundle, **felder))
+
 def protokolliere_msg(
     protokoll: Optional[Protokoll],
     *,
@@ -154,8 +491,8 @@ def protokolliere_doc(
     bundle: Mapping[str, Any],
     kontext: Optional[dict] = None,
 ) -> None:
-    """Sicheres Anhängen eines DocBundles (no-op, wenn kein Protokoll übergeben wurde)."""
-    if protokoll is not None:
+    """Sicheres Anhängen eines DocBundles (no-op ohne Protokoll bzw. bei NullProtokoll)."""
+    if doku_aktiv(protokoll):
         protokoll.add_doc(bundle=bundle, kontext=kontext)
 
 def merge_protokoll(src, dst, *, only_errors: bool = False):
@@ -174,6 +511,25 @@ def merge_protokoll(src, dst, *, only_errors: bool = False):
             continue
         protokolliere_msg(dst, severity=m.severity, code=m.code, text=m.text, kontext=m.context)
 
+def protokoll_uebertragen(src, dst, *, kontext: Optional[dict] = None, basis: Optional[dict] = None) -> None:
+    """
+    Überträgt Messages, Docs und Decisions aus 'src' nach 'dst' (Reihenfolge bleibt erhalten).
+    - kontext: wird jedem Kontext/Scope zusätzlich aufgeprägt (überschreibt)
+    - basis:   wird jedem Kontext/Scope unterlegt (aufgezeichnete Einträge überschreiben)
+    Für das Wiedergeben einmalig berechneter/gecachter Zwischenwerte.
+    """
+    if src is None or dst is None:
+        return
+    for m in collect_messages(src):
+        protokolliere_msg(dst, severity=m.severity, code=m.code, text=m.text,
+                          kontext=merge_kontext(merge_kontext(basis, m.context), kontext))
+    if doku_aktiv(dst):
+        for bundle, ctx in collect_docs(src):
+            protokolliere_doc(dst, bundle=bundle, kontext=merge_kontext(merge_kontext(basis, ctx), kontext))
+    for d in collect_decisions(src):
+        protokolliere_decision(dst, key=d.key, value=d.value,
+                               scope=merge_kontext(merge_kontext(basis, d.scope), kontext), meta=d.meta)
+
 def protokolliere_decision(
     protokoll: Optional[Protokoll],
     *,
@@ -185,7 +541,7 @@ def protokolliere_decision(
     if protokoll is None:
         return
     if hasattr(protokoll, "add_decision"):
-        decision = Decision(key=key, value=value, scope=dict(scope or {}), meta=dict(meta) if meta else None)
+        decision = Decision(key=key, value=value, scope=kontext_als_dict(scope), meta=dict(meta) if meta else None)
         protokoll.add_decision(decision=decision)
 
 # ========= Verschlankte Ergebnis-Typen =========
@@ -8,6 +8,7 @@ from windlast_CORE.rechenfunktionen import (
 from windlast_CORE.rechenfunktionen.kippsicherheit import kippsicherheit as _kippsicherheit
 from windlast_CORE.rechenfunktionen.gleitsicherheit import gleitsicherheit as _gleitsicherheit
 from windlast_CORE.rechenfunktionen.abhebesicherheit import abhebesicherheit as _abhebesicherheit
+from windlast_CORE.rechenfunktionen.symmetrie import Symmetrie, symmetrie_von
 from windlast_CORE.datenstruktur.enums import (
     Norm,
     MaterialTyp,
@@ -16,6 +17,7 @@ from windlast_CORE.datenstruktur.enums import (
     RechenmethodeGleiten,
     RechenmethodeAbheben,
     VereinfachungKonstruktion,
+    RichtungsStrategie,
 )
 from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext
 
@@ -155,6 +157,7 @@ class Konstruktion:
         methode: RechenmethodeKippen = RechenmethodeKippen.STANDARD,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -172,6 +175,7 @@ class Konstruktion:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
@@ -187,6 +191,7 @@ class Konstruktion:
         methode: RechenmethodeGleiten = RechenmethodeGleiten.MIN_REIBWERT,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -204,6 +209,7 @@ class Konstruktion:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
@@ -219,6 +225,7 @@ class Konstruktion:
         methode: RechenmethodeAbheben = RechenmethodeAbheben.STANDARD,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -236,9 +243,14 @@ class Konstruktion:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
 
     def gesamtgewicht(self) -> float:
-        return _gesamtgewicht(self)
\ No newline at end of file
+        return _gesamtgewicht(self)
+
+    def symmetrie(self) -> Symmetrie:
+        """Spiegel-/Drehsymmetrien der Bauelemente (siehe rechenfunktionen.symmetrie)."""
+        return symmetrie_von(self)
\ No newline at end of file
@@ -8,7 +8,8 @@ from windlast_CORE.rechenfunktionen import (
 from windlast_CORE.rechenfunktionen.kippsicherheit import kippsicherheit as _kippsicherheit
 from windlast_CORE.rechenfunktionen.gleitsicherheit import gleitsicherheit as _gleitsicherheit
 from windlast_CORE.rechenfunktionen.abhebesicherheit import abhebesicherheit as _abhebesicherheit
-from windlast_CORE.datenstruktur.enums import Norm, MaterialTyp, FormTyp, RechenmethodeKippen, RechenmethodeGleiten, RechenmethodeAbheben, VereinfachungKonstruktion, TraversenOrientierung
+from windlast_CORE.rechenfunktionen.symmetrie import Symmetrie, symmetrie_von
+from windlast_CORE.datenstruktur.enums import Norm, MaterialTyp, FormTyp, RechenmethodeKippen, RechenmethodeGleiten, RechenmethodeAbheben, VereinfachungKonstruktion, RichtungsStrategie, TraversenOrientierung
 from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext
 
 # TODO: ID-Vergabe
@@ -201,6 +202,7 @@ class Tisch:
         methode: RechenmethodeKippen = RechenmethodeKippen.STANDARD,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -218,6 +220,7 @@ class Tisch:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
@@ -233,6 +236,7 @@ class Tisch:
         methode: RechenmethodeGleiten = RechenmethodeGleiten.MIN_REIBWERT,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -250,6 +254,7 @@ class Tisch:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
@@ -265,6 +270,7 @@ class Tisch:
         methode: RechenmethodeAbheben = RechenmethodeAbheben.STANDARD,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -282,9 +288,14 @@ class Tisch:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
     
     def gesamtgewicht(self) -> float:
         return _gesamtgewicht(self)
+
+    def symmetrie(self) -> Symmetrie:
+        """Spiegel-/Drehsymmetrien der Bauelemente (siehe rechenfunktionen.symmetrie)."""
+        return symmetrie_von(self)
@@ -8,7 +8,8 @@ from windlast_CORE.rechenfunktionen import (
 from windlast_CORE.rechenfunktionen.kippsicherheit import kippsicherheit as _kippsicherheit
 from windlast_CORE.rechenfunktionen.gleitsicherheit import gleitsicherheit as _gleitsicherheit
 from windlast_CORE.rechenfunktionen.abhebesicherheit import abhebesicherheit as _abhebesicherheit
-from windlast_CORE.datenstruktur.enums import Norm, MaterialTyp, FormTyp, RechenmethodeKippen, RechenmethodeGleiten, RechenmethodeAbheben, VereinfachungKonstruktion, TraversenOrientierung
+from windlast_CORE.rechenfunktionen.symmetrie import Symmetrie, symmetrie_von
+from windlast_CORE.datenstruktur.enums import Norm, MaterialTyp, FormTyp, RechenmethodeKippen, RechenmethodeGleiten, RechenmethodeAbheben, VereinfachungKonstruktion, RichtungsStrategie, TraversenOrientierung
 from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext
 
 # TODO: ID-Vergabe
@@ -146,6 +147,7 @@ class Tor:
         methode: RechenmethodeKippen = RechenmethodeKippen.STANDARD,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -163,6 +165,7 @@ class Tor:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
@@ -178,6 +181,7 @@ class Tor:
         methode: RechenmethodeGleiten = RechenmethodeGleiten.MIN_REIBWERT,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -195,6 +199,7 @@ class Tor:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
@@ -210,6 +215,7 @@ class Tor:
         methode: RechenmethodeAbheben = RechenmethodeAbheben.STANDARD,
         vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
         anzahl_windrichtungen: int = 4,
+        richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
         protokoll: Optional[Protokoll] = None,
         kontext: Optional[dict] = None,
     ) -> List[Zwischenergebnis]:
@@ -227,9 +233,14 @@ class Tor:
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
             protokoll=protokoll,
             kontext=base_ctx,
         )
     
     def gesamtgewicht(self) -> float:
         return _gesamtgewicht(self)
+
+    def symmetrie(self) -> Symmetrie:
+        """Spiegel-/Drehsymmetrien der Bauelemente (siehe rechenfunktionen.symmetrie)."""
+        return symmetrie_von(self)
@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import csv
+import hashlib
 import sys
 from typing import Dict, Optional, Tuple, List
 from windlast_CORE.datenstruktur.enums import MaterialTyp
@@ -209,6 +210,19 @@ class Catalog:
         self._bodenplatten = _load_bodenplatten_csv(self._root / "bodenplatten.csv")
         self._traversen = _load_traversen_csv(self._root / "traversen.csv")
         self._rohre = _load_rohre_csv(self._root / "rohre.csv")
+        self._spec_version = self._berechne_spec_version()
+
+    def _berechne_spec_version(self) -> str:
+        """Inhalts-Hash der Spec-CSVs (für inhaltsadressierte Caches)."""
+        h = hashlib.sha1()
+        for name in ("bodenplatten.csv", "traversen.csv", "rohre.csv"):
+            h.update(name.encode("utf-8"))
+            h.update((self._root / name).read_bytes())
+        return h.hexdigest()[:16]
+
+    @property
+    def spec_version(self) -> str:
+        return self._spec_version
 
     @property
     def bodenplatten(self) -> Dict[str, BodenplatteSpec]:
@@ -254,5 +268,6 @@ class Catalog:
         self._bodenplatten = _load_bodenplatten_csv(self._root / "bodenplatten.csv")
         self._traversen = _load_traversen_csv(self._root / "traversen.csv")
         self._rohre = _load_rohre_csv(self._root / "rohre.csv")
+        self._spec_version = self._berechne_spec_version()
 
 catalog = Catalog()
@@ -4,17 +4,26 @@ from math import inf
 from typing import Dict, Callable, Sequence, List, Optional
 from collections.abc import Sequence as _SeqABC
 
-from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, protokolliere_decision, make_docbundle, merge_protokoll, make_protokoll, collect_docs
-from windlast_CORE.datenstruktur.enums import Norm, RechenmethodeAbheben, VereinfachungKonstruktion, Lasttyp, Variabilitaet, Severity
+from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, protokolliere_decision, lazy_docbundle, merge_protokoll, make_protokoll, collect_docs, doku_aktiv, richtungsdoc_behalten
+from windlast_CORE.datenstruktur.enums import Norm, RechenmethodeAbheben, VereinfachungKonstruktion, RichtungsStrategie, Lasttyp, Variabilitaet, Severity
 from windlast_CORE.datenstruktur.konstanten import _EPS, aktuelle_konstanten
 from windlast_CORE.datenstruktur.kraefte import Kraefte
-from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import sicherheitsbeiwert
+from windlast_CORE.datenstruktur.prepared import PreparedKonstruktion
+from windlast_CORE.datenstruktur.fortschritt import fortschritt_checkpoint
+from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import sicherheitsbeiwert, protokolliere_gamma
 
+from windlast_CORE.rechenfunktionen.geom3d import Vec3
+
+from windlast_CORE.rechenfunktionen.symmetrie import symmetrie_von
 from windlast_CORE.rechenfunktionen.standsicherheit_utils import (
     generiere_windrichtungen,
     obtain_pool,
     get_or_create_lastset,
-    abhebe_envelope_pro_bauelement,
+    erzeuge_lastsets,
+    gamma_schluessel,
+    verfeinere_windrichtung,
+    richtungsrecord_aus_symmetrie,
+    abhebe_envelope_block,
 )
 
 def _emit_docs_with_role(*, dst_protokoll, docs, base_ctx: dict, role: str, extra_ctx: dict | None = None):
@@ -23,17 +32,22 @@ def _emit_docs_with_role(*, dst_protokoll, docs, base_ctx: dict, role: str, extr
     Nur Top-Level-Vergleichswerte dürfen 'entscheidungsrelevant' bleiben.
     """
     TOPLEVEL = {"dir_sicherheit", "dir_min_sicherheit", "dir_ballast"}
+    if not doku_aktiv(dst_protokoll):
+        return
+    nachweis = base_ctx.get("nachweis")
     for bundle, ctx in docs:
         ktx = merge_kontext(base_ctx, ctx or {})
+        if not richtungsdoc_behalten(dst_protokoll, ktx, nachweis=nachweis, gewinner=(role == "relevant")):
+            continue
         doc_type = (ktx.get("doc_type") or (ctx or {}).get("doc_type"))
 
         eff_role = role
         if role == "entscheidungsrelevant" and doc_type not in TOPLEVEL:
             eff_role = "irrelevant"
 
-        ktx["rolle"] = eff_role
+        ktx = merge_kontext(ktx, {"rolle": eff_role})
         if extra_ctx:
-            ktx.update(extra_ctx)
+            ktx = merge_kontext(ktx, extra_ctx)
         protokolliere_doc(dst_protokoll, bundle=bundle, kontext=ktx)
 
 def _validate_inputs(
@@ -47,6 +61,7 @@ def _validate_inputs(
     methode: RechenmethodeAbheben,
     vereinfachung_konstruktion: VereinfachungKonstruktion,
     anzahl_windrichtungen: int,
+    richtungsstrategie: RichtungsStrategie,
 ) -> None:
     # konstruktion: hat bauelemente?
     if not hasattr(konstruktion, "bauelemente"):
@@ -84,6 +99,14 @@ def _validate_inputs(
     if not isinstance(anzahl_windrichtungen, int) or anzahl_windrichtungen < 1:
         raise ValueError("anzahl_windrichtungen muss ein int ≥ 1 sein.")
 
+    # richtungsstrategie: RichtungsStrategie und existent
+    if not isinstance(richtungsstrategie, RichtungsStrategie):
+        raise TypeError("richtungsstrategie muss vom Typ RichtungsStrategie sein.")
+
+    # vorbereitete Konstruktion: muss zu den Nachweis-Eingaben passen
+    if isinstance(konstruktion, PreparedKonstruktion) and not konstruktion.passt(norm, staudruecke, obergrenzen, konst):
+        raise ValueError("PreparedKonstruktion wurde für eine andere Norm/q-Profil/Konstanten vorbereitet.")
+
 def _abhebesicherheit_DinEn13814_2005_06(
     konstruktion,
     norm: Norm,
@@ -95,6 +118,7 @@ def _abhebesicherheit_DinEn13814_2005_06(
     methode: RechenmethodeAbheben = RechenmethodeAbheben.STANDARD,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -124,9 +148,32 @@ def _abhebesicherheit_DinEn13814_2005_06(
         )
         sicherheitsbeiwert_ballast = sicherheitsbeiwert(norm, ballastkraft_dummy, ist_guenstig=True, protokoll=protokoll, kontext=base_ctx)
         dir_records = []
+        gamma_keys = set()  # γ-Kombinationen aller Richtungen → Doku einmal je Nachweis
+
+        windrichtungen = generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx)
+        # Symmetrische Konstruktion → nur der Fundamentalbereich wird gerechnet, der Rest gespiegelt
+        symmetrie = symmetrie_von(konstruktion)
+        # Lasten aller Richtungen im Batch (richtungsunabhängiger Anteil nur einmal)
+        erzeuge_lastsets(
+            pool,
+            konstruktion,
+            windrichtungen=symmetrie.fundamentalbereich(windrichtungen),
+            norm=norm,
+            staudruecke=staudruecke,
+            obergrenzen=obergrenzen,
+            konst=konst,
+            kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
+            dokumentation=doku_aktiv(protokoll),
+        )
 
-        for winkel, richtung in generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx):
-            sub_prot = make_protokoll()
+        def _richtung_auswerten(winkel: float, richtung: Vec3) -> float:
+            fortschritt_checkpoint()  # Abbruch-Checkpoint + Fortschritt je Windrichtung
+            gespiegelt = richtungsrecord_aus_symmetrie(symmetrie, winkel, dir_records, dokumentation=doku_aktiv(protokoll))
+            if gespiegelt is not None:
+                dir_records.append(gespiegelt)
+                return gespiegelt["dir_min_sicherheit"]
+
+            sub_prot = make_protokoll(dokumentation=doku_aktiv(protokoll))
             lastset = get_or_create_lastset(
                 pool,
                 konstruktion,
@@ -139,98 +186,110 @@ def _abhebesicherheit_DinEn13814_2005_06(
                 protokoll=sub_prot,
                 kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
             )
-            kraefte_nach_element = lastset.kraefte_nach_element
+            block = lastset.block
+            if doku_aktiv(protokoll):
+                gamma_keys.update(gamma_schluessel(block, "ABHEBE"))
 
             total_normal_down = 0.0
             total_normal_up = 0.0
 
             richtung_ctx = merge_kontext(base_ctx, {"windrichtung_deg": f"{winkel}°", "windrichtung": richtung, "nachweis": "ABHEBE"})
 
-            for element, lastfaelle_elem in kraefte_nach_element.items():
-                N_down_b, N_up_b = abhebe_envelope_pro_bauelement(norm, lastfaelle_elem, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
+            for element_idx, element in enumerate(block.elemente):
+                N_down_b, N_up_b = abhebe_envelope_block(norm, block, element_idx, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_down",
+                            wert=N_down_b,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_up",
+                            wert=N_up_b,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                total_normal_down += N_down_b
+                total_normal_up += N_up_b
+
+            # Richtungs-Aggregate dokumentieren
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_down",
-                        wert=N_down_b,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_down",
+                        wert=total_normal_down,
                         einheit="N",
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_down_sum", "windrichtung_deg": f"{winkel}°"},
                 )
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_up",
-                        wert=N_up_b,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_up",
+                        wert=total_normal_up,
                         einheit="N",
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_up_sum", "windrichtung_deg": f"{winkel}°"},
                 )
-                total_normal_down += N_down_b
-                total_normal_up += N_up_b
-
-            # Richtungs-Aggregate dokumentieren
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_down",
-                    wert=total_normal_down,
-                    einheit="N",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_down_sum", "windrichtung_deg": f"{winkel}°"},
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_up",
-                    wert=total_normal_up,
-                    einheit="N",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_up_sum", "windrichtung_deg": f"{winkel}°"},
-            )
 
             sicherheit = inf if total_normal_up <= _EPS else (total_normal_down / total_normal_up)
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Sicherheit S_abheb,{int(winkel)}°",
-                    wert=sicherheit,
-                    formel="S = ΣN_down / ΣN_up",
-                    formelzeichen=["N_down", "N_up"],
-                    quelle_formel="---",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
-            )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Sicherheit S_abheb,{int(winkel)}°",
+                        wert=sicherheit,
+                        formel="S = ΣN_down / ΣN_up",
+                        formelzeichen=["N_down", "N_up"],
+                        quelle_formel="---",
+                    ),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
+                )
 
             if total_normal_up <= _EPS:
                 ballastkraft = 0.0
             else:
                 ballastkraft = max(0.0, total_normal_up - total_normal_down) / sicherheitsbeiwert_ballast.wert
 
-            if ballastkraft > ballast_erforderlich_max:
-                ballast_erforderlich_max = ballastkraft
-
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Ballast m_Ballast,abheb,{int(winkel)}°",
-                    wert=ballastkraft,
-                    formel="ΔN_down,erf = max(0, ΣN_up − ΣN_down) / γ_g",
-                    formelzeichen=["N_up", "N_down", "γ_g"],
-                    quelle_formel="---",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
-            )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Ballast m_Ballast,abheb,{int(winkel)}°",
+                        wert=ballastkraft,
+                        formel="ΔN_down,erf = max(0, ΣN_up − ΣN_down) / γ_g",
+                        formelzeichen=["N_up", "N_down", "γ_g"],
+                        quelle_formel="---",
+                    ),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
+                )
 
             # WICHTIG: nicht hier schon mergen/entscheiden – erst sammeln:
             dir_records.append({
+                "winkel": winkel,
                 "windrichtung_deg": f"{winkel}°",
                 "dir_min_sicherheit": sicherheit,        # (hier ist S_dir für diese Richtung bereits die relevante Größe)
                 "dir_ballast_max": ballastkraft,
                 "docs": collect_docs(sub_prot),
                 "sub_prot": sub_prot,
             })
-            
+            return dir_records[-1]["dir_min_sicherheit"]
+
+        stuetzstellen = [(winkel, _richtung_auswerten(winkel, richtung)) for winkel, richtung in windrichtungen]
+        if richtungsstrategie is RichtungsStrategie.ADAPTIV:
+            # Kritische Richtung zwischen den Rasterrichtungen eingrenzen (Goldener Schnitt)
+            verfeinere_windrichtung(_richtung_auswerten, stuetzstellen, protokoll=protokoll, kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE"}))
+
         if not dir_records:
             return [Zwischenergebnis(wert=float("nan")), Zwischenergebnis(wert=float("nan"))]
 
@@ -260,7 +319,7 @@ def _abhebesicherheit_DinEn13814_2005_06(
         # Endwerte (relevant)
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Abhebesicherheit S_abheb",
                 wert=sicherheit_min_global,
                 formel="S_abheb = ΣN_down / ΣN_up",
@@ -272,7 +331,7 @@ def _abhebesicherheit_DinEn13814_2005_06(
         )
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Erforderlicher Ballast m_Ballast,abheb",
                 wert=ballast_kg,
                 einheit="kg",
@@ -284,6 +343,12 @@ def _abhebesicherheit_DinEn13814_2005_06(
             kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "rolle": "relevant"}),
         )
 
+        # γ-Dokumentation einmal je Nachweis (statt je Einzelkraft)
+        protokolliere_gamma(
+            norm, gamma_keys, protokoll=protokoll,
+            kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "gamma", "rolle": "relevant"}),
+        )
+
         #Entscheidung protokollieren
         protokolliere_decision(
             protokoll,
@@ -313,6 +378,7 @@ def _abhebesicherheit_DinEn17879_2024_08(
     methode: RechenmethodeAbheben = RechenmethodeAbheben.STANDARD,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -342,9 +408,32 @@ def _abhebesicherheit_DinEn17879_2024_08(
         )
         sicherheitsbeiwert_ballast = sicherheitsbeiwert(norm, ballastkraft_dummy, ist_guenstig=True, protokoll=protokoll, kontext=base_ctx)
         dir_records = []
+        gamma_keys = set()  # γ-Kombinationen aller Richtungen → Doku einmal je Nachweis
+
+        windrichtungen = generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx)
+        # Symmetrische Konstruktion → nur der Fundamentalbereich wird gerechnet, der Rest gespiegelt
+        symmetrie = symmetrie_von(konstruktion)
+        # Lasten aller Richtungen im Batch (richtungsunabhängiger Anteil nur einmal)
+        erzeuge_lastsets(
+            pool,
+            konstruktion,
+            windrichtungen=symmetrie.fundamentalbereich(windrichtungen),
+            norm=norm,
+            staudruecke=staudruecke,
+            obergrenzen=obergrenzen,
+            konst=konst,
+            kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
+            dokumentation=doku_aktiv(protokoll),
+        )
 
-        for winkel, richtung in generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx):
-            sub_prot = make_protokoll()
+        def _richtung_auswerten(winkel: float, richtung: Vec3) -> float:
+            fortschritt_checkpoint()  # Abbruch-Checkpoint + Fortschritt je Windrichtung
+            gespiegelt = richtungsrecord_aus_symmetrie(symmetrie, winkel, dir_records, dokumentation=doku_aktiv(protokoll))
+            if gespiegelt is not None:
+                dir_records.append(gespiegelt)
+                return gespiegelt["dir_min_sicherheit"]
+
+            sub_prot = make_protokoll(dokumentation=doku_aktiv(protokoll))
             lastset = get_or_create_lastset(
                 pool,
                 konstruktion,
@@ -357,98 +446,110 @@ def _abhebesicherheit_DinEn17879_2024_08(
                 protokoll=sub_prot,
                 kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
             )
-            kraefte_nach_element = lastset.kraefte_nach_element
+            block = lastset.block
+            if doku_aktiv(protokoll):
+                gamma_keys.update(gamma_schluessel(block, "ABHEBE"))
 
             total_normal_down = 0.0
             total_normal_up = 0.0
 
             richtung_ctx = merge_kontext(base_ctx, {"windkel_deg": f"{winkel}°", "windrichtung": richtung, "nachweis": "ABHEBE"})
 
-            for element, lastfaelle_elem in kraefte_nach_element.items():
-                N_down_b, N_up_b = abhebe_envelope_pro_bauelement(norm, lastfaelle_elem, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
-                protokolliere_doc(  
+            for element_idx, element in enumerate(block.elemente):
+                N_down_b, N_up_b = abhebe_envelope_block(norm, block, element_idx, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(  
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_down",
+                            wert=N_down_b,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_up",
+                            wert=N_up_b,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                total_normal_down += N_down_b
+                total_normal_up += N_up_b
+
+            # Richtungs-Aggregate dokumentieren
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_down",
-                        wert=N_down_b,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_down",
+                        wert=total_normal_down,
                         einheit="N",
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_down_sum", "windrichtung_deg": f"{winkel}°"},
                 )
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_up",
-                        wert=N_up_b,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_up",
+                        wert=total_normal_up,
                         einheit="N",
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_up_sum", "windrichtung_deg": f"{winkel}°"},
                 )
-                total_normal_down += N_down_b
-                total_normal_up += N_up_b
-
-            # Richtungs-Aggregate dokumentieren
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_down",
-                    wert=total_normal_down,
-                    einheit="N",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_down_sum", "windrichtung_deg": f"{winkel}°"},
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_up",
-                    wert=total_normal_up,
-                    einheit="N",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_N_up_sum", "windrichtung_deg": f"{winkel}°"},
-            )
 
             sicherheit = inf if total_normal_up <= _EPS else (total_normal_down / total_normal_up)
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Sicherheit S_abheb,{int(winkel)}°",
-                    wert=sicherheit,
-                    formel="S = ΣN_down / ΣN_up",
-                    formelzeichen=["N_down", "N_up"],
-                    quelle_formel="---",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
-            )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Sicherheit S_abheb,{int(winkel)}°",
+                        wert=sicherheit,
+                        formel="S = ΣN_down / ΣN_up",
+                        formelzeichen=["N_down", "N_up"],
+                        quelle_formel="---",
+                    ),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
+                )
 
             if total_normal_up <= _EPS:
                 ballastkraft = 0.0
             else:
                 ballastkraft = max(0.0, total_normal_up - total_normal_down) / sicherheitsbeiwert_ballast.wert
 
-            if ballastkraft > ballast_erforderlich_max:
-                ballast_erforderlich_max = ballastkraft
-
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Ballast m_Ballast,abheb,{int(winkel)}°",
-                    wert=ballastkraft,
-                    formel="ΔN_down,erf = max(0, ΣN_up − ΣN_down) / γ_g",
-                    formelzeichen=["N_up", "N_down", "γ_g"],
-                    quelle_formel="---",
-                ),
-                kontext={"nachweis": "ABHEBE", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
-            )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Ballast m_Ballast,abheb,{int(winkel)}°",
+                        wert=ballastkraft,
+                        formel="ΔN_down,erf = max(0, ΣN_up − ΣN_down) / γ_g",
+                        formelzeichen=["N_up", "N_down", "γ_g"],
+                        quelle_formel="---",
+                    ),
+                    kontext={"nachweis": "ABHEBE", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
+                )
 
             # WICHTIG: nicht hier schon mergen/entscheiden – erst sammeln:
             dir_records.append({
+                "winkel": winkel,
                 "windrichtung_deg": f"{winkel}°",
                 "dir_min_sicherheit": sicherheit,        # (hier ist S_dir für diese Richtung bereits die relevante Größe)
                 "dir_ballast_max": ballastkraft,
                 "docs": collect_docs(sub_prot),
                 "sub_prot": sub_prot,
             })
-            
+            return dir_records[-1]["dir_min_sicherheit"]
+
+        stuetzstellen = [(winkel, _richtung_auswerten(winkel, richtung)) for winkel, richtung in windrichtungen]
+        if richtungsstrategie is RichtungsStrategie.ADAPTIV:
+            # Kritische Richtung zwischen den Rasterrichtungen eingrenzen (Goldener Schnitt)
+            verfeinere_windrichtung(_richtung_auswerten, stuetzstellen, protokoll=protokoll, kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE"}))
+
         if not dir_records:
             return [Zwischenergebnis(wert=float("nan")), Zwischenergebnis(wert=float("nan"))]
 
@@ -478,7 +579,7 @@ def _abhebesicherheit_DinEn17879_2024_08(
         # Endwerte (relevant)
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Abhebesicherheit S_abheb",
                 wert=sicherheit_min_global,
                 formel="S_abheb = ΣN_down / ΣN_up",
@@ -490,7 +591,7 @@ def _abhebesicherheit_DinEn17879_2024_08(
         )
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Erforderlicher Ballast m_Ballast,abheb",
                 wert=ballast_kg,
                 einheit="kg",
@@ -502,6 +603,12 @@ def _abhebesicherheit_DinEn17879_2024_08(
             kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "rolle": "relevant"}),
         )
 
+        # γ-Dokumentation einmal je Nachweis (statt je Einzelkraft)
+        protokolliere_gamma(
+            norm, gamma_keys, protokoll=protokoll,
+            kontext=merge_kontext(base_ctx, {"nachweis": "ABHEBE", "doc_type": "gamma", "rolle": "relevant"}),
+        )
+
         #Entscheidung protokollieren
         protokolliere_decision(
             protokoll,
@@ -541,6 +648,7 @@ def abhebesicherheit(
     methode: RechenmethodeAbheben = RechenmethodeAbheben.STANDARD,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -564,6 +672,7 @@ def abhebesicherheit(
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
         )
     except Exception as e:
         protokolliere_msg(
@@ -583,6 +692,7 @@ def abhebesicherheit(
         methode=methode,
         vereinfachung_konstruktion=vereinfachung_konstruktion,
         anzahl_windrichtungen=anzahl_windrichtungen,
+        richtungsstrategie=richtungsstrategie,
         protokoll=protokoll,
         kontext=base_ctx,
     )
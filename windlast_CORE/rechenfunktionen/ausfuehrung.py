@@ -0,0 +1,133 @@
+# rechenfunktionen/ausfuehrung.py — serielle/parallele Ausführung unabhängiger Rechenjobs
+from __future__ import annotations
+import contextvars
+import itertools
+import os
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+from windlast_CORE.datenstruktur.konstanten import aktuelle_konstanten, setze_konstanten
+from windlast_CORE.materialdaten.catalog import catalog
+
+Ausfuehrung = Literal["serial", "threads", "processes"]
+AUSFUEHRUNGEN: Tuple[str, ...] = ("serial", "threads", "processes")
+
+Aufruf = Tuple[tuple, Dict[str, Any]]
+
+def pruefe_ausfuehrung(executor: str, workers: Optional[int]) -> None:
+    if executor not in AUSFUEHRUNGEN:
+        raise ValueError(f"Unbekannter executor: {executor!r} (erlaubt: {', '.join(AUSFUEHRUNGEN)})")
+    if workers is not None and (not isinstance(workers, int) or isinstance(workers, bool) or workers < 1):
+        raise ValueError("workers muss ein int ≥ 1 sein (oder None → Anzahl CPUs).")
+
+# ----- Prozess-Worker: warmer Pool je Worker-Anzahl (einmal je Prozess), geteiltes Objekt je Auftrag gemerkt -----
+# Der Pool wird auch vom API-Batchpfad (windlast_API/core_adapter/batch.py) genutzt → ein Satz warmer Worker je Server.
+# Frozen-Builds (PyInstaller, spawn) brauchen multiprocessing.freeze_support() im Einstiegspunkt (siehe windlast_API/app.py).
+
+_prozess_pools: Dict[int, ProcessPoolExecutor] = {}
+_prozess_pools_lock = threading.Lock()
+_auftrag_nummern = itertools.count(1)
+
+_worker_auftrag: Optional[int] = None
+_worker_objekt: Any = None
+
+def _catalog_zustand() -> Dict[str, Any]:
+    return dict(vars(catalog))
+
+def _worker_init() -> None:
+    # Katalog beim Start des Workers laden, nicht beim ersten Job
+    catalog.spec_version
+
+def _worker_aufruf(auftrag: int, daten: bytes, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+    global _worker_auftrag, _worker_objekt
+    if auftrag != _worker_auftrag:
+        objekt, catalog_zustand, konst = pickle.loads(daten)
+        if catalog_zustand.get("_spec_version") != catalog.spec_version:
+            vars(catalog).update(catalog_zustand)
+        setze_konstanten(konst)
+        _worker_objekt = objekt
+        _worker_auftrag = auftrag
+    return fn(_worker_objekt, *args, **kwargs)
+
+def prozess_pool(workers: int) -> ProcessPoolExecutor:
+    """Warmer ProcessPoolExecutor für diese Worker-Anzahl (Katalog in jedem Worker vorgeladen)."""
+    with _prozess_pools_lock:
+        pool = _prozess_pools.get(workers)
+        if pool is None:
+            pool = _prozess_pools[workers] = ProcessPoolExecutor(max_workers=workers, initializer=_worker_init)
+        return pool
+
+def prozess_pool_verwerfen(workers: int, pool: ProcessPoolExecutor) -> None:
+    """
+    Defekten Pool verwerfen (nach BrokenProcessPool); der nächste prozess_pool(...) legt einen frischen an.
+    Hat ein anderer Aufrufer ihn schon ersetzt, bleibt der neue Pool unangetastet.
+    """
+    with _prozess_pools_lock:
+        if _prozess_pools.get(workers) is pool:
+            del _prozess_pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+class Ausfuehrer:
+    """
+    Führt fn(geteilt, *args, **kwargs) für mehrere Aufrufe aus; Ergebnisse immer in Eingabereihenfolge.
+
+    - "serial":    nacheinander im aufrufenden Thread
+    - "threads":   ThreadPoolExecutor (Kontextvariablen wie aktuelle_konstanten() werden je Job kopiert)
+    - "processes": warmer ProcessPoolExecutor je Worker-Anzahl, bleibt über Aufrufe hinweg bestehen.
+                   'geteilt', Katalog und Konstanten werden einmal je Ausfuehrer gepickelt und in jedem
+                   Worker beim ersten Job des Ausfuehrers entpackt. fn muss modulweit definiert sein.
+
+    Der Thread-Pool wird beim ersten map(...) mit Parallelität angelegt und bis __exit__ wiederverwendet.
+    """
+    def __init__(self, executor: Ausfuehrung = "serial", workers: Optional[int] = None, *, geteilt: Any = None) -> None:
+        pruefe_ausfuehrung(executor, workers)
+        self.executor = executor
+        self.workers = workers or os.cpu_count() or 1
+        self.geteilt = geteilt
+        self._pool: Optional[Executor] = None
+        self._auftrag: Optional[Tuple[int, bytes]] = None
+
+    def __enter__(self) -> "Ausfuehrer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.schliessen()
+
+    def schliessen(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _pool_holen(self) -> Executor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _auftrag_holen(self) -> Tuple[int, bytes]:
+        if self._auftrag is None:
+            daten = pickle.dumps((self.geteilt, _catalog_zustand(), aktuelle_konstanten()))
+            self._auftrag = (next(_auftrag_nummern), daten)
+        return self._auftrag
+
+    def map(self, fn: Callable[..., Any], aufrufe: Sequence[Aufruf]) -> List[Any]:
+        if self.executor == "serial" or self.workers <= 1 or len(aufrufe) <= 1:
+            return [fn(self.geteilt, *args, **kwargs) for args, kwargs in aufrufe]
+        if self.executor == "threads":
+            pool = self._pool_holen()
+            futures = [
+                pool.submit(contextvars.copy_context().run, fn, self.geteilt, *args, **kwargs)
+                for args, kwargs in aufrufe
+            ]
+            return [f.result() for f in futures]
+        auftrag, daten = self._auftrag_holen()
+        pool = prozess_pool(self.workers)
+        try:
+            futures = [pool.submit(_worker_aufruf, auftrag, daten, fn, args, kwargs) for args, kwargs in aufrufe]
+            return [f.result() for f in futures]
+        except BrokenProcessPool:
+            # Worker abgestürzt → beim nächsten Aufruf frischen Pool anlegen
+            prozess_pool_verwerfen(self.workers, pool)
+            raise
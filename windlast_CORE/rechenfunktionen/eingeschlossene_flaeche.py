@@ -3,9 +3,10 @@ from windlast_CORE.datenstruktur.zwischenergebnis import (
     Zwischenergebnis,
     Protokoll,
     merge_kontext,
-    make_docbundle,
+    lazy_docbundle,
     protokolliere_msg,
     protokolliere_doc,
+    doku_aktiv,
 )
 from windlast_CORE.datenstruktur.enums import Norm, ObjektTyp, Severity
 from windlast_CORE.materialdaten.catalog import catalog
@@ -58,34 +59,36 @@ def _eingeschlossene_flaeche_default(
                 text=f"Traverse '{objekt_name_intern}': ungültige Höhe ({hoehe}).",
                 kontext=merge_kontext(base_ctx, {"input_source": "catalog", "laenge": laenge, "hoehe": hoehe}),
             )
+            if doku_aktiv(protokoll):
+                protokolliere_doc(
+                    protokoll,
+                    bundle=lazy_docbundle(
+                        titel="Eingeschlossene Fläche A_c",
+                        wert=float("nan"),
+                        einheit="m²",
+                        einzelwerte=[laenge, hoehe],
+                        formel="A_c = L · h",
+                        quelle_formel="Norm xyz (Abschnitt ...)",
+                    ),
+                    kontext=merge_kontext(base_ctx, {"nan": True}),
+                )
+            return Zwischenergebnis(wert=float("nan"))
+
+        wert = laenge * hoehe
+
+        if doku_aktiv(protokoll):
             protokolliere_doc(
                 protokoll,
-                bundle=make_docbundle(
+                bundle=lazy_docbundle(
                     titel="Eingeschlossene Fläche A_c",
-                    wert=float("nan"),
+                    wert=wert,
                     einheit="m²",
                     einzelwerte=[laenge, hoehe],
                     formel="A_c = L · h",
                     quelle_formel="Norm xyz (Abschnitt ...)",
                 ),
-                kontext=merge_kontext(base_ctx, {"nan": True}),
+                kontext=base_ctx,
             )
-            return Zwischenergebnis(wert=float("nan"))
-
-        wert = laenge * hoehe
-
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(
-                titel="Eingeschlossene Fläche A_c",
-                wert=wert,
-                einheit="m²",
-                einzelwerte=[laenge, hoehe],
-                formel="A_c = L · h",
-                quelle_formel="Norm xyz (Abschnitt ...)",
-            ),
-            kontext=base_ctx,
-        )
         return Zwischenergebnis(wert=wert)
     
     elif objekttyp == ObjektTyp.ROHR:
@@ -103,34 +106,36 @@ def _eingeschlossene_flaeche_default(
                 text=f"Rohr '{objekt_name_intern}': ungültiger Außendurchmesser ({d_aussen}).",
                 kontext=merge_kontext(base_ctx, {"input_source": "catalog", "laenge": laenge, "d_aussen": d_aussen}),
             )
+            if doku_aktiv(protokoll):
+                protokolliere_doc(
+                    protokoll,
+                    bundle=lazy_docbundle(
+                        titel="Eingeschlossene Fläche A_c",
+                        wert=float("nan"),
+                        einheit="m²",
+                        einzelwerte=[laenge, d_aussen],
+                        formel="A_c = L · d_aussen",
+                        quelle_formel="Norm xyz (Abschnitt ...)",
+                    ),
+                    kontext=merge_kontext(base_ctx, {"nan": True}),
+                )
+            return Zwischenergebnis(wert=float("nan"))
+
+        wert = laenge * d_aussen
+
+        if doku_aktiv(protokoll):
             protokolliere_doc(
                 protokoll,
-                bundle=make_docbundle(
+                bundle=lazy_docbundle(
                     titel="Eingeschlossene Fläche A_c",
-                    wert=float("nan"),
+                    wert=wert,
                     einheit="m²",
                     einzelwerte=[laenge, d_aussen],
                     formel="A_c = L · d_aussen",
                     quelle_formel="Norm xyz (Abschnitt ...)",
                 ),
-                kontext=merge_kontext(base_ctx, {"nan": True}),
+                kontext=base_ctx,
             )
-            return Zwischenergebnis(wert=float("nan"))
-
-        wert = laenge * d_aussen
-
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(
-                titel="Eingeschlossene Fläche A_c",
-                wert=wert,
-                einheit="m²",
-                einzelwerte=[laenge, d_aussen],
-                formel="A_c = L · d_aussen",
-                quelle_formel="Norm xyz (Abschnitt ...)",
-            ),
-            kontext=base_ctx,
-        )
         return Zwischenergebnis(wert=wert)
 
     else:
@@ -168,11 +173,12 @@ def eingeschlossene_flaeche(
             text=str(e),
             kontext=base_ctx,
         )
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(titel="Eingeschlossene Fläche A_e", wert=float("nan")),
-            kontext=merge_kontext(base_ctx, {"nan": True}),
-        )
+        if doku_aktiv(protokoll):
+            protokolliere_doc(
+                protokoll,
+                bundle=lazy_docbundle(titel="Eingeschlossene Fläche A_e", wert=float("nan")),
+                kontext=merge_kontext(base_ctx, {"nan": True}),
+            )
         return Zwischenergebnis(wert=float("nan"))
     
     funktion = _DISPATCH.get(norm, _DISPATCH[Norm.DEFAULT])
@@ -4,18 +4,23 @@ from math import inf
 from typing import Dict, Callable, Sequence, List, Optional
 from collections.abc import Sequence as _SeqABC
 
-from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, protokolliere_decision, make_docbundle, make_protokoll, merge_protokoll, collect_docs
-from windlast_CORE.datenstruktur.enums import Norm, RechenmethodeGleiten, VereinfachungKonstruktion, Lasttyp, Variabilitaet, Severity
+from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, protokolliere_decision, lazy_docbundle, make_protokoll, merge_protokoll, collect_docs, doku_aktiv, richtungsdoc_behalten
+from windlast_CORE.datenstruktur.enums import Norm, RechenmethodeGleiten, VereinfachungKonstruktion, RichtungsStrategie, Lasttyp, Variabilitaet, Severity
 from windlast_CORE.datenstruktur.konstanten import _EPS, aktuelle_konstanten
-from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import sicherheitsbeiwert
+from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import sicherheitsbeiwert, protokolliere_gamma
 from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.datenstruktur.prepared import PreparedKonstruktion
+from windlast_CORE.datenstruktur.fortschritt import fortschritt_checkpoint
 
 from windlast_CORE.rechenfunktionen.standsicherheit_utils import (
     generiere_windrichtungen,
     obtain_pool,
     get_or_create_lastset,
+    erzeuge_lastsets,
+    gamma_schluessel,
+    verfeinere_windrichtung,
     ermittle_min_reibwert,
-    gleit_envelope_pro_bauelement,
+    gleit_envelope_block,
 )
 from windlast_CORE.rechenfunktionen.geom3d import Vec3, vektoren_addieren, vektor_laenge
 
@@ -24,17 +29,22 @@ def _emit_docs_with_role(*, dst_protokoll, docs, base_ctx: dict, role: str, extr
     Nur Top-Level-Vergleichswerte dürfen 'entscheidungsrelevant' bleiben.
     """
     TOPLEVEL = {"dir_sicherheit", "dir_min_sicherheit", "dir_ballast"}
+    if not doku_aktiv(dst_protokoll):
+        return
+    nachweis = base_ctx.get("nachweis")
     for bundle, ctx in docs:
         ktx = merge_kontext(base_ctx, ctx or {})
+        if not richtungsdoc_behalten(dst_protokoll, ktx, nachweis=nachweis, gewinner=(role == "relevant")):
+            continue
         doc_type = (ktx.get("doc_type") or (ctx or {}).get("doc_type"))
 
         eff_role = role
         if role == "entscheidungsrelevant" and doc_type not in TOPLEVEL:
             eff_role = "irrelevant"
 
-        ktx["rolle"] = eff_role
+        ktx = merge_kontext(ktx, {"rolle": eff_role})
         if extra_ctx:
-            ktx.update(extra_ctx)
+            ktx = merge_kontext(ktx, extra_ctx)
         protokolliere_doc(dst_protokoll, bundle=bundle, kontext=ktx)
 
 
@@ -49,6 +59,7 @@ def _validate_inputs(
     methode: RechenmethodeGleiten,
     vereinfachung_konstruktion: VereinfachungKonstruktion,
     anzahl_windrichtungen: int,
+    richtungsstrategie: RichtungsStrategie,
 ) -> None:
     # konstruktion: hat bauelemente?
     if not hasattr(konstruktion, "bauelemente"):
@@ -85,6 +96,14 @@ def _validate_inputs(
     # anzahl_windrichtungen: int >= 1?
     if not isinstance(anzahl_windrichtungen, int) or anzahl_windrichtungen < 1:
         raise ValueError("anzahl_windrichtungen muss ein int ≥ 1 sein.")
+
+    # richtungsstrategie: RichtungsStrategie und existent
+    if not isinstance(richtungsstrategie, RichtungsStrategie):
+        raise TypeError("richtungsstrategie muss vom Typ RichtungsStrategie sein.")
+
+    # vorbereitete Konstruktion: muss zu den Nachweis-Eingaben passen
+    if isinstance(konstruktion, PreparedKonstruktion) and not konstruktion.passt(norm, staudruecke, obergrenzen, konst):
+        raise ValueError("PreparedKonstruktion wurde für eine andere Norm/q-Profil/Konstanten vorbereitet.")
     
 def _gleitsicherheit_DinEn13814_2005_06(
     konstruktion,
@@ -97,6 +116,7 @@ def _gleitsicherheit_DinEn13814_2005_06(
     methode: RechenmethodeGleiten = RechenmethodeGleiten.MIN_REIBWERT,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -119,7 +139,7 @@ def _gleitsicherheit_DinEn13814_2005_06(
 
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Minimaler Reibwert μ_min",
                 wert=reibwert_min,
                 formel="μ_min = min(μ_Bauelemente)",
@@ -139,9 +159,25 @@ def _gleitsicherheit_DinEn13814_2005_06(
         sicherheitsbeiwert_ballast = sicherheitsbeiwert(norm, ballastkraft_dummy, ist_guenstig=True, protokoll=protokoll, kontext=base_ctx)
         pool = obtain_pool(konstruktion, reset_berechnungen)
         dir_records = []
+        gamma_keys = set()  # γ-Kombinationen aller Richtungen → Doku einmal je Nachweis
 
-        for winkel, richtung in generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx):
-            sub_prot = make_protokoll()
+        windrichtungen = generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx)
+        # Lasten aller Richtungen im Batch (richtungsunabhängiger Anteil nur einmal)
+        erzeuge_lastsets(
+            pool,
+            konstruktion,
+            windrichtungen=windrichtungen,
+            norm=norm,
+            staudruecke=staudruecke,
+            obergrenzen=obergrenzen,
+            konst=konst,
+            kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
+            dokumentation=doku_aktiv(protokoll),
+        )
+
+        def _richtung_auswerten(winkel: float, richtung: Vec3) -> float:
+            fortschritt_checkpoint()  # Abbruch-Checkpoint + Fortschritt je Windrichtung
+            sub_prot = make_protokoll(dokumentation=doku_aktiv(protokoll))
             lastset = get_or_create_lastset(
                 pool,
                 konstruktion,
@@ -154,7 +190,9 @@ def _gleitsicherheit_DinEn13814_2005_06(
                 protokoll=sub_prot,
                 kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
             )
-            kraefte_nach_element = lastset.kraefte_nach_element
+            block = lastset.block
+            if doku_aktiv(protokoll):
+                gamma_keys.update(gamma_schluessel(block, "GLEIT"))
 
             # Richtungs-lokale Aggregation
             dir_min_sicherheit = inf
@@ -166,115 +204,124 @@ def _gleitsicherheit_DinEn13814_2005_06(
 
             richtung_ctx = merge_kontext(base_ctx, {"windrichtung_deg": f"{winkel}°", "windrichtung": richtung, "nachweis": "GLEIT"})
 
-            for element, lastfaelle_elem in kraefte_nach_element.items():
-                H_vec, N_down, N_up = gleit_envelope_pro_bauelement(norm, lastfaelle_elem, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
+            for element_idx, element in enumerate(block.elemente):
+                H_vec, N_down, N_up = gleit_envelope_block(norm, block, element_idx, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Horizontalkraft H",
+                            wert=H_vec,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_horizontalkraft", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_down",
+                            wert=N_down,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_up",
+                            wert=N_up,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                total_horizontal = vektoren_addieren([total_horizontal, H_vec])
+                total_normal_up += N_up
+                total_normal_down += N_down
+
+            horizontal_betrag = vektor_laenge(total_horizontal)
+            normal_effektiv = max(0.0, total_normal_down - total_normal_up)
+            reibkraft = reibwert_min * normal_effektiv
+
+            # === Zwischendocs (Aggregat der Richtung) ===
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Horizontalkraft H",
-                        wert=H_vec,
+                    bundle=lazy_docbundle(
+                        titel="Summe Horizontalbetrag |H|",
+                        wert=horizontal_betrag,
                         einheit="N",
+                        formel="|T| = √(T_x² + T_y² + T_z²)",
+                        formelzeichen=["T_x", "T_y", "T_z"],
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_horizontalkraft", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "horizontal_betrag", "windrichtung_deg": f"{winkel}°"}),
                 )
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_down",
-                        wert=N_down,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_down",
+                        wert=total_normal_down,
                         einheit="N",
+                        formel="ΣN_down = N_{down,Element}",
+                        formelzeichen=["N_{down,Element}"],
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_down", "windrichtung_deg": f"{winkel}°"}),
                 )
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_up",
-                        wert=N_up,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_up",
+                        wert=total_normal_up,
                         einheit="N",
+                        formel="ΣN_up = N_{up,Element}",
+                        formelzeichen=["N_{up,Element}"],
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_up", "windrichtung_deg": f"{winkel}°"}),
+                )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel="Effektive Normalkraft N_eff",
+                        wert=normal_effektiv,
+                        einheit="N",
+                        formel="N_eff = max(0, ΣN_down − ΣN_up)",
+                        formelzeichen=["ΣN_down", "ΣN_up"],
+                    ),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_effektiv", "windrichtung_deg": f"{winkel}°"}),
+                )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel="Reibkraft R",
+                        wert=reibkraft,
+                        einheit="N",
+                        formel="R = μ_min · N_eff",
+                        formelzeichen=["μ_min", "N_eff"],
+                    ),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "reibkraft", "windrichtung_deg": f"{winkel}°"}),
                 )
-                total_horizontal = vektoren_addieren([total_horizontal, H_vec])
-                total_normal_up += N_up
-                total_normal_down += N_down
-
-            horizontal_betrag = vektor_laenge(total_horizontal)
-            normal_effektiv = max(0.0, total_normal_down - total_normal_up)
-            reibkraft = reibwert_min * normal_effektiv
-
-            # === Zwischendocs (Aggregat der Richtung) ===
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Horizontalbetrag |H|",
-                    wert=horizontal_betrag,
-                    einheit="N",
-                    formel="|T| = √(T_x² + T_y² + T_z²)",
-                    formelzeichen=["T_x", "T_y", "T_z"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "horizontal_betrag", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_down",
-                    wert=total_normal_down,
-                    einheit="N",
-                    formel="ΣN_down = N_{down,Element}",
-                    formelzeichen=["N_{down,Element}"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_down", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_up",
-                    wert=total_normal_up,
-                    einheit="N",
-                    formel="ΣN_up = N_{up,Element}",
-                    formelzeichen=["N_{up,Element}"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_up", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Effektive Normalkraft N_eff",
-                    wert=normal_effektiv,
-                    einheit="N",
-                    formel="N_eff = max(0, ΣN_down − ΣN_up)",
-                    formelzeichen=["ΣN_down", "ΣN_up"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_effektiv", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Reibkraft R",
-                    wert=reibkraft,
-                    einheit="N",
-                    formel="R = μ_min · N_eff",
-                    formelzeichen=["μ_min", "N_eff"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "reibkraft", "windrichtung_deg": f"{winkel}°"}),
-            )
 
             if horizontal_betrag > _EPS:
                 sicherheit = reibkraft / horizontal_betrag
                 dir_min_sicherheit = min(dir_min_sicherheit, sicherheit)
                 
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Sicherheit S_gleit,{int(winkel)}°",
-                    wert=sicherheit,
-                    formel="S = R / T",
-                    formelzeichen=["R", "T"],
-                    quelle_formel="---",
-                ),
-                kontext={"nachweis": "GLEIT", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
-            )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Sicherheit S_gleit,{int(winkel)}°",
+                        wert=dir_min_sicherheit,
+                        formel="S = R / T",
+                        formelzeichen=["R", "T"],
+                        quelle_formel="---",
+                    ),
+                    kontext={"nachweis": "GLEIT", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
+                )
 
             if reibwert_min <= _EPS:
                 if horizontal_betrag > _EPS:
@@ -288,18 +335,19 @@ def _gleitsicherheit_DinEn13814_2005_06(
                 dir_ballast_max = ballastkraft
 
             # Ballast-Doc (Richtung)
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Ballast m_Ballast,gleit,{int(winkel)}°",
-                    wert=ballastkraft,
-                    einheit="kg",
-                    formel="Δm_Ballast,gleit = T/μ + ΣN_up − ΣN_down",
-                    formelzeichen=["T", "μ", "N_up", "N_down"],
-                    quelle_formel="---",
-                ),
-                kontext={"nachweis": "GLEIT", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
-            )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Ballast m_Ballast,gleit,{int(winkel)}°",
+                        wert=ballastkraft,
+                        einheit="kg",
+                        formel="Δm_Ballast,gleit = T/μ + ΣN_up − ΣN_down",
+                        formelzeichen=["T", "μ", "N_up", "N_down"],
+                        quelle_formel="---",
+                    ),
+                    kontext={"nachweis": "GLEIT", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
+                )
 
             # Record ablegen (WICHTIG: innerhalb der Schleife!)
             dir_records.append({
@@ -309,6 +357,12 @@ def _gleitsicherheit_DinEn13814_2005_06(
                 "docs": collect_docs(sub_prot),
                 "sub_prot": sub_prot,
             })
+            return dir_records[-1]["dir_min_sicherheit"]
+
+        stuetzstellen = [(winkel, _richtung_auswerten(winkel, richtung)) for winkel, richtung in windrichtungen]
+        if richtungsstrategie is RichtungsStrategie.ADAPTIV:
+            # Kritische Richtung zwischen den Rasterrichtungen eingrenzen (Goldener Schnitt)
+            verfeinere_windrichtung(_richtung_auswerten, stuetzstellen, protokoll=protokoll, kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT"}))
 
         # --- Globale Entscheidung & Rollenvergabe ---
         if not dir_records:
@@ -343,7 +397,7 @@ def _gleitsicherheit_DinEn13814_2005_06(
 
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Gleitsicherheit S_gleit",
                 wert=sicherheit_min_global,
                 formel="S = R / T",
@@ -354,7 +408,7 @@ def _gleitsicherheit_DinEn13814_2005_06(
         )
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Erforderlicher Ballast m_Ballast,gleit",
                 wert=ballast_kg,
                 einheit="kg",
@@ -365,6 +419,12 @@ def _gleitsicherheit_DinEn13814_2005_06(
             kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "rolle": "relevant"}),
         )
 
+        # γ-Dokumentation einmal je Nachweis (statt je Einzelkraft)
+        protokolliere_gamma(
+            norm, gamma_keys, protokoll=protokoll,
+            kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "gamma", "rolle": "relevant"}),
+        )
+
         #Entscheidung protokollieren
         protokolliere_decision(
             protokoll,
@@ -394,6 +454,7 @@ def _gleitsicherheit_DinEn17879_2024_08(
     methode: RechenmethodeGleiten = RechenmethodeGleiten.MIN_REIBWERT,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None
 ) -> List[Zwischenergebnis]:
@@ -416,7 +477,7 @@ def _gleitsicherheit_DinEn17879_2024_08(
 
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Minimaler Reibwert μ_min",
                 wert=reibwert_min,
                 formel="μ_min = min(μ_Bauelemente)",
@@ -436,9 +497,25 @@ def _gleitsicherheit_DinEn17879_2024_08(
         sicherheitsbeiwert_ballast = sicherheitsbeiwert(norm, ballastkraft_dummy, ist_guenstig=True, protokoll=protokoll, kontext=base_ctx)
         pool = obtain_pool(konstruktion, reset_berechnungen)
         dir_records = []
+        gamma_keys = set()  # γ-Kombinationen aller Richtungen → Doku einmal je Nachweis
+
+        windrichtungen = generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx)
+        # Lasten aller Richtungen im Batch (richtungsunabhängiger Anteil nur einmal)
+        erzeuge_lastsets(
+            pool,
+            konstruktion,
+            windrichtungen=windrichtungen,
+            norm=norm,
+            staudruecke=staudruecke,
+            obergrenzen=obergrenzen,
+            konst=konst,
+            kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
+            dokumentation=doku_aktiv(protokoll),
+        )
 
-        for winkel, richtung in generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx):
-            sub_prot = make_protokoll()
+        def _richtung_auswerten(winkel: float, richtung: Vec3) -> float:
+            fortschritt_checkpoint()  # Abbruch-Checkpoint + Fortschritt je Windrichtung
+            sub_prot = make_protokoll(dokumentation=doku_aktiv(protokoll))
             lastset = get_or_create_lastset(
                 pool,
                 konstruktion,
@@ -451,7 +528,9 @@ def _gleitsicherheit_DinEn17879_2024_08(
                 protokoll=sub_prot,
                 kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
             )
-            kraefte_nach_element = lastset.kraefte_nach_element
+            block = lastset.block
+            if doku_aktiv(protokoll):
+                gamma_keys.update(gamma_schluessel(block, "GLEIT"))
 
             # Richtungs-lokale Aggregation
             dir_min_sicherheit = inf
@@ -463,115 +542,124 @@ def _gleitsicherheit_DinEn17879_2024_08(
 
             richtung_ctx = merge_kontext(base_ctx, {"windrichtung_deg": f"{winkel}°", "windrichtung": richtung, "nachweis": "GLEIT"})
 
-            for element, lastfaelle_elem in kraefte_nach_element.items():
-                H_vec, N_down, N_up = gleit_envelope_pro_bauelement(norm, lastfaelle_elem, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
+            for element_idx, element in enumerate(block.elemente):
+                H_vec, N_down, N_up = gleit_envelope_block(norm, block, element_idx, protokoll=sub_prot, kontext=merge_kontext(richtung_ctx, {"element_id": str(element)}))
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Horizontalkraft H",
+                            wert=H_vec,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_horizontalkraft", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_down",
+                            wert=N_down,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel="Normalkraft N_up",
+                            wert=N_up,
+                            einheit="N",
+                        ),
+                        kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    )
+                total_horizontal = vektoren_addieren([total_horizontal, H_vec])
+                total_normal_up += N_up
+                total_normal_down += N_down
+
+            horizontal_betrag = vektor_laenge(total_horizontal)
+            normal_effektiv = max(0.0, total_normal_down - total_normal_up)
+            reibkraft = reibwert_min * normal_effektiv
+
+            # === Zwischendocs (Aggregat der Richtung) ===
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Horizontalkraft H",
-                        wert=H_vec,
+                    bundle=lazy_docbundle(
+                        titel="Summe Horizontalbetrag |H|",
+                        wert=horizontal_betrag,
                         einheit="N",
+                        formel="|T| = √(T_x² + T_y² + T_z²)",
+                        formelzeichen=["T_x", "T_y", "T_z"],
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_horizontalkraft", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "horizontal_betrag", "windrichtung_deg": f"{winkel}°"}),
                 )
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_down",
-                        wert=N_down,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_down",
+                        wert=total_normal_down,
                         einheit="N",
+                        formel="ΣN_down = N_{down,Element}",
+                        formelzeichen=["N_{down,Element}"],
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_down", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_down", "windrichtung_deg": f"{winkel}°"}),
                 )
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel="Normalkraft N_up",
-                        wert=N_up,
+                    bundle=lazy_docbundle(
+                        titel="Summe Normalkräfte ΣN_up",
+                        wert=total_normal_up,
                         einheit="N",
+                        formel="ΣN_up = N_{up,Element}",
+                        formelzeichen=["N_{up,Element}"],
                     ),
-                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "element_normalkraft_up", "windrichtung_deg": f"{winkel}°", "element_id": str(element)}),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_up", "windrichtung_deg": f"{winkel}°"}),
                 )
-                total_horizontal = vektoren_addieren([total_horizontal, H_vec])
-                total_normal_up += N_up
-                total_normal_down += N_down
-
-            horizontal_betrag = vektor_laenge(total_horizontal)
-            normal_effektiv = max(0.0, total_normal_down - total_normal_up)
-            reibkraft = reibwert_min * normal_effektiv
-
-            # === Zwischendocs (Aggregat der Richtung) ===
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Horizontalbetrag |H|",
-                    wert=horizontal_betrag,
-                    einheit="N",
-                    formel="|T| = √(T_x² + T_y² + T_z²)",
-                    formelzeichen=["T_x", "T_y", "T_z"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "horizontal_betrag", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_down",
-                    wert=total_normal_down,
-                    einheit="N",
-                    formel="ΣN_down = N_{down,Element}",
-                    formelzeichen=["N_{down,Element}"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_down", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Summe Normalkräfte ΣN_up",
-                    wert=total_normal_up,
-                    einheit="N",
-                    formel="ΣN_up = N_{up,Element}",
-                    formelzeichen=["N_{up,Element}"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_up", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Effektive Normalkraft N_eff",
-                    wert=normal_effektiv,
-                    einheit="N",
-                    formel="N_eff = max(0, ΣN_down − ΣN_up)",
-                    formelzeichen=["ΣN_down", "ΣN_up"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_effektiv", "windrichtung_deg": f"{winkel}°"}),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel="Reibkraft R",
-                    wert=reibkraft,
-                    einheit="N",
-                    formel="R = μ_min · N_eff",
-                    formelzeichen=["μ_min", "N_eff"],
-                ),
-                kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "reibkraft", "windrichtung_deg": f"{winkel}°"}),
-            )
-
-            if horizontal_betrag > _EPS:
-                sicherheit = reibkraft / horizontal_betrag
-                dir_min_sicherheit = min(dir_min_sicherheit, sicherheit)
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel=f"Richtungs-Sicherheit S_gleit,{int(winkel)}°",
-                        wert=sicherheit,
-                        formel="S = R / T",
-                        formelzeichen=["R", "T"],
-                        quelle_formel="---",
+                    bundle=lazy_docbundle(
+                        titel="Effektive Normalkraft N_eff",
+                        wert=normal_effektiv,
+                        einheit="N",
+                        formel="N_eff = max(0, ΣN_down − ΣN_up)",
+                        formelzeichen=["ΣN_down", "ΣN_up"],
                     ),
-                    kontext={"nachweis": "GLEIT", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "normal_effektiv", "windrichtung_deg": f"{winkel}°"}),
+                )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel="Reibkraft R",
+                        wert=reibkraft,
+                        einheit="N",
+                        formel="R = μ_min · N_eff",
+                        formelzeichen=["μ_min", "N_eff"],
+                    ),
+                    kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "reibkraft", "windrichtung_deg": f"{winkel}°"}),
                 )
 
+            if horizontal_betrag > _EPS:
+                sicherheit = reibkraft / horizontal_betrag
+                dir_min_sicherheit = min(dir_min_sicherheit, sicherheit)
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel=f"Richtungs-Sicherheit S_gleit,{int(winkel)}°",
+                            wert=sicherheit,
+                            formel="S = R / T",
+                            formelzeichen=["R", "T"],
+                            quelle_formel="---",
+                        ),
+                        kontext={"nachweis": "GLEIT", "doc_type": "dir_sicherheit", "windrichtung_deg": f"{winkel}°"},
+                    )
+
             if reibwert_min <= _EPS:
                 if horizontal_betrag > _EPS:
                     ballastkraft = inf
@@ -584,18 +672,19 @@ def _gleitsicherheit_DinEn17879_2024_08(
                 dir_ballast_max = ballastkraft
 
             # Ballast-Doc (Richtung)
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Ballast m_Ballast,gleit,{int(winkel)}°",
-                    wert=ballastkraft,
-                    einheit="kg",
-                    formel=f"m_Ballast,gleit,{int(winkel)}° = T/μ + ΣN_up − ΣN_down",
-                    formelzeichen=["T", "μ", "N_up", "N_down"],
-                    quelle_formel="---",
-                ),
-                kontext={"nachweis": "GLEIT", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
-            )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Ballast m_Ballast,gleit,{int(winkel)}°",
+                        wert=ballastkraft,
+                        einheit="kg",
+                        formel=f"m_Ballast,gleit,{int(winkel)}° = T/μ + ΣN_up − ΣN_down",
+                        formelzeichen=["T", "μ", "N_up", "N_down"],
+                        quelle_formel="---",
+                    ),
+                    kontext={"nachweis": "GLEIT", "doc_type": "dir_ballast", "windrichtung_deg": f"{winkel}°"},
+                )
 
             # Record ablegen (WICHTIG: innerhalb der Schleife!)
             dir_records.append({
@@ -605,6 +694,12 @@ def _gleitsicherheit_DinEn17879_2024_08(
                 "docs": collect_docs(sub_prot),
                 "sub_prot": sub_prot,
             })
+            return dir_records[-1]["dir_min_sicherheit"]
+
+        stuetzstellen = [(winkel, _richtung_auswerten(winkel, richtung)) for winkel, richtung in windrichtungen]
+        if richtungsstrategie is RichtungsStrategie.ADAPTIV:
+            # Kritische Richtung zwischen den Rasterrichtungen eingrenzen (Goldener Schnitt)
+            verfeinere_windrichtung(_richtung_auswerten, stuetzstellen, protokoll=protokoll, kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT"}))
 
         # --- Globale Entscheidung & Rollenvergabe ---
         if not dir_records:
@@ -639,7 +734,7 @@ def _gleitsicherheit_DinEn17879_2024_08(
 
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Gleitsicherheit S_gleit",
                 wert=sicherheit_min_global,
                 formel="S_gleit = R / T",
@@ -650,7 +745,7 @@ def _gleitsicherheit_DinEn17879_2024_08(
         )
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Erforderlicher Ballast m_Ballast,gleit",
                 wert=ballast_kg,
                 einheit="kg",
@@ -661,6 +756,12 @@ def _gleitsicherheit_DinEn17879_2024_08(
             kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "rolle": "relevant"}),
         )
 
+        # γ-Dokumentation einmal je Nachweis (statt je Einzelkraft)
+        protokolliere_gamma(
+            norm, gamma_keys, protokoll=protokoll,
+            kontext=merge_kontext(base_ctx, {"nachweis": "GLEIT", "doc_type": "gamma", "rolle": "relevant"}),
+        )
+
         #Entscheidung protokollieren
         protokolliere_decision(
             protokoll,
@@ -696,6 +797,7 @@ def gleitsicherheit(
     methode: RechenmethodeGleiten = RechenmethodeGleiten.MIN_REIBWERT,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -716,6 +818,7 @@ def gleitsicherheit(
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
         )
     except Exception as e:
         protokolliere_msg(
@@ -735,6 +838,7 @@ def gleitsicherheit(
         methode=methode,
         vereinfachung_konstruktion=vereinfachung_konstruktion,
         anzahl_windrichtungen=anzahl_windrichtungen,
+        richtungsstrategie=richtungsstrategie,
         protokoll=protokoll,
         kontext=base_ctx,
     )
@@ -4,19 +4,27 @@ from math import inf
 from typing import Dict, Callable, Sequence, List, Optional, Tuple, Iterable
 from collections.abc import Sequence as _SeqABC
 
-from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, protokolliere_decision, make_docbundle, merge_protokoll, make_protokoll, collect_docs
-from windlast_CORE.datenstruktur.enums import Norm, RechenmethodeKippen, VereinfachungKonstruktion, Lasttyp, Variabilitaet, Severity
+from windlast_CORE.datenstruktur.zwischenergebnis import Zwischenergebnis, Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, protokolliere_decision, lazy_docbundle, merge_protokoll, make_protokoll, collect_docs, doku_aktiv, richtungsdoc_behalten
+from windlast_CORE.datenstruktur.enums import Norm, RechenmethodeKippen, VereinfachungKonstruktion, RichtungsStrategie, Lasttyp, Variabilitaet, Severity
 from windlast_CORE.datenstruktur.konstanten import _EPS, aktuelle_konstanten
 from windlast_CORE.datenstruktur.kraefte import Kraefte
-from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import sicherheitsbeiwert
-from windlast_CORE.rechenfunktionen.geom3d import flaechenschwerpunkt, moment_einzelkraft_um_achse
+from windlast_CORE.datenstruktur.prepared import PreparedKonstruktion
+from windlast_CORE.datenstruktur.fortschritt import fortschritt_checkpoint
+from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import sicherheitsbeiwert, protokolliere_gamma
+from windlast_CORE.rechenfunktionen.geom3d import Vec3
 
+from windlast_CORE.rechenfunktionen.symmetrie import symmetrie_von
 from windlast_CORE.rechenfunktionen.standsicherheit_utils import (
     generiere_windrichtungen,
-    sammle_kippachsen,
+    kippgeometrie,
     obtain_pool,
     get_or_create_lastset,
-    kipp_envelope_pro_bauelement,
+    erzeuge_lastsets,
+    kipp_matrix,
+    protokolliere_kipp_lastfallfehler,
+    gamma_schluessel,
+    verfeinere_windrichtung,
+    richtungsrecord_aus_symmetrie,
 )
 
 def _emit_kipp_docs_two_stage(
@@ -27,19 +35,25 @@ def _emit_kipp_docs_two_stage(
     is_global_winner: bool,
     best_achse_idx: int | None,
 ):
+    if not doku_aktiv(dst_protokoll):
+        return
+    nachweis = base_ctx.get("nachweis")
     for bundle, ctx in docs:
         ktx = merge_kontext(base_ctx, ctx or {})
+        if not richtungsdoc_behalten(dst_protokoll, ktx, nachweis=nachweis, gewinner=is_global_winner):
+            continue
         doc_type    = (ktx.get("doc_type") or "")
         achse_index = ktx.get("achse_index")
+        rolle = None
 
         # 1) Achsentscheidung innerhalb der Richtung
         if isinstance(achse_index, int) and best_achse_idx is not None:
             if is_global_winner:
                 # Diese Achse liefert die Richtungs-Minimum-Sicherheit
                 if achse_index == best_achse_idx:
-                    ktx["rolle"] = "relevant"
+                    rolle = "relevant"
                 else:
-                    ktx["rolle"] = "entscheidungsrelevant"
+                    rolle = "entscheidungsrelevant"
             else:
                 # andere Achsen bleiben ohne rolle => später "irrelevant"
                 pass
@@ -47,11 +61,13 @@ def _emit_kipp_docs_two_stage(
         # 2) Richtungsentscheidung (wie bisher)
         if is_global_winner:
             if isinstance(doc_type, str) and doc_type.startswith("dir_"):
-                ktx["rolle"] = "relevant"
+                rolle = "relevant"
         else:
             if doc_type in ("dir_min_sicherheit", "dir_ballast"):
-                ktx["rolle"] = "entscheidungsrelevant"
+                rolle = "entscheidungsrelevant"
 
+        if rolle is not None:
+            ktx = merge_kontext(ktx, {"rolle": rolle})
         protokolliere_doc(dst_protokoll, bundle=bundle, kontext=ktx)
 
 def _validate_inputs(
@@ -65,6 +81,7 @@ def _validate_inputs(
     methode: RechenmethodeKippen,
     vereinfachung_konstruktion: VereinfachungKonstruktion,
     anzahl_windrichtungen: int,
+    richtungsstrategie: RichtungsStrategie,
 ) -> None:
     # konstruktion: hat bauelemente?
     if not hasattr(konstruktion, "bauelemente"):
@@ -102,6 +119,14 @@ def _validate_inputs(
     if not isinstance(anzahl_windrichtungen, int) or anzahl_windrichtungen < 1:
         raise ValueError("anzahl_windrichtungen muss ein int ≥ 1 sein.")
 
+    # richtungsstrategie: RichtungsStrategie und existent
+    if not isinstance(richtungsstrategie, RichtungsStrategie):
+        raise TypeError("richtungsstrategie muss vom Typ RichtungsStrategie sein.")
+
+    # vorbereitete Konstruktion: muss zu den Nachweis-Eingaben passen
+    if isinstance(konstruktion, PreparedKonstruktion) and not konstruktion.passt(norm, staudruecke, obergrenzen, konst):
+        raise ValueError("PreparedKonstruktion wurde für eine andere Norm/q-Profil/Konstanten vorbereitet.")
+
 def _kippsicherheit_DinEn13814_2005_06(
     konstruktion,
     norm: Norm,
@@ -113,6 +138,7 @@ def _kippsicherheit_DinEn13814_2005_06(
     methode: RechenmethodeKippen = RechenmethodeKippen.STANDARD,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -132,7 +158,8 @@ def _kippsicherheit_DinEn13814_2005_06(
 
     if methode == RechenmethodeKippen.STANDARD:
         # 1) Eckpunkte sammeln → Kippachsen bestimmen
-        achsen = sammle_kippachsen(konstruktion, protokoll=protokoll, kontext=base_ctx)
+        geometrie = kippgeometrie(konstruktion, protokoll=protokoll, kontext=base_ctx)
+        achsen = list(geometrie.achsen)
         if not achsen:
             return [Zwischenergebnis(wert=float("nan")), Zwischenergebnis(wert=float("nan"))]
         # 1.1) Grundgrößen für Ballast bestimmen
@@ -143,8 +170,6 @@ def _kippsicherheit_DinEn13814_2005_06(
             Angriffsflaeche_Einzelkraefte=[[(0.0, 0.0, 0.0)]],
         )
         sicherheitsbeiwert_ballast = sicherheitsbeiwert(norm, ballastkraft_dummy, ist_guenstig=True)
-        huelle_punkte = [a.punkt for a in achsen]
-        schwerpunkt_ballast = flaechenschwerpunkt(huelle_punkte)
 
         # 2) Minimum der Sicherheit über alle (Windrichtung × Achse)
         sicherheit_min_global = inf
@@ -152,9 +177,32 @@ def _kippsicherheit_DinEn13814_2005_06(
 
         pool = obtain_pool(konstruktion, reset_berechnungen)
         dir_records = []  # (winkel, richtung, min_sicherheit, ballast_max)
+        gamma_keys = set()  # γ-Kombinationen aller Richtungen → Doku einmal je Nachweis
+
+        windrichtungen = generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx)
+        # Symmetrische Konstruktion → nur der Fundamentalbereich wird gerechnet, der Rest gespiegelt
+        symmetrie = symmetrie_von(konstruktion)
+        # Lasten aller Richtungen im Batch (richtungsunabhängiger Anteil nur einmal)
+        erzeuge_lastsets(
+            pool,
+            konstruktion,
+            windrichtungen=symmetrie.fundamentalbereich(windrichtungen),
+            norm=norm,
+            staudruecke=staudruecke,
+            obergrenzen=obergrenzen,
+            konst=konst,
+            kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
+            dokumentation=doku_aktiv(protokoll),
+        )
+
+        def _richtung_auswerten(winkel: float, richtung: Vec3) -> float:
+            fortschritt_checkpoint()  # Abbruch-Checkpoint + Fortschritt je Windrichtung
+            gespiegelt = richtungsrecord_aus_symmetrie(symmetrie, winkel, dir_records, dokumentation=doku_aktiv(protokoll))
+            if gespiegelt is not None:
+                dir_records.append(gespiegelt)
+                return gespiegelt["dir_min_sicherheit"]
 
-        for winkel, richtung in generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx):
-            sub_prot = make_protokoll()
+            sub_prot = make_protokoll(dokumentation=doku_aktiv(protokoll))
             lastset = get_or_create_lastset(
                 pool,
                 konstruktion,
@@ -167,7 +215,12 @@ def _kippsicherheit_DinEn13814_2005_06(
                 protokoll=sub_prot,
                 kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
             )
-            kraefte_nach_element = lastset.kraefte_nach_element
+            block = lastset.block
+            if doku_aktiv(protokoll):
+                gamma_keys.update(gamma_schluessel(block, "KIPP", achsen))
+
+            # 2b) Kernel: Envelope-Beiträge aller Achsen × Bauelemente in einem Durchlauf
+            matrix = kipp_matrix(norm, achsen, block)
 
             # Richtungs-lokale Aggregation
             dir_min_sicherheit = inf
@@ -183,87 +236,94 @@ def _kippsicherheit_DinEn13814_2005_06(
 
                 achse_ctx = merge_kontext(base_ctx, {"achse_index": achse_idx, "windrichtung_deg": f"{winkel}°", "windrichtung": richtung, "nachweis": "KIPP"})
 
-                for element, lastfaelle_elem in kraefte_nach_element.items():
-                    kipp_b, stand_b = kipp_envelope_pro_bauelement(norm, achse, lastfaelle_elem, protokoll=sub_prot, kontext=merge_kontext(achse_ctx, {"element_id": str(element)}))
+                for element_idx, element in enumerate(matrix.elemente):
+                    protokolliere_kipp_lastfallfehler(matrix, element_idx, protokoll=sub_prot, kontext=merge_kontext(achse_ctx, {"element_id": str(element)}))
+                    kipp_b = matrix.kipp[achse_idx][element_idx]
+                    stand_b = matrix.stand[achse_idx][element_idx]
+                    if doku_aktiv(sub_prot):
+                        protokolliere_doc(
+                            sub_prot,
+                            bundle=lazy_docbundle(
+                                titel="Kippmoment M_K",
+                                wert=kipp_b,
+                                einheit="Nm",
+                            ),
+                            kontext=merge_kontext(base_ctx, {
+                                "nachweis": "KIPP",
+                                "doc_type": "axis_momente",
+                                "achse_index": achse_idx,
+                                "element_id": str(element),
+                            }),
+                        )
+                    if doku_aktiv(sub_prot):
+                        protokolliere_doc(
+                            sub_prot,
+                            bundle=lazy_docbundle(
+                                titel="Standmoment M_St",
+                                wert=stand_b,
+                                einheit="Nm",
+                            ),
+                            kontext=merge_kontext(base_ctx, {
+                                "nachweis": "KIPP",
+                                "doc_type": "axis_momente",
+                                "achse_index": achse_idx,
+                                "element_id": str(element),
+                            }),
+                        )
+                    total_kipp += kipp_b
+                    total_stand += stand_b
+
+                # Sicherheit Sicherheit = Stand / Kipp
+                if total_kipp <= _EPS:
+                    sicherheit = inf  # keine kippende Wirkung → unendlich sicher bzgl. Kippen
+                else:
+                    sicherheit = total_stand / total_kipp
+
+                if doku_aktiv(sub_prot):
                     protokolliere_doc(
                         sub_prot,
-                        bundle=make_docbundle(
-                            titel="Kippmoment M_K",
-                            wert=kipp_b,
+                        bundle=lazy_docbundle(
+                            titel="Summe Kippmoment ΣM_K",
+                            wert=total_kipp,
+                            formel="ΣM_K = ΣM_K,Bauelement",
                             einheit="Nm",
                         ),
                         kontext=merge_kontext(base_ctx, {
                             "nachweis": "KIPP",
                             "doc_type": "axis_momente",
                             "achse_index": achse_idx,
-                            "element_id": str(element),
                         }),
                     )
+                if doku_aktiv(sub_prot):
                     protokolliere_doc(
                         sub_prot,
-                        bundle=make_docbundle(
-                            titel="Standmoment M_St",
-                            wert=stand_b,
+                        bundle=lazy_docbundle(
+                            titel="Summe Standmoment ΣM_St",
+                            wert=total_stand,
+                            formel="ΣM_St = ΣM_St,Bauelement",
                             einheit="Nm",
                         ),
                         kontext=merge_kontext(base_ctx, {
                             "nachweis": "KIPP",
                             "doc_type": "axis_momente",
                             "achse_index": achse_idx,
-                            "element_id": str(element),
                         }),
                     )
-                    total_kipp += kipp_b
-                    total_stand += stand_b
-
-                # Sicherheit Sicherheit = Stand / Kipp
-                if total_kipp <= _EPS:
-                    sicherheit = inf  # keine kippende Wirkung → unendlich sicher bzgl. Kippen
-                else:
-                    sicherheit = total_stand / total_kipp
-
-                protokolliere_doc(
-                    sub_prot,
-                    bundle=make_docbundle(
-                        titel="Summe Kippmoment ΣM_K",
-                        wert=total_kipp,
-                        formel="ΣM_K = ΣM_K,Bauelement",
-                        einheit="Nm",
-                    ),
-                    kontext=merge_kontext(base_ctx, {
-                        "nachweis": "KIPP",
-                        "doc_type": "axis_momente",
-                        "achse_index": achse_idx,
-                    }),
-                )
-                protokolliere_doc(
-                    sub_prot,
-                    bundle=make_docbundle(
-                        titel="Summe Standmoment ΣM_St",
-                        wert=total_stand,
-                        formel="ΣM_St = ΣM_St,Bauelement",
-                        einheit="Nm",
-                    ),
-                    kontext=merge_kontext(base_ctx, {
-                        "nachweis": "KIPP",
-                        "doc_type": "axis_momente",
-                        "achse_index": achse_idx,
-                    }),
-                )
-                protokolliere_doc(
-                    sub_prot,
-                    bundle=make_docbundle(
-                        titel=f"Achs-Sicherheit S_kipp,Achse{achse_idx}",
-                        wert=sicherheit,
-                        formel=f"S_kipp,Achse{achse_idx} = ΣM_St / ΣM_K",
-                        formelzeichen=["M_St", "M_K"],
-                    ),
-                    kontext=merge_kontext(base_ctx, {
-                        "nachweis": "KIPP",
-                        "doc_type": "axis_sicherheit",
-                        "achse_index": achse_idx,
-                    }),
-                )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel=f"Achs-Sicherheit S_kipp,Achse{achse_idx}",
+                            wert=sicherheit,
+                            formel=f"S_kipp,Achse{achse_idx} = ΣM_St / ΣM_K",
+                            formelzeichen=["M_St", "M_K"],
+                        ),
+                        kontext=merge_kontext(base_ctx, {
+                            "nachweis": "KIPP",
+                            "doc_type": "axis_sicherheit",
+                            "achse_index": achse_idx,
+                        }),
+                    )
 
                 if sicherheit < dir_min_sicherheit:
                     dir_min_sicherheit = sicherheit
@@ -272,12 +332,7 @@ def _kippsicherheit_DinEn13814_2005_06(
                 moment_defizit = max(0.0, total_kipp - total_stand)
 
                 if moment_defizit > _EPS:
-                    ballast_kippmoment_einheit = moment_einzelkraft_um_achse(
-                        achse,
-                        (0.0, 0.0, -1.0),  # Einheitliche Abwärtskraft
-                        schwerpunkt_ballast,
-                    )
-                    ballast_standmoment_proN = max(0.0, -ballast_kippmoment_einheit)
+                    ballast_standmoment_proN = geometrie.ballast_standmoment_einheit[achse_idx]
 
                     if ballast_standmoment_proN <= _EPS:
                         ballastkraft = inf  # kein Standsicherheitsbeitrag durch Ballast möglich     
@@ -290,53 +345,57 @@ def _kippsicherheit_DinEn13814_2005_06(
                 if ballastkraft > dir_ballast_max:
                     dir_ballast_max = ballastkraft
 
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel=f"Achs-Ballast m_Ballast,kipp,Achse{achse_idx}",
+                            wert=ballastkraft / aktuelle_konstanten().erdbeschleunigung,  # kg
+                            formel="m_Ballast,kipp,Achse = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
+                            formelzeichen=["M_K", "M_St", "γ_g", "m_stand,1N", "g"],
+                            einheit="kg",
+                        ),
+                        kontext=merge_kontext(base_ctx, {
+                            "nachweis": "KIPP",
+                            "doc_type": "axis_ballast",
+                            "achse_index": achse_idx,
+                        }),
+                    )
+
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel=f"Achs-Ballast m_Ballast,kipp,Achse{achse_idx}",
-                        wert=ballastkraft / aktuelle_konstanten().erdbeschleunigung,  # kg
-                        formel="m_Ballast,kipp,Achse = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
-                        formelzeichen=["M_K", "M_St", "γ_g", "m_stand,1N", "g"],
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Sicherheit S_kipp,{winkel}°",
+                        wert=dir_min_sicherheit,
+                        formel="S_kipp = ΣM_St / ΣM_K",
+                        formelzeichen=["M_St", "M_K"],
+                    ),
+                    kontext=merge_kontext(base_ctx, {
+                        "nachweis": "KIPP",
+                        "doc_type": "dir_min_sicherheit",
+                        "windrichtung_deg": f"{winkel}°",
+                    }),
+                )
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Ballast m_Ballast,kipp,{winkel}°",
+                        wert=dir_ballast_max / aktuelle_konstanten().erdbeschleunigung,
                         einheit="kg",
+                        formel="m_Ballast,kipp = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
+                        formelzeichen=["M_K", "M_St", "γ_g", "m_stand,1N", "g"],
                     ),
                     kontext=merge_kontext(base_ctx, {
                         "nachweis": "KIPP",
-                        "doc_type": "axis_ballast",
-                        "achse_index": achse_idx,
+                        "doc_type": "dir_ballast",
+                        "windrichtung_deg": f"{winkel}°",
                     }),
                 )
 
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Sicherheit S_kipp,{winkel}°",
-                    wert=dir_min_sicherheit,
-                    formel="S_kipp = ΣM_St / ΣM_K",
-                    formelzeichen=["M_St", "M_K"],
-                ),
-                kontext=merge_kontext(base_ctx, {
-                    "nachweis": "KIPP",
-                    "doc_type": "dir_min_sicherheit",
-                    "windrichtung_deg": f"{winkel}°",
-                }),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Ballast m_Ballast,kipp,{winkel}°",
-                    wert=dir_ballast_max / aktuelle_konstanten().erdbeschleunigung,
-                    einheit="kg",
-                    formel="m_Ballast,kipp = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
-                    formelzeichen=["M_K", "M_St", "γ_g", "m_stand,1N", "g"],
-                ),
-                kontext=merge_kontext(base_ctx, {
-                    "nachweis": "KIPP",
-                    "doc_type": "dir_ballast",
-                    "windrichtung_deg": f"{winkel}°",
-                }),
-            )
-
             dir_records.append({
+                "winkel": winkel,
                 "windrichtung_deg": f"{winkel}°",
                 "dir_min_sicherheit": dir_min_sicherheit,
                 "dir_ballast_max": dir_ballast_max,
@@ -352,6 +411,12 @@ def _kippsicherheit_DinEn13814_2005_06(
                 value=best_achse_idx,
                 scope={"windrichtung_deg": f"{winkel}°"},
             )
+            return dir_records[-1]["dir_min_sicherheit"]
+
+        stuetzstellen = [(winkel, _richtung_auswerten(winkel, richtung)) for winkel, richtung in windrichtungen]
+        if richtungsstrategie is RichtungsStrategie.ADAPTIV:
+            # Kritische Richtung zwischen den Rasterrichtungen eingrenzen (Goldener Schnitt)
+            verfeinere_windrichtung(_richtung_auswerten, stuetzstellen, protokoll=protokoll, kontext=merge_kontext(base_ctx, {"nachweis": "KIPP"}))
 
         # --- Globale Entscheidung & Rollenvergabe ---
         if not dir_records:
@@ -388,7 +453,7 @@ def _kippsicherheit_DinEn13814_2005_06(
 
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Kippsicherheit S_kipp",
                 wert=sicherheit_min_global,
                 formel="S_kipp = ΣM_St / ΣM_K",
@@ -400,7 +465,7 @@ def _kippsicherheit_DinEn13814_2005_06(
         )
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Erforderlicher Ballast m_Ballast,kipp",
                 wert=ballast_kg,
                 einheit="kg",
@@ -412,6 +477,12 @@ def _kippsicherheit_DinEn13814_2005_06(
             kontext=merge_kontext(base_ctx, {"nachweis": "KIPP", "rolle": "relevant"}),
         )
 
+        # γ-Dokumentation einmal je Nachweis (statt je Einzelkraft)
+        protokolliere_gamma(
+            norm, gamma_keys, protokoll=protokoll,
+            kontext=merge_kontext(base_ctx, {"nachweis": "KIPP", "doc_type": "gamma", "rolle": "relevant"}),
+        )
+
         #Entscheidung protokollieren
         protokolliere_decision(
             protokoll,
@@ -442,6 +513,7 @@ def _kippsicherheit_DinEn17879_2024_08(
     methode: RechenmethodeKippen = RechenmethodeKippen.STANDARD,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -461,7 +533,8 @@ def _kippsicherheit_DinEn17879_2024_08(
 
     if methode == RechenmethodeKippen.STANDARD:
         # 1) Eckpunkte sammeln → Kippachsen bestimmen
-        achsen = sammle_kippachsen(konstruktion, protokoll=protokoll, kontext=base_ctx)
+        geometrie = kippgeometrie(konstruktion, protokoll=protokoll, kontext=base_ctx)
+        achsen = list(geometrie.achsen)
         if not achsen:
             return [Zwischenergebnis(wert=float("nan")), Zwischenergebnis(wert=float("nan"))]
         # 1.1) Grundgrößen für Ballast bestimmen
@@ -472,8 +545,6 @@ def _kippsicherheit_DinEn17879_2024_08(
             Angriffsflaeche_Einzelkraefte=[[(0.0, 0.0, 0.0)]],
         )
         sicherheitsbeiwert_ballast = sicherheitsbeiwert(norm, ballastkraft_dummy, ist_guenstig=True)
-        huelle_punkte = [a.punkt for a in achsen]
-        schwerpunkt_ballast = flaechenschwerpunkt(huelle_punkte)
 
         # 2) Minimum der Sicherheit über alle (Windrichtung × Achse)
         sicherheit_min_global = inf
@@ -481,9 +552,32 @@ def _kippsicherheit_DinEn17879_2024_08(
 
         pool = obtain_pool(konstruktion, reset_berechnungen)
         dir_records = []  # (winkel, richtung, min_sicherheit, ballast_max)
+        gamma_keys = set()  # γ-Kombinationen aller Richtungen → Doku einmal je Nachweis
+
+        windrichtungen = generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx)
+        # Symmetrische Konstruktion → nur der Fundamentalbereich wird gerechnet, der Rest gespiegelt
+        symmetrie = symmetrie_von(konstruktion)
+        # Lasten aller Richtungen im Batch (richtungsunabhängiger Anteil nur einmal)
+        erzeuge_lastsets(
+            pool,
+            konstruktion,
+            windrichtungen=symmetrie.fundamentalbereich(windrichtungen),
+            norm=norm,
+            staudruecke=staudruecke,
+            obergrenzen=obergrenzen,
+            konst=konst,
+            kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
+            dokumentation=doku_aktiv(protokoll),
+        )
+
+        def _richtung_auswerten(winkel: float, richtung: Vec3) -> float:
+            fortschritt_checkpoint()  # Abbruch-Checkpoint + Fortschritt je Windrichtung
+            gespiegelt = richtungsrecord_aus_symmetrie(symmetrie, winkel, dir_records, dokumentation=doku_aktiv(protokoll))
+            if gespiegelt is not None:
+                dir_records.append(gespiegelt)
+                return gespiegelt["dir_min_sicherheit"]
 
-        for winkel, richtung in generiere_windrichtungen(anzahl=anzahl_windrichtungen, protokoll=protokoll, kontext=base_ctx):
-            sub_prot = make_protokoll()
+            sub_prot = make_protokoll(dokumentation=doku_aktiv(protokoll))
             lastset = get_or_create_lastset(
                 pool,
                 konstruktion,
@@ -496,7 +590,12 @@ def _kippsicherheit_DinEn17879_2024_08(
                 protokoll=sub_prot,
                 kontext=merge_kontext(base_ctx, {"nachweis": "LOADS"}),
             )
-            kraefte_nach_element = lastset.kraefte_nach_element
+            block = lastset.block
+            if doku_aktiv(protokoll):
+                gamma_keys.update(gamma_schluessel(block, "KIPP", achsen))
+
+            # 2b) Kernel: Envelope-Beiträge aller Achsen × Bauelemente in einem Durchlauf
+            matrix = kipp_matrix(norm, achsen, block)
 
             # Richtungs-lokale Aggregation
             dir_min_sicherheit = inf           # <<< NEU: kleinstes S dieser Richtung
@@ -512,87 +611,94 @@ def _kippsicherheit_DinEn17879_2024_08(
 
                 achse_ctx = merge_kontext(base_ctx, {"achse_index": achse_idx, "windrichtung_deg": f"{winkel}°", "windrichtung": richtung, "nachweis": "KIPP"})
 
-                for element, lastfaelle_elem in kraefte_nach_element.items():
-                    kipp_b, stand_b = kipp_envelope_pro_bauelement(norm, achse, lastfaelle_elem, protokoll=sub_prot, kontext=merge_kontext(achse_ctx, {"element_id": str(element)}))
+                for element_idx, element in enumerate(matrix.elemente):
+                    protokolliere_kipp_lastfallfehler(matrix, element_idx, protokoll=sub_prot, kontext=merge_kontext(achse_ctx, {"element_id": str(element)}))
+                    kipp_b = matrix.kipp[achse_idx][element_idx]
+                    stand_b = matrix.stand[achse_idx][element_idx]
+                    if doku_aktiv(sub_prot):
+                        protokolliere_doc(
+                            sub_prot,
+                            bundle=lazy_docbundle(
+                                titel="Kippmoment M_K",
+                                wert=kipp_b,
+                                einheit="Nm",
+                            ),
+                            kontext=merge_kontext(base_ctx, {
+                                "nachweis": "KIPP",
+                                "doc_type": "axis_momente",
+                                "achse_index": achse_idx,
+                                "element_id": str(element),
+                            }),
+                        )
+                    if doku_aktiv(sub_prot):
+                        protokolliere_doc(
+                            sub_prot,
+                            bundle=lazy_docbundle(
+                                titel="Standmoment M_St",
+                                wert=stand_b,
+                                einheit="Nm",
+                            ),
+                            kontext=merge_kontext(base_ctx, {
+                                "nachweis": "KIPP",
+                                "doc_type": "axis_momente",
+                                "achse_index": achse_idx,
+                                "element_id": str(element),
+                            }),
+                        )
+                    total_kipp += kipp_b
+                    total_stand += stand_b
+
+                # Sicherheit Sicherheit = Stand / Kipp
+                if total_kipp <= _EPS:
+                    sicherheit = inf  # keine kippende Wirkung → unendlich sicher bzgl. Kippen
+                else:
+                    sicherheit = total_stand / total_kipp
+
+                if doku_aktiv(sub_prot):
                     protokolliere_doc(
                         sub_prot,
-                        bundle=make_docbundle(
-                            titel="Kippmoment M_K",
-                            wert=kipp_b,
+                        bundle=lazy_docbundle(
+                            titel="Summe Kippmoment ΣM_K",
+                            wert=total_kipp,
+                            formel="ΣM_K = ΣM_K,Bauelement",
                             einheit="Nm",
                         ),
                         kontext=merge_kontext(base_ctx, {
                             "nachweis": "KIPP",
                             "doc_type": "axis_momente",
                             "achse_index": achse_idx,
-                            "element_id": str(element),
                         }),
                     )
+                if doku_aktiv(sub_prot):
                     protokolliere_doc(
                         sub_prot,
-                        bundle=make_docbundle(
-                            titel="Standmoment M_St",
-                            wert=stand_b,
+                        bundle=lazy_docbundle(
+                            titel="Summe Standmoment ΣM_St",
+                            wert=total_stand,
+                            formel="ΣM_St = ΣM_St,Bauelement",
                             einheit="Nm",
                         ),
                         kontext=merge_kontext(base_ctx, {
                             "nachweis": "KIPP",
                             "doc_type": "axis_momente",
                             "achse_index": achse_idx,
-                            "element_id": str(element),
                         }),
                     )
-                    total_kipp += kipp_b
-                    total_stand += stand_b
-
-                # Sicherheit Sicherheit = Stand / Kipp
-                if total_kipp <= _EPS:
-                    sicherheit = inf  # keine kippende Wirkung → unendlich sicher bzgl. Kippen
-                else:
-                    sicherheit = total_stand / total_kipp
-
-                protokolliere_doc(
-                    sub_prot,
-                    bundle=make_docbundle(
-                        titel="Summe Kippmoment ΣM_K",
-                        wert=total_kipp,
-                        formel="ΣM_K = ΣM_K,Bauelement",
-                        einheit="Nm",
-                    ),
-                    kontext=merge_kontext(base_ctx, {
-                        "nachweis": "KIPP",
-                        "doc_type": "axis_momente",
-                        "achse_index": achse_idx,
-                    }),
-                )
-                protokolliere_doc(
-                    sub_prot,
-                    bundle=make_docbundle(
-                        titel="Summe Standmoment ΣM_St",
-                        wert=total_stand,
-                        formel="ΣM_St = ΣM_St,Bauelement",
-                        einheit="Nm",
-                    ),
-                    kontext=merge_kontext(base_ctx, {
-                        "nachweis": "KIPP",
-                        "doc_type": "axis_momente",
-                        "achse_index": achse_idx,
-                    }),
-                )
-                protokolliere_doc(
-                    sub_prot,
-                    bundle=make_docbundle(
-                        titel=f"Achs-Sicherheit S_kipp,Achse{achse_idx}",
-                        wert=sicherheit,
-                        formel=f"S_kipp,Achse{achse_idx} = ΣM_St / ΣM_K",
-                        formelzeichen=["M_St", "M_K"],
-                    ),
-                    kontext=merge_kontext(base_ctx, {
-                        "nachweis": "KIPP",
-                        "doc_type": "axis_sicherheit",
-                        "achse_index": achse_idx,
-                    }),
-                )
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel=f"Achs-Sicherheit S_kipp,Achse{achse_idx}",
+                            wert=sicherheit,
+                            formel=f"S_kipp,Achse{achse_idx} = ΣM_St / ΣM_K",
+                            formelzeichen=["M_St", "M_K"],
+                        ),
+                        kontext=merge_kontext(base_ctx, {
+                            "nachweis": "KIPP",
+                            "doc_type": "axis_sicherheit",
+                            "achse_index": achse_idx,
+                        }),
+                    )
 
                 # Richtungs-Minimum aktualisieren
                 if sicherheit < dir_min_sicherheit:
@@ -602,12 +708,7 @@ def _kippsicherheit_DinEn17879_2024_08(
                 moment_defizit = max(0.0, total_kipp - total_stand)
 
                 if moment_defizit > _EPS:
-                    ballast_kippmoment_einheit = moment_einzelkraft_um_achse(
-                        achse,
-                        (0.0, 0.0, -1.0),  # Einheitliche Abwärtskraft
-                        schwerpunkt_ballast,
-                    )
-                    ballast_standmoment_proN = max(0.0, -ballast_kippmoment_einheit)
+                    ballast_standmoment_proN = geometrie.ballast_standmoment_einheit[achse_idx]
 
                     if ballast_standmoment_proN <= _EPS:
                         ballastkraft = inf  # kein Standsicherheitsbeitrag durch Ballast möglich     
@@ -620,53 +721,57 @@ def _kippsicherheit_DinEn17879_2024_08(
                 if ballastkraft > dir_ballast_max:
                     dir_ballast_max = ballastkraft
 
+                if doku_aktiv(sub_prot):
+                    protokolliere_doc(
+                        sub_prot,
+                        bundle=lazy_docbundle(
+                            titel=f"Achs-Ballast m_Ballast,kipp,Achse{achse_idx}",
+                            wert=ballastkraft / aktuelle_konstanten().erdbeschleunigung,  # kg
+                            einheit= "kg",
+                            formel="m_Ballast,kipp,Achse = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
+                            formelzeichen=["M_K", "M_St", "γ_g", "m_stand,1N", "g"],
+                        ),
+                        kontext=merge_kontext(base_ctx, {
+                            "nachweis": "KIPP",
+                            "doc_type": "axis_ballast",
+                            "achse_index": achse_idx,
+                        }),
+                    )
+
+            if doku_aktiv(sub_prot):
+                protokolliere_doc(
+                    sub_prot,
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Sicherheit S_kipp,{winkel}°",
+                        wert=dir_min_sicherheit,
+                        formel="S_kipp = ΣM_St / ΣM_K",
+                        formelzeichen=["M_St", "M_K"],
+                    ),
+                    kontext=merge_kontext(base_ctx, {
+                        "nachweis": "KIPP",
+                        "doc_type": "dir_min_sicherheit",
+                        "windrichtung_deg": f"{winkel}°",
+                    }),
+                )
+            if doku_aktiv(sub_prot):
                 protokolliere_doc(
                     sub_prot,
-                    bundle=make_docbundle(
-                        titel=f"Achs-Ballast m_Ballast,kipp,Achse{achse_idx}",
-                        wert=ballastkraft / aktuelle_konstanten().erdbeschleunigung,  # kg
-                        einheit= "kg",
-                        formel="m_Ballast,kipp,Achse = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
+                    bundle=lazy_docbundle(
+                        titel=f"Richtungs-Ballast m_Ballast,kipp,{winkel}°",
+                        wert=dir_ballast_max / aktuelle_konstanten().erdbeschleunigung,
+                        einheit="kg",
+                        formel="m_Ballast,kipp = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
                         formelzeichen=["M_K", "M_St", "γ_g", "m_stand,1N", "g"],
                     ),
                     kontext=merge_kontext(base_ctx, {
                         "nachweis": "KIPP",
-                        "doc_type": "axis_ballast",
-                        "achse_index": achse_idx,
+                        "doc_type": "dir_ballast",
+                        "windrichtung_deg": f"{winkel}°",
                     }),
                 )
 
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Sicherheit S_kipp,{winkel}°",
-                    wert=dir_min_sicherheit,
-                    formel="S_kipp = ΣM_St / ΣM_K",
-                    formelzeichen=["M_St", "M_K"],
-                ),
-                kontext=merge_kontext(base_ctx, {
-                    "nachweis": "KIPP",
-                    "doc_type": "dir_min_sicherheit",
-                    "windrichtung_deg": f"{winkel}°",
-                }),
-            )
-            protokolliere_doc(
-                sub_prot,
-                bundle=make_docbundle(
-                    titel=f"Richtungs-Ballast m_Ballast,kipp,{winkel}°",
-                    wert=dir_ballast_max / aktuelle_konstanten().erdbeschleunigung,
-                    einheit="kg",
-                    formel="m_Ballast,kipp = max(0, ΣM_K − ΣM_St) / (γ_g · m_stand,1N)",
-                    formelzeichen=["M_K", "M_St", "γ_g", "m_stand,1N", "g"],
-                ),
-                kontext=merge_kontext(base_ctx, {
-                    "nachweis": "KIPP",
-                    "doc_type": "dir_ballast",
-                    "windrichtung_deg": f"{winkel}°",
-                }),
-            )
-
             dir_records.append({
+                "winkel": winkel,
                 "windrichtung_deg": f"{winkel}°",
                 "dir_min_sicherheit": dir_min_sicherheit,
                 "dir_ballast_max": dir_ballast_max,
@@ -682,6 +787,12 @@ def _kippsicherheit_DinEn17879_2024_08(
                 value=best_achse_idx,
                 scope={"windrichtung_deg": f"{winkel}°"},
             )
+            return dir_records[-1]["dir_min_sicherheit"]
+
+        stuetzstellen = [(winkel, _richtung_auswerten(winkel, richtung)) for winkel, richtung in windrichtungen]
+        if richtungsstrategie is RichtungsStrategie.ADAPTIV:
+            # Kritische Richtung zwischen den Rasterrichtungen eingrenzen (Goldener Schnitt)
+            verfeinere_windrichtung(_richtung_auswerten, stuetzstellen, protokoll=protokoll, kontext=merge_kontext(base_ctx, {"nachweis": "KIPP"}))
 
         # --- Globale Entscheidung & Rollenvergabe ---
         if not dir_records:
@@ -718,7 +829,7 @@ def _kippsicherheit_DinEn17879_2024_08(
 
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Kippsicherheit S_kipp",
                 wert=sicherheit_min_global,
                 formel="S_kipp = ΣM_St / ΣM_K",
@@ -730,7 +841,7 @@ def _kippsicherheit_DinEn17879_2024_08(
         )
         protokolliere_doc(
             protokoll,
-            bundle=make_docbundle(
+            bundle=lazy_docbundle(
                 titel="Erforderlicher Ballast m_Ballast,kipp",
                 wert=ballast_kg,
                 einheit="kg",
@@ -742,6 +853,12 @@ def _kippsicherheit_DinEn17879_2024_08(
             kontext=merge_kontext(base_ctx, {"nachweis": "KIPP", "rolle": "relevant"}),
         )
 
+        # γ-Dokumentation einmal je Nachweis (statt je Einzelkraft)
+        protokolliere_gamma(
+            norm, gamma_keys, protokoll=protokoll,
+            kontext=merge_kontext(base_ctx, {"nachweis": "KIPP", "doc_type": "gamma", "rolle": "relevant"}),
+        )
+
         #Entscheidung protokollieren
         protokolliere_decision(
             protokoll,
@@ -777,6 +894,7 @@ def kippsicherheit(
     methode: RechenmethodeKippen = RechenmethodeKippen.STANDARD,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 4,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> List[Zwischenergebnis]:
@@ -800,6 +918,7 @@ def kippsicherheit(
             methode=methode,
             vereinfachung_konstruktion=vereinfachung_konstruktion,
             anzahl_windrichtungen=anzahl_windrichtungen,
+            richtungsstrategie=richtungsstrategie,
         )
     except Exception as e:
         protokolliere_msg(
@@ -822,6 +941,7 @@ def kippsicherheit(
         methode=methode,
         vereinfachung_konstruktion=vereinfachung_konstruktion,
         anzahl_windrichtungen=anzahl_windrichtungen,
+        richtungsstrategie=richtungsstrategie,
         protokoll=protokoll,
         kontext=base_ctx,
     )
\ No newline at end of file
@@ -0,0 +1,97 @@
+# rechenfunktionen/prepare.py
+from __future__ import annotations
+from typing import Any, List, Optional, Sequence, Tuple
+
+from windlast_CORE.datenstruktur.enums import Norm
+from windlast_CORE.datenstruktur.konstanten import aktuelle_konstanten
+from windlast_CORE.datenstruktur.lastcache import (
+    LastCacheEintrag, lastcache, element_fingerprint, gewicht_schluessel,
+)
+from windlast_CORE.datenstruktur.prepared import PreparedKonstruktion, ElementReibwert
+from windlast_CORE.datenstruktur.zwischenergebnis import make_aufzeichnung
+from windlast_CORE.materialdaten.catalog import catalog
+from windlast_CORE.rechenfunktionen.standsicherheit_utils import kippgeometrie_von
+from windlast_CORE.rechenfunktionen.symmetrie import symmetrie_von
+
+def prepare(
+    konstruktion: Any,
+    norm: Norm,
+    q_profile: Tuple[Sequence[float], Sequence[float]],
+    *,
+    konst=None,
+    dokumentation: bool = True,
+) -> PreparedKonstruktion:
+    """
+    Kompiliert eine Konstruktion für (Norm, q-Profil, Konstanten) vor: alle richtungsunabhängigen
+    Größen werden genau einmal bestimmt (Fingerprints, Katalogwerte über Gewichtskräfte,
+    Reibwerte, Kippgeometrie, Symmetrie; Schlankheit/Segmentierung/eingeschlossene Flächen/Reynoldszahlen
+    bei Bedarf einmal je Element, siehe PreparedKonstruktion.wind_vorbereitung).
+
+    - q_profile:     (staudruecke, obergrenzen) wie für die Nachweise
+    - dokumentation: False → nur Messages aufzeichnen (passend zu dokumentation="none")
+
+    Bereits vorbereitete Konstruktionen werden zurückgegeben, wenn sie passen, sonst neu vorbereitet.
+    Fehler einzelner Elemente werden nicht geworfen, sondern beim Verwenden wie bisher gemeldet.
+    """
+    staudruecke, obergrenzen = q_profile
+    if isinstance(konstruktion, PreparedKonstruktion):
+        if konstruktion.passt(norm, staudruecke, obergrenzen, konst) and konstruktion.stufe >= (2 if dokumentation else 1):
+            return konstruktion
+        konstruktion = konstruktion.konstruktion
+
+    stufe = 2 if dokumentation else 1
+    bauelemente = tuple(getattr(konstruktion, "bauelemente", []) or [])
+    fingerprints = tuple(element_fingerprint(elem) for elem in bauelemente)
+    spec_version = catalog.spec_version
+    konst_gewicht = aktuelle_konstanten()
+
+    gewichte: List[Optional[LastCacheEintrag]] = []
+    gewicht_fehler: List[Optional[str]] = []
+    reibwerte: List[ElementReibwert] = []
+
+    for elem, fp in zip(bauelemente, fingerprints):
+        # Gewicht (über den LastCache, damit auch andere Anfragen profitieren)
+        eintrag = None
+        fehler = None
+        fn_gewicht = getattr(elem, "gewichtskraefte", None)
+        if callable(fn_gewicht):
+            key = gewicht_schluessel(fp, spec_version, konst_gewicht) if fp is not None else None
+            eintrag = lastcache.get(key, stufe=stufe) if key is not None else None
+            if eintrag is None:
+                aufz = make_aufzeichnung(stufe)
+                try:
+                    eintrag = LastCacheEintrag(kraefte=tuple(fn_gewicht(protokoll=aufz, kontext=None) or ()), protokoll=aufz)
+                    if key is not None:
+                        lastcache.put(key, eintrag)
+                except Exception as e:
+                    fehler = str(e)
+        gewichte.append(eintrag)
+        gewicht_fehler.append(fehler)
+
+        # Reibwert (Materialkette aus Katalog)
+        reib_fn = getattr(elem, "reibwert_effektiv", None)
+        if callable(reib_fn):
+            aufz = make_aufzeichnung(stufe)
+            try:
+                mu = reib_fn(norm, protokoll=aufz, kontext=None)
+                reibwerte.append(ElementReibwert(wert=None if mu is None else float(mu), protokoll=aufz))
+            except Exception as e:
+                reibwerte.append(ElementReibwert(fehler=str(e), protokoll=aufz))
+        else:
+            reibwerte.append(ElementReibwert())
+
+    return PreparedKonstruktion(
+        konstruktion=konstruktion,
+        norm=norm,
+        staudruecke=tuple(float(q) for q in staudruecke),
+        obergrenzen=tuple(float(z) for z in obergrenzen),
+        konst=konst,
+        stufe=stufe,
+        bauelemente=bauelemente,
+        fingerprints=fingerprints,
+        gewichte=tuple(gewichte),
+        gewicht_fehler=tuple(gewicht_fehler),
+        reibwerte=tuple(reibwerte),
+        kippgeometrie=kippgeometrie_von(konstruktion, stufe=stufe),
+        symmetrie=symmetrie_von(konstruktion),
+    )
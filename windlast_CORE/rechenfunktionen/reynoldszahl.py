@@ -4,9 +4,10 @@ from windlast_CORE.datenstruktur.zwischenergebnis import (
     Zwischenergebnis,
     Protokoll,
     merge_kontext,
-    make_docbundle,
+    lazy_docbundle,
     protokolliere_msg,
     protokolliere_doc,
+    doku_aktiv,
 )
 from windlast_CORE.datenstruktur.enums import Norm, ObjektTyp, Severity
 from windlast_CORE.materialdaten.catalog import catalog
@@ -55,44 +56,47 @@ def _reynoldszahl_DinEn1991_1_4_2010_12(
                 text=f"Traverse '{objekt_name_intern}': ungültiger Gurt-Durchmesser ({charak_Laenge}).",
                 kontext=merge_kontext(base_ctx, {"input_source": "catalog"}),
             )
-            protokolliere_doc(
-                protokoll,
-                bundle=make_docbundle(
-                    titel="Reynoldszahl Re",
-                    wert=float("nan"),
-                    einzelwerte=[staudruck, luftdichte, geschwindigkeit, charak_Laenge, zaehigkeit],
-                    formel="Re = v·L/ν; v = √(2·q/ρ)",
-                ),
-                kontext=merge_kontext(base_ctx, {"nan": True}),
-            )
+            if doku_aktiv(protokoll):
+                protokolliere_doc(
+                    protokoll,
+                    bundle=lazy_docbundle(
+                        titel="Reynoldszahl Re",
+                        wert=float("nan"),
+                        einzelwerte=[staudruck, luftdichte, geschwindigkeit, charak_Laenge, zaehigkeit],
+                        formel="Re = v·L/ν; v = √(2·q/ρ)",
+                    ),
+                    kontext=merge_kontext(base_ctx, {"nan": True}),
+                )
             return Zwischenergebnis(wert=float("nan"))
         
         geschwindigkeit = math.sqrt(2.0 * staudruck / luftdichte)
 
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(
-                titel="Strömungsgeschwindigkeit v",
-                wert=geschwindigkeit,
-                einzelwerte=[staudruck, luftdichte],
-                formel="v = √(2·q/ρ)",
-                einheit="m/s",
-            ),
-            kontext=base_ctx,
-        )
+        if doku_aktiv(protokoll):
+            protokolliere_doc(
+                protokoll,
+                bundle=lazy_docbundle(
+                    titel="Strömungsgeschwindigkeit v",
+                    wert=geschwindigkeit,
+                    einzelwerte=[staudruck, luftdichte],
+                    formel="v = √(2·q/ρ)",
+                    einheit="m/s",
+                ),
+                kontext=base_ctx,
+            )
 
         wert = geschwindigkeit * charak_Laenge / zaehigkeit
 
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(
-                titel="Reynoldszahl Re",
-                wert=wert,
-                einzelwerte=[staudruck, luftdichte, geschwindigkeit, charak_Laenge, zaehigkeit],
-                formel="Re = v·L/ν; v = √(2·q/ρ)",
-            ),
-            kontext=base_ctx,
-        )
+        if doku_aktiv(protokoll):
+            protokolliere_doc(
+                protokoll,
+                bundle=lazy_docbundle(
+                    titel="Reynoldszahl Re",
+                    wert=wert,
+                    einzelwerte=[staudruck, luftdichte, geschwindigkeit, charak_Laenge, zaehigkeit],
+                    formel="Re = v·L/ν; v = √(2·q/ρ)",
+                ),
+                kontext=base_ctx,
+            )
         return Zwischenergebnis(wert=wert)
     
     elif objekttyp == ObjektTyp.ROHR:
@@ -108,30 +112,32 @@ def _reynoldszahl_DinEn1991_1_4_2010_12(
                 text=f"Rohr '{objekt_name_intern}': ungültiger Außendurchmesser ({charak_Laenge}).",
                 kontext=merge_kontext(base_ctx, {"input_source": "catalog"}),
             )
+            if doku_aktiv(protokoll):
+                protokolliere_doc(
+                    protokoll,
+                    bundle=lazy_docbundle(
+                        titel="Reynoldszahl Re",
+                        wert=float("nan"),
+                        einzelwerte=[staudruck, luftdichte, geschwindigkeit, charak_Laenge, zaehigkeit],
+                        formel="Re = v·L/ν; v = √(2·q/ρ)",
+                    ),
+                    kontext=merge_kontext(base_ctx, {"nan": True}),
+                )
+            return Zwischenergebnis(wert=float("nan"))
+
+        wert = geschwindigkeit * charak_Laenge / zaehigkeit
+
+        if doku_aktiv(protokoll):
             protokolliere_doc(
                 protokoll,
-                bundle=make_docbundle(
+                bundle=lazy_docbundle(
                     titel="Reynoldszahl Re",
-                    wert=float("nan"),
+                    wert=wert,
                     einzelwerte=[staudruck, luftdichte, geschwindigkeit, charak_Laenge, zaehigkeit],
                     formel="Re = v·L/ν; v = √(2·q/ρ)",
                 ),
-                kontext=merge_kontext(base_ctx, {"nan": True}),
+                kontext=base_ctx,
             )
-            return Zwischenergebnis(wert=float("nan"))
-
-        wert = geschwindigkeit * charak_Laenge / zaehigkeit
-
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(
-                titel="Reynoldszahl Re",
-                wert=wert,
-                einzelwerte=[staudruck, luftdichte, geschwindigkeit, charak_Laenge, zaehigkeit],
-                formel="Re = v·L/ν; v = √(2·q/ρ)",
-            ),
-            kontext=base_ctx,
-        )
         return Zwischenergebnis(wert=wert)
     else:
         raise NotImplementedError(f"Objekttyp '{objekttyp}' wird aktuell nicht unterstützt.")
@@ -171,11 +177,12 @@ def reynoldszahl(
             text=str(e),
             kontext=base_ctx,
         )
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(titel="Reynoldszahl Re", wert=float("nan")),
-            kontext=merge_kontext(base_ctx, {"nan": True}),
-        )
+        if doku_aktiv(protokoll):
+            protokolliere_doc(
+                protokoll,
+                bundle=lazy_docbundle(titel="Reynoldszahl Re", wert=float("nan")),
+                kontext=merge_kontext(base_ctx, {"nan": True}),
+            )
         return Zwischenergebnis(wert=float("nan"))
 
     funktion = _DISPATCH.get(norm, _DISPATCH[Norm.DEFAULT])
@@ -7,13 +7,8 @@ from windlast_CORE.datenstruktur.konstanten import _EPS
 def in_intervall(z: float, z_min: float, z_max: float, is_first: bool) -> bool:
     return (z_min + _EPS < z <= (z_max + _EPS)) or (is_first and z_min - _EPS <= z <= z_max + _EPS)
 
-def segmentiere_strecke_nach_hoehenbereichen(
-    startpunkt: Vec3,
-    endpunkt: Vec3,
-    staudruecke: Sequence[float],   # [q1, q2, ...] in N/m²
-    obergrenzen: Sequence[float],   # [z1, z2, ...] in m (streng aufsteigend, ab z=0)
-    z_unterkante: float = 0.0,      # Unterkante des ersten Bereichs (typisch 0.0 m)
-) -> List[Dict]:
+def pruefe_hoehenbereiche(staudruecke: Sequence[float], obergrenzen: Sequence[float]) -> None:
+    """Validiert ein q-Profil (wirft ValueError wie segmentiere_strecke_nach_hoehenbereichen)."""
     if not obergrenzen:
         raise ValueError("obergrenzen darf nicht leer sein.")
     if any(obergrenzen[i] <= obergrenzen[i-1] for i in range(1, len(obergrenzen))):
@@ -23,6 +18,15 @@ def segmentiere_strecke_nach_hoehenbereichen(
     if any(q < 0 for q in staudruecke):
         raise ValueError("staudruecke müssen ≥ 0 sein.")
 
+def segmentiere_strecke_nach_hoehenbereichen(
+    startpunkt: Vec3,
+    endpunkt: Vec3,
+    staudruecke: Sequence[float],   # [q1, q2, ...] in N/m²
+    obergrenzen: Sequence[float],   # [z1, z2, ...] in m (streng aufsteigend, ab z=0)
+    z_unterkante: float = 0.0,      # Unterkante des ersten Bereichs (typisch 0.0 m)
+) -> List[Dict]:
+    pruefe_hoehenbereiche(staudruecke, obergrenzen)
+
     z_top = obergrenzen[-1]  # höchste Obergrenze
 
     # Fehler wenn Konstruktion zu hoch
@@ -75,6 +79,7 @@ def segmentiere_strecke_nach_hoehenbereichen(
             "start_lokal": start_lokal,
             "ende_lokal": ende_lokal,
             "staudruck": staudruecke[i],
+            "bereich_index": i,
         })
         z_min = z_max
 
@@ -1,17 +1,22 @@
 # rechenfunktionen/sicherheitsbeiwert.py
 from __future__ import annotations
-from typing import Dict, Callable, Optional
+from dataclasses import dataclass
+from typing import Dict, Callable, Iterable, Optional, Tuple
 
 from windlast_CORE.datenstruktur.zwischenergebnis import (
     Zwischenergebnis,
     Protokoll,
     merge_kontext,
-    make_docbundle,
+    lazy_docbundle,
     protokolliere_msg,
     protokolliere_doc,
+    protokoll_uebertragen,
+    make_protokoll,
+    doku_aktiv,
 )
 from windlast_CORE.datenstruktur.enums import Norm, Lasttyp, Variabilitaet, Severity
 from windlast_CORE.datenstruktur.kraefte import Kraefte
+from windlast_CORE.datenstruktur.kraftblock import LASTTYPEN, VARIABILITAETEN, LASTTYP_CODE, VARIABILITAET_CODE
 
 # TODO: Umgang mit Reibung (Reibung auf Boden -> Gewicht / Reibung durch Wind -> Wind)
 
@@ -70,25 +75,27 @@ def _beiwert_default(
                 text=f"Unbekannter Lasttyp: {kraft.typ}",
                 kontext=base_ctx,
             )
-            protokolliere_doc(
-                protokoll,
-                bundle=make_docbundle(titel=titel, wert=float("nan")),
-                kontext=merge_kontext(base_ctx, {"nan": True}),
-            )
+            if doku_aktiv(protokoll):
+                protokolliere_doc(
+                    protokoll,
+                    bundle=lazy_docbundle(titel=titel, wert=float("nan")),
+                    kontext=merge_kontext(base_ctx, {"nan": True}),
+                )
             return Zwischenergebnis(wert=float("nan"))
 
-    protokolliere_doc(
-        protokoll,
-        bundle=make_docbundle(
-            titel=titel,
-            wert=gamma,
-            formel=formel,
-            quelle_formel="DIN EN 17879:2024-08 / DIN EN 13814:2005-06",
-            formelzeichen=["γ"],
-            quelle_formelzeichen=["---"],
-        ),
-        kontext=base_ctx,
-    )
+    if doku_aktiv(protokoll):
+        protokolliere_doc(
+            protokoll,
+            bundle=lazy_docbundle(
+                titel=titel,
+                wert=gamma,
+                formel=formel,
+                quelle_formel="DIN EN 17879:2024-08 / DIN EN 13814:2005-06",
+                formelzeichen=["γ"],
+                quelle_formelzeichen=["---"],
+            ),
+            kontext=base_ctx,
+        )
     return Zwischenergebnis(wert=gamma)
 
 # Norm-Dispatch (derzeit alle Normen → default)
@@ -119,12 +126,86 @@ def sicherheitsbeiwert(
             protokoll, severity=Severity.ERROR, code="SICHB/INPUT_INVALID",
             text=str(e), kontext=base_ctx,
         )
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(titel="Sicherheitsbeiwert γ", wert=float("nan")),
-            kontext=merge_kontext(base_ctx, {"nan": True}),
-        )
+        if doku_aktiv(protokoll):
+            protokolliere_doc(
+                protokoll,
+                bundle=lazy_docbundle(titel="Sicherheitsbeiwert γ", wert=float("nan")),
+                kontext=merge_kontext(base_ctx, {"nan": True}),
+            )
         return Zwischenergebnis(wert=float("nan"))
 
     fn = _DISPATCH.get(norm, _DISPATCH[Norm.DEFAULT])
-    return fn(kraft, ist_guenstig, protokoll=protokoll, kontext=base_ctx)
\ No newline at end of file
+    return fn(kraft, ist_guenstig, protokoll=protokoll, kontext=base_ctx)
+# ========= Kompilierte γ-Tabelle =========
+# γ hängt nur von (Norm, Lasttyp, Variabilität, ist_guenstig) ab – nicht von der einzelnen Kraft.
+# Die Tabelle wird je Norm einmal über den Dispatch aufgebaut und neu erzeugt, sobald sich
+# die Dispatch-Funktion der Norm ändert. Die Dokumentation jeder Kombination wird dabei
+# einmal aufgezeichnet und über protokolliere_gamma(...) einmal je Nachweis wiedergegeben.
+
+GammaSchluessel = Tuple[int, int, bool]  # (Lasttyp-Code, Variabilitäts-Code, ist_guenstig), Codes wie KraftBlock
+
+@dataclass(frozen=True)
+class GammaTabelle:
+    """
+    γ-Werte einer Norm für alle Kombinationen aus LASTTYPEN × VARIABILITAETEN × ist_guenstig.
+
+    - werte:         GammaSchluessel → γ (für die Rechenschleifen)
+    - aufzeichnung:  GammaSchluessel → Protokoll mit Doc/Meldungen der Kombination (ohne äußeren Kontext)
+    - fn:            Dispatch-Funktion, mit der die Tabelle gebaut wurde (für die Invalidierung)
+    """
+    norm: Norm
+    werte: Dict[GammaSchluessel, float]
+    aufzeichnung: Dict[GammaSchluessel, Protokoll]
+    fn: Callable[..., Zwischenergebnis]
+
+    def wert(self, typ: Lasttyp, variabilitaet: Variabilitaet, ist_guenstig: bool) -> float:
+        return self.werte[(LASTTYP_CODE[typ], VARIABILITAET_CODE[variabilitaet], ist_guenstig)]
+
+_TABELLEN: Dict[Norm, GammaTabelle] = {}
+
+def _baue_gamma_tabelle(norm: Norm, fn: Callable[..., Zwischenergebnis]) -> GammaTabelle:
+    werte: Dict[GammaSchluessel, float] = {}
+    aufzeichnung: Dict[GammaSchluessel, Protokoll] = {}
+    for t, typ in enumerate(LASTTYPEN):
+        for v, variabilitaet in enumerate(VARIABILITAETEN):
+            # γ hängt nicht von den Einzelkräften ab → eine Platzhalter-Kraft je Kombination genügt
+            kraft = Kraefte(
+                typ=typ,
+                variabilitaet=variabilitaet,
+                Einzelkraefte=[(0.0, 0.0, 0.0)],
+                Angriffsflaeche_Einzelkraefte=[[(0.0, 0.0, 0.0)]],
+            )
+            for ist_guenstig in (False, True):
+                prot = make_protokoll()
+                werte[(t, v, ist_guenstig)] = sicherheitsbeiwert(norm, kraft, ist_guenstig, protokoll=prot).wert
+                aufzeichnung[(t, v, ist_guenstig)] = prot
+    return GammaTabelle(norm=norm, werte=werte, aufzeichnung=aufzeichnung, fn=fn)
+
+def gamma_tabelle(norm: Norm) -> GammaTabelle:
+    """
+    Kompilierte γ-Tabelle der Norm (einmal aufgebaut, danach aus dem Modul-Cache).
+    Wird _DISPATCH für die Norm geändert, wird die Tabelle beim nächsten Zugriff neu gebaut.
+    """
+    fn = _DISPATCH.get(norm, _DISPATCH[Norm.DEFAULT])
+    tabelle = _TABELLEN.get(norm)
+    if tabelle is None or tabelle.fn is not fn:
+        tabelle = _baue_gamma_tabelle(norm, fn)
+        _TABELLEN[norm] = tabelle
+    return tabelle
+
+def protokolliere_gamma(
+    norm: Norm,
+    schluessel: Iterable[GammaSchluessel],
+    *,
+    protokoll: Optional[Protokoll] = None,
+    kontext: Optional[dict] = None,
+) -> None:
+    """
+    Gibt die aufgezeichnete Dokumentation der γ-Kombinationen einmal ins Protokoll wieder
+    (statt je Einzelkraft). Jede Kombination nur einmal, in Tabellenreihenfolge.
+    """
+    if protokoll is None:
+        return
+    tabelle = gamma_tabelle(norm)
+    for key in sorted(set(schluessel)):
+        protokoll_uebertragen(tabelle.aufzeichnung[key], protokoll, basis=kontext)
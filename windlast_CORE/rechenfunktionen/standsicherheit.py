@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Tuple, Any, List, Dict, Literal
+from typing import Optional, Tuple, Any, List, Dict, Literal, Mapping, FrozenSet, Iterable
 from enum import Enum
 from dataclasses import asdict, is_dataclass
 import json
@@ -10,22 +10,41 @@ import json
 from windlast_CORE.datenstruktur.enums import (
     Norm, Windzone, Betriebszustand, Schutzmassnahmen,
     RechenmethodeKippen, RechenmethodeGleiten, RechenmethodeAbheben,
-    VereinfachungKonstruktion, Nachweis, Severity, ValueSource, NormStatus, Zeitfaktor
+    VereinfachungKonstruktion, RichtungsStrategie, Nachweis, Severity, ValueSource, NormStatus, Zeitfaktor
 )
 from windlast_CORE.datenstruktur.zeit import Dauer, convert_dauer
 from windlast_CORE.datenstruktur.standsicherheit_ergebnis import (
     StandsicherheitErgebnis, NormErgebnis, SafetyValue, Message, Meta, NormStatus, NormDetails, AlternativeErgebnis
 )
 from windlast_CORE.rechenfunktionen.staudruecke import staudruecke  # type: ignore
+from windlast_CORE.rechenfunktionen.prepare import prepare
+from windlast_CORE.rechenfunktionen.ausfuehrung import Ausfuehrer, Ausfuehrung, pruefe_ausfuehrung
+from windlast_CORE.datenstruktur.ergebnis_json import ergebnis_json
+from windlast_CORE.datenstruktur.fortschritt import BerechnungAbgebrochen, fortschritt_checkpoint, fortschritt_planen
 from windlast_CORE.datenstruktur.zwischenergebnis import (
     make_protokoll,
     collect_messages,
     merge_kontext,
     Protokoll,
-    collect_docs,
     protokolliere_doc,
+    protokolliere_msg,
     make_docbundle,
+    doku_aktiv,
+    DocAufbewahrung,
+    DOC_AUFBEWAHRUNG,
 )
+from windlast_CORE.datenstruktur.begrenztes_protokoll import (
+    BegrenztesProtokoll,
+    DocGrenzen,
+    DOC_GRENZEN,
+    docs_einsammeln,
+    protokoll_statistik,
+)
+
+Dokumentation = Literal["none", "relevant", "full"]
+
+# Einzeln gerechnete Nachweise (BALLAST ergibt sich aus ihnen)
+EINZELNACHWEISE: Tuple[Nachweis, ...] = (Nachweis.KIPP, Nachweis.GLEIT, Nachweis.ABHEBE)
 
 def dataclass_to_json(obj):
     """
@@ -33,9 +52,9 @@ def dataclass_to_json(obj):
     """
     if is_dataclass(obj):
         return {k: dataclass_to_json(v) for k, v in asdict(obj).items()}
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):   # auch LazyDocBundle
         return {dataclass_to_json(k): dataclass_to_json(v) for k, v in obj.items()}
-    if isinstance(obj, list):
+    if isinstance(obj, (list, tuple)):
         return [dataclass_to_json(v) for v in obj]
     if isinstance(obj, Enum):
         return obj.value
@@ -43,11 +62,8 @@ def dataclass_to_json(obj):
 
 def save_ergebnis_to_file(ergebnis, pfad="ergebnis_dump.json"):
     from pathlib import Path
-    import json
-    Path(pfad).write_text(
-        json.dumps(dataclass_to_json(ergebnis), indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    # ergebnis_json: ein Durchlauf ohne asdict-Kopie; Enums als Name, inf als "INF" (wie die API)
+    Path(pfad).write_bytes(ergebnis_json(ergebnis, indent=2))
     print(f"✅ Ergebnis gespeichert unter: {Path(pfad).resolve()}")
 
 # -----------------------------
@@ -135,8 +151,10 @@ def _rechne_drei_nachweise(
     meth_abhebe: RechenmethodeAbheben,
     vereinfachung_konstruktion: VereinfachungKonstruktion,
     anzahl_windrichtungen: int,
+    richtungsstrategie: RichtungsStrategie,
     reasons: List[Message],
     norm_label: str,
+    nachweise: FrozenSet[Nachweis] = frozenset(Nachweis),
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
 ) -> Tuple[Dict[Nachweis, SafetyValue], Tuple[Optional[float], Optional[float], Optional[float]]]:
@@ -145,58 +163,91 @@ def _rechne_drei_nachweise(
     """
     Führt Kipp/Gleit/Abhebe durch (inkl. Fehlermeldungen im gleichen Stil wie bisher)
     und liefert SafetyValues + die drei Rohwerte (für Fallback-Trigger).
+    Nur die Nachweise in 'nachweise' werden gerechnet (siehe nachweise_aufloesen);
+    nicht gerechnete fehlen in den SafetyValues, ihr Rohwert ist None.
     """
     out: Dict[Nachweis, SafetyValue] = {}
     v_kipp = v_gleit = v_abhebe = None
     b_kipp = b_gleit = b_abhebe = None
 
-    # Kipp
+    # Richtungsunabhängiges einmal je (Norm, q-Profil) auflösen, für alle drei Nachweise
+    # (schlägt das fehl, wird das gemeldet; die Nachweise rechnen dann direkt und melden ihre Fehler wie bisher)
     try:
-        r = konstruktion.berechne_kippsicherheit(
-            norm, q, z, konst=konst, reset_berechnungen=True,
-            methode=meth_kipp, vereinfachung_konstruktion=vereinfachung_konstruktion,
-            anzahl_windrichtungen=anzahl_windrichtungen,
-            protokoll=protokoll,
+        konstruktion = prepare(konstruktion, norm, (q, z), konst=konst, dokumentation=doku_aktiv(protokoll))
+    except BerechnungAbgebrochen:
+        raise
+    except Exception as e:
+        protokolliere_msg(
+            protokoll, severity=Severity.WARN, code="PREPARE/FAILED",
+            text=f"Vorbereitung der Konstruktion ({norm_label}) fehlgeschlagen, Nachweise rechnen ohne: {e}",
             kontext=base_ctx,
         )
-        v_kipp = float(r[0].wert); b_kipp = float(r[1].wert)
-        out[Nachweis.KIPP] = SafetyValue(v_kipp, meth_kipp, ValueSource.COMPUTED, [])
-    except Exception as e:
-        reasons.append(Message(code="KIPP_FAILED", severity=Severity.ERROR,
-                               text=f"Kippsicherheit ({norm_label}) fehlgeschlagen: {e}", context={}))
-        out[Nachweis.KIPP] = SafetyValue(None, meth_kipp, ValueSource.ERROR, [])
+
+    # Nicht angeforderte Nachweise werden übersprungen; der erste gerechnete setzt die Berechnungen zurück
+    erster = next(n for n in EINZELNACHWEISE if n in nachweise)
+
+    # Kipp
+    if Nachweis.KIPP in nachweise:
+        try:
+            r = konstruktion.berechne_kippsicherheit(
+                norm, q, z, konst=konst, reset_berechnungen=(erster is Nachweis.KIPP),
+                methode=meth_kipp, vereinfachung_konstruktion=vereinfachung_konstruktion,
+                anzahl_windrichtungen=anzahl_windrichtungen,
+                richtungsstrategie=richtungsstrategie,
+                protokoll=protokoll,
+                kontext=base_ctx,
+            )
+            v_kipp = float(r[0].wert); b_kipp = float(r[1].wert)
+            out[Nachweis.KIPP] = SafetyValue(v_kipp, meth_kipp, ValueSource.COMPUTED, [])
+        except BerechnungAbgebrochen:
+            raise
+        except Exception as e:
+            reasons.append(Message(code="KIPP_FAILED", severity=Severity.ERROR,
+                                   text=f"Kippsicherheit ({norm_label}) fehlgeschlagen: {e}", context={}))
+            out[Nachweis.KIPP] = SafetyValue(None, meth_kipp, ValueSource.ERROR, [])
 
     # Gleit
-    try:
-        r = konstruktion.berechne_gleitsicherheit(
-            norm, q, z, konst=konst, reset_berechnungen=False,
-            methode=meth_gleit, vereinfachung_konstruktion=vereinfachung_konstruktion,
-            anzahl_windrichtungen=anzahl_windrichtungen,
-            protokoll=protokoll,
-            kontext=base_ctx,
-        )
-        v_gleit = float(r[0].wert); b_gleit = float(r[1].wert)
-        out[Nachweis.GLEIT] = SafetyValue(v_gleit, meth_gleit, ValueSource.COMPUTED, [])
-    except Exception as e:
-        reasons.append(Message(code="GLEIT_FAILED", severity=Severity.ERROR,
-                               text=f"Gleitsicherheit ({norm_label}) fehlgeschlagen: {e}", context={}))
-        out[Nachweis.GLEIT] = SafetyValue(None, meth_gleit, ValueSource.ERROR, [])
+    if Nachweis.GLEIT in nachweise:
+        try:
+            r = konstruktion.berechne_gleitsicherheit(
+                norm, q, z, konst=konst, reset_berechnungen=(erster is Nachweis.GLEIT),
+                methode=meth_gleit, vereinfachung_konstruktion=vereinfachung_konstruktion,
+                anzahl_windrichtungen=anzahl_windrichtungen,
+                richtungsstrategie=richtungsstrategie,
+                protokoll=protokoll,
+                kontext=base_ctx,
+            )
+            v_gleit = float(r[0].wert); b_gleit = float(r[1].wert)
+            out[Nachweis.GLEIT] = SafetyValue(v_gleit, meth_gleit, ValueSource.COMPUTED, [])
+        except BerechnungAbgebrochen:
+            raise
+        except Exception as e:
+            reasons.append(Message(code="GLEIT_FAILED", severity=Severity.ERROR,
+                                   text=f"Gleitsicherheit ({norm_label}) fehlgeschlagen: {e}", context={}))
+            out[Nachweis.GLEIT] = SafetyValue(None, meth_gleit, ValueSource.ERROR, [])
 
     # Abhebe
-    try:
-        r = konstruktion.berechne_abhebesicherheit(
-            norm, q, z, konst=konst, reset_berechnungen=False,
-            methode=meth_abhebe, vereinfachung_konstruktion=vereinfachung_konstruktion,
-            anzahl_windrichtungen=anzahl_windrichtungen,
-            protokoll=protokoll,
-            kontext=base_ctx,
-        )
-        v_abhebe = float(r[0].wert); b_abhebe = float(r[1].wert)
-        out[Nachweis.ABHEBE] = SafetyValue(v_abhebe, meth_abhebe, ValueSource.COMPUTED, [])
-    except Exception as e:
-        reasons.append(Message(code="ABHEBE_FAILED", severity=Severity.ERROR,
-                               text=f"Abhebesicherheit ({norm_label}) fehlgeschlagen: {e}", context={}))
-        out[Nachweis.ABHEBE] = SafetyValue(None, meth_abhebe, ValueSource.ERROR, [])
+    if Nachweis.ABHEBE in nachweise:
+        try:
+            r = konstruktion.berechne_abhebesicherheit(
+                norm, q, z, konst=konst, reset_berechnungen=(erster is Nachweis.ABHEBE),
+                methode=meth_abhebe, vereinfachung_konstruktion=vereinfachung_konstruktion,
+                anzahl_windrichtungen=anzahl_windrichtungen,
+                richtungsstrategie=richtungsstrategie,
+                protokoll=protokoll,
+                kontext=base_ctx,
+            )
+            v_abhebe = float(r[0].wert); b_abhebe = float(r[1].wert)
+            out[Nachweis.ABHEBE] = SafetyValue(v_abhebe, meth_abhebe, ValueSource.COMPUTED, [])
+        except BerechnungAbgebrochen:
+            raise
+        except Exception as e:
+            reasons.append(Message(code="ABHEBE_FAILED", severity=Severity.ERROR,
+                                   text=f"Abhebesicherheit ({norm_label}) fehlgeschlagen: {e}", context={}))
+            out[Nachweis.ABHEBE] = SafetyValue(None, meth_abhebe, ValueSource.ERROR, [])
+
+    if Nachweis.BALLAST not in nachweise:
+        return out, (v_kipp, v_gleit, v_abhebe)
 
     # Max-Ballast bilden + Quelle-Nachweis merken
     ballast_pairs: list[tuple[Nachweis, float]] = []
@@ -221,7 +272,7 @@ def _rechne_drei_nachweise(
     )
 
     # Globalen Ballast auch als Protokoll-Dokument ablegen
-    if protokoll is not None and ballast_wert is not None:
+    if doku_aktiv(protokoll) and ballast_wert is not None:
         protokolliere_doc(
             protokoll,
             bundle=make_docbundle(
@@ -249,6 +300,102 @@ def _rechne_drei_nachweise(
     return out, (v_kipp, v_gleit, v_abhebe)
 
 
+def _nur_relevante_docs(docs: List[Tuple[Any, dict]]) -> List[Tuple[Any, dict]]:
+    """
+    Filter für dokumentation="relevant". Behalten werden:
+    - Docs mit eigener Rolle "relevant"/"entscheidungsrelevant",
+    - BASIS-/BALLAST-Docs und richtungsunabhängige Docs (ohne windrichtung_deg),
+    - alle übrigen Docs (z.B. LOADS) der maßgebenden Windrichtung eines Nachweises je Szenario.
+    """
+    massgebend = set()
+    for _, ctx in docs:
+        if (ctx.get("doc_type") in ("dir_sicherheit", "dir_min_sicherheit")
+                and ctx.get("rolle") == "relevant" and ctx.get("windrichtung_deg") is not None):
+            massgebend.add((ctx.get("szenario"), ctx.get("windrichtung_deg")))
+
+    out = []
+    for bundle, ctx in docs:
+        wdir = ctx.get("windrichtung_deg")
+        if (ctx.get("rolle") in ("relevant", "entscheidungsrelevant")
+                or ctx.get("nachweis") in ("BASIS", "BALLAST")
+                or wdir is None
+                or (ctx.get("szenario"), wdir) in massgebend):
+            out.append((bundle, ctx))
+    return out
+
+def _fortschritt_einheiten(anzahl_windrichtungen: int, nachweise: FrozenSet[Nachweis] = frozenset(Nachweis)) -> int:
+    """Geplante Fortschritts-Einheiten je Szenario: gerechnete Einzelnachweise × Windrichtungen."""
+    return sum(1 for n in EINZELNACHWEISE if n in nachweise) * max(1, anzahl_windrichtungen)
+
+def nachweise_aufloesen(nachweise: Optional[Iterable[Nachweis]]) -> FrozenSet[Nachweis]:
+    """
+    Angeforderte Nachweise → tatsächlich zu rechnende (None → alle).
+    BALLAST ist das Maximum der drei Einzelnachweise und zieht diese deshalb mit.
+    """
+    if nachweise is None:
+        return frozenset(Nachweis)
+    menge = set(nachweise)
+    if Nachweis.BALLAST in menge:
+        menge.update(EINZELNACHWEISE)
+    if not menge:
+        raise ValueError("Mindestens ein Nachweis muss angefordert werden.")
+    return frozenset(menge)
+
+@dataclass
+class _SzenarioErgebnis:
+    """Ergebnis eines (Norm × Szenario)-Jobs, eigenes Protokoll je Job (wird in fester Reihenfolge zusammengeführt)."""
+    z: Optional[List[float]]
+    q: Optional[List[float]]
+    reasons_staudruck: List[Message]
+    anzahl_msgs_staudruck: int          # Messages im Protokoll nach der Staudruck-Ermittlung
+    protokoll: Protokoll
+    werte: Optional[Dict[Nachweis, SafetyValue]] = None
+    rohwerte: Tuple[Optional[float], Optional[float], Optional[float]] = (None, None, None)
+    reasons_nachweise: Optional[List[Message]] = None
+
+def _rechne_szenario(
+    konstruktion: Any,
+    s: StaudruckSzenario,
+    *,
+    norm_label: str,
+    aufstelldauer: Optional[Dauer],
+    konst: Optional[Any],
+    methode: Tuple[RechenmethodeKippen, RechenmethodeGleiten, RechenmethodeAbheben],
+    vereinfachung_konstruktion: VereinfachungKonstruktion,
+    anzahl_windrichtungen: int,
+    richtungsstrategie: RichtungsStrategie,
+    dokumentation: Dokumentation,
+    nachweise: FrozenSet[Nachweis] = frozenset(Nachweis),
+    doc_aufbewahrung: DocAufbewahrung = "alle",
+    doc_grenzen: DocGrenzen = DOC_GRENZEN,
+) -> _SzenarioErgebnis:
+    """Staudrücke + drei Nachweise eines Szenarios (unabhängig von allen anderen → parallelisierbar)."""
+    meth_kipp, meth_gleit, meth_abhebe = methode
+    fortschritt_checkpoint(0)
+    if dokumentation != "none" and doc_grenzen.aktiv:
+        prot = BegrenztesProtokoll(grenzen=doc_grenzen, aufbewahrung=doc_aufbewahrung)
+    else:
+        prot = make_protokoll(dokumentation=(dokumentation != "none"), aufbewahrung=doc_aufbewahrung)
+    z, q, reasons = _ermittle_staudruecke(konstruktion, s, aufstelldauer=aufstelldauer, protokoll=prot, kontext={})
+    ergebnis = _SzenarioErgebnis(
+        z=z, q=q, reasons_staudruck=reasons,
+        anzahl_msgs_staudruck=len(collect_messages(prot)), protokoll=prot,
+    )
+    if z is None or q is None:
+        fortschritt_checkpoint(_fortschritt_einheiten(anzahl_windrichtungen, nachweise))  # geplante Richtungen entfallen
+        return ergebnis
+
+    ergebnis.reasons_nachweise = []
+    ergebnis.werte, ergebnis.rohwerte = _rechne_drei_nachweise(
+        konstruktion, s.norm, q, z,
+        konst=konst, meth_kipp=meth_kipp, meth_gleit=meth_gleit, meth_abhebe=meth_abhebe,
+        vereinfachung_konstruktion=vereinfachung_konstruktion, anzahl_windrichtungen=anzahl_windrichtungen,
+        richtungsstrategie=richtungsstrategie,
+        reasons=ergebnis.reasons_nachweise, norm_label=norm_label, nachweise=nachweise,
+        protokoll=prot, kontext={"szenario_anzeigename": s.anzeigename, "szenario": s.label,},
+    )
+    return ergebnis
+
 # -----------------------------
 # 3) Top-Level Orchestrierung
 # -----------------------------
@@ -261,10 +408,61 @@ def standsicherheit(
     methode: Optional[Tuple[RechenmethodeKippen, RechenmethodeGleiten, RechenmethodeAbheben]] = None,
     vereinfachung_konstruktion: VereinfachungKonstruktion = VereinfachungKonstruktion.KEINE,
     anzahl_windrichtungen: int = 8,
+    richtungsstrategie: RichtungsStrategie = RichtungsStrategie.RASTER,
+    dokumentation: Dokumentation = "full",
+    doc_aufbewahrung: DocAufbewahrung = "alle",
+    doc_grenzen: Optional[DocGrenzen] = None,
+    executor: Ausfuehrung = "serial",
+    workers: Optional[int] = None,
+    normen: Optional[Iterable[Norm]] = None,
+    nachweise: Optional[Iterable[Nachweis]] = None,
+    alternativen: bool = True,
 ) -> StandsicherheitErgebnis:
     """
     Rechnet Kipp-/Gleit-/Abhebesicherheit je Norm. Staudrücke/Alternativen laufen über Szenarien.
+
+    richtungsstrategie:
+      - RASTER:  anzahl_windrichtungen gleichmäßig verteilte Richtungen
+      - ADAPTIV: das Raster dient als Grobsuche; je Nachweis wird die kritische Richtung danach
+                 per Goldenem Schnitt eingegrenzt (siehe verfeinere_windrichtung)
+
+    dokumentation:
+      - "full":     alle Zwischenergebnisse (DocBundles werden erst bei Bedarf ausgewertet)
+      - "relevant": nur Docs, die das Ergebnis bestimmen (siehe _nur_relevante_docs)
+      - "none":     nur Zahlen + Messages (NullProtokoll, keine Doku-Erzeugung)
+
+    doc_aufbewahrung (Docs werden schon beim Rechnen ausgedünnt, siehe DocAufbewahrung):
+      - "alle":     alle Docs aller Windrichtungen (Standard)
+      - "gewinner": unterlegene Richtungen nur mit Zusammenfassungen (dir_*) und LOADS;
+                    Protokoll dedupliziert beim Einfügen (DedupProtokoll)
+
+    doc_grenzen (None → DOC_GRENZEN aus WINDLAST_DOC_GRENZE/_GRENZEN/_UEBERLAUF):
+      Obergrenzen je (nachweis, doc_type); darüber werden Docs zusammengefasst (Standard) oder
+      ausgelagert (Temp-File, gelesen erst beim Mappen), siehe BegrenztesProtokoll. Speicher-Statistik der
+      Szenario-Protokolle: protokoll_statistik.stats()
+
+    executor / workers:
+      - "serial":    Norm × Szenario nacheinander (Standard)
+      - "threads" / "processes": Primär-Szenarien aller Normen parallel, danach die benötigten
+                     Alternativ-Szenarien parallel (workers=None → Anzahl CPUs). Jedes Szenario
+                     protokolliert in ein eigenes Protokoll; zusammengeführt wird in fester
+                     Reihenfolge, das Ergebnis ist identisch zu "serial".
+
+    normen / nachweise / alternativen (Projektion, es wird nur Angefordertes gerechnet):
+      - normen:       nur diese Normen (None → alle)
+      - nachweise:    nur diese Nachweise (None → alle; BALLAST zieht KIPP/GLEIT/ABHEBE mit)
+      - alternativen: False → keine Alternativ-Szenarien (2. Welle entfällt)
+
+    Fortschritt/Abbruch: ist ein Fortschritt gesetzt (fortschritt_kontext), wird je Szenario,
+    Nachweis und Windrichtung gemeldet; nach abbrechen() endet die Rechnung am nächsten
+    Checkpoint mit BerechnungAbgebrochen ("processes": nur Abbruch vor Start der Worker-Jobs).
     """
+    if dokumentation not in ("none", "relevant", "full"):
+        raise ValueError(f"Unbekannte dokumentation: {dokumentation!r} (erlaubt: none, relevant, full)")
+    if doc_aufbewahrung not in DOC_AUFBEWAHRUNG:
+        raise ValueError(f"Unbekannte doc_aufbewahrung: {doc_aufbewahrung!r} (erlaubt: {', '.join(DOC_AUFBEWAHRUNG)})")
+    pruefe_ausfuehrung(executor, workers)
+    nachweise = nachweise_aufloesen(nachweise)
     if methode is None:
         methode = (
             RechenmethodeKippen.STANDARD,
@@ -286,31 +484,36 @@ def standsicherheit(
         methoden={Nachweis.KIPP: meth_kipp, Nachweis.GLEIT: meth_gleit, Nachweis.ABHEBE: meth_abhebe},
         vereinfachung_konstruktion=vereinfachung_konstruktion,
         anzahl_windrichtungen=anzahl_windrichtungen,
+        richtungsstrategie=richtungsstrategie,
         konst_overrides={} if konst is None else {"custom": True},
     )
 
-    normen: Dict[Norm, NormErgebnis] = {}
+    norm_ergebnisse: Dict[Norm, NormErgebnis] = {}
 
-    # Helper zum Ausführen einer Norm mit beliebig vielen Szenarien
-    def _rechne_norm(
-        szenarien: List[StaudruckSzenario],
-        *,
-        normtitel: str,
-        allow_alternativen: bool = True,
+    job_parameter = dict(
+        aufstelldauer=aufstelldauer, konst=konst, methode=methode,
+        vereinfachung_konstruktion=vereinfachung_konstruktion, anzahl_windrichtungen=anzahl_windrichtungen,
+        richtungsstrategie=richtungsstrategie, dokumentation=dokumentation, nachweise=nachweise,
+        doc_aufbewahrung=doc_aufbewahrung, doc_grenzen=DOC_GRENZEN if doc_grenzen is None else doc_grenzen,
+    )
+
+    def _fallback_noetig(primaer: _SzenarioErgebnis, szenarien: List[StaudruckSzenario], allow_alternativen: bool) -> bool:
+        # Fallback nur versuchen, wenn eine Sicherheit < 1 oder wenn man sie immer anbieten will
+        if primaer.z is None or primaer.q is None:
+            return False
+        need_fallback = any(v is not None and v < 1.0 for v in primaer.rohwerte)
+        return need_fallback and len(szenarien) > 1 and allow_alternativen and alternativen
+
+    # Helper: NormErgebnis aus Primär- und (ggf.) Alternativ-Szenarien zusammensetzen
+    def _norm_ergebnis(
+        primaer: _SzenarioErgebnis,
+        alternativ: List[Tuple[StaudruckSzenario, _SzenarioErgebnis]],
     ) -> NormErgebnis:
         # Primär-Szenario ist szenarien[0]; alle weiteren werden als alternativen[...] abgelegt
         reasons_all: List[Message] = []
-        prot = make_protokoll()
-
-        # Primär
-        s_primary = szenarien[0]
-        z, q, reasons = _ermittle_staudruecke(konstruktion, s_primary, aufstelldauer=aufstelldauer, protokoll=prot, kontext={})
-        reasons_all.extend(reasons)
-        try:
-            reasons_all.extend(collect_messages(prot))
-        except Exception:
-            pass
-        if z is None or q is None:
+        reasons_all.extend(primaer.reasons_staudruck)
+        reasons_all.extend(collect_messages(primaer.protokoll)[:primaer.anzahl_msgs_staudruck])
+        if primaer.z is None or primaer.q is None:
             # Ohne q/z: ERROR + Platzhalterwerte wie bisher
             return NormErgebnis(
                 status=NormStatus.ERROR,
@@ -322,107 +525,103 @@ def standsicherheit(
                     Nachweis.BALLAST: SafetyValue(None, "MAX_BALLAST_KIPP_GLEIT_ABHEBE", ValueSource.ERROR, []),
                 },
             )
+        reasons_all.extend(primaer.reasons_nachweise or [])
 
-        werte, (v_kipp, v_gleit, v_abhebe) = _rechne_drei_nachweise(
-            konstruktion, szenarien[0].norm, q, z,
-            konst=konst, meth_kipp=meth_kipp, meth_gleit=meth_gleit, meth_abhebe=meth_abhebe,
-            vereinfachung_konstruktion=vereinfachung_konstruktion, anzahl_windrichtungen=anzahl_windrichtungen,
-            reasons=reasons_all, norm_label=normtitel,
-            protokoll=prot, kontext={"szenario_anzeigename": s_primary.anzeigename, "szenario": s_primary.label,},
-        )
-
+        protokolle = [primaer.protokoll]
         alternativen: Dict[str, AlternativeErgebnis] = {}
-        # Fallback nur versuchen, wenn eine Sicherheit < 1 oder wenn man sie immer anbieten will
-        need_fallback = any(v is not None and v < 1.0 for v in (v_kipp, v_gleit, v_abhebe))
-
-        if need_fallback and len(szenarien) > 1 and allow_alternativen:
-            for s in szenarien[1:]:
-                z_b, q_b, reasons_b = _ermittle_staudruecke(konstruktion, s, aufstelldauer=aufstelldauer, protokoll=prot, kontext={})
-                reasons_all.extend(reasons_b)
-                if z_b is None or q_b is None:
-                    # Wenn Staudrücke fürs Fallback nicht verfügbar, einfach überspringen (Reasons sind geloggt)
-                    continue
-                vals_b, _ = _rechne_drei_nachweise(
-                    konstruktion, s.norm, q_b, z_b,
-                    konst=konst, meth_kipp=meth_kipp, meth_gleit=meth_gleit, meth_abhebe=meth_abhebe,
-                    vereinfachung_konstruktion=vereinfachung_konstruktion, anzahl_windrichtungen=anzahl_windrichtungen,
-                    reasons=reasons_all, norm_label=f"{s.norm.name} ({s.label})",
-                    protokoll=prot, kontext={"szenario_anzeigename": s.anzeigename, "szenario": s.label,},
-                )
-                alternativen[s.label] = AlternativeErgebnis(
-                    anzeigename=s.anzeigename,
-                    werte=vals_b,
-                )
+        for s, e in alternativ:
+            reasons_all.extend(e.reasons_staudruck)
+            protokolle.append(e.protokoll)
+            if e.z is None or e.q is None:
+                # Wenn Staudrücke fürs Fallback nicht verfügbar, einfach überspringen (Reasons sind geloggt)
+                continue
+            reasons_all.extend(e.reasons_nachweise or [])
+            alternativen[s.label] = AlternativeErgebnis(
+                anzeigename=s.anzeigename,
+                werte=e.werte,
+            )
 
-        try:
+        for prot in protokolle:
             reasons_all.extend(collect_messages(prot))
-        except Exception:
-            pass
 
-        
-        # NEU: Docs einsammeln und in details hängen
-        docs = []
-        try:
-            docs = collect_docs(prot)  # Liste von (bundle, ctx)
-        except Exception:
-            docs = []
+        # Docs einsammeln und in details hängen (Reihenfolge: Primär, dann Alternativen)
+        if dokumentation != "none":
+            for prot in protokolle:
+                protokoll_statistik.erfassen(prot)
+        # Liste von (bundle, ctx); mit ausgelagerten Docs eine DocFolge, die erst beim Mappen liest
+        docs = docs_einsammeln(protokolle)
+        if dokumentation == "relevant":
+            docs = _nur_relevante_docs(docs)
 
         status = NormStatus.ERROR if any(m.severity == Severity.ERROR for m in reasons_all) else NormStatus.CALCULATED
-        details = NormDetails()  # falls du bisher None gelassen hast
+        details = NormDetails()
         details.notes = details.notes or []
         details.windrichtungen = details.windrichtungen or []
         details.docs = docs
 
-        return NormErgebnis(status=status, reasons=reasons_all, werte=werte, alternativen=alternativen, details=details)
-    
+        return NormErgebnis(status=status, reasons=reasons_all, werte=primaer.werte, alternativen=alternativen, details=details)
+
     aufstelldauer_monate = convert_dauer(aufstelldauer.wert, aufstelldauer.einheit, Zeitfaktor.MONAT) if aufstelldauer else None
     allow_alternativen_1991 = (aufstelldauer_monate is not None and aufstelldauer_monate <= 24.0)
 
-    # --------------------------
-    # DIN EN 13814:2005-06
-    # --------------------------
-    normen[Norm.DIN_EN_13814_2005_06] = _rechne_norm(
-        [
+    # (szenarien, normtitel, allow_alternativen) je Norm; Primär-Szenario ist jeweils szenarien[0]
+    norm_szenarien: Dict[Norm, Tuple[List[StaudruckSzenario], str, bool]] = {
+        # DIN EN 13814:2005-06
+        Norm.DIN_EN_13814_2005_06: ([
             StaudruckSzenario("AUSSER_BETRIEB", "Außer Betrieb", Norm.DIN_EN_13814_2005_06, modus="betrieb",
                             betriebszustand=Betriebszustand.AUSSER_BETRIEB, windzone=windzone),
             StaudruckSzenario("IN_BETRIEB",     "mit Schutzmaßnahmen", Norm.DIN_EN_13814_2005_06, modus="betrieb",
                             betriebszustand=Betriebszustand.IN_BETRIEB, windzone=windzone),
-        ],
-        normtitel="DIN EN 13814:2005-06",
-        allow_alternativen=True,
-    )
-
-    # --------------------------
-    # DIN EN 17879:2024-08
-    # --------------------------
-    normen[Norm.DIN_EN_17879_2024_08] = _rechne_norm(
-        [
+        ], "DIN EN 13814:2005-06", True),
+        # DIN EN 17879:2024-08
+        Norm.DIN_EN_17879_2024_08: ([
             StaudruckSzenario("AUSSER_BETRIEB", "Außer Betrieb", Norm.DIN_EN_17879_2024_08, modus="betrieb",
                             betriebszustand=Betriebszustand.AUSSER_BETRIEB, windzone=windzone),
             StaudruckSzenario("IN_BETRIEB",     "mit Schutzmaßnahmen", Norm.DIN_EN_17879_2024_08, modus="betrieb",
                             betriebszustand=Betriebszustand.IN_BETRIEB, windzone=windzone),
-        ],
-        normtitel="DIN EN 17879:2024-08",
-        allow_alternativen=True,
-    )
-
-    # --------------------------
-    # DIN EN 1991-1-4:2010-12
-    # --------------------------
-    normen[Norm.DIN_EN_1991_1_4_2010_12] = _rechne_norm(
-        [
+        ], "DIN EN 17879:2024-08", True),
+        # DIN EN 1991-1-4:2010-12
+        Norm.DIN_EN_1991_1_4_2010_12: ([
             StaudruckSzenario("STANDARD", "Standard", Norm.DIN_EN_1991_1_4_2010_12, modus="schutz",
                             schutz=Schutzmassnahmen.KEINE, windzone=windzone),
             StaudruckSzenario("VERSTAERKEND", "mit verstärkenden Sicherungsmaßnahmen", Norm.DIN_EN_1991_1_4_2010_12, modus="schutz",
                             schutz=Schutzmassnahmen.VERSTAERKEND, windzone=windzone),
             StaudruckSzenario("SCHUETZEND", "mit schützenden Sicherungsmaßnahmen", Norm.DIN_EN_1991_1_4_2010_12, modus="schutz",
                             schutz=Schutzmassnahmen.SCHUETZEND, windzone=windzone),
-        ],
-        normtitel="DIN EN 1991-1-4:2010-12",
-        allow_alternativen=allow_alternativen_1991,
-    )
+        ], "DIN EN 1991-1-4:2010-12", allow_alternativen_1991),
+    }
+    if normen is not None:
+        gewaehlt = set(normen)
+        norm_szenarien = {n: v for n, v in norm_szenarien.items() if n in gewaehlt}
+
+    with Ausfuehrer(executor, workers, geteilt=konstruktion) as ausfuehrer:
+        # 1. Welle: Primär-Szenarien aller Normen
+        fortschritt_planen(len(norm_szenarien) * _fortschritt_einheiten(anzahl_windrichtungen, nachweise))
+        primaer_liste = ausfuehrer.map(_rechne_szenario, [
+            ((szenarien[0],), dict(job_parameter, norm_label=normtitel))
+            for szenarien, normtitel, _ in norm_szenarien.values()
+        ])
+        primaer = dict(zip(norm_szenarien, primaer_liste))
+
+        # 2. Welle: Alternativ-Szenarien der Normen, deren Primär-Ergebnis sie braucht
+        alternativ_jobs = [
+            (norm, s)
+            for norm, (szenarien, _, allow_alternativen) in norm_szenarien.items()
+            if _fallback_noetig(primaer[norm], szenarien, allow_alternativen)
+            for s in szenarien[1:]
+        ]
+        fortschritt_planen(len(alternativ_jobs) * _fortschritt_einheiten(anzahl_windrichtungen, nachweise))
+        alternativ_liste = ausfuehrer.map(_rechne_szenario, [
+            ((s,), dict(job_parameter, norm_label=f"{s.norm.name} ({s.label})"))
+            for _, s in alternativ_jobs
+        ])
+
+    for norm in norm_szenarien:
+        norm_ergebnisse[norm] = _norm_ergebnis(primaer[norm], [
+            (s, e) for (n, s), e in zip(alternativ_jobs, alternativ_liste) if n == norm
+        ])
 
     # Ergebnis speichern (Debug)
-    # save_ergebnis_to_file(StandsicherheitErgebnis(normen=normen, messages=[], meta=meta))
+    # save_ergebnis_to_file(StandsicherheitErgebnis(normen=norm_ergebnisse, messages=[], meta=meta))
 
-    return StandsicherheitErgebnis(normen=normen, messages=[], meta=meta)
+    return StandsicherheitErgebnis(normen=norm_ergebnisse, messages=[], meta=meta)
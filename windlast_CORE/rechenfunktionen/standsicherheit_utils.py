@@ -1,13 +1,25 @@
 import math
-from typing import List, Tuple, Optional, Sequence, Iterable, Dict
-from windlast_CORE.rechenfunktionen.geom3d import Vec3, vektor_zwischen_punkten, vektor_normieren, einheitsvektor_aus_winkeln, konvexe_huelle_xy, moment_einzelkraft_um_achse, vektor_laenge
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, List, Tuple, Optional, Sequence, Iterable, Dict
+from windlast_CORE.rechenfunktionen.geom3d import Vec3, vektor_zwischen_punkten, vektor_normieren, einheitsvektor_aus_winkeln, konvexe_huelle_xy, moment_einzelkraft_um_achse, vektor_laenge, flaechenschwerpunkt
 from windlast_CORE.datenstruktur.objekte3d import Achse
 from windlast_CORE.datenstruktur.kraefte import Kraefte
 from windlast_CORE.datenstruktur.enums import Norm, Lasttyp, Variabilitaet, Severity
-from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll, merge_kontext, protokolliere_msg, protokolliere_doc, make_docbundle
-from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import sicherheitsbeiwert
+from windlast_CORE.datenstruktur.zwischenergebnis import Protokoll, LazyDocBundle, merge_kontext, protokolliere_msg, protokolliere_doc, make_docbundle, lazy_docbundle, make_protokoll, make_aufzeichnung, protokoll_stufe, protokoll_uebertragen, doku_aktiv
+from windlast_CORE.rechenfunktionen.sicherheitsbeiwert import GammaSchluessel, gamma_tabelle
+from windlast_CORE.rechenfunktionen.symmetrie import Symmetrie
 from windlast_CORE.datenstruktur.lastpool import LastPool, LastSet
-from windlast_CORE.datenstruktur.konstanten import _EPS
+from windlast_CORE.datenstruktur.kraftblock import KraftBlock, LASTTYP_CODE
+from windlast_CORE.datenstruktur.konstanten import _EPS, aktuelle_konstanten
+from windlast_CORE.datenstruktur.lastcache import (
+    LastCache, LastCacheEintrag, lastcache, element_fingerprint,
+    q_profil_schluessel, wind_schluessel, gewicht_schluessel,
+)
+from windlast_CORE.datenstruktur.geometrie import Kippgeometrie, geometrie_schluessel
+from windlast_CORE.datenstruktur.prepared import PreparedKonstruktion
+from windlast_CORE.datenstruktur.fortschritt import fortschritt_planen
+from windlast_CORE.materialdaten.catalog import catalog
 
 def generiere_windrichtungen(
     anzahl: int = 4,
@@ -33,6 +45,92 @@ def generiere_windrichtungen(
 
     return result
 
+# Adaptive Richtungssuche: Abbruch, sobald das Suchintervall kleiner als die Toleranz ist
+_ADAPTIV_TOLERANZ_DEG = 0.5
+_ADAPTIV_MAX_AUSWERTUNGEN = 20
+_GOLDENER_SCHNITT = (math.sqrt(5.0) - 1.0) / 2.0
+
+def verfeinere_windrichtung(
+    auswerten: Callable[[float, Vec3], float],
+    stuetzstellen: Sequence[Tuple[float, float]],
+    *,
+    toleranz_deg: float = _ADAPTIV_TOLERANZ_DEG,
+    max_auswertungen: int = _ADAPTIV_MAX_AUSWERTUNGEN,
+    protokoll: Optional[Protokoll] = None,
+    kontext: Optional[dict] = None,
+) -> Tuple[float, float]:
+    """
+    Grenzt die kritische Windrichtung (minimale Sicherheit) zwischen den Rasterrichtungen ein.
+
+    - stuetzstellen: (winkel_deg, sicherheit) der Grobsuche
+    - auswerten(winkel_deg, richtung) rechnet eine weitere Richtung und liefert deren Sicherheit
+
+    Die Raster-Nachbarn der ungünstigsten Stützstelle bilden das Suchintervall, das per
+    Goldenem Schnitt bis auf toleranz_deg verkleinert wird (höchstens max_auswertungen
+    zusätzliche Richtungen; Winkel auf 0.01° gerundet).
+
+    Rückgabe: (winkel_deg, sicherheit) der ungünstigsten ausgewerteten Richtung.
+    """
+    base_ctx = merge_kontext(kontext, {"funktion": "verfeinere_windrichtung"})
+
+    punkte = sorted((w % 360.0, s) for w, s in stuetzstellen)
+    if not punkte:
+        return float("nan"), float("nan")
+
+    werte: Dict[int, Tuple[float, float]] = {_angle_key(w): (w, s) for w, s in punkte}
+    anzahl = 0
+
+    def f(w: float) -> float:
+        nonlocal anzahl
+        w = round(w % 360.0, 2)
+        key = _angle_key(w)
+        if key not in werte:
+            anzahl += 1
+            fortschritt_planen(1)  # Verfeinerungen kommen zum geplanten Raster hinzu
+            werte[key] = (w, auswerten(w, einheitsvektor_aus_winkeln(w, 0.0)))
+        return werte[key][1]
+
+    i_min = min(range(len(punkte)), key=lambda i: punkte[i][1])
+    w_min, s_min = punkte[i_min]
+
+    # Ohne endliches Minimum (z. B. keine kippende Wirkung → inf) gibt es nichts einzugrenzen
+    if math.isfinite(s_min):
+        if len(punkte) > 1:
+            a = punkte[i_min - 1][0] if i_min > 0 else punkte[-1][0] - 360.0
+            b = punkte[i_min + 1][0] if i_min + 1 < len(punkte) else punkte[0][0] + 360.0
+        else:
+            a, b = w_min - 180.0, w_min + 180.0
+
+        c = b - _GOLDENER_SCHNITT * (b - a)
+        d = a + _GOLDENER_SCHNITT * (b - a)
+        fc, fd = f(c), f(d)
+        while (b - a) > toleranz_deg and anzahl < max_auswertungen:
+            if fc <= fd:
+                b, d, fd = d, c, fc
+                c = b - _GOLDENER_SCHNITT * (b - a)
+                fc = f(c)
+            else:
+                a, c, fc = c, d, fd
+                d = a + _GOLDENER_SCHNITT * (b - a)
+                fd = f(d)
+
+    # Ungünstigste Richtung über alle ausgewerteten Stützstellen (bei Gleichstand die Rasterrichtung)
+    w_krit, s_krit = min(werte.values(), key=lambda ws: ws[1])
+
+    if doku_aktiv(protokoll):
+        protokolliere_doc(
+            protokoll,
+            bundle=lazy_docbundle(
+                titel="Kritische Windrichtung θ_krit",
+                wert=w_krit,
+                einheit="°",
+                formel=f"θ_krit = argmin S(θ) (Raster {len(punkte)} Richtungen + {anzahl} Verfeinerungen, Toleranz {toleranz_deg}°)",
+                quelle_formel="---",
+            ),
+            kontext=merge_kontext(base_ctx, {"doc_type": "kritische_windrichtung", "rolle": "relevant"}),
+        )
+    return w_krit, s_krit
+
 def ermittle_kraefte_pro_windrichtung(
     konstruktion,
     norm: Norm,
@@ -43,15 +141,61 @@ def ermittle_kraefte_pro_windrichtung(
     *,
     protokoll: Optional[Protokoll] = None,
     kontext: Optional[dict] = None,
+    winkel_deg: Optional[float] = None,
 ) -> Dict[str, List[Kraefte]]:
+    """
+    Kräfte aller Bauelemente für eine Windrichtung (Dict[element_id, List[Kraefte]]).
+    Läuft über ermittle_kraefte_fuer_windrichtungen (gleicher Rechenweg, gleicher LastCache);
+    winkel_deg=None → Azimut aus dem Richtungsvektor.
+    """
+    if winkel_deg is None:
+        winkel_deg = math.degrees(math.atan2(windrichtung[1], windrichtung[0])) % 360.0
+    return ermittle_kraefte_fuer_windrichtungen(
+        konstruktion, norm, [(winkel_deg, windrichtung)], staudruecke, obergrenzen, konst,
+        protokolle=[protokoll], kontext=kontext,
+    )[0]
+
+def ermittle_kraefte_fuer_windrichtungen(
+    konstruktion,
+    norm: Norm,
+    windrichtungen: Sequence[Tuple[float, Vec3]],
+    staudruecke: Sequence[float],
+    obergrenzen: Sequence[float],
+    konst,
+    *,
+    protokolle: Optional[Sequence[Optional[Protokoll]]] = None,
+    kontext: Optional[dict] = None,
+    cache: Optional[LastCache] = lastcache,
+) -> List[Dict[str, List[Kraefte]]]:
+    """
+    Kräfte aller Bauelemente für alle Windrichtungen auf einmal:
+    - Windkräfte über elem.windkraefte_batch(...) (richtungsunabhängiger Anteil nur einmal)
+    - Gewichtskräfte einmal je Element (richtungsunabhängig)
+    - Lasten je Element über den inhaltsadressierten LastCache (cache=None → ohne Cache)
+    Die Doku wird relativ zum Element-Kontext aufgezeichnet und in protokolle[d] wiedergegeben,
+    sodass jedes Richtungs-Protokoll exakt die Einträge des Einzelaufrufs erhält.
+    Rückgabe: je Windrichtung Dict[element_id, List[Kraefte]]
+    """
+    n = len(windrichtungen)
+    protokolle = list(protokolle) if protokolle is not None else [None] * n
+    stufe = max((protokoll_stufe(p) for p in protokolle), default=0)
+    richtungen = [richtung for _, richtung in windrichtungen]
+    dir_ctx = [
+        {"winkel_deg": f"{winkel}°", "windrichtung": richtung}
+        for winkel, richtung in windrichtungen
+    ]
     base_ctx = merge_kontext(kontext, {
         "funktion": "ermittle_kraefte_pro_windrichtung",
         "norm": getattr(norm, "value", str(norm)),
-        "windrichtung": windrichtung,
     })
 
-    # 1)Wind- & Gewichtskräfte aller Bauelemente holen
-    kraefte_windrichtung: List[Kraefte] = []
+    spec_version = catalog.spec_version
+    q_profil = q_profil_schluessel(staudruecke, obergrenzen)
+    konst_wind = konst or aktuelle_konstanten()
+    konst_gewicht = aktuelle_konstanten()
+
+    kraefte_je_richtung: List[List[Kraefte]] = [[] for _ in range(n)]
+    vorbereitet = konstruktion if isinstance(konstruktion, PreparedKonstruktion) else None
 
     for idx, elem in enumerate(getattr(konstruktion, "bauelemente", []) or []):
         elem_ctx = merge_kontext(base_ctx, {
@@ -59,57 +203,191 @@ def ermittle_kraefte_pro_windrichtung(
             "element_id": getattr(elem, "element_id_intern", None),
             "objekttyp": getattr(getattr(elem, "objekttyp", None), "value", None),
         })
-        # Gewicht
+        if vorbereitet is not None:
+            fp = vorbereitet.fingerprints[idx] if cache is not None else None
+        else:
+            fp = element_fingerprint(elem) if cache is not None else None
+
+        # Gewicht (richtungsunabhängig → einmal berechnen, je Richtung wiedergeben)
         fn_gewicht = getattr(elem, "gewichtskraefte", None)
         if callable(fn_gewicht):
-            try:
-                kraefte_gewicht = fn_gewicht(protokoll=protokoll, kontext=elem_ctx)
-                if kraefte_gewicht:
-                    kraefte_windrichtung.extend(kraefte_gewicht)
-            except Exception as e:
-                protokolliere_msg(
-                    protokoll, severity=Severity.ERROR,
-                    code="UTILS/GEWICHT_FAIL",
-                    text=f"gewichtskraefte() für Element {idx} fehlgeschlagen: {e}",
-                    kontext=elem_ctx,
-                )
-
-        # Wind
+            eintrag = None
+            fehler = None
+            if vorbereitet is not None and (vorbereitet.gewicht_fehler[idx] is not None
+                                           or (vorbereitet.gewichte[idx] is not None
+                                               and vorbereitet.gewichte[idx].stufe >= stufe)):
+                eintrag = vorbereitet.gewichte[idx]
+                fehler = vorbereitet.gewicht_fehler[idx]
+            key = gewicht_schluessel(fp, spec_version, konst_gewicht) if fp is not None else None
+            if eintrag is None and fehler is None and key is not None:
+                eintrag = cache.get(key, stufe=stufe)
+            if eintrag is None and fehler is None:
+                aufz = make_aufzeichnung(stufe)
+                try:
+                    kraefte_gewicht = fn_gewicht(protokoll=aufz, kontext=None)
+                    eintrag = LastCacheEintrag(kraefte=tuple(kraefte_gewicht or ()), protokoll=aufz)
+                    if key is not None:
+                        cache.put(key, eintrag)
+                except Exception as e:
+                    fehler = e
+            for d in range(n):
+                ctx_d = merge_kontext(elem_ctx, dir_ctx[d])
+                if fehler is not None:
+                    protokolliere_msg(
+                        protokolle[d], severity=Severity.ERROR,
+                        code="UTILS/GEWICHT_FAIL",
+                        text=f"gewichtskraefte() für Element {idx} fehlgeschlagen: {fehler}",
+                        kontext=ctx_d,
+                    )
+                    continue
+                protokoll_uebertragen(eintrag.protokoll, protokolle[d], basis=ctx_d)
+                kraefte_je_richtung[d].extend(eintrag.kraefte)
+
+        # Wind (fehlende Richtungen in einem Aufruf)
+        fn_batch = getattr(elem, "windkraefte_batch", None)
         fn_wind = getattr(elem, "windkraefte", None)
-        if callable(fn_wind):
-            try:
-                kraefte_wind = fn_wind(
-                    norm=norm,
-                    windrichtung=windrichtung,
-                    staudruecke=staudruecke,
-                    obergrenzen=obergrenzen,
-                    konst=konst,
-                    protokoll=protokoll,
-                    kontext=elem_ctx,
-                )
-                if kraefte_wind:
-                    kraefte_windrichtung.extend(kraefte_wind)
-            except Exception as e:
-                protokolliere_msg(
-                    protokoll, severity=Severity.ERROR,
-                    code="UTILS/WIND_FAIL",
-                    text=f"windkraefte() für Element {idx} fehlgeschlagen: {e}",
-                    kontext=elem_ctx,
-                )
-    
-    # 2) Nach Bauelement gruppieren (erwartet: element_id_intern gesetzt)
-    kraefte_nach_element: Dict[str, List[Kraefte]] = {}
-    for k in kraefte_windrichtung:
-        key = k.element_id_intern or f"elem_{id(k)}"  # Fallback, falls ID fehlt
-        kraefte_nach_element.setdefault(key, []).append(k)
-
-    return kraefte_nach_element
+        if callable(fn_batch) or callable(fn_wind):
+            keys = [
+                wind_schluessel(fp, spec_version, norm, q_profil, winkel, richtung, konst_wind) if fp is not None else None
+                for winkel, richtung in windrichtungen
+            ]
+            eintraege: List[Optional[LastCacheEintrag]] = [
+                cache.get(key, stufe=stufe) if key is not None else None
+                for key in keys
+            ]
+            fehlend = [d for d in range(n) if eintraege[d] is None]
+            fehler = None
+            if fehlend:
+                aufz = [make_aufzeichnung(stufe) for _ in fehlend]
+                try:
+                    if callable(fn_batch):
+                        optionen = {}
+                        vorbereitung = vorbereitet.wind_vorbereitung(idx) if vorbereitet is not None else None
+                        if vorbereitung is not None:
+                            optionen["vorbereitung"] = vorbereitung
+                        kraefte_wind = fn_batch(
+                            norm=norm,
+                            richtungen=[richtungen[d] for d in fehlend],
+                            staudruecke=staudruecke,
+                            obergrenzen=obergrenzen,
+                            konst=konst,
+                            protokolle=aufz,
+                            kontext=None,
+                            richtungs_kontexte=[dir_ctx[d] for d in fehlend],
+                            **optionen,
+                        )
+                    else:
+                        kraefte_wind = [
+                            fn_wind(
+                                norm=norm,
+                                windrichtung=richtungen[d],
+                                staudruecke=staudruecke,
+                                obergrenzen=obergrenzen,
+                                konst=konst,
+                                protokoll=prot,
+                                kontext=dir_ctx[d],
+                            )
+                            for d, prot in zip(fehlend, aufz)
+                        ]
+                    for d, prot, kraefte_d in zip(fehlend, aufz, kraefte_wind):
+                        eintraege[d] = LastCacheEintrag(kraefte=tuple(kraefte_d or ()), protokoll=prot)
+                        if keys[d] is not None:
+                            cache.put(keys[d], eintraege[d])
+                except Exception as e:
+                    fehler = e
+            for d in range(n):
+                if eintraege[d] is None:
+                    protokolliere_msg(
+                        protokolle[d], severity=Severity.ERROR,
+                        code="UTILS/WIND_FAIL",
+                        text=f"windkraefte() für Element {idx} fehlgeschlagen: {fehler}",
+                        kontext=merge_kontext(elem_ctx, dir_ctx[d]),
+                    )
+                    continue
+                protokoll_uebertragen(eintraege[d].protokoll, protokolle[d], basis=elem_ctx)
+                kraefte_je_richtung[d].extend(eintraege[d].kraefte)
+
+    # Nach Bauelement gruppieren (erwartet: element_id_intern gesetzt)
+    ergebnis: List[Dict[str, List[Kraefte]]] = []
+    for kraefte_windrichtung in kraefte_je_richtung:
+        kraefte_nach_element: Dict[str, List[Kraefte]] = {}
+        for k in kraefte_windrichtung:
+            key = k.element_id_intern or f"elem_{id(k)}"  # Fallback, falls ID fehlt
+            kraefte_nach_element.setdefault(key, []).append(k)
+        ergebnis.append(kraefte_nach_element)
+    return ergebnis
 
 def _angle_key(winkel_deg: float) -> int:
     return int(round(winkel_deg * 1e4))
 
+def richtungsrecord_aus_symmetrie(
+    symmetrie: Symmetrie,
+    winkel_deg: float,
+    dir_records: Sequence[dict],
+    *,
+    dokumentation: bool = True,
+) -> Optional[dict]:
+    """
+    Ergebnis einer bereits gerechneten, symmetrisch äquivalenten Windrichtung übernehmen.
+
+    Sucht in dir_records eine gerechnete Richtung, die ein Bild von winkel_deg unter der
+    Symmetrie ist, und liefert eine Kopie mit umgeschriebener Windrichtung (None → selbst rechnen).
+    Übernommen werden nur die Richtungs-Docs (doc_type "dir_*", Kontext + Titel umgeschrieben,
+    "symmetrie_quelle" = Ursprungsrichtung); Element-/Achsen-Docs und Messages bleiben bei der Quelle.
+    """
+    if not symmetrie:
+        return None
+    bilder = {_angle_key(w) for w in symmetrie.bilder(winkel_deg)}
+    for rec in dir_records:
+        if rec.get("symmetrie_quelle") is None and _angle_key(rec["winkel"] % 360.0) in bilder:
+            quelle = rec
+            break
+    else:
+        return None
+
+    docs = []
+    if dokumentation:
+        for bundle, ctx in quelle["docs"]:
+            doc_type = (ctx or {}).get("doc_type") or ""
+            if not doc_type.startswith("dir_"):
+                continue
+            docs.append((
+                LazyDocBundle(partial(_titel_umschreiben, bundle, quelle["winkel"], winkel_deg)),
+                merge_kontext(ctx, {"windrichtung_deg": f"{winkel_deg}°", "symmetrie_quelle": quelle["windrichtung_deg"]}),
+            ))
+
+    rec = dict(quelle)
+    rec.update(
+        winkel=winkel_deg,
+        windrichtung_deg=f"{winkel_deg}°",
+        best_achse_idx=None,
+        docs=docs,
+        sub_prot=None,
+        symmetrie_quelle=quelle["windrichtung_deg"],
+    )
+    return rec
+
+def _titel_umschreiben(bundle, von: float, nach: float) -> dict:
+    daten = dict(bundle)
+    titel = daten.get("titel")
+    if isinstance(titel, str):
+        if f"{von}°" in titel:
+            daten["titel"] = titel.replace(f"{von}°", f"{nach}°")
+        else:
+            daten["titel"] = titel.replace(f"{int(von)}°", f"{int(nach)}°")
+    return daten
+
 def obtain_pool(konstruktion, reset_berechnungen: bool, *, protokoll: Optional[Protokoll]=None, kontext: Optional[dict]=None) -> LastPool:
     base_ctx = merge_kontext(kontext, {"funktion": "obtain_pool"})
+    if isinstance(konstruktion, PreparedKonstruktion):
+        # Pool gehört zur Vorbereitung (gleiches q-Profil); Reset leert nur die Richtungen
+        if reset_berechnungen:
+            konstruktion.lastpool.nach_winkel.clear()
+            protokolliere_msg(protokoll, severity=Severity.HINT,
+                              code="UTILS/POOL_RESET",
+                              text="Lastpool neu angelegt/gesetzt (reset_berechnungen=True oder fehlte).",
+                              kontext=base_ctx)
+        return konstruktion.lastpool
     if reset_berechnungen or not hasattr(konstruktion, "_lastpool") or konstruktion._lastpool is None:
         konstruktion._lastpool = LastPool()
         protokolliere_msg(protokoll, severity=Severity.HINT,
@@ -140,24 +418,115 @@ def get_or_create_lastset(
 
     key = _angle_key(winkel_deg)
     ls = pool.nach_winkel.get(key)
+    if ls is not None and ls.lade_protokoll is not None:
+        # vorab per erzeuge_lastsets(...) berechnet → Lade-Doku an den ersten Nutzer übergeben
+        protokoll_uebertragen(ls.lade_protokoll, protokoll)
+        ls.lade_protokoll = None
     if ls is None:
-        kbe = ermittle_kraefte_pro_windrichtung(
+        kbe = ermittle_kraefte_fuer_windrichtungen(
             konstruktion,
             norm=norm,
-            windrichtung=windrichtung,
+            windrichtungen=[(winkel_deg, windrichtung)],
             staudruecke=staudruecke,
             obergrenzen=obergrenzen,
             konst=konst,
-            protokoll=protokoll,
-            kontext=base_ctx,
-        )
-        ls = LastSet(winkel_deg=winkel_deg, windrichtung=windrichtung, kraefte_nach_element=kbe)
+            protokolle=[protokoll],
+            kontext=merge_kontext(kontext, {"funktion": "get_or_create_lastset"}),
+        )[0]
+        ls = LastSet(winkel_deg=winkel_deg, windrichtung=windrichtung, block=KraftBlock.aus_kraefte(kbe))
         pool.nach_winkel[key] = ls
     return ls
 
+def erzeuge_lastsets(
+    pool: LastPool,
+    konstruktion,
+    *,
+    windrichtungen: Sequence[Tuple[float, Vec3]],
+    norm: Norm,
+    staudruecke: Sequence[float],
+    obergrenzen: Sequence[float],
+    konst,
+    kontext: Optional[dict] = None,
+    dokumentation: bool = True,
+) -> None:
+    """
+    Legt alle noch fehlenden LastSets der gegebenen Windrichtungen in einem Batch an
+    (ermittle_kraefte_fuer_windrichtungen). Die Lade-Doku je Richtung wird im LastSet
+    gepuffert und beim ersten get_or_create_lastset(...) in dessen Protokoll übertragen.
+    dokumentation=False → nur Messages puffern (NullProtokoll).
+    """
+    fehlend = [(w, r) for w, r in windrichtungen if _angle_key(w) not in pool.nach_winkel]
+    if not fehlend:
+        return
+    base_ctx = merge_kontext(kontext, {"funktion": "get_or_create_lastset"})
+    puffer = [make_protokoll(dokumentation=dokumentation) for _ in fehlend]
+    kbe_liste = ermittle_kraefte_fuer_windrichtungen(
+        konstruktion,
+        norm=norm,
+        windrichtungen=fehlend,
+        staudruecke=staudruecke,
+        obergrenzen=obergrenzen,
+        konst=konst,
+        protokolle=puffer,
+        kontext=base_ctx,
+    )
+    for (winkel_deg, windrichtung), kbe, prot in zip(fehlend, kbe_liste, puffer):
+        pool.nach_winkel[_angle_key(winkel_deg)] = LastSet(
+            winkel_deg=winkel_deg,
+            windrichtung=windrichtung,
+            block=KraftBlock.aus_kraefte(kbe),
+            lade_protokoll=prot,
+        )
+
 # Kippsicherheit Utils --------------------------------------------
 
 def sammle_kippachsen(konstruktion, *, protokoll: Optional[Protokoll] = None, kontext: Optional[dict] = None) -> List[Achse]:
+    return list(kippgeometrie(konstruktion, protokoll=protokoll, kontext=kontext).achsen)
+
+def kippgeometrie(konstruktion, *, protokoll: Optional[Protokoll] = None, kontext: Optional[dict] = None) -> Kippgeometrie:
+    """
+    Hülle, Kippachsen, Ballast-Schwerpunkt und Ballast-Standmoment je Achse der Konstruktion.
+    Am Objekt gecacht und über die Geometrie-Versionen der Bauelemente invalidiert
+    (PreparedKonstruktion: aus prepare(...)); die Doku wird relativ zum Aufrufer wiedergegeben.
+    """
+    if isinstance(konstruktion, PreparedKonstruktion):
+        geo = konstruktion.kippgeometrie
+    else:
+        geo = kippgeometrie_von(konstruktion, stufe=protokoll_stufe(protokoll))
+    protokoll_uebertragen(geo.protokoll, protokoll, basis=kontext)
+    return geo
+
+def kippgeometrie_von(konstruktion, *, stufe: int = 0) -> Kippgeometrie:
+    """Kippgeometrie einer Konstruktion mit Aufzeichnung der Stufe 'stufe' (siehe protokoll_stufe), am Objekt gecacht."""
+    bauelemente = getattr(konstruktion, "bauelemente", []) or []
+    schluessel = geometrie_schluessel(bauelemente, catalog.spec_version)
+    cache = getattr(konstruktion, "_kippgeometrie_cache", None)
+    if schluessel is not None and cache is not None and cache[0] == schluessel and cache[1].stufe >= stufe:
+        return cache[1]
+
+    aufz = make_aufzeichnung(stufe)
+    achsen = _sammle_kippachsen(konstruktion, protokoll=aufz, kontext=None)
+    huelle = tuple(a.punkt for a in achsen)
+    schwerpunkt = flaechenschwerpunkt(list(huelle)) if huelle else None
+    einheit = tuple(
+        max(0.0, -moment_einzelkraft_um_achse(achse, (0.0, 0.0, -1.0), schwerpunkt))  # je 1 N Ballast
+        for achse in achsen
+    )
+    geo = Kippgeometrie(
+        huelle=huelle,
+        achsen=tuple(achsen),
+        schwerpunkt_ballast=schwerpunkt,
+        ballast_standmoment_einheit=einheit,
+        protokoll=aufz,
+    )
+    if schluessel is not None:
+        try:
+            konstruktion._kippgeometrie_cache = (schluessel, geo)
+        except AttributeError:
+            pass
+    return geo
+
+def _sammle_kippachsen(konstruktion, *, protokoll: Optional[Protokoll] = None, kontext: Optional[dict] = None) -> List[Achse]:
     base_ctx = merge_kontext(kontext, {"funktion": "sammle_kippachsen"})
     eckpunkte: List[Vec3] = []
 
@@ -240,7 +609,8 @@ def bewerte_lastfall_fuer_achse(
     Pro Einzelkraft i:
       1) m_sign = u · ((r_i - p) × F_i)
       2) m_kipp = -m_sign  (>0 = kippend/ungünstig, <=0 = stabilisierend/günstig)
-      3) γ = Sicherheitsbeiwert(norm, lastfall, ist_guenstig=(m_kipp <= 0))
+      3) γ aus gamma_tabelle(norm) je ist_guenstig=(m_kipp <= 0)
+         (Doku der γ-Werte einmal je Nachweis, siehe protokolliere_gamma)
       4) Summen:
            kipp_sum  += γ * max(m_kipp, 0)
            stand_sum += γ * max(-m_kipp, 0)
@@ -268,6 +638,9 @@ def bewerte_lastfall_fuer_achse(
         )
         return 0.0, 0.0
     
+    gamma = gamma_tabelle(norm)
+    g_unguenstig = gamma.wert(lastfall.typ, lastfall.variabilitaet, False)
+    g_guenstig = gamma.wert(lastfall.typ, lastfall.variabilitaet, True)
     kipp_sum = 0.0
     stand_sum = 0.0
 
@@ -275,16 +648,12 @@ def bewerte_lastfall_fuer_achse(
         # 1) Moment um die Achse (Skalar, Rechtsschraube) …
         m_kipp = moment_einzelkraft_um_achse(achse, Kraft, Punkt)
 
-        # 2) Sicherheitsbeiwert nach Günstigkeit bestimmen
-        ist_guenstig = (m_kipp <= _EPS)
-        gamma = sicherheitsbeiwert(norm, lastfall, ist_guenstig, protokoll=protokoll, kontext=base_ctx).wert
-
-        # 3) Aufteilen in kippend vs. stabilisierend
+        # 2) Aufteilen in kippend (γ ungünstig) vs. stabilisierend (γ günstig)
         if m_kipp > _EPS:
-            kipp_sum += gamma * m_kipp
+            kipp_sum += g_unguenstig * m_kipp
         else:
             # (-m_kipp) ist der Betrag des stabilisierenden Moments
-            stand_sum += gamma * (-m_kipp)
+            stand_sum += g_guenstig * (-m_kipp)
 
     return kipp_sum, stand_sum
 
@@ -352,6 +721,198 @@ def kipp_envelope_pro_bauelement(
     stand_sum_bauteil = best_gew_stand + best_other_stand
     return kipp_sum_bauteil, stand_sum_bauteil
 
+@dataclass
+class KippMatrix:
+    """
+    Ergebnis des Kipp-Kernels für eine Windrichtung (alle Achsen × alle Bauelemente).
+
+    - elemente:  Element-IDs in Reihenfolge des KraftBlocks
+    - block:     zugrunde liegender KraftBlock (für die Dokumentation)
+    - kipp/stand: [achse_index][element_index] → Envelope-Beiträge (wie kipp_envelope_pro_bauelement)
+    """
+    elemente: List[str]
+    block: KraftBlock
+    kipp: List[List[float]]
+    stand: List[List[float]]
+
+def _achsen_stapeln(achsen: Sequence[Achse]) -> List[Tuple[float, float, float, float, float, float]]:
+    """Achsen als (px, py, pz, ux, uy, uz) mit einmalig normierter Richtung."""
+    achsen_flach: List[Tuple[float, float, float, float, float, float]] = []
+    for achse in achsen:
+        ux, uy, uz = vektor_normieren(achse.richtung)
+        px, py, pz = achse.punkt
+        achsen_flach.append((px, py, pz, ux, uy, uz))
+    return achsen_flach
+
+def gamma_schluessel(
+    block: KraftBlock, nachweis: str, achsen: Optional[Sequence[Achse]] = None,
+) -> List[GammaSchluessel]:
+    """
+    γ-Kombinationen (Lasttyp-Code, Variabilitäts-Code, ist_guenstig), die der Nachweis im Block
+    tatsächlich angewendet hat – Grundlage für die einmalige γ-Dokumentation je Nachweis (protokolliere_gamma).
+    Günstig/ungünstig wie in den Kerneln:
+      - KIPP:   Vorzeichen des Moments je Achse (m > 0 ungünstig), nur Lastfälle mit Angriffspunkten
+      - GLEIT:  fx, fy oder fz > 0 ungünstig, fz < 0 günstig
+      - ABHEBE: fz > 0 ungünstig, fz < 0 günstig
+    """
+    kr = block.kraefte
+    verwendet = set()
+    if nachweis == "KIPP":
+        achsen_flach = _achsen_stapeln(achsen or ())
+        for lf in range(block.anzahl_lastfaelle):
+            if not block.lf_gueltig[lf]:
+                continue
+            typ = block.lf_typ[lf]
+            var = block.lf_variabilitaet[lf]
+            for fx, fy, fz, px, py, pz in block.iter_kraefte(lf):
+                for (ax, ay, az, ux, uy, uz) in achsen_flach:
+                    r0 = px - ax
+                    r1 = py - ay
+                    r2 = pz - az
+                    m = (r1 * fz - r2 * fy) * ux + (r2 * fx - r0 * fz) * uy + (r0 * fy - r1 * fx) * uz
+                    verwendet.add((typ, var, not m > _EPS))
+    elif nachweis in ("GLEIT", "ABHEBE"):
+        horizontal = nachweis == "GLEIT"
+        for lf in range(block.anzahl_lastfaelle):
+            typ = block.lf_typ[lf]
+            var = block.lf_variabilitaet[lf]
+            for i in range(3 * block.lf_start[lf], 3 * block.lf_start[lf + 1], 3):
+                fz = kr[i + 2]
+                if fz > _EPS or (horizontal and (kr[i] > _EPS or kr[i + 1] > _EPS)):
+                    verwendet.add((typ, var, False))
+                if fz < -_EPS:
+                    verwendet.add((typ, var, True))
+    else:
+        raise ValueError(f"gamma_schluessel: unbekannter Nachweis {nachweis!r}")
+    return sorted(verwendet)
+
+def kipp_matrix(
+    norm: Norm,
+    achsen: Sequence[Achse],
+    block: KraftBlock,
+) -> KippMatrix:
+    """
+    Array-Kernel für den Kippnachweis einer Windrichtung.
+
+    Liest Einzelkräfte/Angriffspunkte direkt aus dem KraftBlock (ein Slice je Lastfall),
+    stapelt alle Achsen in (px, py, pz, ux, uy, uz), liest γ je (Lasttyp, Variabilität,
+    ist_guenstig) aus der kompilierten γ-Tabelle und bildet daraus für alle Achsen × Bauelemente
+    die Envelope-Beiträge.
+
+    Rechenweg und Rundungsreihenfolge entsprechen exakt
+    bewerte_lastfall_fuer_achse + kipp_envelope_pro_bauelement.
+    Dokumentation erfolgt NICHT hier: γ einmal je Nachweis (protokolliere_gamma),
+    Fehlermeldungen je Zelle über protokolliere_kipp_lastfallfehler(...).
+    """
+    # 1) Achsen stapeln (Richtung einmalig normieren)
+    achsen_flach = _achsen_stapeln(achsen)
+
+    # 2) Lastfälle je Element aus dem Block lesen, γ aus der kompilierten Tabelle
+    gamma = gamma_tabelle(norm).werte
+    wind = LASTTYP_CODE[Lasttyp.WIND]
+    gewicht = LASTTYP_CODE[Lasttyp.GEWICHT]
+
+    bloecke: List[List[Tuple[int, float, float, Optional[List[Tuple[float, ...]]]]]] = []
+    for e in range(block.anzahl_elemente):
+        zeilen = []
+        for lf in block.lastfaelle_von(e):
+            typ = block.lf_typ[lf]
+            if not block.lf_gueltig[lf]:
+                zeilen.append((typ, 0.0, 0.0, None))
+                continue
+            var = block.lf_variabilitaet[lf]
+            zeilen.append((typ, gamma[(typ, var, False)], gamma[(typ, var, True)], list(block.iter_kraefte(lf))))
+        bloecke.append(zeilen)
+
+    # 3) Momente für alle Achsen × Elemente × Lastfälle × Kräfte
+    kipp_m: List[List[float]] = []
+    stand_m: List[List[float]] = []
+
+    for (ax, ay, az, ux, uy, uz) in achsen_flach:
+        kipp_row: List[float] = []
+        stand_row: List[float] = []
+
+        for zeilen in bloecke:
+            wind_kipp = None
+            gew_best = None
+            other_best = None
+
+            for typ, g_unguenstig, g_guenstig, flach in zeilen:
+                kipp_sum = 0.0
+                stand_sum = 0.0
+                if flach is not None:
+                    for fx, fy, fz, px, py, pz in flach:
+                        r0 = px - ax
+                        r1 = py - ay
+                        r2 = pz - az
+                        # u · ((r - p) × F) – gleiche Auswertungsreihenfolge wie moment_einzelkraft_um_achse
+                        m = (r1 * fz - r2 * fy) * ux + (r2 * fx - r0 * fz) * uy + (r0 * fy - r1 * fx) * uz
+                        if m > _EPS:
+                            kipp_sum += g_unguenstig * m
+                        else:
+                            stand_sum += g_guenstig * (-m)
+
+                # Envelope je Typ (identisch zu kipp_envelope_pro_bauelement)
+                if typ == wind:
+                    if wind_kipp is None or kipp_sum > wind_kipp:
+                        wind_kipp = kipp_sum
+                elif typ == gewicht:
+                    if gew_best is None or (kipp_sum - stand_sum) > (gew_best[0] - gew_best[1]):
+                        gew_best = (kipp_sum, stand_sum)
+                else:
+                    if other_best is None or kipp_sum > other_best[0]:
+                        other_best = (kipp_sum, stand_sum)
+
+            best_wind_kipp = wind_kipp if wind_kipp is not None else 0.0
+            best_gew_kipp, best_gew_stand = gew_best if gew_best is not None else (0.0, 0.0)
+            best_other_kipp, best_other_stand = other_best if other_best is not None else (0.0, 0.0)
+
+            kipp_row.append(best_wind_kipp + best_gew_kipp + best_other_kipp)
+            stand_row.append(best_gew_stand + best_other_stand)
+
+        kipp_m.append(kipp_row)
+        stand_m.append(stand_row)
+
+    return KippMatrix(
+        elemente=list(block.elemente),
+        block=block,
+        kipp=kipp_m,
+        stand=stand_m,
+    )
+
+def protokolliere_kipp_lastfallfehler(
+    matrix: KippMatrix,
+    element_index: int,
+    *,
+    protokoll: Optional[Protokoll] = None,
+    kontext: Optional[dict] = None,
+) -> None:
+    """
+    Meldet die im Kernel übersprungenen (ungültigen) Lastfälle einer Zelle (Achse × Bauelement)
+    mit denselben Kontexten wie der skalare Pfad (kipp_envelope_pro_bauelement → bewerte_lastfall_fuer_achse).
+    """
+    if protokoll is None:
+        return
+    block = matrix.block
+    env_ctx = None
+    for lf in block.lastfaelle_von(element_index):
+        if block.lf_gueltig[lf]:
+            continue
+        if env_ctx is None:
+            env_ctx = merge_kontext(kontext, {"funktion": "kipp_envelope_pro_bauelement"})
+        lastfall = block.als_kraefte(lf)
+        Angriffspunkte = lastfall.Angriffspunkte_Einzelkraefte
+        protokolliere_msg(
+            protokoll, severity=Severity.ERROR, code="KIPP/NO_ATTACK_POINTS",
+            text="Angriffspunkte der Einzelkräfte fehlen oder ungleich lang.",
+            kontext=merge_kontext(env_ctx, {
+                "funktion": "bewerte_lastfall_fuer_achse",
+                "lasttyp": block.lasttyp(lf),
+                "anzahl_kraefte": len(lastfall.Einzelkraefte),
+                "anzahl_punkte": 0 if Angriffspunkte is None else len(Angriffspunkte),
+            }),
+        )
+
 # Gleitsicherheit Utils ------------------------------
 
 def ermittle_min_reibwert(
@@ -368,6 +929,19 @@ def ermittle_min_reibwert(
             "element_id": getattr(elem, "element_id_intern", None),
         })
 
+        if isinstance(konstruktion, PreparedKonstruktion):
+            reib = konstruktion.reibwerte[idx]
+            protokoll_uebertragen(reib.protokoll, protokoll, basis=elem_ctx)
+            if reib.fehler is not None:
+                protokolliere_msg(
+                    protokoll, severity=Severity.ERROR, code="GLEIT/MU_READ_FAIL",
+                    text=f"Reibwert-Ermittlung für Element {idx} fehlgeschlagen: {reib.fehler}",
+                    kontext=elem_ctx,
+                )
+            elif reib.wert is not None:
+                mu_werte.append(reib.wert)
+            continue
+
         reib_fn = getattr(elem, "reibwert_effektiv", None)
         if not callable(reib_fn):
             continue
@@ -410,6 +984,10 @@ def bewerte_lastfall_fuer_gleiten(
 
     Einzelkraefte: Sequence[Vec3] = lastfall.Einzelkraefte
 
+    gamma = gamma_tabelle(norm)
+    g_u = gamma.wert(lastfall.typ, lastfall.variabilitaet, False)
+    g_g = gamma.wert(lastfall.typ, lastfall.variabilitaet, True)
+
     Hx = Hy = Hz = 0.0
     N_down = 0.0
     N_up   = 0.0
@@ -420,18 +998,14 @@ def bewerte_lastfall_fuer_gleiten(
         fz = Kraft[2]
 
         if fx > _EPS:
-            gamma = sicherheitsbeiwert(norm, lastfall, ist_guenstig=False, protokoll=protokoll, kontext=base_ctx).wert
-            Hx += gamma * fx
+            Hx += g_u * fx
         if fy > _EPS:
-            gamma = sicherheitsbeiwert(norm, lastfall, ist_guenstig=False, protokoll=protokoll, kontext=base_ctx).wert
-            Hy += gamma * fy
+            Hy += g_u * fy
 
         if fz > _EPS:
-            gamma = sicherheitsbeiwert(norm, lastfall, ist_guenstig=False, protokoll=protokoll, kontext=base_ctx).wert
-            N_up += gamma * fz
+            N_up += g_u * fz
         elif fz < -_EPS:
-            gamma = sicherheitsbeiwert(norm, lastfall, ist_guenstig=True, protokoll=protokoll, kontext=base_ctx).wert
-            N_down += gamma * (-fz)
+            N_down += g_g * (-fz)
 
     H_vec: Vec3 = (Hx, Hy, Hz)
 
@@ -470,6 +1044,62 @@ def gleit_envelope_pro_bauelement(
 
     return best_H_vec, best_N_down, best_N_up
 
+def gleit_envelope_block(
+    norm: Norm, block: KraftBlock, element_index: int,
+    *, protokoll: Optional[Protokoll] = None, kontext: Optional[dict] = None
+) -> Tuple[Vec3, float, float]:
+    """
+    Wie gleit_envelope_pro_bauelement, liest die Lastfälle des Elements aber direkt
+    aus dem KraftBlock-Slice (γ aus gamma_tabelle; Doku einmal je Nachweis über protokolliere_gamma).
+    """
+    gamma = gamma_tabelle(norm).werte
+    wind = LASTTYP_CODE[Lasttyp.WIND]
+    gewicht = LASTTYP_CODE[Lasttyp.GEWICHT]
+    kr = block.kraefte
+
+    best_H_vec: Vec3 = (0.0, 0.0, 0.0)
+    best_H_betrag = -1.0
+    best_N_down = None
+    best_N_up = 0.0
+
+    for lf in block.lastfaelle_von(element_index):
+        typ = block.lf_typ[lf]
+        var = block.lf_variabilitaet[lf]
+        g_u = gamma[(typ, var, False)]
+        g_g = gamma[(typ, var, True)]
+
+        Hx = Hy = 0.0
+        N_down = 0.0
+        N_up = 0.0
+        for i in range(3 * block.lf_start[lf], 3 * block.lf_start[lf + 1], 3):
+            fx = kr[i]
+            fy = kr[i + 1]
+            fz = kr[i + 2]
+            if fx > _EPS:
+                Hx += g_u * fx
+            if fy > _EPS:
+                Hy += g_u * fy
+            if fz > _EPS:
+                N_up += g_u * fz
+            elif fz < -_EPS:
+                N_down += g_g * (-fz)
+
+        H_vec: Vec3 = (Hx, Hy, 0.0)
+        if typ == wind:
+            H_betrag = vektor_laenge(H_vec)
+            if H_betrag > best_H_betrag:
+                best_H_betrag = H_betrag
+                best_H_vec = H_vec
+                best_N_up = N_up
+
+        if typ == gewicht:
+            best_N_down = N_down if best_N_down is None else min(best_N_down, N_down)
+
+    if best_N_down is None:
+        best_N_down = 0.0
+
+    return best_H_vec, best_N_down, best_N_up
+
 # Abhebesicherheit Utils -----------------------------------
 
 def bewerte_lastfall_fuer_abheben(
@@ -484,6 +1114,9 @@ def bewerte_lastfall_fuer_abheben(
       N_up   (ungünstig, NACH OBEN; aus allen Lastfällen mit γ_ungünstig, als positive Größe).
     Rückgabe: (N_down, N_up)
     """
+    gamma = gamma_tabelle(norm)
+    g_u = gamma.wert(lastfall.typ, lastfall.variabilitaet, False)
+    g_g = gamma.wert(lastfall.typ, lastfall.variabilitaet, True)
     N_down = 0.0
     N_up = 0.0
 
@@ -491,12 +1124,10 @@ def bewerte_lastfall_fuer_abheben(
         fz = F[2]
         if fz > _EPS:
             # nach oben → ungünstig
-            gamma = sicherheitsbeiwert(norm, lastfall, ist_guenstig=False, protokoll=protokoll, kontext=base_ctx).wert
-            N_up += gamma * fz
+            N_up += g_u * fz
         elif fz < -_EPS:
             # nach unten → günstig, positive Magnitude
-            gamma = sicherheitsbeiwert(norm, lastfall, ist_guenstig=True, protokoll=protokoll, kontext=base_ctx).wert
-            N_down += gamma * (-fz)
+            N_down += g_g * (-fz)
 
     return N_down, N_up
 
@@ -527,4 +1158,45 @@ def abhebe_envelope_pro_bauelement(
     if best_N_down is None:
         best_N_down = 0.0
 
-    return best_N_down, best_N_up
\ No newline at end of file
+    return best_N_down, best_N_up
+
+def abhebe_envelope_block(
+    norm: Norm, block: KraftBlock, element_index: int, *,
+    protokoll: Optional[Protokoll] = None, kontext: Optional[dict] = None
+) -> Tuple[float, float]:
+    """
+    Wie abhebe_envelope_pro_bauelement, liest die Lastfälle des Elements aber direkt
+    aus dem KraftBlock-Slice (γ aus gamma_tabelle; Doku einmal je Nachweis über protokolliere_gamma).
+    """
+    gamma = gamma_tabelle(norm).werte
+    gewicht = LASTTYP_CODE[Lasttyp.GEWICHT]
+    kr = block.kraefte
+
+    best_N_up = 0.0
+    best_N_down = None  # min über GEWICHT
+
+    for lf in block.lastfaelle_von(element_index):
+        typ = block.lf_typ[lf]
+        var = block.lf_variabilitaet[lf]
+        g_u = gamma[(typ, var, False)]
+        g_g = gamma[(typ, var, True)]
+
+        N_down = 0.0
+        N_up = 0.0
+        for i in range(3 * block.lf_start[lf] + 2, 3 * block.lf_start[lf + 1], 3):
+            fz = kr[i]
+            if fz > _EPS:
+                N_up += g_u * fz
+            elif fz < -_EPS:
+                N_down += g_g * (-fz)
+
+        if N_up > best_N_up:
+            best_N_up = N_up
+
+        if typ == gewicht:
+            best_N_down = N_down if best_N_down is None else min(best_N_down, N_down)
+
+    if best_N_down is None:
+        best_N_down = 0.0
+
+    return best_N_down, best_N_up
@@ -0,0 +1,232 @@
+# rechenfunktionen/symmetrie.py
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from windlast_CORE.datenstruktur.konstanten import _EPS
+from windlast_CORE.datenstruktur.geometrie import geometrie_schluessel
+from windlast_CORE.datenstruktur.lastcache import element_fingerprint
+from windlast_CORE.materialdaten.catalog import catalog
+from windlast_CORE.rechenfunktionen.geom3d import Vec3
+
+# Geometriefelder der Bauelemente (alle übrigen Felder = Katalog-Spec, müssen exakt gleich sein)
+_PUNKT_FELDER = ("start", "ende", "mittelpunkt")
+_PUNKTLISTEN_FELDER = ("eckpunkte",)
+_VEKTOR_FELDER = ("orientierung", "drehung")
+_IGNORIERTE_FELDER = ("element_id_intern", "anzeigename")
+
+# Kandidaten (Grad): Spiegelachsen in der xy-Ebene bzw. Drehwinkel um die z-Achse
+_SPIEGELACHSEN_DEG = (0.0, 30.0, 45.0, 60.0, 90.0, 120.0, 135.0, 150.0)
+_DREHWINKEL_DEG = (60.0, 90.0, 120.0, 180.0, 240.0, 270.0, 300.0)
+
+def _normiere_winkel(winkel_deg: float) -> float:
+    w = round(winkel_deg % 360.0, 6)
+    return 0.0 if w >= 360.0 else w
+
+@dataclass(frozen=True)
+class Symmetrieabbildung:
+    """
+    Abbildung der Konstruktion auf sich selbst (vertikale Spiegelebene bzw. Drehung um vertikale Achse).
+    - art:        "spiegelung" | "drehung"
+    - winkel_deg: Richtung der Spiegelachse in der xy-Ebene bzw. Drehwinkel (0° = x-Achse)
+    - zentrum:    (x, y) des Bezugspunkts (liegt auf jeder Spiegelebene / ist Drehzentrum)
+    """
+    art: str
+    winkel_deg: float
+    zentrum: Tuple[float, float]
+
+    def _matrix(self) -> Tuple[float, float, float, float]:
+        if self.art == "spiegelung":
+            w = math.radians(2.0 * self.winkel_deg)
+            return (math.cos(w), math.sin(w), math.sin(w), -math.cos(w))
+        w = math.radians(self.winkel_deg)
+        return (math.cos(w), -math.sin(w), math.sin(w), math.cos(w))
+
+    def vektor(self, v: Vec3) -> Vec3:
+        a, b, c, d = self._matrix()
+        x, y, z = (float(k) for k in v)
+        return (a * x + b * y, c * x + d * y, z)
+
+    def punkt(self, p: Vec3) -> Vec3:
+        cx, cy = self.zentrum
+        x, y, z = self.vektor((float(p[0]) - cx, float(p[1]) - cy, float(p[2])))
+        return (x + cx, y + cy, z)
+
+    def richtung(self, winkel_deg: float) -> float:
+        """Bild einer Windrichtung (Azimut in Grad), normiert auf [0°, 360°)."""
+        if self.art == "spiegelung":
+            return _normiere_winkel(2.0 * self.winkel_deg - winkel_deg)
+        return _normiere_winkel(winkel_deg + self.winkel_deg)
+
+@dataclass(frozen=True)
+class Symmetrie:
+    """
+    Gefundene Symmetrien einer Konstruktion (ohne Identität).
+    Leer → keine Symmetrie, alle Windrichtungen müssen gerechnet werden.
+    """
+    abbildungen: Tuple[Symmetrieabbildung, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.abbildungen)
+
+    def bilder(self, winkel_deg: float) -> List[float]:
+        """Alle Bilder einer Windrichtung unter den Symmetrieabbildungen (ohne die Richtung selbst)."""
+        eigen = _normiere_winkel(winkel_deg)
+        bilder: List[float] = []
+        for abb in self.abbildungen:
+            w = abb.richtung(winkel_deg)
+            if abs(w - eigen) > 1e-6 and w not in bilder:
+                bilder.append(w)
+        return bilder
+
+    def fundamentalbereich(self, windrichtungen: Sequence[Tuple[float, Vec3]]) -> List[Tuple[float, Vec3]]:
+        """
+        Teilmenge der Windrichtungen, die tatsächlich gerechnet werden muss:
+        je Bahn der Symmetriegruppe nur der erste Vertreter (in Eingabereihenfolge).
+        """
+        if not self.abbildungen:
+            return list(windrichtungen)
+        gerechnet: Dict[float, bool] = {}
+        ergebnis: List[Tuple[float, Vec3]] = []
+        for winkel, richtung in windrichtungen:
+            if any(b in gerechnet for b in self.bilder(winkel)):
+                continue
+            gerechnet[_normiere_winkel(winkel)] = True
+            ergebnis.append((winkel, richtung))
+        return ergebnis
+
+KEINE_SYMMETRIE = Symmetrie()
+
+@dataclass(frozen=True)
+class _Beschreibung:
+    spec: Hashable
+    punkte: Tuple[Tuple[str, Vec3], ...]
+    punktlisten: Tuple[Tuple[str, Tuple[Vec3, ...]], ...]
+    vektoren: Tuple[Tuple[str, Vec3], ...]
+
+def _beschreibe(elem: Any) -> Optional[_Beschreibung]:
+    fp = element_fingerprint(elem)
+    if fp is None:
+        return None
+    typ, werte = fp
+    geometrie = _PUNKT_FELDER + _PUNKTLISTEN_FELDER + _VEKTOR_FELDER + _IGNORIERTE_FELDER
+    spec = (typ, tuple((k, v) for k, v in werte if k not in geometrie))
+    felder = {k: v for k, v in werte if v is not None}
+    try:
+        punkte = tuple((k, tuple(float(c) for c in felder[k])) for k in _PUNKT_FELDER if k in felder)
+        punktlisten = tuple(
+            (k, tuple(tuple(float(c) for c in p) for p in felder[k]))
+            for k in _PUNKTLISTEN_FELDER if k in felder
+        )
+        vektoren = tuple((k, tuple(float(c) for c in felder[k])) for k in _VEKTOR_FELDER if k in felder)
+    except (TypeError, ValueError):
+        return None
+    return _Beschreibung(spec=spec, punkte=punkte, punktlisten=punktlisten, vektoren=vektoren)
+
+def _gleich(a: Vec3, b: Vec3) -> bool:
+    return all(abs(x - y) <= _EPS for x, y in zip(a, b))
+
+def _gleiche_punktmengen(a: Sequence[Vec3], b: Sequence[Vec3]) -> bool:
+    if len(a) != len(b):
+        return False
+    offen = list(b)
+    for p in a:
+        for i, q in enumerate(offen):
+            if _gleich(p, q):
+                del offen[i]
+                break
+        else:
+            return False
+    return True
+
+def _abbilden(besch: _Beschreibung, abb: Symmetrieabbildung) -> _Beschreibung:
+    return _Beschreibung(
+        spec=besch.spec,
+        punkte=tuple((k, abb.punkt(p)) for k, p in besch.punkte),
+        punktlisten=tuple((k, tuple(abb.punkt(p) for p in ps)) for k, ps in besch.punktlisten),
+        vektoren=tuple((k, abb.vektor(v)) for k, v in besch.vektoren),
+    )
+
+def _deckungsgleich(bild: _Beschreibung, ziel: _Beschreibung) -> bool:
+    if bild.spec != ziel.spec:
+        return False
+    if [k for k, _ in bild.punkte] != [k for k, _ in ziel.punkte]:
+        return False
+    if [k for k, _ in bild.vektoren] != [k for k, _ in ziel.vektoren]:
+        return False
+    if not all(_gleich(v, w) for (_, v), (_, w) in zip(bild.vektoren, ziel.vektoren)):
+        return False
+    for (k, ps), (k2, qs) in zip(bild.punktlisten, ziel.punktlisten):
+        if k != k2 or not _gleiche_punktmengen(ps, qs):
+            return False
+    a = [p for _, p in bild.punkte]
+    b = [p for _, p in ziel.punkte]
+    if all(_gleich(p, q) for p, q in zip(a, b)):
+        return True
+    # Strecken (start/ende) sind richtungslos: vertauschte Endpunkte sind dieselbe Geometrie
+    namen = [k for k, _ in bild.punkte]
+    return namen == ["start", "ende"] and _gleich(a[0], b[1]) and _gleich(a[1], b[0])
+
+def _ist_symmetrie(beschreibungen: Sequence[_Beschreibung], abb: Symmetrieabbildung) -> bool:
+    offen = list(range(len(beschreibungen)))
+    for besch in beschreibungen:
+        bild = _abbilden(besch, abb)
+        for pos, j in enumerate(offen):
+            if _deckungsgleich(bild, beschreibungen[j]):
+                del offen[pos]
+                break
+        else:
+            return False
+    return True
+
+def ermittle_symmetrie(bauelemente: Sequence[Any]) -> Symmetrie:
+    """
+    Sucht Spiegel- (vertikale Ebenen) und Drehsymmetrien (vertikale Achse) der Bauelemente.
+    Verglichen werden Typ, Katalog-Spec (alle Nicht-Geometrie-Felder), Punkte und
+    Orientierungsvektoren jeweils innerhalb _EPS. Bezugspunkt ist der Mittelwert aller Punkte
+    (liegt bei jeder Symmetrie auf der Spiegelebene bzw. im Drehzentrum).
+    Nicht beschreibbare Elemente (keine Dataclass o.ä.) → keine Symmetrie.
+    """
+    beschreibungen: List[_Beschreibung] = []
+    for elem in bauelemente:
+        besch = _beschreibe(elem)
+        if besch is None:
+            return KEINE_SYMMETRIE
+        beschreibungen.append(besch)
+
+    punkte = [p for b in beschreibungen for _, p in b.punkte]
+    punkte += [p for b in beschreibungen for _, ps in b.punktlisten for p in ps]
+    if not punkte:
+        return KEINE_SYMMETRIE
+    zentrum = (
+        sum(p[0] for p in punkte) / len(punkte),
+        sum(p[1] for p in punkte) / len(punkte),
+    )
+
+    kandidaten = [Symmetrieabbildung("spiegelung", w, zentrum) for w in _SPIEGELACHSEN_DEG]
+    kandidaten += [Symmetrieabbildung("drehung", w, zentrum) for w in _DREHWINKEL_DEG]
+    return Symmetrie(tuple(abb for abb in kandidaten if _ist_symmetrie(beschreibungen, abb)))
+
+def symmetrie_von(konstruktion: Any) -> Symmetrie:
+    """
+    Symmetrie einer Konstruktion (über .bauelemente), am Objekt gecacht.
+    Schlüssel sind die Geometrie-Versionen (sonst Fingerprints) der Bauelemente → Änderungen invalidieren den Cache.
+    Vorbereitete Konstruktionen (PreparedKonstruktion) bringen ihre Symmetrie bereits mit.
+    """
+    vorab = getattr(konstruktion, "symmetrie", None)
+    if isinstance(vorab, Symmetrie):
+        return vorab
+    bauelemente = list(getattr(konstruktion, "bauelemente", None) or [])
+    schluessel = geometrie_schluessel(bauelemente, catalog.spec_version)
+    if schluessel is None:
+        schluessel = tuple(element_fingerprint(el) for el in bauelemente)
+    cache = getattr(konstruktion, "_symmetrie_cache", None)
+    if cache is not None and cache[0] == schluessel:
+        return cache[1]
+    ergebnis = ermittle_symmetrie(bauelemente)
+    try:
+        konstruktion._symmetrie_cache = (schluessel, ergebnis)
+    except AttributeError:
+        pass
+    return ergebnis
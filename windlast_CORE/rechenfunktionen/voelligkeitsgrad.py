@@ -4,9 +4,10 @@ from windlast_CORE.datenstruktur.zwischenergebnis import (
     Zwischenergebnis,
     Protokoll,
     merge_kontext,
-    make_docbundle,
+    lazy_docbundle,
     protokolliere_msg,
     protokolliere_doc,
+    doku_aktiv,
 )
 from windlast_CORE.datenstruktur.enums import Norm, Severity
 
@@ -51,17 +52,18 @@ def _voelligkeitsgrad_default(
             kontext=merge_kontext(base_ctx, {"phi": wert}),
         )
 
-    protokolliere_doc(
-        protokoll,
-        bundle=make_docbundle(
-            titel="Völligkeitsgrad φ",
-            wert=wert,
-            formel="φ = A_proj / A_e",
-            formelzeichen=["φ", "A_proj", "A_e"],
-            einzelwerte=[a_projiziert, a_eingeschlossen],
-        ),
-        kontext=base_ctx,
-    )
+    if doku_aktiv(protokoll):
+        protokolliere_doc(
+            protokoll,
+            bundle=lazy_docbundle(
+                titel="Völligkeitsgrad φ",
+                wert=wert,
+                formel="φ = A_proj / A_e",
+                formelzeichen=["φ", "A_proj", "A_e"],
+                einzelwerte=[a_projiziert, a_eingeschlossen],
+            ),
+            kontext=base_ctx,
+        )
     return Zwischenergebnis(wert=wert)
 
 _DISPATCH_VG: Dict[Norm, Callable[..., Zwischenergebnis]] = {
@@ -93,11 +95,12 @@ def voelligkeitsgrad(
             text=str(e),
             kontext=base_ctx,
         )
-        protokolliere_doc(
-            protokoll,
-            bundle=make_docbundle(titel="Völligkeitsgrad φ", wert=float("nan")),
-            kontext=merge_kontext(base_ctx, {"nan": True}),
-        )
+        if doku_aktiv(protokoll):
+            protokolliere_doc(
+                protokoll,
+                bundle=lazy_docbundle(titel="Völligkeitsgrad φ", wert=float("nan")),
+                kontext=merge_kontext(base_ctx, {"nan": True}),
+            )
         return Zwischenergebnis(wert=float("nan"))
     
     funktion = _DISPATCH_VG.get(norm, _DISPATCH_VG[Norm.DEFAULT])
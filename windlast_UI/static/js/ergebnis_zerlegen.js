@@ -12,6 +12,59 @@
 
   function createZeroCounts() { return { error:0, warn:0, hint:0, info:0 }; }
 
+  // ---- Spaltenweises Doc-Format (docs_format=columnar, siehe core_adapter/docs_spalten.py) ----
+  function isColumnar(docs) {
+    return !!docs && !Array.isArray(docs) && docs.format === "columnar";
+  }
+
+  // Block → Liste von Doc-Objekten (wie im Objektformat). Kontexte werden je (Kontext, Rolle)
+  // nur einmal aufgebaut und von allen Docs geteilt (nur lesen!).
+  function decodeDocs(docs) {
+    if (Array.isArray(docs)) return docs;
+    if (!isColumnar(docs)) return [];
+    const T = docs.table || [];
+    const C = docs.columns || {};
+    const keySets = docs.context_keys || [];
+    const contexts = docs.contexts || [];
+    const pick = (i) => (i === null || i === undefined) ? null : T[i];
+
+    const ctxCache = new Map();
+    const contextFor = (ki, ri) => {
+      const cacheKey = ki + ":" + ri;
+      let ctx = ctxCache.get(cacheKey);
+      if (ctx) return ctx;
+      const e = contexts[ki] || [0];
+      const names = keySets[e[0]] || [];
+      ctx = {};
+      for (let j = 0; j < names.length; j++) ctx[names[j]] = pick(e[j + 1]);
+      if (ri !== null && ri !== undefined) ctx.rolle_pro_nachweis = T[ri];
+      ctxCache.set(cacheKey, ctx);
+      return ctx;
+    };
+
+    const out = new Array(docs.count || 0);
+    for (let n = 0; n < out.length; n++) {
+      out[n] = {
+        title:          pick(C.title?.[n]),
+        value:          C.value?.[n] ?? null,
+        unit:           pick(C.unit?.[n]),
+        formula:        pick(C.formula?.[n]),
+        formula_source: pick(C.formula_source?.[n]),
+        symbols:        pick(C.symbols?.[n]),
+        symbols_source: pick(C.symbols_source?.[n]),
+        items:          pick(C.items?.[n]),
+        items_source:   pick(C.items_source?.[n]),
+        context:        contextFor(C.context?.[n], C.role?.[n]),
+      };
+    }
+    return out;
+  }
+
+  // Roh-Docs aus dem Payload: Liste, spaltenweiser Block oder (nicht mitgeliefert) leer
+  function rawDocs(docs) {
+    return (Array.isArray(docs) || isColumnar(docs)) ? docs : [];
+  }
+
   const ResultsIndex = {
     build(payload) {
       const idx = Object.create(ResultsIndex._proto);
@@ -30,8 +83,8 @@
       idx.altLabelsByNorm = {};
 
       for (const [normKey, norm] of Object.entries(idx.payload.normen || {})) {
-        // 1) Haupt-Docs/-Messages in den Index legen
-        const mainDocs = Array.isArray(norm?.docs) ? norm.docs : [];
+        // 1) Haupt-Docs/-Messages in den Index legen (spaltenweise Blöcke erst in getDocs dekodieren)
+        const mainDocs = rawDocs(norm?.docs);
         const mainMsgs = Array.isArray(norm?.messages) ? norm.messages : [];
         idx.docsMainByNorm[normKey] = mainDocs;
         idx.msgsMainByNorm[normKey] = mainMsgs;
@@ -60,7 +113,7 @@
         // ---- Alternativen einlesen (Docs & Messages) ----
         const alts = norm?.alternativen || {};
         for (const [altName, altVal] of Object.entries(alts)) {
-          const altDocs = Array.isArray(altVal?.docs) ? altVal.docs : [];
+          const altDocs = rawDocs(altVal?.docs);
           const altMsgs = Array.isArray(altVal?.messages) ? altVal.messages : [];
 
           idx.docsByAlt[normKey][altName] = altDocs;
@@ -114,12 +167,13 @@
 
       // ==================== DOCS (Zwischenergebnisse) ====================
 
-      // Direkter Zugriff: Haupt vs. Alternative
+      // Direkter Zugriff: Haupt vs. Alternative (spaltenweise Blöcke beim ersten Zugriff dekodiert)
       getDocs(normKey, altName = null) {
-        if (altName) {
-          return this.docsByAlt?.[normKey]?.[altName] || [];
-        }
-        return this.docsMainByNorm?.[normKey] || [];
+        const store = altName ? this.docsByAlt?.[normKey] : this.docsMainByNorm;
+        const key = altName ? altName : normKey;
+        const docs = store?.[key];
+        if (isColumnar(docs)) store[key] = decodeDocs(docs);
+        return store?.[key] || [];
       },
 
       // Szenario-basiert (wie bei Messages):
@@ -232,5 +286,8 @@
     }
   };
 
+  ResultsIndex.isColumnar = isColumnar;
+  ResultsIndex.decodeDocs = decodeDocs;
+
   global.ResultsIndex = ResultsIndex;
 })(window);
\ No newline at end of file
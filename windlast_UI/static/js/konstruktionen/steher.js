@@ -274,6 +274,8 @@ async function submitSteher() {
     const payload = {
       konstruktion,
       ...readHeaderValues(),
+      // Docs (Zwischenergebnisse) lädt das Ergebnis-Modal bei Bedarf über meta.result_id nach
+      fields: "kipp,gleit,abhebe,ballast,alternativen,messages",
     };
 
     const data = await fetchJSON("/api/v1/konstruktion/berechnen", {
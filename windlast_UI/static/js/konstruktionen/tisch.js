@@ -285,6 +285,8 @@ async function submitTisch() {
     const payload = {
       konstruktion,
       ...header,
+      // Docs (Zwischenergebnisse) lädt das Ergebnis-Modal bei Bedarf über meta.result_id nach
+      fields: "kipp,gleit,abhebe,ballast,alternativen,messages",
     };
 
     // 6) Generischen Endpoint aufrufen
@@ -294,6 +294,8 @@ async function submitTor() {
     const payload = {
       konstruktion,
       ...header,
+      // Docs (Zwischenergebnisse) lädt das Ergebnis-Modal bei Bedarf über meta.result_id nach
+      fields: "kipp,gleit,abhebe,ballast,alternativen,messages",
     };
 
     // 3) Generischen Endpoint aufrufen
@@ -11,6 +11,7 @@ import {
     prettyValHTML,
     formatMathWithSubSup,
 } from "../utils/formatierung.js";
+import { fetchJSON } from "../utils/api.js";
 
 // === Konfiguration der Gruppierung der Zwischenergebnisse ===
 // Format: [merkmalKeyAusContext, labelFürFehlendeWerte]
@@ -542,6 +543,30 @@ export function openErgebnisseModal(normKey, szenario = null, { initialNachweis
 
   // Daten holen
   const norm = VM?.payload?.normen?.[normKey] || {};
+
+  // Docs nicht mitgeliefert (schnelle Hauptrechnung ohne "docs") → einmalig über result_id nachladen
+  const holder = szenario ? norm.alternativen?.[szenario] : norm;
+  const resultId = VM?.payload?.meta?.result_id;
+  if (holder && holder.docs === undefined && resultId) {
+    const params = new URLSearchParams({ norm: normKey, docs_format: "columnar" });
+    if (szenario) params.set("szenario", szenario);
+    fetchJSON(`/api/v1/ergebnis/${encodeURIComponent(resultId)}/docs?${params}`)
+      .then(data => {
+        holder.docs = window.ResultsIndex.decodeDocs(data?.docs);
+        openErgebnisseModal(normKey, szenario, { initialNachweis });
+      })
+      .catch(e => {
+        document.dispatchEvent(new CustomEvent("toast", {
+          detail: { level: "error", text: String(e?.message || e) }
+        }));
+      });
+    return;
+  }
+
+  // spaltenweise Blöcke (docs_format=columnar) einmal dekodieren und ersetzen
+  if (holder && window.ResultsIndex.isColumnar(holder.docs)) {
+    holder.docs = window.ResultsIndex.decodeDocs(holder.docs);
+  }
   const items = szenario ? (norm.alternativen?.[szenario]?.docs || []) : (norm.docs || []);
 
   const buildModal = DEPS.buildModal || _fallbackBuildModal;